@@ -0,0 +1,68 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Benchmarks for comparing datasets."""
+
+from io import BytesIO
+
+from pydicom3 import dcmread
+from pydicom3.dataset import Dataset, FileMetaDataset
+from pydicom3.uid import ExplicitVRLittleEndian, generate_uid
+
+
+def _create_dataset(nr_elements: int) -> Dataset:
+    """Return a dataset with approximately `nr_elements` elements, mostly in
+    the items of a *Per-frame Functional Groups Sequence*.
+    """
+    ds = Dataset()
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds.SOPClassUID = "1.2.840.10008.5.1.4.1.1.4.1"
+    ds.SOPInstanceUID = generate_uid()
+    ds.PatientName = "Citizen^Jan"
+
+    # Each item has 8 elements including the sequence elements
+    groups = []
+    for idx in range(nr_elements // 8):
+        position = Dataset()
+        position.ImagePositionPatient = [-125.5, -130.25, idx * 1.5]
+        content = Dataset()
+        content.InStackPositionNumber = idx + 1
+        content.DimensionIndexValues = [1, idx + 1]
+        content.FrameComments = f"Frame {idx + 1}"
+        group = Dataset()
+        group.PlanePositionSequence = [position]
+        group.FrameContentSequence = [content]
+        groups.append(group)
+
+    ds.PerFrameFunctionalGroupsSequence = groups
+    ds.BitsAllocated = 8
+    ds.PixelData = b"\x00" * 1024
+
+    return ds
+
+
+class TimeCompare:
+    """Time comparing newly read datasets with large headers."""
+
+    params = ([1_000, 10_000, 100_000],)
+    param_names = ["nr_elements"]
+
+    def setup(self, nr_elements):
+        buffer = BytesIO()
+        _create_dataset(nr_elements).save_as(buffer, enforce_file_format=True)
+        self.data = buffer.getvalue()
+
+    def time_equal(self, nr_elements):
+        """Time comparing two unmodified copies."""
+        dcmread(BytesIO(self.data)) == dcmread(BytesIO(self.data))
+
+    def time_diff(self, nr_elements):
+        """Time finding the differences between two unmodified copies."""
+        list(dcmread(BytesIO(self.data)).diff(dcmread(BytesIO(self.data))))
+
+    def time_diff_modified(self, nr_elements):
+        """Time finding a difference in one of the sequence items."""
+        ds = dcmread(BytesIO(self.data))
+        other = dcmread(BytesIO(self.data))
+        seq = other.PerFrameFunctionalGroupsSequence
+        seq[-1].FrameContentSequence[0].FrameComments = "Modified"
+        list(ds.diff(other))
@@ -0,0 +1,149 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Benchmarks for converting and writing the values of large DS and IS
+elements.
+"""
+
+from io import BytesIO
+
+import numpy
+
+from pydicom3 import config, dcmread
+from pydicom3.dataset import Dataset, FileMetaDataset
+from pydicom3.uid import ExplicitVRLittleEndian, generate_uid
+from pydicom3.valuerep import format_number_as_ds, format_numbers_as_ds
+from pydicom3.values import convert_DS_array
+
+
+def _encode_contour(nr_points: int) -> bytes:
+    """Return an encoded *Contour Data* value with `nr_points` points."""
+    values = [f"{(idx % 997) * 0.25 - 125.5:.2f}" for idx in range(3 * nr_points)]
+    value = "\\".join(values).encode()
+
+    return value + b" " * (len(value) % 2)
+
+
+def _encode_rtstruct(nr_contours: int, nr_points: int) -> bytes:
+    """Return an encoded RT Structure Set dataset with `nr_contours` contours
+    of `nr_points` points each.
+    """
+    ds = Dataset()
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds.SOPClassUID = "1.2.840.10008.5.1.4.1.1.481.3"
+    ds.SOPInstanceUID = generate_uid()
+    ds.Modality = "RTSTRUCT"
+
+    contour_data = _encode_contour(nr_points)
+    contours = []
+    for idx in range(nr_contours):
+        contour = Dataset()
+        contour.ContourGeometricType = "CLOSED_PLANAR"
+        contour.NumberOfContourPoints = nr_points
+        contour.add_new(0x30060050, "DS", contour_data)
+        contours.append(contour)
+
+    roi = Dataset()
+    roi.ReferencedROINumber = 1
+    roi.ROIDisplayColor = [255, 0, 0]
+    roi.ContourSequence = contours
+    ds.ROIContourSequence = [roi]
+
+    buffer = BytesIO()
+    ds.save_as(buffer, enforce_file_format=True)
+
+    return buffer.getvalue()
+
+
+class TimeConvertDS:
+    """Time converting a large DS value."""
+
+    params = ([1_000, 100_000], [False, True])
+    param_names = ["nr_points", "use_numpy"]
+
+    def setup(self, nr_points, use_numpy):
+        self.value = _encode_contour(nr_points)
+        self.original = config.use_DS_numpy
+        config.use_DS_numpy = use_numpy
+
+    def teardown(self, nr_points, use_numpy):
+        config.use_DS_numpy = self.original
+
+    def time_convert(self, nr_points, use_numpy):
+        """Time converting the value using the current config."""
+        if use_numpy:
+            convert_DS_array(self.value)
+        else:
+            ds = Dataset()
+            ds.add_new(0x30060050, "DS", self.value)
+            list(ds.ContourData)
+
+
+class TimeReadContours:
+    """Time reading an RT Structure Set and converting every contour."""
+
+    params = ([False, True],)
+    param_names = ["use_numpy"]
+
+    def setup_cache(self):
+        with open("contours", "wb") as f:
+            f.write(_encode_rtstruct(300, 1_000))
+
+    def setup(self, use_numpy):
+        self.original = config.use_DS_numpy
+        config.use_DS_numpy = use_numpy
+
+    def teardown(self, use_numpy):
+        config.use_DS_numpy = self.original
+
+    def time_contour_data(self, use_numpy):
+        """Time reading the dataset and converting every Contour Data."""
+        ds = dcmread("contours")
+        for contour in ds.ROIContourSequence[0].ContourSequence:
+            contour.ContourData
+
+
+class TimeFormatDS:
+    """Time formatting an array of floats as a DS value."""
+
+    params = ([1_000, 1_000_000], [False, True])
+    param_names = ["nr_values", "vectorised"]
+
+    def setup(self, nr_values, vectorised):
+        rng = numpy.random.default_rng(1234)
+        self.values = rng.random(nr_values) * 500 - 250
+
+    def time_format(self, nr_values, vectorised):
+        """Time formatting the values."""
+        if vectorised:
+            format_numbers_as_ds(self.values)
+        else:
+            "\\".join(format_number_as_ds(v) for v in self.values.tolist())
+
+
+class TimeWriteContours:
+    """Time writing an RT Structure Set with array Contour Data values."""
+
+    def setup(self):
+        rng = numpy.random.default_rng(1234)
+        self.ds = Dataset()
+        self.ds.file_meta = FileMetaDataset()
+        self.ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+        self.ds.SOPClassUID = "1.2.840.10008.5.1.4.1.1.481.3"
+        self.ds.SOPInstanceUID = generate_uid()
+        contours = []
+        for idx in range(300):
+            contour = Dataset()
+            contour.ContourGeometricType = "CLOSED_PLANAR"
+            contour.NumberOfContourPoints = 1_000
+            contour.ContourData = rng.random(3_000) * 500 - 250
+            contours.append(contour)
+
+        roi = Dataset()
+        roi.ReferencedROINumber = 1
+        roi.ROIDisplayColor = numpy.asarray([255, 0, 0])
+        roi.ContourSequence = contours
+        self.ds.ROIContourSequence = [roi]
+
+    def time_save_as(self):
+        """Time writing the dataset."""
+        self.ds.save_as(BytesIO(), enforce_file_format=True)
@@ -0,0 +1,129 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Benchmarks for copying datasets."""
+
+import copy
+
+from pydicom3 import dcmread
+from pydicom3.data import get_testdata_file
+from pydicom3.dataset import Dataset
+
+
+def _create_flat(nr_elements: int) -> Dataset:
+    """Return a dataset with `nr_elements` private elements in the top level."""
+    ds = dcmread(get_testdata_file("CT_small.dcm"))
+    for idx in range(nr_elements):
+        group = 0x0009 + 2 * (idx // 0xFF)
+        ds.add_new((group << 16) | 0x1000 | (idx % 0xFF), "LO", f"Value {idx}")
+
+    return ds
+
+
+def _create_nested(nr_items: int) -> Dataset:
+    """Return a dataset with a *Per-frame Functional Groups Sequence* with
+    `nr_items` items, each with nested sequences.
+    """
+    ds = dcmread(get_testdata_file("CT_small.dcm"))
+    groups = []
+    for idx in range(nr_items):
+        position = Dataset()
+        position.ImagePositionPatient = [-125.5, -130.25, idx * 1.5]
+        content = Dataset()
+        content.InStackPositionNumber = idx + 1
+        content.DimensionIndexValues = [1, idx + 1]
+        content.FrameComments = f"Frame {idx + 1}"
+        group = Dataset()
+        group.PlanePositionSequence = [position]
+        group.FrameContentSequence = [content]
+        groups.append(group)
+
+    ds.PerFrameFunctionalGroupsSequence = groups
+
+    return ds
+
+
+def _anonymise(ds: Dataset) -> None:
+    """Modify a dozen elements as an anonymisation pipeline would."""
+    ds.PatientName = "Anonymous"
+    ds.PatientID = "12345678"
+    ds.PatientBirthDate = ""
+    ds.PatientSex = ""
+    ds.PatientAge = ""
+    ds.PatientWeight = None
+    ds.InstitutionName = ""
+    ds.InstitutionAddress = ""
+    ds.ReferringPhysicianName = ""
+    ds.OperatorsName = ""
+    ds.StudyID = ""
+    ds.AccessionNumber = ""
+
+
+class TimeCopyFlat:
+    """Time copying a dataset with many top-level elements."""
+
+    params = ([1_000, 10_000],)
+    param_names = ["nr_elements"]
+
+    def setup(self, nr_elements):
+        self.ds = _create_flat(nr_elements)
+
+    def time_deepcopy(self, nr_elements):
+        """Time deep copying the dataset."""
+        copy.deepcopy(self.ds)
+
+    def time_copy_cow(self, nr_elements):
+        """Time a copy-on-write copy of the dataset."""
+        self.ds.copy(cow=True)
+
+    def time_deepcopy_modify(self, nr_elements):
+        """Time deep copying the dataset and modifying a dozen elements."""
+        _anonymise(copy.deepcopy(self.ds))
+
+    def time_copy_cow_modify(self, nr_elements):
+        """Time a copy-on-write copy of the dataset and modifying a dozen
+        elements.
+        """
+        _anonymise(self.ds.copy(cow=True))
+
+
+class TimeCopyNested:
+    """Time copying a dataset with a large nested sequence."""
+
+    params = ([1_000, 10_000],)
+    param_names = ["nr_items"]
+
+    def setup(self, nr_items):
+        self.ds = _create_nested(nr_items)
+
+    def time_deepcopy(self, nr_items):
+        """Time deep copying the dataset."""
+        copy.deepcopy(self.ds)
+
+    def time_copy_cow(self, nr_items):
+        """Time a copy-on-write copy of the dataset."""
+        self.ds.copy(cow=True)
+
+    def time_deepcopy_modify(self, nr_items):
+        """Time deep copying the dataset and modifying a dozen elements and
+        the first frame's position.
+        """
+        ds = copy.deepcopy(self.ds)
+        _anonymise(ds)
+        group = ds.PerFrameFunctionalGroupsSequence[0]
+        group.PlanePositionSequence[0].ImagePositionPatient = [0, 0, 0]
+
+    def time_copy_cow_modify(self, nr_items):
+        """Time a copy-on-write copy of the dataset and modifying a dozen
+        elements and the first frame's position.
+        """
+        ds = self.ds.copy(cow=True)
+        _anonymise(ds)
+        group = ds.PerFrameFunctionalGroupsSequence[0]
+        group.PlanePositionSequence[0].ImagePositionPatient = [0, 0, 0]
+
+    def peakmem_deepcopy(self, nr_items):
+        """Peak memory deep copying the dataset."""
+        copy.deepcopy(self.ds)
+
+    def peakmem_copy_cow(self, nr_items):
+        """Peak memory of a copy-on-write copy of the dataset."""
+        self.ds.copy(cow=True)
@@ -0,0 +1,65 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Benchmarks for filereader.data_element_generator()."""
+
+from pydicom3.dataset import Dataset
+from pydicom3.filebase import DicomFileLike
+from pydicom3.filereader import data_element_generator
+from pydicom3.filewriter import write_dataset
+
+
+def _create_dataset(nr_elements: int) -> Dataset:
+    """Return a dataset with `nr_elements` short private elements."""
+    ds = Dataset()
+    for idx in range(nr_elements):
+        # Private groups have up to 0xF000 elements in the 0x1000 to 0xFFFF range
+        group, elem = divmod(idx, 0xF000)
+        ds.add_new((0x0009 + 2 * group) << 16 | (0x1000 + elem), "LO", f"{idx:08d}")
+
+    return ds
+
+
+class TimeDataElementGenerator:
+    """Time parsing datasets with many elements from buffered and unbuffered
+    file-likes.
+    """
+
+    params = (
+        [1_000, 10_000, 100_000],
+        ["explicit", "implicit"],
+        ["buffered", "unbuffered"],
+    )
+    param_names = ["nr_elements", "encoding", "file"]
+
+    def setup_cache(self):
+        # The files are written to the benchmark's working directory once,
+        #   as the larger datasets are slow to create
+        for nr_elements in self.params[0]:
+            ds = _create_dataset(nr_elements)
+            for encoding in self.params[1]:
+                fp = DicomFileLike(open(f"{nr_elements}_{encoding}", "wb"))
+                fp.is_implicit_VR = encoding == "implicit"
+                fp.is_little_endian = True
+                with fp:
+                    write_dataset(fp, ds)
+
+    def setup(self, nr_elements, encoding, file):
+        self.is_implicit_VR = encoding == "implicit"
+        buffering = -1 if file == "buffered" else 0
+        self.fp = open(f"{nr_elements}_{encoding}", "rb", buffering=buffering)
+
+    def teardown(self, nr_elements, encoding, file):
+        self.fp.close()
+
+    def time_generator(self, nr_elements, encoding, file):
+        """Time reading every element."""
+        self.fp.seek(0)
+        for _ in data_element_generator(self.fp, self.is_implicit_VR, True):
+            pass
+
+    def time_generator_deferred(self, nr_elements, encoding, file):
+        """Time reading every element with all values deferred."""
+        self.fp.seek(0)
+        for _ in data_element_generator(
+            self.fp, self.is_implicit_VR, True, defer_size=0
+        ):
+            pass
@@ -0,0 +1,80 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Benchmarks for functional_groups.extract_per_frame()."""
+
+from pydicom3 import dcmread
+from pydicom3.dataset import Dataset, FileMetaDataset
+from pydicom3.functional_groups import extract_per_frame
+from pydicom3.uid import ExplicitVRLittleEndian, generate_uid
+
+
+KEYWORDS = ["ImagePositionPatient", "InStackPositionNumber", "DimensionIndexValues"]
+
+
+def _create_dataset(nr_frames: int) -> Dataset:
+    """Return a dataset with a *Per-frame Functional Groups Sequence* with
+    `nr_frames` items.
+    """
+    ds = Dataset()
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds.SOPClassUID = "1.2.840.10008.5.1.4.1.1.4.1"
+    ds.SOPInstanceUID = generate_uid()
+    ds.NumberOfFrames = nr_frames
+
+    orientation = Dataset()
+    orientation.ImageOrientationPatient = [1, 0, 0, 0, 1, 0]
+    shared = Dataset()
+    shared.PlaneOrientationSequence = [orientation]
+    ds.SharedFunctionalGroupsSequence = [shared]
+
+    groups = []
+    for idx in range(nr_frames):
+        position = Dataset()
+        position.ImagePositionPatient = [0, 0, idx]
+        content = Dataset()
+        content.InStackPositionNumber = idx + 1
+        content.DimensionIndexValues = [1, idx + 1]
+        group = Dataset()
+        group.PlanePositionSequence = [position]
+        group.FrameContentSequence = [content]
+        groups.append(group)
+
+    ds.PerFrameFunctionalGroupsSequence = groups
+    ds.BitsAllocated = 8
+    ds.PixelData = b"\x00" * 1024
+
+    return ds
+
+
+class TimeExtractPerFrame:
+    """Time getting per-frame values from datasets with many frames."""
+
+    params = ([100, 1_000, 10_000],)
+    param_names = ["nr_frames"]
+
+    def setup_cache(self):
+        # The files are written to the benchmark's working directory once,
+        #   as the larger datasets are slow to create
+        for nr_frames in self.params[0]:
+            _create_dataset(nr_frames).save_as(
+                f"functional_groups_{nr_frames}", enforce_file_format=True
+            )
+
+    def setup(self, nr_frames):
+        self.path = f"functional_groups_{nr_frames}"
+
+    def time_dcmread(self, nr_frames):
+        """Time getting the values from each item with dcmread()."""
+        ds = dcmread(self.path)
+        for group in ds.PerFrameFunctionalGroupsSequence:
+            group.PlanePositionSequence[0].ImagePositionPatient
+            group.FrameContentSequence[0].InStackPositionNumber
+            group.FrameContentSequence[0].DimensionIndexValues
+
+    def time_extract_per_frame_dataset(self, nr_frames):
+        """Time extracting the values after reading with dcmread()."""
+        extract_per_frame(dcmread(self.path), KEYWORDS)
+
+    def time_extract_per_frame_file(self, nr_frames):
+        """Time extracting the values from the file."""
+        extract_per_frame(self.path, KEYWORDS)
@@ -0,0 +1,94 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Benchmarks for leanread.iter_elements() compared with dcmread()."""
+
+from pydicom3 import dcmread
+from pydicom3.dataset import Dataset, FileMetaDataset
+from pydicom3.leanread import iter_elements
+from pydicom3.uid import ExplicitVRLittleEndian, generate_uid
+
+
+def _create_dataset(nr_items: int) -> Dataset:
+    """Return a dataset with a *Per-frame Functional Groups Sequence* with
+    `nr_items` items.
+    """
+    ds = Dataset()
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds.SOPClassUID = "1.2.840.10008.5.1.4.1.1.4.1"
+    ds.SOPInstanceUID = generate_uid()
+    ds.PatientName = "Citizen^Jan"
+    ds.PatientID = "12345678"
+    ds.NumberOfFrames = nr_items
+
+    groups = []
+    for idx in range(nr_items):
+        position = Dataset()
+        position.ImagePositionPatient = [0, 0, idx]
+        content = Dataset()
+        content.InStackPositionNumber = idx + 1
+        content.DimensionIndexValues = [1, idx + 1]
+        group = Dataset()
+        group.PlanePositionSequence = [position]
+        group.FrameContentSequence = [content]
+        groups.append(group)
+
+    ds.PerFrameFunctionalGroupsSequence = groups
+    ds.BitsAllocated = 8
+    ds.PixelData = b"\x00" * 1024
+
+    return ds
+
+
+class TimeIterElements:
+    """Time getting values from datasets with large sequences using
+    iter_elements() and dcmread().
+    """
+
+    params = ([100, 1_000, 10_000],)
+    param_names = ["nr_items"]
+
+    def setup_cache(self):
+        # The files are written to the benchmark's working directory once,
+        #   as the larger datasets are slow to create
+        for nr_items in self.params[0]:
+            _create_dataset(nr_items).save_as(
+                f"leanread_{nr_items}", enforce_file_format=True
+            )
+
+    def setup(self, nr_items):
+        self.path = f"leanread_{nr_items}"
+
+    def time_dcmread_all(self, nr_items):
+        """Time getting every element's value with dcmread()."""
+        for elem in dcmread(self.path).iterall():
+            elem.value
+
+    def time_iter_elements_all(self, nr_items):
+        """Time getting every element's value with iter_elements()."""
+        for _ in iter_elements(self.path, descend=True):
+            pass
+
+    def time_dcmread_top_level(self, nr_items):
+        """Time getting a top-level value with dcmread()."""
+        dcmread(self.path, specific_tags=["PixelData"]).PixelData
+
+    def time_iter_elements_top_level(self, nr_items):
+        """Time getting a top-level value with iter_elements()."""
+        for _ in iter_elements(self.path, include=lambda path: path == (0x7FE00010,)):
+            pass
+
+    def time_dcmread_nested(self, nr_items):
+        """Time getting a value from each sequence item with dcmread()."""
+        ds = dcmread(self.path)
+        for group in ds.PerFrameFunctionalGroupsSequence:
+            group.PlanePositionSequence[0].ImagePositionPatient
+
+    def time_iter_elements_nested(self, nr_items):
+        """Time getting a value from each sequence item with iter_elements()."""
+        for _ in iter_elements(
+            self.path,
+            include=lambda path: path[-1] == 0x00200032,
+            exclude=lambda path: path[-1] == 0x00209111,
+            descend=True,
+        ):
+            pass
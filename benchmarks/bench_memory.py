@@ -0,0 +1,106 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Benchmarks for the memory used by datasets with many elements."""
+
+import tracemalloc
+
+from pydicom3 import dcmread
+from pydicom3.dataset import Dataset, FileMetaDataset
+from pydicom3.uid import ExplicitVRLittleEndian, generate_uid
+
+
+def _create_dataset(nr_elements: int) -> Dataset:
+    """Return a dataset with approximately `nr_elements` elements, mostly in
+    the items of a *Per-frame Functional Groups Sequence*.
+    """
+    ds = Dataset()
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds.SOPClassUID = "1.2.840.10008.5.1.4.1.1.4.1"
+    ds.SOPInstanceUID = generate_uid()
+    ds.PatientName = "Citizen^Jan"
+    ds.PatientID = "12345678"
+
+    # Each item has 10 elements including the sequence elements
+    groups = []
+    for idx in range(nr_elements // 10):
+        position = Dataset()
+        position.ImagePositionPatient = [-125.5, -130.25, idx * 1.5]
+        content = Dataset()
+        content.InStackPositionNumber = idx + 1
+        content.DimensionIndexValues = [1, idx + 1]
+        content.FrameAcquisitionDateTime = "20240101120000.000000"
+        content.FrameComments = f"Frame {idx + 1}"
+        volume = Dataset()
+        volume.FrameType = ["DERIVED", "PRIMARY", "VOLUME", "NONE"]
+        volume.VolumetricProperties = "VOLUME"
+        group = Dataset()
+        group.PlanePositionSequence = [position]
+        group.FrameContentSequence = [content]
+        group.MRImageFrameTypeSequence = [volume]
+        groups.append(group)
+
+    ds.NumberOfFrames = len(groups)
+    ds.PerFrameFunctionalGroupsSequence = groups
+    ds.BitsAllocated = 8
+    ds.PixelData = b"\x00" * 1024
+
+    return ds
+
+
+def _bytes_per_element(path: str) -> float:
+    """Return the memory allocated per element when reading `path` and
+    converting every element.
+    """
+    tracemalloc.start()
+    try:
+        nr_elements = 0
+        ds = dcmread(path)
+        for elem in ds.iterall():
+            nr_elements += 1
+
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return size / nr_elements
+
+
+class MemoryHeader:
+    """Track the memory used by datasets with large headers."""
+
+    params = ([1_000, 10_000, 100_000],)
+    param_names = ["nr_elements"]
+
+    def setup_cache(self):
+        # The files are written to the benchmark's working directory once,
+        #   as the larger datasets are slow to create
+        for nr_elements in self.params[0]:
+            _create_dataset(nr_elements).save_as(
+                f"memory_{nr_elements}", enforce_file_format=True
+            )
+
+    def setup(self, nr_elements):
+        self.path = f"memory_{nr_elements}"
+
+    def peakmem_dcmread(self, nr_elements):
+        """Peak memory reading the dataset."""
+        dcmread(self.path)
+
+    def peakmem_dcmread_converted(self, nr_elements):
+        """Peak memory reading the dataset and converting every element."""
+        for elem in dcmread(self.path).iterall():
+            pass
+
+    def mem_dataset(self, nr_elements):
+        """Size of the dataset after converting every element."""
+        ds = dcmread(self.path)
+        for elem in ds.iterall():
+            pass
+
+        return ds
+
+    def track_bytes_per_element(self, nr_elements):
+        """Bytes allocated per element after converting every element."""
+        return _bytes_per_element(self.path)
+
+    track_bytes_per_element.unit = "bytes"
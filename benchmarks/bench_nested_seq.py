@@ -6,8 +6,6 @@ from pydicom3.tag import Tag
 def create_nested_test_seq(num_items: int = 6280) -> Dataset:
     """Create a simplified version of sequence from issue #1728"""
     # original had 6280 items, but that is probably larger than needed
-    from copy import deepcopy
-
     ds = Dataset()
 
     # Per-frame Functional Groups Sequence
@@ -33,7 +31,7 @@ def create_nested_test_seq(num_items: int = 6280) -> Dataset:
 
     for i in range(num_items - 1):
         func_gp = Dataset()
-        plane_pos = deepcopy(plane_pos1)
+        plane_pos = plane_pos1.copy(cow=True)
         # Ensure different numbers to avoid memory caching of some kind
         plane_pos.ColumnPositionInTotalImagePixelMatrix = i
         plane_pos.RowPositionInTotalImagePixelMatrix = i
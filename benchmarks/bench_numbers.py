@@ -0,0 +1,65 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Benchmarks for converting and writing numeric element values."""
+
+from io import BytesIO
+from struct import pack
+
+from pydicom3 import config, dcmread
+from pydicom3.dataset import Dataset, FileMetaDataset
+from pydicom3.uid import ExplicitVRLittleEndian, generate_uid
+from pydicom3.values import convert_numbers
+
+
+def _encode(nr_values: int) -> bytes:
+    """Return an encoded dataset with a *Real World Value LUT Data* element
+    with `nr_values` **FD** values.
+    """
+    ds = Dataset()
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds.SOPClassUID = "1.2.840.10008.5.1.4.1.1.4"
+    ds.SOPInstanceUID = generate_uid()
+    item = Dataset()
+    item.RealWorldValueLUTData = [idx * 0.5 for idx in range(nr_values)]
+    ds.RealWorldValueMappingSequence = [item]
+
+    buffer = BytesIO()
+    ds.save_as(buffer, enforce_file_format=True)
+
+    return buffer.getvalue()
+
+
+class TimeConvertNumbers:
+    """Time converting numeric values to a list or an array."""
+
+    params = ([16, 1_024, 65_536], [0, 2])
+    param_names = ["nr_values", "array_threshold"]
+
+    def setup(self, nr_values, array_threshold):
+        self.value = pack(f"<{nr_values}d", *range(nr_values))
+
+    def time_convert_numbers(self, nr_values, array_threshold):
+        """Time converting the encoded values."""
+        convert_numbers(self.value, True, "d", array_threshold)
+
+
+class TimeNumericRoundTrip:
+    """Time reading, converting and writing a large numeric element."""
+
+    # The encoded value of an explicit VR element is limited to 64 KiB
+    params = ([1_024, 8_000], [0, 2])
+    param_names = ["nr_values", "array_threshold"]
+
+    def setup(self, nr_values, array_threshold):
+        self.data = _encode(nr_values)
+        self.original = config.settings.numeric_array_threshold
+        config.settings.numeric_array_threshold = array_threshold
+
+    def teardown(self, nr_values, array_threshold):
+        config.settings.numeric_array_threshold = self.original
+
+    def time_roundtrip(self, nr_values, array_threshold):
+        """Time reading, converting and writing the dataset."""
+        ds = dcmread(BytesIO(self.data))
+        ds.RealWorldValueMappingSequence[0].RealWorldValueLUTData
+        ds.save_as(BytesIO())
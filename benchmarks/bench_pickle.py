@@ -0,0 +1,111 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Benchmarks for pickling datasets."""
+
+from io import BytesIO
+import pickle
+
+from pydicom3 import dcmread
+from pydicom3.dataset import Dataset, FileMetaDataset
+from pydicom3.uid import ExplicitVRLittleEndian, generate_uid
+
+
+def _encode(nr_frames: int) -> bytes:
+    """Return an encoded CT dataset with `nr_frames` 512 x 512 16-bit frames."""
+    ds = Dataset()
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds.SOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+    ds.SOPInstanceUID = generate_uid()
+    ds.StudyInstanceUID = generate_uid()
+    ds.SeriesInstanceUID = generate_uid()
+    ds.PatientName = "Citizen^Jan"
+    ds.PatientID = "12345678"
+    ds.Modality = "CT"
+    ds.ImagePositionPatient = [-250, -250, 0]
+    ds.ImageOrientationPatient = [1, 0, 0, 0, 1, 0]
+    ds.PixelSpacing = [0.9765625, 0.9765625]
+    ds.SliceThickness = 1
+    ds.RescaleIntercept = -1024
+    ds.RescaleSlope = 1
+    ds.SamplesPerPixel = 1
+    ds.PhotometricInterpretation = "MONOCHROME2"
+    ds.Rows = 512
+    ds.Columns = 512
+    ds.NumberOfFrames = nr_frames
+    ds.BitsAllocated = 16
+    ds.BitsStored = 12
+    ds.HighBit = 11
+    ds.PixelRepresentation = 0
+    ds.PixelData = b"\x00\x01" * 512 * 512 * nr_frames
+
+    buffer = BytesIO()
+    ds.save_as(buffer, enforce_file_format=True)
+
+    return buffer.getvalue()
+
+
+def _dumps(obj, protocol):
+    """Return the pickled `obj` and any out-of-band buffers."""
+    buffers = []
+    if protocol < 5:
+        return pickle.dumps(obj, protocol=protocol), buffers
+
+    data = pickle.dumps(obj, protocol=protocol, buffer_callback=buffers.append)
+    return data, buffers
+
+
+class TimePickleSeries:
+    """Time pickling a 512 slice CT series."""
+
+    params = ([False, True], [4, 5])
+    param_names = ["converted", "protocol"]
+
+    def setup(self, converted, protocol):
+        data = _encode(1)
+        self.series = [dcmread(BytesIO(data)) for _ in range(512)]
+        if converted:
+            for ds in self.series:
+                for elem in ds:
+                    pass
+
+        self.pickled = _dumps(self.series, protocol)
+
+    def time_dumps(self, converted, protocol):
+        """Time pickling the series."""
+        _dumps(self.series, protocol)
+
+    def time_loads(self, converted, protocol):
+        """Time unpickling the series."""
+        data, buffers = self.pickled
+        pickle.loads(data, buffers=buffers)
+
+
+class TimePickleMultiFrame:
+    """Time pickling a large multi-frame dataset."""
+
+    # 128 MiB and 512 MiB of pixel data, the same scaling applies to larger
+    #   datasets but the memory needed to pickle them in-band gets excessive
+    params = ([256, 1024], [4, 5])
+    param_names = ["nr_frames", "protocol"]
+
+    def setup_cache(self):
+        for nr_frames in self.params[0]:
+            with open(f"pickle_{nr_frames}", "wb") as f:
+                f.write(_encode(nr_frames))
+
+    def setup(self, nr_frames, protocol):
+        self.ds = dcmread(f"pickle_{nr_frames}")
+        self.pickled = _dumps(self.ds, protocol)
+
+    def time_dumps(self, nr_frames, protocol):
+        """Time pickling the dataset."""
+        _dumps(self.ds, protocol)
+
+    def time_loads(self, nr_frames, protocol):
+        """Time unpickling the dataset."""
+        data, buffers = self.pickled
+        pickle.loads(data, buffers=buffers)
+
+    def peakmem_dumps(self, nr_frames, protocol):
+        """Track the peak memory used pickling the dataset."""
+        _dumps(self.ds, protocol)
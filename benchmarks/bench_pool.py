@@ -0,0 +1,121 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Benchmarks for sharing element values between the datasets in a series."""
+
+from io import BytesIO
+import tracemalloc
+
+from pydicom3 import dcmread
+from pydicom3.dataset import Dataset, FileMetaDataset
+from pydicom3.pool import ElementPool
+from pydicom3.uid import ExplicitVRLittleEndian, generate_uid
+
+
+def _encode_series(nr_slices: int) -> list[bytes]:
+    """Return the encoded headers of a CT series with `nr_slices` slices."""
+    study_uid = generate_uid()
+    series_uid = generate_uid()
+    frame_uid = generate_uid()
+    series = []
+    for idx in range(nr_slices):
+        ds = Dataset()
+        ds.file_meta = FileMetaDataset()
+        ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+        ds.SpecificCharacterSet = "ISO_IR 100"
+        ds.ImageType = ["ORIGINAL", "PRIMARY", "AXIAL"]
+        ds.SOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+        ds.SOPInstanceUID = generate_uid()
+        ds.StudyDate = "20240101"
+        ds.StudyTime = "120000"
+        ds.Modality = "CT"
+        ds.Manufacturer = "ACME Medical Systems"
+        ds.InstitutionName = "General Hospital"
+        ds.ReferringPhysicianName = "Doe^John"
+        ds.StudyDescription = "CT CHEST WITH CONTRAST"
+        ds.SeriesDescription = "AXIAL 1.25mm"
+        ds.ManufacturerModelName = "Scanner 3000"
+        ds.PatientName = "Citizen^Jan"
+        ds.PatientID = "12345678"
+        ds.PatientBirthDate = "19700101"
+        ds.PatientSex = "F"
+        ds.SliceThickness = "1.25"
+        ds.KVP = "120"
+        ds.StudyInstanceUID = study_uid
+        ds.SeriesInstanceUID = series_uid
+        ds.SeriesNumber = "3"
+        ds.InstanceNumber = str(idx + 1)
+        ds.ImagePositionPatient = ["-250.000", "-250.000", f"{-idx * 1.25:.3f}"]
+        ds.ImageOrientationPatient = ["1", "0", "0", "0", "1", "0"]
+        ds.FrameOfReferenceUID = frame_uid
+        ds.SliceLocation = f"{-idx * 1.25:.3f}"
+        ds.SamplesPerPixel = 1
+        ds.PhotometricInterpretation = "MONOCHROME2"
+        ds.Rows = 512
+        ds.Columns = 512
+        ds.PixelSpacing = ["0.976562", "0.976562"]
+        ds.BitsAllocated = 16
+        ds.BitsStored = 12
+        ds.HighBit = 11
+        ds.PixelRepresentation = 0
+        ds.WindowCenter = "40"
+        ds.WindowWidth = "400"
+        ds.RescaleIntercept = "-1024"
+        ds.RescaleSlope = "1"
+        code = Dataset()
+        code.CodeValue = "T-D3000"
+        code.CodingSchemeDesignator = "SRT"
+        code.CodeMeaning = "Chest"
+        ds.AnatomicRegionSequence = [code]
+
+        buffer = BytesIO()
+        ds.save_as(buffer, enforce_file_format=True)
+        series.append(buffer.getvalue())
+
+    return series
+
+
+def _read_series(series: list[bytes], pool: ElementPool | None) -> list[Dataset]:
+    """Return the datasets in `series` with every element converted."""
+    datasets = [dcmread(BytesIO(data), pool=pool) for data in series]
+    for ds in datasets:
+        for elem in ds.iterall():
+            pass
+
+    return datasets
+
+
+class TimeElementPool:
+    """Time reading a series with and without a pool."""
+
+    params = ([False, True],)
+    param_names = ["use_pool"]
+
+    def setup(self, use_pool):
+        self.series = _encode_series(500)
+
+    def time_read_series(self, use_pool):
+        """Time reading the series and converting every element."""
+        _read_series(self.series, ElementPool() if use_pool else None)
+
+
+class MemoryElementPool:
+    """Track the memory used by a series read with and without a pool."""
+
+    params = ([False, True],)
+    param_names = ["use_pool"]
+
+    def setup(self, use_pool):
+        self.series = _encode_series(2000)
+
+    def track_bytes_per_dataset(self, use_pool):
+        """Bytes allocated per dataset after converting every element."""
+        tracemalloc.start()
+        try:
+            pool = ElementPool() if use_pool else None
+            datasets = _read_series(self.series, pool)
+            size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        return size / len(datasets)
+
+    track_bytes_per_dataset.unit = "bytes"
@@ -0,0 +1,76 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Benchmarks for reading datasets from range sources with DicomRangeIO."""
+
+from pydicom3 import dcmread, probe
+from pydicom3.dataset import Dataset, FileMetaDataset
+from pydicom3.encaps import encapsulate, get_frame
+from pydicom3.filebase import CountingRangeSource, DicomRangeIO, LocalRangeSource
+from pydicom3.uid import RLELossless, generate_uid
+
+
+def _create_dataset(nr_frames: int) -> Dataset:
+    """Return a dataset with `nr_frames` 64 KiB encapsulated frames."""
+    ds = Dataset()
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = RLELossless
+    ds.SOPClassUID = "1.2.840.10008.5.1.4.1.1.7"
+    ds.SOPInstanceUID = generate_uid()
+    ds.PatientName = "Citizen^Jan"
+    ds.NumberOfFrames = nr_frames
+    ds.BitsAllocated = 8
+    frames = [bytes([idx % 256]) * 64 * 1024 for idx in range(nr_frames)]
+    ds.PixelData = encapsulate(frames, has_bot=True)
+    ds["PixelData"].VR = "OB"
+
+    return ds
+
+
+class TrackRangeRequests:
+    """Track the number of range requests needed to read datasets and frames
+    with and without read-ahead.
+    """
+
+    params = ([10, 100], [0, 192 * 1024])
+    param_names = ["nr_frames", "read_ahead"]
+
+    def setup_cache(self):
+        # The files are written to the benchmark's working directory once
+        for nr_frames in self.params[0]:
+            _create_dataset(nr_frames).save_as(
+                f"rangeio_{nr_frames}", enforce_file_format=True
+            )
+
+    def setup(self, nr_frames, read_ahead):
+        self.path = f"rangeio_{nr_frames}"
+        self.offset = probe(self.path).pixel_data_offset
+
+    def _open(self, read_ahead):
+        self.source = CountingRangeSource(LocalRangeSource(self.path))
+        return DicomRangeIO(self.source, read_ahead=read_ahead)
+
+    def track_dcmread(self, nr_frames, read_ahead):
+        """Track the requests to read the dataset without the pixel data."""
+        with self._open(read_ahead) as fp:
+            dcmread(fp, defer_size=1024)
+
+        return self.source.count
+
+    def track_get_frame(self, nr_frames, read_ahead):
+        """Track the requests to get the last frame."""
+        with self._open(read_ahead) as fp:
+            fp.seek(self.offset)
+            get_frame(fp, nr_frames - 1, number_of_frames=nr_frames)
+
+        return self.source.count
+
+    def time_dcmread(self, nr_frames, read_ahead):
+        """Time reading the dataset without the pixel data."""
+        with self._open(read_ahead) as fp:
+            dcmread(fp, defer_size=1024)
+
+    def time_get_frame(self, nr_frames, read_ahead):
+        """Time getting each frame."""
+        with self._open(read_ahead) as fp:
+            for idx in range(nr_frames):
+                fp.seek(self.offset)
+                get_frame(fp, idx, number_of_frames=nr_frames)
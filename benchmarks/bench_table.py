@@ -0,0 +1,53 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Benchmarks for table.tabulate()."""
+
+import os
+
+from pydicom3 import dcmread
+from pydicom3.data import get_testdata_file
+from pydicom3.table import tabulate
+from pydicom3.uid import generate_uid
+
+
+KEYWORDS = ["Modality", "SeriesInstanceUID", "SliceThickness", "ImagePositionPatient"]
+
+
+class TimeTabulate:
+    """Time collecting header values from many files."""
+
+    params = ([100, 1_000],)
+    param_names = ["nr_files"]
+
+    def setup_cache(self):
+        ds = dcmread(get_testdata_file("CT_small.dcm"))
+        for nr_files in self.params[0]:
+            os.makedirs(f"table_{nr_files}", exist_ok=True)
+            for idx in range(nr_files):
+                ds.SOPInstanceUID = generate_uid()
+                ds.SliceThickness = idx % 5 * 0.5
+                ds.save_as(f"table_{nr_files}/{idx}.dcm")
+
+    def setup(self, nr_files):
+        self.paths = [f"table_{nr_files}/{idx}.dcm" for idx in range(nr_files)]
+
+    def time_dcmread(self, nr_files):
+        """Time a dcmread() loop collecting the values in dicts."""
+        rows = []
+        for path in self.paths:
+            ds = dcmread(path)
+            rows.append({kw: ds.get(kw) for kw in KEYWORDS})
+
+    def time_tabulate(self, nr_files):
+        """Time collecting the values using tabulate()."""
+        tabulate(self.paths, KEYWORDS)
+
+    def peakmem_dcmread(self, nr_files):
+        """Peak memory of a dcmread() loop collecting the values in dicts."""
+        rows = []
+        for path in self.paths:
+            ds = dcmread(path)
+            rows.append({kw: ds.get(kw) for kw in KEYWORDS})
+
+    def peakmem_tabulate(self, nr_files):
+        """Peak memory collecting the values using tabulate()."""
+        tabulate(self.paths, KEYWORDS)
@@ -0,0 +1,77 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Benchmarks for Dataset.traverse()."""
+
+from io import BytesIO
+
+from pydicom3 import dcmread
+from pydicom3.dataset import Dataset, FileMetaDataset
+from pydicom3.uid import ExplicitVRLittleEndian, generate_uid
+
+
+def _create_dataset(nr_elements: int) -> Dataset:
+    """Return a dataset with approximately `nr_elements` elements, mostly in
+    the items of a *Per-frame Functional Groups Sequence*.
+    """
+    ds = Dataset()
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds.SOPClassUID = "1.2.840.10008.5.1.4.1.1.4.1"
+    ds.SOPInstanceUID = generate_uid()
+    ds.PatientName = "Citizen^Jan"
+    ds.add_new(0x00091010, "LO", "Private")
+
+    # Each item has 8 elements including the sequence elements
+    groups = []
+    for idx in range(nr_elements // 8):
+        position = Dataset()
+        position.ImagePositionPatient = [-125.5, -130.25, idx * 1.5]
+        content = Dataset()
+        content.InStackPositionNumber = idx + 1
+        content.DimensionIndexValues = [1, idx + 1]
+        content.FrameComments = f"Frame {idx + 1}"
+        group = Dataset()
+        group.PlanePositionSequence = [position]
+        group.FrameContentSequence = [content]
+        groups.append(group)
+
+    ds.PerFrameFunctionalGroupsSequence = groups
+    ds.BitsAllocated = 8
+    ds.PixelData = b"\x00" * 1024
+
+    return ds
+
+
+class TimeTraverse:
+    """Time visiting the elements of datasets with large headers."""
+
+    params = ([1_000, 10_000, 100_000],)
+    param_names = ["nr_elements"]
+
+    def setup(self, nr_elements):
+        buffer = BytesIO()
+        _create_dataset(nr_elements).save_as(buffer, enforce_file_format=True)
+        self.data = buffer.getvalue()
+        self.ds = dcmread(BytesIO(self.data))
+
+    def time_iterall(self, nr_elements):
+        """Time visiting and converting every element."""
+        for elem in self.ds.iterall():
+            pass
+
+    def time_traverse_raw(self, nr_elements):
+        """Time visiting every element without converting them."""
+        for ds, elem in dcmread(BytesIO(self.data)).traverse(raw=True):
+            pass
+
+    def time_traverse_pruned(self, nr_elements):
+        """Time visiting the elements outside the functional groups."""
+
+        def prune(ds, elem):
+            return elem.tag == 0x52009230
+
+        for ds, elem in self.ds.traverse(prune=prune):
+            pass
+
+    def time_remove_private_tags(self, nr_elements):
+        """Time removing the private elements from a newly read dataset."""
+        dcmread(BytesIO(self.data)).remove_private_tags()
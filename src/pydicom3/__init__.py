@@ -9,7 +9,7 @@ Quick Start
 1. A simple program to read a dicom file, modify a value, and write to a new
    file::
 
-    from pydicom3.filereader import dcmread
+    from pydicom3.filereader import dcmread, read_headers
     dataset = dcmread("file1.dcm")
     dataset.PatientName = 'anonymous'
     dataset.save_as("file2.dcm")
@@ -31,9 +31,10 @@ Quick Start
 from pydicom3.dataelem import DataElement
 from pydicom3.dataset import Dataset, FileDataset, FileMetaDataset
 import pydicom3.examples
-from pydicom3.filereader import dcmread
+from pydicom3.filereader import async_dcmread, dcmread, read_headers
+from pydicom3.fileprobe import probe
 from pydicom3.filewriter import dcmwrite
-from pydicom3.pixels.utils import pixel_array, iter_pixels
+from pydicom3.pixels.utils import pixel_array, iter_pixels, aiter_pixels
 from pydicom3.sequence import Sequence
 
 from ._version import (
@@ -50,9 +51,13 @@ __all__ = [
     "FileMetaDataset",
     "Sequence",
     "dcmread",
+    "async_dcmread",
+    "read_headers",
+    "probe",
     "dcmwrite",
     "pixel_array",
     "iter_pixels",
+    "aiter_pixels",
     "__version__",
     "__version_info__",
     "__dicom_version__",
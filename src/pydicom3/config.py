@@ -250,6 +250,9 @@ class Settings:
         # currently the default value depends on enforce_valid_values
         self._writing_validation_mode: int | None = RAISE if _use_future else None
         self._infer_sq_for_un_vr: bool = True
+        self._lazy_sequences: bool = False
+        self._deferred_read_pool_size: int = 0
+        self._numeric_array_threshold: int = 0
 
         # Chunk size to use when reading from buffered DataElement values
         self._buffered_read_size = 8192
@@ -320,6 +323,84 @@ class Settings:
     def infer_sq_for_un_vr(self, value: bool) -> None:
         self._infer_sq_for_un_vr = value
 
+    @property
+    def lazy_sequences(self) -> bool:
+        """If ``True`` then when reading a sequence only the location of each
+        item is recorded and an item is only parsed the first time it's
+        accessed, see :class:`~pydicom3.sequence.LazySequence`. Items that
+        have never been accessed are written using their original encoding.
+        Default ``False``.
+
+        .. versionadded:: 3.1
+        """
+        return self._lazy_sequences
+
+    @lazy_sequences.setter
+    def lazy_sequences(self, value: bool) -> None:
+        self._lazy_sequences = value
+
+    @property
+    def deferred_read_pool_size(self) -> int:
+        """Get or set the maximum number of idle file handles kept open for
+        reading the values of deferred elements.
+
+        If greater than 0 then the handles used to read deferred values from
+        a file are kept in a pool shared by all datasets rather than the file
+        being re-opened for every read, with the least recently used handles
+        closed when there are too many. Default ``0``.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        size : int
+            The maximum number of idle handles, must be at least 0.
+        """
+        return self._deferred_read_pool_size
+
+    @deferred_read_pool_size.setter
+    def deferred_read_pool_size(self, size: int) -> None:
+        if size < 0:
+            raise ValueError("The pool size must be at least 0")
+
+        self._deferred_read_pool_size = size
+
+        # Close any idle handles over the new limit
+        from pydicom3.filereader import _DEFERRED_FILES
+
+        _DEFERRED_FILES.trim()
+
+    @property
+    def numeric_array_threshold(self) -> int:
+        """Get or set the number of values at which the values of elements
+        with a VR of **FD**, **FL**, **SL**, **SS**, **SV**, **UL**, **US** or
+        **UV** are converted to a read-only :class:`numpy.ndarray`.
+
+        If greater than 0 then elements with more than one value and at least
+        this many values are converted to an array that's a view of the
+        encoded value, rather than to a :class:`list` of :class:`int` or
+        :class:`float`. Requires NumPy. Default ``0``.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        nr_values : int
+            The minimum number of values, or ``0`` to always return a
+            :class:`list`.
+        """
+        return self._numeric_array_threshold
+
+    @numeric_array_threshold.setter
+    def numeric_array_threshold(self, nr_values: int) -> None:
+        if nr_values < 0:
+            raise ValueError("The threshold must be at least 0")
+
+        if nr_values and not have_numpy:
+            raise ImportError("NumPy is required for 'numeric_array_threshold'")
+
+        self._numeric_array_threshold = nr_values
+
 
 settings = Settings()
 """The global configuration object of type :class:`Settings` to access some
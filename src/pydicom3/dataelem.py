@@ -10,9 +10,12 @@ A DataElement has a tag,
 import base64
 from collections.abc import Callable, MutableSequence
 import copy
+import copyreg
 from io import BufferedIOBase
 import json
-from typing import Any, TYPE_CHECKING, NamedTuple
+from operator import attrgetter
+from pickle import PickleBuffer
+from typing import Any, TYPE_CHECKING, NamedTuple, SupportsIndex
 
 from pydicom3 import config  # don't import datetime_conversion directly
 from pydicom3.config import logger
@@ -101,11 +104,80 @@ def empty_value_for_VR(
     return None
 
 
+# The minimum length of a bytes-like value for it to be pickled as a
+#   PickleBuffer, which allows out-of-band transfer with protocol 5
+_MIN_PICKLE_BUFFER_LENGTH = 64 * 1024
+
+# The VRs whose values may be a numpy.ndarray, as returned by
+#   values.convert_numbers() for elements with many values or by
+#   values.convert_DS_array() and values.convert_IS_array()
+_ARRAY_VRS = {
+    VR_.DS,
+    VR_.FD,
+    VR_.FL,
+    VR_.IS,
+    VR_.SL,
+    VR_.SS,
+    VR_.SV,
+    VR_.UL,
+    VR_.US,
+    VR_.UV,
+}
+
+
+def _pickle_value(value: Any, protocol: int) -> Any:
+    """Return an element `value` in a form that can be pickled.
+
+    Large bytes-like values are returned as a :class:`pickle.PickleBuffer` when
+    using protocol 5 or higher, so they can be transferred out-of-band rather
+    than being copied into the pickle data. Memory-mapped values are
+    :class:`memoryview` instances, which can't otherwise be pickled.
+    """
+    if isinstance(value, memoryview):
+        if protocol >= 5 and value.nbytes >= _MIN_PICKLE_BUFFER_LENGTH:
+            return PickleBuffer(value)
+
+        return value.tobytes()
+
+    if (
+        protocol >= 5
+        and isinstance(value, bytes | bytearray)
+        and len(value) >= _MIN_PICKLE_BUFFER_LENGTH
+    ):
+        return PickleBuffer(value)
+
+    return value
+
+
+def _unpickle_value(value: Any) -> Any:
+    """Return an unpickled element `value`, which will be a
+    :class:`memoryview` if it was transferred out-of-band.
+    """
+    if isinstance(value, PickleBuffer):
+        return value.raw()
+
+    return value
+
+
 def _pass_through(val: Any) -> Any:
     """Pass through function to skip DataElement value validation."""
     return val
 
 
+# The attributes set for every DataElement
+_ELEMENT_ATTRIBUTES = (
+    "tag",
+    "_value",
+    "VR",
+    "validation_mode",
+    "file_tell",
+    "is_undefined_length",
+    "private_creator",
+)
+# Returns the attributes other than the tag and value
+_get_attributes = attrgetter(*_ELEMENT_ATTRIBUTES[2:])
+
+
 class DataElement:
     """Contain and manipulate a DICOM Element.
 
@@ -166,6 +238,10 @@ class DataElement:
         The element's Value Representation.
     """
 
+    # The instance dict is only created if an attribute other than those in
+    #   _ELEMENT_ATTRIBUTES is set, such as a per-element display option
+    __slots__ = _ELEMENT_ATTRIBUTES + ("__dict__", "__weakref__")
+
     descripWidth = 35
     maxBytesToDisplay = 16
     showVR = True
@@ -515,7 +591,7 @@ class DataElement:
         if self.value is None:
             return 0
 
-        if isinstance(self.value, str | bytes | PersonName):
+        if isinstance(self.value, str | bytes | memoryview | PersonName):
             return 1 if self.value else 0
 
         if isinstance(self.value, BufferedIOBase):
@@ -583,6 +659,13 @@ class DataElement:
                 "an alternative that supports ndarrays."
             )
 
+        if (
+            self.VR in _ARRAY_VRS
+            and config.have_numpy
+            and isinstance(val, numpy.ndarray)
+        ):
+            return val
+
         if self.VR == VR_.SQ:  # a sequence - leave it alone
             from pydicom3.sequence import Sequence
 
@@ -644,14 +727,67 @@ class DataElement:
         self.validate(val)
         return val
 
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        """Return the information needed to pickle the element.
+
+        Large bytes-like values are pickled as :class:`pickle.PickleBuffer`
+        so they can be transferred out-of-band with protocol 5.
+        """
+        state = (
+            int(self.tag),
+            _pickle_value(self._value, int(protocol)),
+            _get_attributes(self),
+            self._extra_state(),
+        )
+
+        return copyreg.__newobj__, (type(self),), state  # type: ignore[attr-defined]
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        """Restore the pickled state."""
+        tag, value, attributes, extra = state
+        self.tag = BaseTag(tag)
+        value = _unpickle_value(value)
+        if isinstance(value, memoryview):
+            # Transferred out-of-band, converted values should be bytes-like
+            value = value.tobytes() if value.readonly else bytearray(value)
+
+        self._value = value
+        for name, value in zip(_ELEMENT_ATTRIBUTES[2:], attributes):
+            setattr(self, name, value)
+
+        for name, value in extra.items():
+            setattr(self, name, value)
+
+    def _extra_state(self) -> dict[str, Any]:
+        """Return any attributes set other than those in _ELEMENT_ATTRIBUTES."""
+        return self.__dict__.copy()
+
+    def __copy__(self) -> "DataElement":
+        """Return a shallow copy of the element that shares its value."""
+        cls = self.__class__
+        result = cls.__new__(cls)
+        state = zip(
+            _ELEMENT_ATTRIBUTES, (self.tag, self._value, *_get_attributes(self))
+        )
+        for name, value in (*state, *self._extra_state().items()):
+            setattr(result, name, value)
+
+        return result
+
     def __deepcopy__(self, memo: dict[int, Any]) -> "DataElement":
         """Implementation of copy.deepcopy()."""
         # Overridden to allow for a nice exception message for buffered elements
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        for k, v in self.__dict__.items():
-            if self.is_buffered and k == "_value":
+        state = zip(
+            _ELEMENT_ATTRIBUTES, (self.tag, self._value, *_get_attributes(self))
+        )
+        for k, v in (*state, *self._extra_state().items()):
+            if k == "_value" and isinstance(v, memoryview):
+                # Values read using dcmread(..., mmap=True) can't be copied
+                setattr(result, k, v.tobytes())
+            elif self.is_buffered and k == "_value":
                 try:
                     setattr(result, k, copy.deepcopy(v, memo))
                 except Exception as exc:
@@ -685,10 +821,13 @@ class DataElement:
                 return False
 
             # tag and VR match, now check the value
-            if config.have_numpy and isinstance(self.value, numpy.ndarray):
-                return len(self.value) == len(other.value) and numpy.allclose(
-                    self.value, other.value
-                )
+            if config.have_numpy and (
+                isinstance(self.value, numpy.ndarray)
+                or isinstance(other.value, numpy.ndarray)
+            ):
+                return numpy.shape(self.value) == numpy.shape(
+                    other.value
+                ) and numpy.allclose(self.value, other.value)
 
             if not self.is_buffered and not other.is_buffered:
                 return self.value == other.value
@@ -847,6 +986,38 @@ class RawDataElement(NamedTuple):
     is_raw: bool = True
     is_buffered: bool = False
 
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        """Return the information needed to pickle the element.
+
+        The element is kept in its raw form. Large bytes-like values are
+        pickled as :class:`pickle.PickleBuffer` so they can be transferred
+        out-of-band with protocol 5, in which case the unpickled value will be
+        a :class:`memoryview` of the transferred buffer.
+        """
+        value = _pickle_value(self.value, int(protocol))
+        if isinstance(value, PickleBuffer):
+            return _unpickle_raw_data_element, (*self[:3], value, *self[4:])
+
+        return RawDataElement, (*self[:3], value, *self[4:])
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "RawDataElement":
+        """Implementation of copy.deepcopy()."""
+        # Overridden as values read using dcmread(..., mmap=True) may be
+        #   memoryviews, which can't be copied
+        if isinstance(self.value, memoryview):
+            return self._replace(value=self.value.tobytes())
+
+        return self._replace(value=copy.deepcopy(self.value, memo))
+
+
+def _unpickle_raw_data_element(*args: Any) -> RawDataElement:
+    """Return a :class:`RawDataElement` with a value that was pickled as a
+    :class:`pickle.PickleBuffer`.
+    """
+    return RawDataElement(
+        *args[:3], _unpickle_value(args[3]), *args[4:]  # type: ignore[call-arg]
+    )
+
 
 def convert_raw_data_element(
     raw: RawDataElement,
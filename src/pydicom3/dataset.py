@@ -15,6 +15,8 @@ Dataset (dict subclass)
             contains its own DataElements, and so on in a recursive manner.
 """
 import copy
+import copyreg
+import hashlib
 import io
 import json
 import os
@@ -23,6 +25,7 @@ import re
 from bisect import bisect_left
 from collections.abc import (
     ValuesView,
+    Iterable,
     Iterator,
     Callable,
     MutableSequence,
@@ -30,6 +33,7 @@ from collections.abc import (
     Set,
 )
 from contextlib import nullcontext
+from functools import cached_property
 from importlib.util import find_spec as have_package
 from itertools import takewhile
 from types import TracebackType
@@ -39,8 +43,11 @@ from typing import (
     AnyStr,
     cast,
     BinaryIO,
+    NamedTuple,
+    SupportsIndex,
     TypeVar,
     overload,
+    TYPE_CHECKING,
 )
 
 try:
@@ -62,20 +69,44 @@ from pydicom3.datadict import (
     get_private_entry,
 )
 from pydicom3.dataelem import DataElement, convert_raw_data_element, RawDataElement
-from pydicom3.filebase import ReadableBuffer, WriteableBuffer
+from pydicom3.filebase import (
+    ReadableBuffer,
+    WriteableBuffer,
+    DicomBytesIO,
+    DicomInflateIO,
+    DicomMemoryViewIO,
+)
 from pydicom3.fileutil import path_from_pathlike, PathType
 from pydicom3.misc import warn_and_log
+from pydicom3.multival import MultiValue
 from pydicom3.pixels import compress, convert_color_space, decompress, pixel_array
 from pydicom3.pixels.utils import (
     reshape_pixel_array,
     get_image_pixel_ids,
     set_pixel_data,
 )
-from pydicom3.tag import Tag, BaseTag, tag_in_exception, TagType, TAG_PIXREP
+from pydicom3.tag import (
+    Tag,
+    BaseTag,
+    tag_in_exception,
+    TagType,
+    TagListType,
+    TAG_PIXREP,
+)
 from pydicom3.uid import PYDICOM_IMPLEMENTATION_UID, UID
-from pydicom3.valuerep import VR as VR_, AMBIGUOUS_VR
+from pydicom3.valuerep import (
+    VR as VR_,
+    AMBIGUOUS_VR,
+    BYTES_VR,
+    CUSTOMIZABLE_CHARSET_VR,
+    FLOAT_VR,
+    INT_VR,
+)
 from pydicom3.waveforms import numpy_handler as wave_handler
 
+if TYPE_CHECKING:  # pragma: no cover
+    from pydicom3.pool import ElementPool
+
 
 # FloatPixelData, DoubleFloatPixelData, PixelData
 PIXEL_KEYWORDS = {0x7FE00008, 0x7FE00009, 0x7FE00010}
@@ -102,6 +133,8 @@ class PrivateBlock:
         that the 2 low order hex digits of the element are always 0.
     """
 
+    __slots__ = ("group", "private_creator", "dataset", "block_start")
+
     def __init__(
         self, key: tuple[int, str], dataset: "Dataset", private_creator_element: int
     ) -> None:
@@ -231,17 +264,164 @@ def _dict_equal(a: "Dataset", b: Any, exclude: list[str] | None = None) -> bool:
     `exclude` is used in FileDataset__eq__ ds.__dict__ compare, which
     would also compare the wrapped _dict member (entire dataset) again.
     """
-    return (
-        len(a) == len(b)
-        and all(key in b for key in a.keys())
-        and all(
-            a[key] == b[key]
-            for key in a.keys()
-            if exclude is None or key not in exclude
-        )
+    if len(a) != len(b) or not all(key in b for key in a.keys()):
+        return False
+
+    comparison = _Comparison(a, b)
+    return all(
+        comparison.equal(key)
+        for key in a.keys()
+        if exclude is None or key not in exclude
     )
 
 
+# The VRs whose decoded values depend on the character set, including *UN*
+#   as it may be converted to a text VR
+_CHARSET_VRS = CUSTOMIZABLE_CHARSET_VR | {VR_.SQ, VR_.UN}
+
+
+class _Comparison:
+    """Compare the elements of two datasets, using the encoded values of raw
+    elements where possible so they don't need to be converted.
+    """
+
+    def __init__(self, a: "Dataset", b: "Dataset") -> None:
+        self.a = a
+        self.b = b
+
+    @cached_property
+    def same_character_set(self) -> bool:
+        """Return ``True`` if both datasets use the same character set."""
+        return self.a._character_set == self.b._character_set
+
+    def equal(self, tag: BaseTag) -> bool:
+        """Return ``True`` if the elements with `tag` are equal."""
+        return self.same(tag) or self.a[tag] == self.b[tag]
+
+    def same(self, tag: BaseTag) -> bool:
+        """Return ``True`` if the elements with `tag` are known to be equal
+        without converting them.
+        """
+        x = self.a._dict[tag]
+        y = self.b._dict[tag]
+        # Elements shared by copy-on-write copies are equal without
+        #   converting or copying them
+        if x is y:
+            return True
+
+        if not isinstance(x, RawDataElement) or not isinstance(y, RawDataElement):
+            return False
+
+        # Raw elements with the same encoding, an unambiguous VR and the same
+        #   encoded value convert to equal elements. Elements with different
+        #   encoded values may still be equal, such as when the padding
+        #   differs, so are left to be compared after conversion
+        if (
+            x.value is None
+            or x.VR != y.VR
+            or x.is_little_endian != y.is_little_endian
+            or x.is_implicit_VR != y.is_implicit_VR
+            or (vr := _element_VR(x)) is None
+            or x.value != y.value
+        ):
+            return False
+
+        return vr not in _CHARSET_VRS or self.same_character_set
+
+
+def _is_mutable(value: Any) -> bool:
+    """Return ``True`` if an element `value` may be changed in-place."""
+    if isinstance(value, MutableSequence | bytearray | io.BufferedIOBase):
+        return True
+
+    return config.have_numpy and isinstance(value, numpy.ndarray)
+
+
+# The VRs of raw little endian values that are hashed as-is by
+#   Dataset.fingerprint()
+_RAW_DIGEST_VRS = (BYTES_VR | AMBIGUOUS_VR | INT_VR | FLOAT_VR) - {
+    VR_.DS,
+    VR_.IS,
+    VR_.UN,
+}
+
+
+def _element_VR(elem: DataElement | RawDataElement) -> str | None:
+    """Return the VR of `elem`, using the DICOM dictionary for raw elements
+    read using implicit VR, or ``None`` if unknown or ambiguous.
+    """
+    if elem.VR is not None:
+        return elem.VR
+
+    try:
+        vr = dictionary_VR(elem.tag)
+    except KeyError:
+        return None
+
+    return None if " or " in vr else vr
+
+
+def _is_un_sequence(elem: DataElement | RawDataElement) -> bool:
+    """Return ``True`` if `elem` is a raw element read with a VR of **UN**
+    that the DICOM dictionary says is a sequence.
+    """
+    if not isinstance(elem, RawDataElement) or elem.VR != VR_.UN:
+        return False
+
+    return _element_VR(elem._replace(VR=None)) == VR_.SQ
+
+
+def _cow_value(value: Any) -> Any:
+    """Return a copy of an element `value` for a copy-on-write dataset.
+
+    Immutable values are returned as-is, mutable containers are copied and
+    the items of sequences are replaced by copy-on-write copies, so only the
+    accessed sequence is duplicated rather than all of its nested items.
+    """
+    if isinstance(value, pydicom3.Sequence):
+        seq = copy.copy(value)
+        seq._list = [
+            item.copy(cow=True) if isinstance(item, Dataset) else item
+            for item in value._list
+        ]
+        return seq
+
+    if isinstance(value, MultiValue):
+        multival = copy.copy(value)
+        multival._list = value._list.copy()
+        return multival
+
+    if isinstance(value, list | bytearray):
+        return value.copy()
+
+    if config.have_numpy and isinstance(value, numpy.ndarray):
+        return value.copy()
+
+    return value
+
+
+class ElementDifference(NamedTuple):
+    """A difference between two datasets yielded by :meth:`Dataset.diff`.
+
+    .. versionadded:: 3.1
+    """
+
+    path: tuple[int, ...]
+    """The element's tag path, which is the tag of each sequence element and
+    the index of the sequence item containing the element, followed by the
+    element's tag, such as ``(0x300A00B0, 0, 0x300A00C2)`` for the *Beam
+    Name* in the first item of the *Beam Sequence*.
+    """
+    left: DataElement | None
+    """The element in the dataset, or ``None`` if it's only in the other
+    dataset.
+    """
+    right: DataElement | None
+    """The element in the other dataset, or ``None`` if it's only in the
+    dataset.
+    """
+
+
 _DatasetValue = DataElement | RawDataElement
 _DatasetType: TypeAlias = "Dataset | MutableMapping[BaseTag, _DatasetValue]"
 
@@ -381,6 +561,13 @@ class Dataset:
 
     indent_chars = "   "
 
+    # The tags of the elements that may be shared with a copy-on-write copy
+    _cow: set[BaseTag] | None = None
+    # The cached element digests used by fingerprint()
+    _hashes: dict[BaseTag, tuple[Any, Any, str | None, Any, bytes]] | None = None
+    # The pool of shared values used when converting raw elements
+    _pool: "ElementPool | None" = None
+
     def __init__(self, *args: _DatasetType, **kwargs: Any) -> None:
         """Create a new :class:`Dataset` instance."""
         self._parent_encoding: str | list[str] = kwargs.get(
@@ -597,29 +784,326 @@ class Dataset:
         See DICOM Standard, Part 5,
         :dcm:`Section 6.1.1<part05/chapter_6.html#sect_6.1.1>`.
         """
-        # Find specific character set. 'ISO_IR 6' is default
-        # May be multi-valued, but let pydicom3.charset handle all logic on that
-        dicom_character_set = self._character_set
-
         # Shortcut to the decode function in pydicom3.charset
         decode_data_element = pydicom3.charset.decode_element
 
-        # Callback for walk(), to decode the chr strings if necessary
-        # This simply calls the pydicom3.charset.decode_element function
-        def decode_callback(ds: "Dataset", data_element: DataElement) -> None:
-            """Callback to decode `data_element`."""
-            if data_element.VR == VR_.SQ:
-                for dset in data_element.value:
-                    dset._parent_encoding = dicom_character_set
-                    dset.decode()
+        # The character set of each dataset. 'ISO_IR 6' is default
+        # May be multi-valued, but let pydicom3.charset handle all logic on that
+        character_sets = {id(self): self._character_set}
+        for ds, elem in self.traverse():
+            dicom_character_set = character_sets[id(ds)]
+            if elem.VR == VR_.SQ:
+                # Items inherit the character set of their parent dataset
+                for item in cast(list[Dataset], elem.value):
+                    item._parent_encoding = dicom_character_set
+                    character_sets[id(item)] = item._character_set
             else:
-                decode_data_element(data_element, dicom_character_set)
+                decode_data_element(cast(DataElement, elem), dicom_character_set)
+
+    def copy(self, *, cow: bool = False) -> "Dataset":
+        """Return a shallow copy of the dataset.
+
+        .. versionchanged:: 3.1
+
+            Added the `cow` keyword parameter.
+
+        Examples
+        --------
 
-        self.walk(decode_callback, recursive=False)
+        Create a copy-on-write copy of a dataset and change its
+        *Patient's Name* without changing the original:
 
-    def copy(self) -> "Dataset":
-        """Return a shallow copy of the dataset."""
-        return copy.copy(self)
+        >>> ds = dcmread(path)
+        >>> anon = ds.copy(cow=True)
+        >>> anon.PatientName = "Anonymous"
+        >>> ds.PatientName == anon.PatientName
+        False
+
+        Parameters
+        ----------
+        cow : bool, optional
+            If ``True`` then return a copy-on-write copy, which shares its
+            elements and sequences with this dataset until an element is
+            accessed through either dataset using ``Dataset[tag]``, a keyword
+            or iteration. Only the accessed element is then copied, and for
+            sequences only the sequence itself is copied, with each of its
+            items becoming a copy-on-write copy of the original item. This
+            makes it much faster than :func:`copy.deepcopy` when only a few
+            elements of a large dataset are changed, but any references to
+            elements, values or sequence items taken before the copy was made
+            are still shared. Elements returned by :meth:`get_item`,
+            :meth:`elements`, :meth:`items`, :meth:`values` and :meth:`pop`
+            are also copied, while unconverted
+            :class:`~pydicom3.dataelem.RawDataElement` elements can't be
+            modified and remain shared. If ``False`` (default) then return a
+            shallow copy made using :func:`copy.copy`.
+
+        Returns
+        -------
+        Dataset
+            The copy of the dataset.
+        """
+        if not cow:
+            return copy.copy(self)
+
+        cls = self.__class__
+        result = cls.__new__(cls)
+        state = self.__dict__.copy()
+        state["_dict"] = copy.copy(self._dict)
+        # Private blocks refer to their dataset and the pixel array may be
+        #   modified in-place, so they're not shared
+        state["_private_blocks"] = {}
+        state["_pixel_array"] = None
+        state["_pixel_array_opts"] = self._pixel_array_opts.copy()
+        state["_pixel_id"] = {}
+        if (file_meta := state.get("file_meta")) is not None:
+            state["file_meta"] = file_meta.copy(cow=True)
+
+        if self._hashes is not None:
+            state["_hashes"] = self._hashes.copy()
+
+        shared = set(self._dict)
+        state["_cow"] = shared
+        result.__dict__.update(state)
+        # The elements are also shared from this dataset's side
+        self._cow = shared.copy() if self._cow is None else self._cow | shared
+
+        return result
+
+    def diff(
+        self, other: "Dataset", *, recursive: bool = True
+    ) -> Iterator[ElementDifference]:
+        """Yield the differences between the dataset and `other`.
+
+        Elements are compared in tag order and each difference is yielded as
+        it's found. Unconverted :class:`~pydicom3.dataelem.RawDataElement`
+        elements with the same encoding and encoded value are equal without
+        being converted, so comparing a dataset against an unmodified copy
+        read from another file only converts the elements that differ. The
+        File Meta Information isn't compared.
+
+        .. versionadded:: 3.1
+
+        Examples
+        --------
+
+        >>> ds = dcmread("rtplan.dcm")
+        >>> other = dcmread("rtplan.dcm")
+        >>> other.BeamSequence[0].BeamName = "Field 2"
+        >>> for path, left, right in ds.diff(other):
+        ...     print(path, left.value, right.value)
+        ((300A,00B0), 0, (300A,00C2)) Field 1 Field 2
+
+        Parameters
+        ----------
+        other : pydicom3.dataset.Dataset
+            The dataset to compare against.
+        recursive : bool, optional
+            If ``True`` (default) then compare the items of sequences with
+            the same number of items and yield the differences between
+            their elements, otherwise yield the sequence element when any
+            of its items differ.
+
+        Yields
+        ------
+        ElementDifference
+            The tag path of the element, the element in the dataset and the
+            element in `other`, with ``None`` for an element that's only in
+            one of the datasets.
+        """
+        yield from self._diff(other, (), recursive)
+
+    def _diff(
+        self, other: "Dataset", path: tuple[int, ...], recursive: bool
+    ) -> Iterator[ElementDifference]:
+        """Yield the differences between the dataset and `other`, with each
+        tag path prefixed by `path`.
+        """
+        comparison = _Comparison(self, other)
+        for tag in sorted(self._dict.keys() | other._dict.keys(), key=int):
+            if tag not in other._dict:
+                yield ElementDifference((*path, tag), self[tag], None)
+                continue
+
+            if tag not in self._dict:
+                yield ElementDifference((*path, tag), None, other[tag])
+                continue
+
+            if comparison.same(tag):
+                continue
+
+            left, right = self[tag], other[tag]
+            if (
+                recursive
+                and left.VR == VR_.SQ
+                and right.VR == VR_.SQ
+                and len(left.value) == len(right.value)
+            ):
+                for idx, (a, b) in enumerate(zip(left.value, right.value)):
+                    yield from a._diff(b, (*path, tag, idx), recursive)
+            elif left != right:
+                yield ElementDifference((*path, tag), left, right)
+
+    def fingerprint(self, exclude: Iterable[int | str] | None = None) -> str:
+        """Return a hash of the dataset's content.
+
+        The hash is computed from the encoded value of each element, as it
+        would be written using little endian, along with its tag, and the
+        hashes of sequence items are combined with those of their parent
+        datasets. The values of unconverted little endian
+        :class:`~pydicom3.dataelem.RawDataElement` elements with a binary VR,
+        such as **OB** or **US**, are hashed as-is, while other raw elements
+        are converted first so the hash doesn't depend on whether an element
+        has been accessed. The File Meta Information isn't included.
+
+        The hashes of each element are cached and only computed again when
+        the element has been set or deleted, or when its value has changed
+        to a different object, so getting the fingerprint again after a small
+        change only encodes the changed elements. Multi-valued elements are
+        only encoded again when their values have changed, while elements
+        with other mutable values, such as a :class:`bytearray` or NumPy
+        :class:`~numpy.ndarray`, are always
+        encoded.
+
+        .. versionadded:: 3.1
+
+        Examples
+        --------
+
+        >>> ds = dcmread(path)
+        >>> ds.fingerprint() == dcmread(path).fingerprint()
+        True
+        >>> ds.fingerprint(exclude=["SOPInstanceUID"])
+        '7bf8b26ae6c03a6a8c3fdac4fd3b03ab'
+
+        Parameters
+        ----------
+        exclude : Iterable[int | str] | None, optional
+            The tags or keywords of elements to exclude from the hash, in the
+            dataset and any sequence items.
+
+        Returns
+        -------
+        str
+            The hash as a 32 character hex string.
+        """
+        tags = {Tag(tag) for tag in exclude} if exclude else set()
+        return self._fingerprint(tags).hex()
+
+    def _fingerprint(self, exclude: set[BaseTag]) -> bytes:
+        """Return the digest for :meth:`fingerprint` excluding the elements
+        with tags in `exclude`.
+        """
+        if self._hashes is None:
+            self._hashes = {}
+
+        hashes = self._hashes
+        digest = hashlib.blake2b(digest_size=16)
+        for tag in sorted(self._dict):
+            if tag in exclude:
+                continue
+
+            elem = self._dict[tag]
+            value: Any
+            if isinstance(elem, RawDataElement):
+                value = elem.value
+            else:
+                value = elem._value
+
+            # Multi-valued elements are only encoded again if their values
+            #   have changed
+            values = tuple(value) if isinstance(value, MultiValue) else None
+            cached = hashes.get(tag)
+            if (
+                cached is not None
+                and cached[0] is elem
+                and cached[1] is value
+                and cached[2] == elem.VR
+                and cached[3] == values
+            ):
+                elem_digest = cached[4]
+            else:
+                elem_digest = self._element_digest(elem, exclude)
+                if elem.is_raw or values is not None or not _is_mutable(value):
+                    hashes[tag] = (elem, value, elem.VR, values, elem_digest)
+
+            digest.update(tag.to_bytes(4, "little"))
+            digest.update(elem_digest)
+
+        return digest.digest()
+
+    def _element_digest(
+        self, elem: DataElement | RawDataElement, exclude: set[BaseTag]
+    ) -> bytes:
+        """Return the digest of the encoded value of `elem`."""
+        from pydicom3.filewriter import correct_ambiguous_vr_element
+        from pydicom3.filewriter import write_data_element
+
+        digest = hashlib.blake2b(digest_size=16)
+        if isinstance(elem, RawDataElement):
+            vr = elem.VR
+            if vr is None and not elem.tag.is_private:
+                try:
+                    vr = dictionary_VR(elem.tag)
+                except KeyError:
+                    pass
+
+            # Little endian binary values are hashed as-is, as they're encoded
+            #   the same as when written
+            if elem.is_little_endian and vr in _RAW_DIGEST_VRS:
+                if elem.value is None and elem.length != 0:
+                    from pydicom3.filereader import read_deferred_data_element
+
+                    elem = read_deferred_data_element(
+                        self.fileobj_type, self._deferred_source(), self.timestamp, elem
+                    )
+
+                value = elem.value or b""
+                digest.update(value)
+                if len(value) % 2:
+                    digest.update(b"\x00")
+
+                return digest.digest()
+
+            # Other elements are converted the same as when accessed, so any
+            #   padding of string values is removed, which also keeps the
+            #   converted sequence items and their cached digests
+            elem = self[elem.tag]
+
+        if elem.VR == VR_.SQ:
+            for item in cast(list[Dataset], elem.value):
+                digest.update(item._fingerprint(exclude))
+
+            return digest.digest()
+
+        value = elem.value
+        if elem.VR in AMBIGUOUS_VR and not isinstance(value, bytes | memoryview):
+            # The VR is corrected on a copy so the element is unchanged
+            try:
+                elem = cast(
+                    DataElement,
+                    correct_ambiguous_vr_element(copy.copy(elem), self, True),
+                )
+            except AttributeError:
+                pass
+
+        if isinstance(value, bytes | memoryview):
+            # Avoid copying large binary values, which are hashed without any
+            #   sequence delimiter as for raw elements
+            digest.update(value)
+            if len(value) % 2:
+                digest.update(b"\x00")
+
+            return digest.digest()
+
+        fp = DicomBytesIO()
+        fp.is_little_endian = True
+        fp.is_implicit_VR = True
+        write_data_element(fp, elem, self._character_set)
+        # Skip the tag and length
+        digest.update(fp.getvalue()[8:])
+
+        return digest.digest()
 
     def __delattr__(self, name: str) -> None:
         """Intercept requests to delete an attribute by `name`.
@@ -700,6 +1184,9 @@ class Dataset:
         if isinstance(key, slice):
             for tag in self._slice_dataset(key.start, key.stop, key.step):
                 del self._dict[tag]
+                if self._hashes:
+                    self._hashes.pop(tag, None)
+
                 # invalidate private blocks in case a private creator is
                 # deleted - will be re-created on next access
                 if self._private_blocks and BaseTag(tag).is_private_creator:
@@ -710,6 +1197,9 @@ class Dataset:
                     self._pixel_id = {}
         elif isinstance(key, BaseTag):
             del self._dict[key]
+            if self._hashes:
+                self._hashes.pop(key, None)
+
             if self._private_blocks and key.is_private_creator:
                 self._private_blocks = {}
 
@@ -721,6 +1211,9 @@ class Dataset:
             # If not a standard tag, than convert to Tag and try again
             tag = Tag(key)
             del self._dict[tag]
+            if self._hashes:
+                self._hashes.pop(tag, None)
+
             if self._private_blocks and tag.is_private_creator:
                 self._private_blocks = {}
 
@@ -860,6 +1353,7 @@ class Dataset:
             :class:`~pydicom3.dataelem.DataElement`) items for the
             :class:`Dataset`.
         """
+        self._unshare_all()
         return self._dict.items()
 
     def keys(self) -> Set[BaseTag]:
@@ -882,6 +1376,7 @@ class Dataset:
             The :class:`DataElements<pydicom3.dataelem.DataElement>` that make
             up the values of the :class:`Dataset`.
         """
+        self._unshare_all()
         return self._dict.values()
 
     def __getattr__(self, name: str) -> Any:
@@ -1053,16 +1548,8 @@ class Dataset:
             if elem.value is None and elem.length != 0:
                 from pydicom3.filereader import read_deferred_data_element
 
-                src = self.filename or self.buffer
-                if (
-                    self.filename
-                    and self.buffer
-                    and not getattr(self.buffer, "closed", False)
-                ):
-                    src = self.buffer
-
                 elem = read_deferred_data_element(
-                    self.fileobj_type, src, self.timestamp, elem
+                    self.fileobj_type, self._deferred_source(), self.timestamp, elem
                 )
 
             if tag != BaseTag(0x00080005):
@@ -1070,7 +1557,12 @@ class Dataset:
             else:
                 character_set = default_encoding
             # Not converted from raw form read from file yet; do so now
-            self[tag] = convert_raw_data_element(elem, encoding=character_set, ds=self)
+            if self._pool is not None:
+                self[tag] = self._pool.convert(elem, character_set, self)
+            else:
+                self[tag] = convert_raw_data_element(
+                    elem, encoding=character_set, ds=self
+                )
 
             # On initial read of the dataset, propagate the pixel representation
             #   (if any) to child datasets in any sequences.
@@ -1083,9 +1575,36 @@ class Dataset:
                 from pydicom3.filewriter import correct_ambiguous_vr_element
 
                 self[tag] = correct_ambiguous_vr_element(self[tag], self, elem[6])
+        elif self._cow is not None and tag in self._cow:
+            self._unshare(tag)
 
         return cast(DataElement, self._dict.get(tag))
 
+    def _unshare(self, tag: BaseTag) -> DataElement | RawDataElement:
+        """Return the element for `tag`, first copying it if it may be shared
+        with a copy-on-write copy.
+        """
+        elem = self._dict[tag]
+        if (
+            self._cow is not None
+            and tag in self._cow
+            and not isinstance(elem, RawDataElement)
+        ):
+            # Raw elements are immutable and can stay shared
+            self._cow.discard(tag)
+            elem = copy.copy(elem)
+            elem._value = _cow_value(elem._value)
+            self._dict[tag] = elem
+
+        return elem
+
+    def _unshare_all(self) -> None:
+        """Copy any elements that may be shared with a copy-on-write copy."""
+        if self._cow:
+            for tag in list(self._cow):
+                if tag in self._dict:
+                    self._unshare(tag)
+
     def private_block(
         self, group: int, private_creator: str, create: bool = False
     ) -> PrivateBlock:
@@ -1273,7 +1792,8 @@ class Dataset:
         if isinstance(key, slice):
             return self._dataset_slice(key)
 
-        elem = self._dict.get(Tag(key))
+        tag = Tag(key)
+        elem = self._dict.get(tag)
         # If a deferred read, return using __getitem__ to read and convert it
         if (
             isinstance(elem, RawDataElement)
@@ -1282,6 +1802,9 @@ class Dataset:
         ):
             return self[key]
 
+        if elem is not None and self._cow is not None and tag in self._cow:
+            elem = self._unshare(tag)
+
         return elem
 
     def _dataset_slice(self, slce: slice) -> "Dataset":
@@ -1585,6 +2108,9 @@ class Dataset:
         except Exception:
             pass
 
+        if self._cow is not None and key in self._cow and key in self._dict:
+            self._unshare(cast(BaseTag, key))
+
         return self._dict.pop(cast(BaseTag, key), *args)
 
     def popitem(self) -> tuple[BaseTag, _DatasetValue]:
@@ -1594,6 +2120,9 @@ class Dataset:
         -------
         tuple of (BaseTag, DataElement)
         """
+        if self._cow and self._dict:
+            self._unshare(next(reversed(self._dict)))
+
         return self._dict.popitem()
 
     def setdefault(self, key: TagType, default: Any | None = None) -> DataElement:
@@ -2535,14 +3064,11 @@ class Dataset:
 
     def remove_private_tags(self) -> None:
         """Remove all private elements from the :class:`Dataset`."""
-
-        def remove_callback(dataset: "Dataset", elem: DataElement) -> None:
-            """Internal method to use as callback to walk() method."""
+        # Deleted private sequences aren't descended into and other elements
+        #   don't need to be converted
+        for ds, elem in self.traverse(raw=True):
             if elem.tag.is_private:
-                # can't del self[tag] - won't be right dataset on recursion
-                del dataset[elem.tag]
-
-        self.walk(remove_callback)
+                del ds[elem.tag]
 
     def save_as(
         self,
@@ -2676,6 +3202,49 @@ class Dataset:
         if not hasattr(self, "file_meta"):
             self.file_meta = FileMetaDataset()
 
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        """Return the information needed to pickle the dataset.
+
+        .. versionadded:: 3.1
+
+        The elements are pickled as a list rather than as a :class:`dict` keyed
+        by tag, and each element is pickled using its own
+        :meth:`~pydicom3.dataelem.DataElement.__reduce_ex__`, so elements that
+        haven't been converted are pickled in their raw form and large
+        bytes-like values can be transferred out-of-band with protocol 5.
+
+        Examples
+        --------
+
+        Pickle a dataset without copying its pixel data into the pickle:
+
+        >>> buffers = []
+        >>> data = pickle.dumps(ds, protocol=5, buffer_callback=buffers.append)
+        >>> ds = pickle.loads(data, buffers=buffers)
+        """
+        return (
+            copyreg.__newobj__,  # type: ignore[attr-defined]
+            (type(self),),
+            self._pickle_state(),
+        )
+
+    def _pickle_state(self) -> dict[str, Any]:
+        """Return the state of the dataset to be pickled."""
+        state = self.__dict__.copy()
+        state["_dict"] = list(self._dict.values())
+        state.pop("_cow", None)
+        state.pop("_hashes", None)
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the pickled state."""
+        elements = state["_dict"]
+        if isinstance(elements, list):
+            state["_dict"] = {elem.tag: elem for elem in elements}
+
+        self.__dict__.update(state)
+
     def __setattr__(self, name: str, value: Any) -> None:
         """Intercept any attempts to set a value for an instance attribute.
 
@@ -2815,6 +3384,11 @@ class Dataset:
             self._pixel_id = {}
 
         self._dict[elem_tag] = elem
+        if self._cow is not None:
+            self._cow.discard(elem_tag)
+
+        if self._hashes:
+            self._hashes.pop(elem_tag, None)
 
         if elem.VR == VR_.SQ and isinstance(elem, DataElement):
             if not isinstance(elem.value, pydicom3.Sequence):
@@ -2924,7 +3498,17 @@ class Dataset:
         # Note that the value of `_pixel_rep` gets updated as we move
         #   down the tree - the value used to correct ambiguous
         #   elements will be from the closest dataset to that element
-        for item in elem.value:
+        from pydicom3.sequence import LazySequence
+
+        items = elem.value
+        if isinstance(items, LazySequence):
+            # Items that haven't been parsed yet are updated when they are
+            if hasattr(self, "_pixel_rep"):
+                items._pixel_rep = self._pixel_rep
+
+            items = [item for item in items._list if isinstance(item, Dataset)]
+
+        for item in items:
             if TAG_PIXREP in item._dict:
                 pr = item._dict[TAG_PIXREP].value
                 if pr is not None:
@@ -3037,11 +3621,139 @@ class Dataset:
         ------
         dataelem.DataElement
         """
-        for elem in self:
-            yield elem
-            if elem.VR == VR_.SQ:
-                for ds in elem.value:
-                    yield from ds.iterall()
+        for _, elem in self.traverse():
+            yield elem  # type: ignore[misc]
+
+    def traverse(
+        self,
+        *,
+        prune: Callable[["Dataset", DataElement | RawDataElement], bool] | None = None,
+        tags: Iterable[TagType] | None = None,
+        VRs: Iterable[str] | None = None,
+        recursive: bool = True,
+        raw: bool = False,
+    ) -> Iterator[tuple["Dataset", DataElement | RawDataElement]]:
+        """Iterate through the elements of the :class:`Dataset` and its
+        sequence items, without recursion.
+
+        Elements are yielded in order of increasing tag number within their
+        dataset, with the elements of each sequence item yielded after the
+        sequence element and before the next element in the parent dataset,
+        the same as :meth:`iterall`. The elements may be deleted or replaced
+        as they're yielded, and a sequence element's items are only used once
+        the element itself has been yielded.
+
+        .. versionadded:: 3.1
+
+        Examples
+        --------
+
+        Get the *Referenced SOP Instance UID* values in a segmentation
+        without converting or visiting the elements in the functional groups:
+
+        >>> uids = [
+        ...     elem.value
+        ...     for _, elem in ds.traverse(
+        ...         prune=lambda ds, elem: elem.tag == 0x52009230,
+        ...         tags=["ReferencedSOPInstanceUID"],
+        ...     )
+        ... ]
+
+        Parameters
+        ----------
+        prune : Callable[[Dataset, DataElement | RawDataElement], bool], optional
+            A callable that's called before each element is visited, with the
+            dataset containing the element and the element as it's stored in
+            the dataset, which may be an unconverted
+            :class:`~pydicom3.dataelem.RawDataElement`. If it returns ``True``
+            then the element is skipped, and if it's a sequence then none of
+            its items are visited.
+        tags : Iterable[int | str | tuple[int, int] | BaseTag], optional
+            If used then only yield the elements with these tags or keywords.
+            Sequences are still visited when their tag isn't included.
+        VRs : Iterable[str], optional
+            If used then only yield the elements with these VRs. Sequences
+            are still visited when ``"SQ"`` isn't included.
+        recursive : bool, optional
+            If ``True`` (default) then visit the elements in sequence items,
+            otherwise only visit the top-level elements.
+        raw : bool, optional
+            If ``True`` then yield the elements as they're stored in the
+            dataset, so :class:`~pydicom3.dataelem.RawDataElement` elements
+            aren't converted. The VR of raw elements read using implicit VR
+            is taken from the DICOM dictionary, and raw sequences, including
+            those read with a VR of **UN**, are still converted so their items
+            can be visited, but private sequences
+            read using implicit VR are only visited if they've been converted
+            after being yielded. If ``False`` (default)
+            then only the yielded elements and the sequences are converted.
+
+        Yields
+        ------
+        tuple[Dataset, DataElement | RawDataElement]
+            The dataset containing the element and the element.
+        """
+        tag_set = {Tag(tag) for tag in tags} if tags is not None else None
+        vr_set = set(VRs) if VRs is not None else None
+        filtered = tag_set is not None or vr_set is not None
+
+        # The datasets to visit and an iterator over their tags, which is
+        #   created once the dataset is visited
+        stack: list[tuple[Dataset, Iterator[BaseTag] | None]] = [(self, None)]
+        while stack:
+            ds, tag_iter = stack[-1]
+            if tag_iter is None:
+                tag_iter = iter(sorted(ds._dict, key=int))
+                stack[-1] = (ds, tag_iter)
+
+            for tag in tag_iter:
+                if (elem := ds._dict.get(tag)) is None:
+                    continue
+
+                if ds._cow is not None and tag in ds._cow:
+                    elem = ds._unshare(tag)
+
+                if prune is not None and prune(ds, elem):
+                    continue
+
+                if _is_un_sequence(elem):
+                    # May be converted to a sequence so its items can be visited
+                    elem = ds[tag]
+
+                if (vr := elem.VR) is None:
+                    vr = _element_VR(elem)
+
+                wanted = not filtered or (
+                    (tag_set is None or tag in tag_set)
+                    and (vr_set is None or vr is None or vr in vr_set)
+                )
+
+                if converted := not raw and (wanted or vr is None):
+                    elem = ds[tag]
+                    vr = elem.VR
+
+                if wanted and (vr_set is None or vr in vr_set):
+                    yield ds, elem
+
+                if not recursive:
+                    continue
+
+                # The element may have been deleted, replaced or converted
+                if (current := ds._dict.get(tag)) is None:
+                    continue
+
+                if current.VR == VR_.SQ or (
+                    current.VR is None and _element_VR(current) == VR_.SQ
+                ):
+                    if not converted or current is not elem:
+                        elem = ds[tag]
+
+                    items = cast(list[Dataset], elem.value)
+                    if items:
+                        stack.extend([(item, None) for item in items][::-1])
+                        break
+            else:
+                stack.pop()
 
     def walk(
         self, callback: Callable[["Dataset", DataElement], None], recursive: bool = True
@@ -3075,17 +3787,9 @@ class Dataset:
             Flag to indicate whether to recurse into sequences (default
             ``True``).
         """
-        taglist = sorted(self._dict.keys())
-        for tag in taglist:
-            with tag_in_exception(tag):
-                data_element = self[tag]
-                callback(self, data_element)  # self = this Dataset
-                # 'tag in self' below needed in case callback deleted
-                # data_element
-                if recursive and tag in self and data_element.VR == VR_.SQ:
-                    sequence = data_element.value
-                    for dataset in sequence:
-                        dataset.walk(callback)
+        for ds, elem in self.traverse(recursive=recursive, raw=True):
+            with tag_in_exception(elem.tag):
+                callback(ds, ds[elem.tag])
 
     @classmethod
     def from_json(
@@ -3436,6 +4140,165 @@ class FileDataset(Dataset):
         if self.filename and os.path.exists(self.filename):
             self.timestamp = os.stat(self.filename).st_mtime
 
+        # The memory-mapped file if read using dcmread(..., mmap=True)
+        self._mapping: DicomMemoryViewIO | None = None
+        # The file kept open by keep_open()
+        self._deferred_fp: BinaryIO | None = None
+
+    def close(self) -> None:
+        """Close any files held open by the dataset.
+
+        .. versionadded:: 3.1
+
+        If the dataset was read using ``dcmread(..., mmap=True)`` then any
+        element values that are views of the memory-mapped file are released
+        and the mapping closed. Any file kept open by :meth:`keep_open`, or
+        re-opened to inflate a deflated dataset, is also closed.
+        """
+        if (mapping := getattr(self, "_mapping", None)) is not None:
+            _release_views(self.file_meta)
+            _release_views(self)
+            mapping.close()
+            self._mapping = None
+
+        if (fp := getattr(self, "_deferred_fp", None)) is not None:
+            fp.close()
+            self._deferred_fp = None
+
+        if isinstance(buffer := getattr(self, "buffer", None), DicomInflateIO):
+            buffer.close()
+
+    def _deferred_source(self) -> PathType | BinaryIO | ReadableBuffer | None:
+        """Return the path or file-like to read the values of deferred
+        elements from.
+        """
+        if (fp := getattr(self, "_deferred_fp", None)) is not None:
+            return cast(BinaryIO, fp)
+
+        if self.filename and self.buffer and not getattr(self.buffer, "closed", False):
+            return self.buffer
+
+        return self.filename or self.buffer
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        """Method invoked on exit from a with statement, calls :meth:`close`."""
+        self.close()
+
+        # Returning anything other than True will re-raise any exceptions
+        return None
+
+    def keep_open(self) -> "FileDataset":
+        """Keep a handle to the file the dataset was read from open for
+        reading the values of deferred elements.
+
+        .. versionadded:: 3.1
+
+        By default the file is re-opened every time the value of a deferred
+        element is read. Keeping the file open until :meth:`close` is called
+        (or the ``with`` block is exited) avoids the cost of repeatedly
+        opening the file and checking its modification time, which is only
+        checked once, when the handle is opened.
+
+        Examples
+        --------
+
+        >>> with dcmread("path/to/file.dcm", defer_size=1024).keep_open() as ds:
+        ...     values = [elem.value for elem in ds]
+
+        Returns
+        -------
+        FileDataset
+            The dataset, for use in a ``with`` statement.
+
+        Raises
+        ------
+        OSError
+            If the dataset wasn't read from a file-like, or the file is
+            missing.
+        """
+        src = self._deferred_source()
+        if src is None:
+            raise OSError(
+                "Unable to keep the file open as the dataset wasn't read from a file"
+            )
+
+        if not isinstance(src, str):
+            # Already open, or read from a buffer-like that's still open
+            return self
+
+        if self.timestamp is not None:
+            if os.stat(src).st_mtime != self.timestamp:
+                warn_and_log(
+                    "Deferred read warning -- file modification time has changed"
+                )
+
+        self._deferred_fp = cast(BinaryIO, self.fileobj_type(src, "rb"))
+        return self
+
+    def load_deferred(self, tags: TagListType | None = None) -> None:
+        """Read the values of deferred elements into memory.
+
+        .. versionadded:: 3.1
+
+        The values are read in a single pass through the file in order of their
+        offset, so loading many deferred values this way is much faster than
+        accessing each element in turn. The values are kept in their raw form
+        until the elements are accessed.
+
+        Parameters
+        ----------
+        tags : list of (int or str or 2-tuple of int), optional
+            The tags or keywords of the deferred elements to load, if not
+            used (default) then the values of all the deferred elements in
+            the dataset will be loaded. Elements that aren't in the dataset or
+            have already been loaded are ignored.
+
+        Raises
+        ------
+        OSError
+            If the file the dataset was read from is missing.
+        ValueError
+            If the tag or VR of any of the deferred elements doesn't match the
+            element read from the file.
+        """
+        from pydicom3.filereader import read_deferred_data_elements
+
+        keys = self._dict.keys() if tags is None else [Tag(tag) for tag in tags]
+        deferred = [
+            elem
+            for tag in keys
+            if isinstance(elem := self._dict.get(tag), RawDataElement)
+            and elem.value is None
+            and elem.length != 0
+        ]
+        if not deferred:
+            return
+
+        elements = read_deferred_data_elements(
+            self.fileobj_type, self._deferred_source(), self.timestamp, deferred
+        )
+        for elem in elements:
+            self._dict[elem.tag] = elem
+
+    def _pickle_state(self) -> dict[str, Any]:
+        """Return the state of the file dataset to be pickled.
+
+        Open files and memory maps can't be pickled, so the unpickled dataset
+        reads any deferred values using the filename instead.
+        """
+        state = super()._pickle_state()
+        state["_deferred_fp"] = None
+        if self._mapping is not None:
+            state["_mapping"] = None
+            state["buffer"] = None
+
+        return state
+
     def __deepcopy__(self, memo: dict[int, Any]) -> "FileDataset":
         """Return a deep copy of the file dataset.
 
@@ -3450,7 +4313,10 @@ class FileDataset(Dataset):
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            if k == "buffer":
+            if k in ("_mapping", "buffer") and self._mapping is not None:
+                # Memory maps can't be copied, the copy uses the file instead
+                setattr(result, k, None)
+            elif k == "buffer":
                 try:
                     setattr(result, k, copy.deepcopy(v, memo))
                 except Exception as exc:
@@ -3461,12 +4327,47 @@ class FileDataset(Dataset):
                         "copied object"
                     )
                     setattr(result, k, copy.deepcopy(None, memo))
+            elif k in ("_cow", "_hashes"):
+                # The deep copy doesn't share any elements
+                continue
+            elif k == "_deferred_fp":
+                # Open files can't be copied, the copy uses the file instead
+                setattr(result, k, None)
             else:
                 setattr(result, k, copy.deepcopy(v, memo))
 
         return result
 
 
+def _release_views(ds: Dataset) -> None:
+    """Release any :class:`memoryview` element values in `ds`."""
+    from pydicom3.sequence import LazySequence
+
+    for elem in ds._dict.values():
+        value = elem.value if isinstance(elem, RawDataElement) else elem._value
+        if isinstance(value, memoryview):
+            _release_view(value)
+        elif not elem.is_raw and elem.VR == VR_.SQ and value:
+            if isinstance(value, LazySequence):
+                # Don't parse the items just to release them
+                if isinstance(value._buffer, memoryview):
+                    _release_view(value._buffer)
+
+                value = [item for item in value._list if isinstance(item, Dataset)]
+
+            for item in cast(list[Dataset], value):
+                _release_views(item)
+
+
+def _release_view(view: memoryview) -> None:
+    """Release `view` unless it's been exported."""
+    try:
+        view.release()
+    except BufferError:
+        # The view has been exported, i.e. used by an ndarray
+        pass
+
+
 def validate_file_meta(
     file_meta: "FileMetaDataset", enforce_standard: bool = True
 ) -> None:
@@ -45,7 +45,7 @@ def parse_basic_offsets(
     ----------
     :dcm:`DICOM Standard, Part 5, Annex A.4<part05/sect_A.4.html#table_A.4-1>`
     """
-    if isinstance(buffer, bytes | bytearray):
+    if isinstance(buffer, bytes | bytearray | memoryview):
         buffer = BytesIO(buffer)
 
     group, elem = unpack(f"{endianness}HH", buffer.read(4))
@@ -92,7 +92,7 @@ def parse_fragments(
         The number of fragments and the absolute offset position of the first
         byte of the item tag for each fragment in `buffer`.
     """
-    if isinstance(buffer, bytes | bytearray):
+    if isinstance(buffer, bytes | bytearray | memoryview):
         buffer = BytesIO(buffer)
 
     start_offset = buffer.tell()
@@ -161,7 +161,7 @@ def generate_fragments(
     bytes
         A pixel data fragment.
     """
-    if isinstance(buffer, bytes | bytearray):
+    if isinstance(buffer, bytes | bytearray | memoryview):
         buffer = BytesIO(buffer)
 
     while True:
@@ -241,7 +241,7 @@ def generate_fragmented_frames(
         An encapsulated pixel data frame, with the contents of the tuple the
         frame's fragmented encoded data.
     """
-    if isinstance(buffer, bytes | bytearray):
+    if isinstance(buffer, bytes | bytearray | memoryview):
         buffer = BytesIO(buffer)
 
     basic_offsets = parse_basic_offsets(buffer, endianness=endianness)
@@ -500,7 +500,7 @@ def get_frame(
     ----------
     DICOM Standard Part 5, :dcm:`Annex A <part05/chapter_A.html>`
     """
-    if isinstance(buffer, bytes | bytearray):
+    if isinstance(buffer, bytes | bytearray | memoryview):
         buffer = BytesIO(buffer)
 
     # `buffer` is positioned at the start of the basic offsets table
@@ -1,14 +1,21 @@
 # Copyright 2008-2020 pydicom3 authors. See LICENSE file for details.
 """Hold DicomFile class, which does basic I/O for a dicom file."""
 
-from io import BytesIO
+import asyncio
+import bisect
+from collections import OrderedDict
+from io import BytesIO, UnsupportedOperation
 import os
 from struct import Struct
+import sys
+import threading
 from types import TracebackType
-from typing import TYPE_CHECKING, cast, Any, TypeVar, Protocol
+from typing import TYPE_CHECKING, BinaryIO, cast, Any, TypeVar, Protocol
+import zlib
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Callable
+    from collections.abc import Callable, Coroutine
+    from mmap import mmap
 
 
 ExitException = tuple[
@@ -25,6 +32,30 @@ class ReadableBuffer(Protocol):
     def tell(self) -> int: ...  # pragma: no cover
 
 
+class AsyncReadableBuffer(Protocol):
+    async def read(self, size: int = ..., /) -> bytes: ...  # pragma: no cover
+
+    async def seek(
+        self, offset: int, whence: int = ..., /
+    ) -> int: ...  # pragma: no cover
+
+    async def tell(self) -> int: ...  # pragma: no cover
+
+
+class RangeSource(Protocol):
+    """A source of data that can only be read in byte ranges, such as an
+    object in an object store.
+
+    ``read_range(offset, length)`` returns `length` bytes starting at `offset`,
+    or fewer if the end of the data is reached. Sources may also have a
+    ``size`` attribute with the total length of the data in bytes.
+
+    .. versionadded:: 3.1
+    """
+
+    def read_range(self, offset: int, length: int, /) -> bytes: ...  # pragma: no cover
+
+
 class WriteableBuffer(Protocol):
     def seek(self, offset: int, whence: int = ..., /) -> int: ...  # pragma: no cover
 
@@ -305,3 +336,703 @@ class DicomBytesIO(DicomIO):
         super().__init__(buffer)
 
         self.getvalue = buffer.getvalue
+
+
+class _InflateBuffer:
+    """Read-only buffer that inflates a raw deflate stream on demand.
+
+    Only a small window of the inflated data is kept in memory. Seeking
+    forward inflates (and discards) data up to the new position and seeking
+    backward within the window is free. A copy of the decompressor state is
+    kept every `checkpoint` inflated bytes, so seeking backward past the
+    window restarts inflation from the nearest prior checkpoint rather than
+    from the start of the compressed stream.
+
+    If the source is a named file that has been closed by its owner (such as
+    by :func:`~pydicom3.filereader.dcmread`) then the file is re-opened when
+    inflation needs to restart, and closed again by :meth:`close`, after which
+    it's re-opened if more data is needed.
+    """
+
+    def __init__(
+        self,
+        buffer: ReadableBuffer,
+        chunk_size: int,
+        history: int,
+        checkpoint: int = 4 * 1024 * 1024,
+    ) -> None:
+        self._source = buffer
+        self._owns_source = False
+        # The offset to the start of the compressed data in `buffer`
+        self._start = buffer.tell()
+        self._chunk_size = chunk_size
+        self._history = history
+        self._checkpoint = checkpoint
+        # (inflated offset, source offset, decompressor) in increasing order
+        self._checkpoints: list[tuple[int, int, Any]] = []
+        self.name: str | None = getattr(buffer, "name", None)
+
+        self._reset()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state to be pickled, which excludes the decompressor."""
+        state = {
+            k: v
+            for k, v in self.__dict__.items()
+            if k not in ("_decompressor", "_window", "_checkpoints")
+        }
+        if self.name:
+            # File objects can't be pickled, re-open the file instead
+            state["_source"] = None
+            state["_owns_source"] = False
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the pickled state."""
+        self.__dict__.update(state)
+        self._checkpoints = []
+        # An empty window past any position forces inflation to restart
+        #   on the next read, so the file isn't re-opened until needed
+        self._window = bytearray()
+        self._window_start = sys.maxsize
+
+    def _reset(self, offset: int = 0) -> None:
+        """Restart inflation from the last checkpoint at or before `offset`."""
+        closed = self._source is None or getattr(self._source, "closed", False)
+        if closed and self.name:
+            # The original file has been closed by its owner (i.e. dcmread()),
+            #   re-open it so we can restart decompression
+            self._source = open(self.name, "rb")
+            self._owns_source = True
+
+        idx = bisect.bisect_right(self._checkpoints, offset, key=lambda x: x[0])
+        if idx:
+            start, source_offset, decompressor = self._checkpoints[idx - 1]
+            self._source.seek(source_offset)
+            # Copy so the checkpoint can be used again
+            self._decompressor = decompressor.copy()
+        else:
+            start = 0
+            self._source.seek(self._start)
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+
+        # The inflated data currently available and its offset
+        self._window = bytearray()
+        self._window_start = start
+        self._pos = start
+        self._eof = False
+
+    def _fill(self, end: int) -> None:
+        """Inflate data until the window reaches offset `end` or EOF."""
+        decompressor = self._decompressor
+        while not self._eof and self._window_start + len(self._window) < end:
+            if decompressor.eof:
+                # Any data following the end of the deflate stream is ignored
+                self._eof = True
+                break
+
+            if decompressor.unconsumed_tail:
+                data = decompressor.unconsumed_tail
+            else:
+                data = self._source.read(self._chunk_size)
+                if not data:
+                    self._eof = True
+                    self._window += decompressor.flush()
+                    break
+
+            self._window += decompressor.decompress(data, self._chunk_size)
+
+            end_offset = self._window_start + len(self._window)
+            last = self._checkpoints[-1][0] if self._checkpoints else 0
+            if self._checkpoint and end_offset - last >= self._checkpoint:
+                self._checkpoints.append(
+                    (end_offset, self._source.tell(), decompressor.copy())
+                )
+
+            # Discard data we no longer need to keep
+            excess = min(
+                self._pos - self._history - self._window_start, len(self._window)
+            )
+            if excess > 0:
+                del self._window[:excess]
+                self._window_start += excess
+
+    def close(self) -> None:
+        """Close the source buffer if it was opened by the inflater.
+
+        The file will be re-opened if any more data needs to be inflated.
+        """
+        if self._owns_source:
+            cast(BinaryIO, self._source).close()
+            # An empty window past any position forces inflation to restart
+            #   on the next read
+            self._window = bytearray()
+            self._window_start = sys.maxsize
+
+    def read(self, size: int = -1, /) -> bytes:
+        """Return up to `size` inflated bytes, or all remaining if `size` < 0"""
+        if self._pos < self._window_start:
+            pos = self._pos
+            self._reset(pos)
+            self._pos = pos
+
+        end = sys.maxsize if size is None or size < 0 else self._pos + size
+        self._fill(end)
+
+        offset = self._pos - self._window_start
+        data = bytes(self._window[offset : end - self._window_start])
+        self._pos += len(data)
+
+        return data
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET, /) -> int:
+        """Change the position in the inflated data and return it."""
+        if whence == os.SEEK_CUR:
+            offset += self._pos
+        elif whence == os.SEEK_END:
+            # Only used in the uncommon case of needing the total length
+            self.seek(0, os.SEEK_SET)
+            while self.read(self._chunk_size):
+                pass
+
+            offset += self._pos
+
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+
+        self._pos = offset
+        return offset
+
+    def tell(self) -> int:
+        """Return the current position in the inflated data."""
+        return self._pos
+
+
+class DicomInflateIO(DicomIO):
+    """Wrapper for reading the inflated data from a buffer containing a raw
+    deflate stream, such as the dataset encoded using *Deflated Explicit VR
+    Little Endian*.
+
+    The data is inflated as it's read rather than in a single pass, so that
+    only the part of the stream that is needed has to be held in memory.
+
+    If `buffer` is a file object with a ``name`` that gets closed while the
+    :class:`DicomInflateIO` is still in use (for example, by
+    :func:`~pydicom3.filereader.dcmread` after reading a dataset with deferred
+    elements) then the file will be re-opened by name when inflation needs to
+    restart. The re-opened file is closed by :meth:`close`, and re-opened
+    again if more data is read afterwards.
+
+    .. versionadded:: 3.1
+
+    See Also
+    --------
+    :class:`~pydicom3.filebase.DicomIO`
+    :class:`~pydicom3.filebase.DicomBytesIO`
+    """
+
+    def __init__(
+        self,
+        buffer: ReadableBuffer,
+        chunk_size: int = 64 * 1024,
+        history: int = 64 * 1024,
+        checkpoint: int = 4 * 1024 * 1024,
+    ) -> None:
+        """Create a new DicomInflateIO instance.
+
+        Parameters
+        ----------
+        buffer : buffer-like object
+            The buffer to read the deflated data from, positioned at the start
+            of the deflate stream.
+        chunk_size : int, optional
+            The number of compressed bytes to read from `buffer` at a time and
+            the maximum number of bytes to inflate at a time (default 64 KiB).
+        history : int, optional
+            The number of inflated bytes prior to the current position to
+            keep in memory (default 64 KiB). Seeking backwards further than
+            this requires the stream to be inflated again from the nearest
+            checkpoint.
+        checkpoint : int, optional
+            The number of inflated bytes between saved copies of the
+            decompressor state (default 4 MiB), or ``0`` to disable
+            checkpoints and always inflate again from the start of the stream.
+            Each checkpoint uses a few tens of KiB of memory.
+        """
+        super().__init__(_InflateBuffer(buffer, chunk_size, history, checkpoint))
+
+
+class _MemoryViewBuffer:
+    """Read-only buffer over a :class:`memoryview` of a bytes-like object."""
+
+    def __init__(
+        self, buffer: "bytes | bytearray | memoryview | mmap", name: str | None
+    ) -> None:
+        self._source = buffer
+        self._view = memoryview(buffer).cast("B")
+        self._pos = 0
+        self.name = name
+
+    @property
+    def closed(self) -> bool:
+        return self._view is None
+
+    def close(self) -> None:
+        if self._view is None:
+            return
+
+        self._view.release()
+        self._view = None  # type: ignore[assignment]
+        if hasattr(self._source, "close"):
+            try:
+                self._source.close()
+            except BufferError:
+                # Views of the mapping are still in use outside the dataset,
+                #   it'll be closed once they've all been garbage collected
+                pass
+
+    def read(self, size: int = -1, /) -> bytes:
+        return bytes(self.read_view(size))
+
+    def read_view(self, size: int = -1, /) -> memoryview:
+        start = self._pos
+        end = len(self._view) if size is None or size < 0 else start + size
+        view = self._view[start:end]
+        self._pos = start + len(view)
+        return view
+
+    def find(self, sub: bytes, /) -> int:
+        if not isinstance(self._source, memoryview):
+            # bytes, bytearray and mmap
+            return self._source.find(sub, self._pos)
+
+        # Search the view in blocks, overlapping in case of a match across
+        #   a block boundary
+        block_size = 4 * 1024 * 1024
+        for start in range(self._pos, len(self._view), block_size):
+            end = start + block_size + len(sub) - 1
+            if (index := bytes(self._view[start:end]).find(sub)) != -1:
+                return start + index
+
+        return -1
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET, /) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._pos
+        elif whence == os.SEEK_END:
+            offset += len(self._view)
+
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+
+        self._pos = offset
+        return offset
+
+    def tell(self) -> int:
+        return self._pos
+
+
+class DicomMemoryViewIO(DicomIO):
+    """Wrapper for reading from a bytes-like object, such as a memory-mapped
+    file, without copying the data.
+
+    In addition to the usual :class:`~pydicom3.filebase.DicomIO` methods,
+    :meth:`read_view` returns the requested data as a :class:`memoryview`
+    of the underlying object rather than as a copy.
+
+    .. versionadded:: 3.1
+
+    See Also
+    --------
+    :class:`~pydicom3.filebase.DicomIO`
+    :class:`~pydicom3.filebase.DicomBytesIO`
+    """
+
+    def __init__(
+        self,
+        buffer: "bytes | bytearray | memoryview | mmap",
+        name: str | None = None,
+    ) -> None:
+        """Create a new DicomMemoryViewIO instance.
+
+        Parameters
+        ----------
+        buffer : bytes | bytearray | memoryview | mmap.mmap
+            The object to read from. If it has a ``close()`` method, such as
+            :class:`mmap.mmap`, then it will be called when the
+            ``DicomMemoryViewIO`` is closed.
+        name : str, optional
+            The name of the file associated with `buffer` (if any).
+        """
+        view_buffer = _MemoryViewBuffer(buffer, name)
+        super().__init__(view_buffer)
+
+        self.read_view = view_buffer.read_view
+        self.find = view_buffer.find
+
+    @property
+    def closed(self) -> bool:
+        """Return ``True`` if the buffer has been closed, ``False`` otherwise."""
+        return cast(_MemoryViewBuffer, self._buffer).closed
+
+    def find(self, sub: bytes, /) -> int:
+        """Return the offset of the first `sub` at or after the current
+        position without changing the position, or ``-1`` if not found.
+        """
+        raise NotImplementedError()  # pragma: no cover
+
+    def read_view(self, size: int = -1, /) -> memoryview:
+        """Return a :class:`memoryview` of up to `size` bytes from the buffer.
+        If `size` is unspecified, all bytes until the end are returned.
+
+        The returned view is only valid until the ``DicomMemoryViewIO`` is
+        closed.
+        """
+        raise NotImplementedError()  # pragma: no cover
+
+
+class _RangeBuffer:
+    """Read-only buffer that reads from a :class:`RangeSource` in blocks.
+
+    Blocks are kept in a least recently used cache, and the blocks that are
+    missing for a read are fetched using a single range request, extended by
+    the read-ahead, so that many small reads from the same part of the data
+    only need one request. Reads larger than the cache bypass it.
+    """
+
+    def __init__(
+        self,
+        source: RangeSource,
+        size: int | None,
+        block_size: int,
+        cache_size: int,
+        read_ahead: int,
+    ) -> None:
+        if block_size < 1:
+            raise ValueError("'block_size' must be greater than 0")
+
+        self._source = source
+        self._size = getattr(source, "size", None) if size is None else size
+        self._block_size = block_size
+        # The maximum number of cached blocks and the number of blocks to
+        #   read ahead
+        self._max_blocks = max(cache_size // block_size, 1)
+        self._read_ahead = -(-read_ahead // block_size)
+        self._blocks: OrderedDict[int, bytes] = OrderedDict()
+        self._pos = 0
+
+    def close(self) -> None:
+        """Clear the cache and close the source (if possible)."""
+        self._blocks.clear()
+        if hasattr(self._source, "close"):
+            self._source.close()
+
+    def _fetch(self, first: int, last: int) -> dict[int, bytes]:
+        """Return the blocks `first` to `last`, inclusive, from the cache or
+        using a single range request for those not in the cache.
+        """
+        blocks = {}
+        missing = []
+        for index in range(first, last + 1):
+            if (block := self._blocks.get(index)) is not None:
+                self._blocks.move_to_end(index)
+                blocks[index] = block
+            else:
+                missing.append(index)
+
+        if not missing:
+            return blocks
+
+        # Coalesce the missing blocks and any read-ahead into one request
+        start, end = missing[0], missing[-1] + 1
+        if end == last + 1:
+            end += self._read_ahead
+            if self._size is not None:
+                end = max(min(end, -(-self._size // self._block_size)), last + 1)
+
+        block_size = self._block_size
+        data = self._source.read_range(start * block_size, (end - start) * block_size)
+        for index in range(start, end):
+            offset = (index - start) * block_size
+            block = data[offset : offset + block_size]
+            if not block:
+                break
+
+            if index in blocks:
+                continue
+
+            if index <= last:
+                blocks[index] = block
+
+            self._blocks[index] = block
+            self._blocks.move_to_end(index)
+            if len(block) < block_size:
+                # Reached the end of the data
+                self._size = index * block_size + len(block)
+                break
+
+        while len(self._blocks) > self._max_blocks:
+            self._blocks.popitem(last=False)
+
+        return blocks
+
+    def read(self, size: int = -1, /) -> bytes:
+        """Return up to `size` bytes, or all remaining if `size` < 0"""
+        start = self._pos
+        if size is None or size < 0:
+            if self._size is None:
+                # Read blocks until the end of the data is found
+                chunks = []
+                while chunk := self.read(self._block_size * self._max_blocks):
+                    chunks.append(chunk)
+
+                return b"".join(chunks)
+
+            size = self._size - start
+
+        end = start + size
+        if self._size is not None:
+            end = min(end, self._size)
+
+        if end <= start:
+            return b""
+
+        if end - start > self._block_size * self._max_blocks:
+            data = self._source.read_range(start, end - start)
+            self._pos += len(data)
+            return data
+
+        block_size = self._block_size
+        first, last = start // block_size, (end - 1) // block_size
+        blocks = self._fetch(first, last)
+        data = b"".join(blocks[idx] for idx in range(first, last + 1) if idx in blocks)
+        data = data[start - first * block_size : end - first * block_size]
+        self._pos += len(data)
+
+        return data
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET, /) -> int:
+        """Change the position in the data and return it."""
+        if whence == os.SEEK_CUR:
+            offset += self._pos
+        elif whence == os.SEEK_END:
+            if self._size is None:
+                raise UnsupportedOperation(
+                    "Unable to seek relative to the end of the range source as "
+                    "its size is unknown"
+                )
+
+            offset += self._size
+
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+
+        self._pos = offset
+        return offset
+
+    def tell(self) -> int:
+        """Return the current position in the data."""
+        return self._pos
+
+
+class DicomRangeIO(DicomIO):
+    """Wrapper for reading from a :class:`RangeSource`, such as an object in
+    an object store, as though it were a file-like.
+
+    Reads are made in blocks, which are kept in a cache with least recently
+    used eviction. The blocks missing from the cache for each read are fetched
+    using a single range request that's also extended by the read-ahead, so
+    parsing a dataset with :func:`~pydicom3.filereader.dcmread` typically
+    requires only a few range requests rather than one per element.
+
+    .. versionadded:: 3.1
+
+    Examples
+    --------
+
+    >>> from pydicom3 import dcmread
+    >>> from pydicom3.filebase import DicomRangeIO, LocalRangeSource
+    >>> with DicomRangeIO(LocalRangeSource("CT_small.dcm")) as fp:
+    ...     ds = dcmread(fp)
+
+    See Also
+    --------
+    :class:`~pydicom3.filebase.DicomIO`
+    :class:`~pydicom3.filebase.LocalRangeSource`
+    :class:`~pydicom3.filebase.CountingRangeSource`
+    """
+
+    def __init__(
+        self,
+        source: RangeSource,
+        size: int | None = None,
+        block_size: int = 64 * 1024,
+        cache_size: int = 4 * 1024 * 1024,
+        read_ahead: int = 192 * 1024,
+    ) -> None:
+        """Create a new DicomRangeIO instance.
+
+        Parameters
+        ----------
+        source : RangeSource
+            The source to read the data from. If it has a ``close()`` method
+            then it will be called when the ``DicomRangeIO`` is closed.
+        size : int, optional
+            The total length of the data in bytes, if not given then the
+            ``size`` attribute of `source` will be used (if available).
+            Seeking relative to the end of the data requires the size be
+            known.
+        block_size : int, optional
+            The size of the blocks the data is read and cached in, in bytes
+            (default 64 KiB).
+        cache_size : int, optional
+            The maximum number of bytes of blocks to keep in the cache
+            (default 4 MiB). Reads larger than this are made directly from
+            `source` without being cached.
+        read_ahead : int, optional
+            The number of bytes past the end of a read to also fetch when a
+            range request is needed (default 192 KiB), rounded up to a whole
+            number of blocks. Use ``0`` to only fetch the blocks needed.
+        """
+        super().__init__(_RangeBuffer(source, size, block_size, cache_size, read_ahead))
+
+
+class LocalRangeSource:
+    """A :class:`RangeSource` for a local file.
+
+    .. versionadded:: 3.1
+    """
+
+    def __init__(self, path: "str | os.PathLike[str]") -> None:
+        """Create a new LocalRangeSource instance.
+
+        Parameters
+        ----------
+        path : str | PathLike
+            The path to the file to read.
+        """
+        self.name = os.fspath(path)
+        self._fp = open(self.name, "rb", buffering=0)
+        self.size = os.fstat(self._fp.fileno()).st_size
+
+    def close(self) -> None:
+        """Close the file."""
+        self._fp.close()
+
+    def read_range(self, offset: int, length: int, /) -> bytes:
+        """Return up to `length` bytes from the file starting at `offset`."""
+        self._fp.seek(offset)
+        return self._fp.readall() if length < 0 else self._fp.read(length)
+
+
+class CountingRangeSource:
+    """A :class:`RangeSource` that records the requests made to another
+    source, for checking the number of range requests needed to read a
+    dataset.
+
+    .. versionadded:: 3.1
+
+    Examples
+    --------
+
+    >>> source = CountingRangeSource(LocalRangeSource("CT_small.dcm"))
+    >>> ds = dcmread(DicomRangeIO(source, read_ahead=0))
+    >>> source.count, source.nr_bytes
+    (1, 39206)
+    """
+
+    def __init__(self, source: RangeSource) -> None:
+        """Create a new CountingRangeSource instance.
+
+        Parameters
+        ----------
+        source : RangeSource
+            The source to read the data from.
+        """
+        self._source = source
+        self.requests: list[tuple[int, int]] = []
+        """The ``(offset, length)`` of each request, in order."""
+        self.nr_bytes = 0
+        """The total number of bytes returned by the requests."""
+
+    @property
+    def count(self) -> int:
+        """Return the number of requests."""
+        return len(self.requests)
+
+    @property
+    def size(self) -> int | None:
+        """Return the size of the source's data, or ``None`` if unknown."""
+        return getattr(self._source, "size", None)
+
+    def close(self) -> None:
+        """Close the source (if possible)."""
+        if hasattr(self._source, "close"):
+            self._source.close()
+
+    def read_range(self, offset: int, length: int, /) -> bytes:
+        """Return up to `length` bytes from the source starting at `offset`."""
+        self.requests.append((offset, length))
+        data = self._source.read_range(offset, length)
+        self.nr_bytes += len(data)
+
+        return data
+
+    def reset(self) -> None:
+        """Clear the recorded requests."""
+        self.requests.clear()
+        self.nr_bytes = 0
+
+
+class _AsyncBuffer:
+    """Read-only buffer that reads from an :class:`AsyncReadableBuffer` by
+    running its coroutines in an event loop in another thread.
+
+    Intended to be read from an executor while the event loop that owns the
+    buffer runs, so that the parsing happens in the executor and the loop only
+    awaits the I/O. Reading from the loop's own thread raises an exception as
+    it would otherwise deadlock.
+    """
+
+    def __init__(
+        self,
+        buffer: AsyncReadableBuffer,
+        loop: asyncio.AbstractEventLoop,
+        position: int,
+    ) -> None:
+        self._source = buffer
+        self._loop = loop
+        # The ID of the loop's thread
+        self._thread = threading.get_ident()
+        self._pos = position
+
+    @classmethod
+    async def from_buffer(cls, buffer: AsyncReadableBuffer) -> "_AsyncBuffer":
+        """Return a new ``_AsyncBuffer`` for `buffer` using the running event
+        loop.
+        """
+        return cls(buffer, asyncio.get_running_loop(), await buffer.tell())
+
+    def _run(self, coro: "Coroutine[Any, Any, Any]") -> Any:
+        """Return the result of `coro` after running it in the event loop."""
+        if threading.get_ident() == self._thread:
+            coro.close()
+            raise RuntimeError(
+                "An async buffer can't be read from the thread running its "
+                "event loop, use an executor instead"
+            )
+
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def read(self, size: int = -1, /) -> bytes:
+        data = cast(bytes, self._run(self._source.read(size)))
+        self._pos += len(data)
+        return data
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET, /) -> int:
+        self._pos = cast(int, self._run(self._source.seek(offset, whence)))
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
@@ -0,0 +1,313 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Persistent indexes of the locations of the elements in DICOM files."""
+
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
+import json
+import os
+import threading
+from typing import Any, NamedTuple, cast
+
+from pydicom3.dataelem import DataElement
+from pydicom3.fileutil import PathType
+from pydicom3.misc import warn_and_log
+from pydicom3.tag import BaseTag, Tag
+
+
+# The suffix appended to the path of a DICOM file to get its sidecar index
+SIDECAR_SUFFIX = ".dcmidx"
+# The maximum number of indexes kept in memory because their sidecar files
+#   couldn't be written, such as for files in a read-only directory
+_MAX_UNSAVED_INDEXES = 4096
+_UNSAVED_INDEXES: "OrderedDict[str, ElementIndex]" = OrderedDict()
+_UNSAVED_LOCK = threading.Lock()
+
+
+class IndexedElement(NamedTuple):
+    """The location of an encoded element within a DICOM file."""
+
+    offset: int
+    """The offset to the start of the element's tag."""
+    VR: str | None
+    """The element's VR, ``None`` for implicit VR."""
+    length: int
+    """The element's encoded value length, ``0xFFFFFFFF`` if undefined."""
+
+
+class ElementIndex:
+    """An index of the location of each top-level element in a DICOM file.
+
+    An index is built by reading the file once with every value deferred and
+    lets :func:`~pydicom3.filereader.dcmread` seek directly to the elements
+    in `specific_tags` rather than parse everything that comes before them.
+    Indexes are only valid while the size and modification time of the file
+    are the same as when it was indexed.
+
+    Examples
+    --------
+
+    >>> index = ElementIndex.from_file("CT_small.dcm")
+    >>> index[0x00100010]
+    IndexedElement(offset=922, VR='PN', length=22)
+
+    .. versionadded:: 3.1
+    """
+
+    def __init__(
+        self,
+        filename: PathType,
+        size: int,
+        mtime: float,
+        elements: dict[int, IndexedElement],
+    ) -> None:
+        """Create a new :class:`ElementIndex`.
+
+        Parameters
+        ----------
+        filename : str or PathLike
+            The path to the indexed file.
+        size : int
+            The size of the indexed file, as given by ``stat.st_size``.
+        mtime : float
+            The modification time of the indexed file, as given by
+            ``stat.st_mtime``.
+        elements : dict[int, IndexedElement]
+            The location of each top-level dataset element, keyed by tag.
+        """
+        self.filename = os.fsdecode(filename)
+        self.size = size
+        self.mtime = mtime
+        self._elements = {BaseTag(k): v for k, v in elements.items()}
+
+    def __contains__(self, tag: Any) -> bool:
+        """Return ``True`` if the element with `tag` has been indexed."""
+        try:
+            return Tag(tag) in self._elements
+        except Exception:
+            return False
+
+    def __eq__(self, other: Any) -> Any:
+        """Return ``True`` if `other` is an identical :class:`ElementIndex`."""
+        if not isinstance(other, ElementIndex):
+            return NotImplemented
+
+        return (
+            self.filename == other.filename
+            and self.size == other.size
+            and self.mtime == other.mtime
+            and self._elements == other._elements
+        )
+
+    @classmethod
+    def from_file(cls, filename: PathType, force: bool = False) -> "ElementIndex":
+        """Return a new :class:`ElementIndex` for the file at `filename`.
+
+        Parameters
+        ----------
+        filename : str or PathLike
+            The path to the DICOM file to be indexed.
+        force : bool, optional
+            See :func:`~pydicom3.filereader.dcmread` for parameter info.
+
+        Returns
+        -------
+        ElementIndex
+            The index for the file.
+        """
+        from pydicom3.filereader import data_element_offset_to_value, dcmread
+
+        filename = os.fspath(filename)
+        # Get the stat before reading so that an index is never newer
+        #   than the file it was built from
+        statinfo = os.stat(filename)
+        ds = dcmread(filename, defer_size=0, force=force)
+
+        elements: dict[int, IndexedElement] = {}
+        for tag, elem in ds._dict.items():
+            # Command Set elements are always read
+            if tag.group == 0x0000:
+                continue
+
+            if isinstance(elem, DataElement):
+                # Undefined length sequences
+                is_implicit_VR = cast(bool, ds.original_encoding[0])
+                length = 0xFFFFFFFF
+                value_tell = elem.file_tell
+            else:
+                is_implicit_VR = elem.is_implicit_VR
+                length = elem.length
+                value_tell = elem.value_tell
+
+            if value_tell is None:
+                continue
+
+            offset = value_tell - data_element_offset_to_value(is_implicit_VR, elem.VR)
+            elements[tag] = IndexedElement(
+                offset, None if is_implicit_VR else elem.VR, length
+            )
+
+        return cls(filename, statinfo.st_size, statinfo.st_mtime, elements)
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "ElementIndex":
+        """Return an :class:`ElementIndex` from its JSON representation.
+
+        Parameters
+        ----------
+        data : str | bytes
+            The index encoded as JSON by :meth:`to_json`.
+
+        Returns
+        -------
+        ElementIndex
+            The decoded index.
+        """
+        d = json.loads(data)
+        elements = {
+            int(tag, 16): IndexedElement(*location)
+            for tag, location in d["elements"].items()
+        }
+
+        return cls(d["filename"], d["size"], d["mtime"], elements)
+
+    def __getitem__(self, tag: Any) -> IndexedElement:
+        """Return the location of the element with `tag`."""
+        return self._elements[Tag(tag)]
+
+    def get(self, tag: Any, default: Any = None) -> IndexedElement | Any:
+        """Return the location of the element with `tag`, or `default` if it
+        hasn't been indexed.
+        """
+        return self._elements.get(Tag(tag), default)
+
+    def is_current(self) -> bool:
+        """Return ``True`` if the indexed file still has the same size and
+        modification time as when it was indexed, ``False`` otherwise.
+        """
+        try:
+            statinfo = os.stat(self.filename)
+        except OSError:
+            return False
+
+        return statinfo.st_size == self.size and statinfo.st_mtime == self.mtime
+
+    def __iter__(self) -> Iterator[BaseTag]:
+        """Yield the indexed tags in ascending order."""
+        yield from sorted(self._elements)
+
+    def __len__(self) -> int:
+        """Return the number of indexed elements."""
+        return len(self._elements)
+
+    @classmethod
+    def load(cls, filename: PathType) -> "ElementIndex":
+        """Return an :class:`ElementIndex` read from the JSON file at
+        `filename`.
+        """
+        with open(filename, "rb") as f:
+            return cls.from_json(f.read())
+
+    def __repr__(self) -> str:
+        """Return a string representation of the index."""
+        return f"<ElementIndex '{self.filename}', {len(self)} elements>"
+
+    def save(self, filename: PathType) -> None:
+        """Write the index as JSON to the file at `filename`."""
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(self.to_json())
+
+    def to_json(self) -> str:
+        """Return the index encoded as JSON."""
+        return json.dumps(
+            {
+                "filename": self.filename,
+                "size": self.size,
+                "mtime": self.mtime,
+                "elements": {
+                    f"{tag:08X}": list(location)
+                    for tag, location in sorted(self._elements.items())
+                },
+            }
+        )
+
+
+def get_element_index(
+    filename: PathType,
+    cache: MutableMapping[str, ElementIndex] | None = None,
+    force: bool = False,
+) -> ElementIndex:
+    """Return a current :class:`ElementIndex` for the file at `filename`.
+
+    If a current index has been stored then it's returned, otherwise the file
+    is indexed and the new index stored, replacing any index that has
+    been invalidated by a change in the size or modification time of the
+    file.
+
+    .. versionadded:: 3.1
+
+    Parameters
+    ----------
+    filename : str or PathLike
+        The path to the DICOM file.
+    cache : MutableMapping[str, ElementIndex], optional
+        If used then a mapping, such as a :class:`dict` or a :mod:`shelve`,
+        to store the index in using the absolute path to the file as the key.
+        If not used (default) then the index is stored as JSON in a sidecar
+        file alongside the DICOM file, with the same name as the file with
+        ``'.dcmidx'`` appended. Failure to write the sidecar is not an error,
+        instead a warning is issued once and the index kept in memory for the
+        rest of the process, up to a limit of the 4096 most recently used
+        indexes.
+    force : bool, optional
+        See :func:`~pydicom3.filereader.dcmread` for parameter info.
+
+    Returns
+    -------
+    ElementIndex
+        The index for the file.
+    """
+    path = os.path.abspath(os.fsdecode(filename))
+    sidecar = f"{path}{SIDECAR_SUFFIX}"
+
+    index: ElementIndex | None = None
+    if cache is not None:
+        index = cache.get(path)
+    else:
+        with _UNSAVED_LOCK:
+            if (index := _UNSAVED_INDEXES.get(path)) is not None:
+                _UNSAVED_INDEXES.move_to_end(path)
+
+        if index is None and os.path.exists(sidecar):
+            try:
+                index = ElementIndex.load(sidecar)
+            except (OSError, ValueError, KeyError, TypeError):
+                index = None
+
+    if index is not None and index.filename == path and index.is_current():
+        return index
+
+    index = ElementIndex.from_file(path, force=force)
+    if cache is not None:
+        cache[path] = index
+        return index
+
+    try:
+        index.save(sidecar)
+    except OSError as exc:
+        with _UNSAVED_LOCK:
+            is_new = path not in _UNSAVED_INDEXES
+            _UNSAVED_INDEXES[path] = index
+            _UNSAVED_INDEXES.move_to_end(path)
+            while len(_UNSAVED_INDEXES) > _MAX_UNSAVED_INDEXES:
+                _UNSAVED_INDEXES.popitem(last=False)
+
+        if is_new:
+            warn_and_log(
+                f"Unable to write the element index to '{sidecar}', it will be "
+                f"kept in memory instead: {exc}"
+            )
+    else:
+        with _UNSAVED_LOCK:
+            _UNSAVED_INDEXES.pop(path, None)
+
+    return index
@@ -0,0 +1,252 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Summarise DICOM files without reading them into a dataset."""
+
+import os
+from struct import Struct
+from typing import BinaryIO, NamedTuple, cast
+
+from pydicom3.filebase import DicomInflateIO, ReadableBuffer
+from pydicom3.filereader import ENCODED_VR, _skip_undefined_length_element
+from pydicom3.fileutil import PathType, path_from_pathlike
+from pydicom3.leanread import _EXTRA_LENGTH_VRS, _dataset_encoding, _read_preamble
+from pydicom3.tag import BaseTag
+from pydicom3.uid import UID
+
+
+# (0008,0016) SOP Class UID, (0008,0018) SOP Instance UID,
+#   (0028,0008) Number of Frames
+_DATASET_TAGS = {0x00080016, 0x00080018, 0x00280008}
+# (0002,0002) Media Storage SOP Class UID, (0002,0003) Media Storage SOP
+#   Instance UID, (0002,0010) Transfer Syntax UID
+_FILE_META_TAGS = {0x00020002, 0x00020003, 0x00020010}
+# (7FE0,0008) Float Pixel Data, (7FE0,0009) Double Float Pixel Data,
+#   (7FE0,0010) Pixel Data
+_PIXEL_TAGS = {0x7FE00008, 0x7FE00009, 0x7FE00010}
+
+
+class ProbeResult(NamedTuple):
+    """A summary of a DICOM file, as returned by :func:`probe`.
+
+    .. versionadded:: 3.1
+    """
+
+    has_preamble: bool
+    """``True`` if the file has the 128-byte preamble and ``'DICM'`` prefix."""
+    transfer_syntax_uid: UID | None
+    """The *Transfer Syntax UID* from the file meta, ``None`` if absent."""
+    sop_class_uid: UID | None
+    """The *SOP Class UID*, or the *Media Storage SOP Class UID* if the
+    dataset has none, ``None`` if both are absent.
+    """
+    sop_instance_uid: UID | None
+    """The *SOP Instance UID*, or the *Media Storage SOP Instance UID* if the
+    dataset has none, ``None`` if both are absent.
+    """
+    pixel_data_offset: int | None
+    """The offset to the start of the pixel data element's value, ``None`` if
+    there's no pixel data or the dataset is deflated.
+    """
+    pixel_data_length: int | None
+    """The length of the pixel data element's value in bytes, ``None`` if
+    there's no pixel data. For encapsulated pixel data this is the length of
+    the items up to but not including the *Sequence Delimiter Item*.
+    """
+    number_of_frames: int | None
+    """The *Number of Frames*, ``1`` if absent and there's pixel data,
+    ``None`` if there's no pixel data or the value can't be parsed.
+    """
+    is_encapsulated: bool
+    """``True`` if the pixel data is encapsulated."""
+
+
+def _decode_uid(value: bytes | None) -> UID | None:
+    """Return the encoded UID `value` as a :class:`~pydicom3.uid.UID`."""
+    if not value or not (value := value.strip(b"\x00 ")):
+        return None
+
+    return UID(value.decode("ascii", errors="replace"))
+
+
+def _read_file_meta(fp: BinaryIO) -> dict[int, bytes]:
+    """Return the values of the file meta elements in `_FILE_META_TAGS`,
+    leaving `fp` positioned at the end of the File Meta Information.
+    """
+    unpack_explicit = Struct("<HH2sH").unpack
+    unpack_implicit = Struct("<HHL").unpack
+    unpack_length = Struct("<L").unpack
+    values: dict[int, bytes] = {}
+    while len(bytes_read := fp.read(8)) == 8:
+        group, elem, vr, length = unpack_explicit(bytes_read)
+        if group != 0x0002:
+            fp.seek(-8, os.SEEK_CUR)
+            break
+
+        if vr in _EXTRA_LENGTH_VRS:
+            length = unpack_length(fp.read(4))[0]
+        elif vr not in ENCODED_VR:
+            # Non-conformant implicit VR file meta (issue #503)
+            group, elem, length = unpack_implicit(bytes_read)
+
+        if (tag := group << 16 | elem) in _FILE_META_TAGS:
+            values[tag] = fp.read(length)
+        else:
+            fp.seek(length, os.SEEK_CUR)
+    else:
+        fp.seek(-len(bytes_read), os.SEEK_CUR)
+
+    return values
+
+
+def _skip_command_set(fp: BinaryIO) -> None:
+    """Move `fp` past any implicit VR little endian Command Set elements."""
+    unpack = Struct("<HHL").unpack
+    while len(bytes_read := fp.read(8)) == 8:
+        group, _, length = unpack(bytes_read)
+        if group != 0x0000:
+            fp.seek(-8, os.SEEK_CUR)
+            return
+
+        fp.seek(length, os.SEEK_CUR)
+
+    fp.seek(-len(bytes_read), os.SEEK_CUR)
+
+
+def _encapsulated_length(fp: BinaryIO, endian_chr: str) -> int:
+    """Return the length of the encapsulated pixel data whose value starts at
+    the current position of `fp` by walking its items.
+    """
+    unpack = Struct(f"{endian_chr}HHL").unpack
+    start = fp.tell()
+    while len(bytes_read := fp.read(8)) == 8:
+        group, elem, length = unpack(bytes_read)
+        if (group, elem) == (0xFFFE, 0xE0DD):
+            return fp.tell() - 8 - start
+
+        fp.seek(length, os.SEEK_CUR)
+
+    # Missing Sequence Delimiter Item, use everything up to the end
+    return fp.seek(0, os.SEEK_END) - start
+
+
+def _probe(fp: BinaryIO, force: bool) -> ProbeResult:
+    """Return a :class:`ProbeResult` for the DICOM data starting at the
+    current position of `fp`.
+    """
+    has_preamble = _read_preamble(fp, force)
+    file_meta = _read_file_meta(fp)
+    _skip_command_set(fp)
+
+    tsyntax = _decode_uid(file_meta.get(0x00020010))
+    is_implicit_VR, is_little_endian, is_deflated = _dataset_encoding(fp, tsyntax)
+    if is_deflated:
+        fp = cast(BinaryIO, DicomInflateIO(fp))
+
+    endian_chr = "><"[is_little_endian]
+    unpack_implicit = Struct(f"{endian_chr}HHL").unpack
+    unpack_explicit = Struct(f"{endian_chr}HH2sH").unpack
+    unpack_length = Struct(f"{endian_chr}L").unpack
+
+    values: dict[int, bytes] = {}
+    offset = length = None
+    is_encapsulated = False
+    while len(bytes_read := fp.read(8)) == 8:
+        vr = None
+        if is_implicit_VR:
+            group, elem, length = unpack_implicit(bytes_read)
+        else:
+            group, elem, raw_vr, length = unpack_explicit(bytes_read)
+            if raw_vr in _EXTRA_LENGTH_VRS:
+                length = unpack_length(fp.read(4))[0]
+
+            vr = raw_vr.decode("ascii", errors="replace")
+
+        tag = group << 16 | elem
+        if tag in _PIXEL_TAGS:
+            offset = fp.tell()
+            is_encapsulated = length == 0xFFFFFFFF
+            if is_encapsulated:
+                length = _encapsulated_length(fp, endian_chr)
+
+            break
+
+        if tag > 0x7FE00010:
+            break
+
+        if length == 0xFFFFFFFF:
+            _skip_undefined_length_element(
+                fp, BaseTag(tag), vr, is_implicit_VR, is_little_endian
+            )
+        elif tag in _DATASET_TAGS:
+            values[tag] = fp.read(length)
+        else:
+            fp.seek(length, os.SEEK_CUR)
+
+    nr_frames = None
+    if 0x00280008 in values:
+        try:
+            nr_frames = int(values[0x00280008].strip(b"\x00 ").decode("ascii"))
+        except ValueError:
+            pass
+    elif offset is not None:
+        nr_frames = 1
+
+    return ProbeResult(
+        has_preamble=has_preamble,
+        transfer_syntax_uid=tsyntax,
+        sop_class_uid=_decode_uid(values.get(0x00080016, file_meta.get(0x00020002))),
+        sop_instance_uid=_decode_uid(values.get(0x00080018, file_meta.get(0x00020003))),
+        pixel_data_offset=None if is_deflated else offset,
+        pixel_data_length=None if offset is None else length,
+        number_of_frames=nr_frames,
+        is_encapsulated=is_encapsulated,
+    )
+
+
+def probe(fp: PathType | BinaryIO | ReadableBuffer, force: bool = False) -> ProbeResult:
+    """Return a summary of a DICOM file without reading it into a dataset.
+
+    Only the element headers are parsed and only the values needed for the
+    summary are read, with no :class:`~pydicom3.dataset.Dataset` or
+    :class:`~pydicom3.dataelem.DataElement` created and no value validation,
+    which makes :func:`probe` much faster than :func:`~pydicom3.dcmread` when
+    classifying large numbers of files. Parsing stops at the pixel data
+    element, whose value is skipped using its length or, if encapsulated, the
+    lengths of its items.
+
+    .. versionadded:: 3.1
+
+    Examples
+    --------
+
+    >>> result = probe("CT_small.dcm")
+    >>> result.transfer_syntax_uid.name
+    'Explicit VR Little Endian'
+    >>> result.pixel_data_offset, result.pixel_data_length
+    (6300, 32768)
+
+    Parameters
+    ----------
+    fp : str, PathLike, file-like or readable buffer
+        The path to the DICOM file, or a file-like positioned at the start of
+        the DICOM data.
+    force : bool, optional
+        If ``False`` (default) then raise an
+        :class:`~pydicom3.errors.InvalidDicomError` if the file has no preamble
+        and ``'DICM'`` prefix, otherwise summarise it anyway.
+
+    Returns
+    -------
+    ProbeResult
+        The summary of the file.
+
+    Raises
+    ------
+    InvalidDicomError
+        If `force` is ``False`` and the file has no preamble and prefix.
+    """
+    fp = path_from_pathlike(fp)
+    if isinstance(fp, str):
+        with open(fp, "rb") as f:
+            return _probe(f, force)
+
+    return _probe(cast(BinaryIO, fp), force)
@@ -1,13 +1,32 @@
 # Copyright 2008-2021 pydicom3 authors. See LICENSE file for details.
 """Read a dicom media file"""
 
-
-# Need zlib and io.BytesIO for deflate-compressed file
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from contextlib import contextmanager
+import functools
+import io
+import mmap as _mmap
 import os
 from struct import Struct, unpack
+import threading
 from typing import BinaryIO, Any, cast
-from collections.abc import Callable, MutableSequence, Iterator
-import zlib
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    MutableMapping,
+    MutableSequence,
+)
 
 from pydicom3 import config
 from pydicom3.charset import default_encoding, convert_encodings
@@ -21,15 +40,27 @@ from pydicom3.dataelem import (
 )
 from pydicom3.dataset import Dataset, FileDataset, FileMetaDataset
 from pydicom3.errors import InvalidDicomError
-from pydicom3.filebase import ReadableBuffer, DicomBytesIO
+from pydicom3.filebase import (
+    AsyncReadableBuffer,
+    ReadableBuffer,
+    DicomIO,
+    DicomInflateIO,
+    DicomMemoryViewIO,
+    _AsyncBuffer,
+    _InflateBuffer,
+    _RangeBuffer,
+    _MemoryViewBuffer,
+)
 from pydicom3.fileutil import (
     read_undefined_length_value,
     path_from_pathlike,
     PathType,
     _unpack_tag,
 )
+from pydicom3.fileindex import ElementIndex, get_element_index
 from pydicom3.misc import size_in_bytes, warn_and_log
-from pydicom3.sequence import Sequence
+from pydicom3.pool import ElementPool
+from pydicom3.sequence import Sequence, LazySequence
 from pydicom3.tag import (
     ItemTag,
     SequenceDelimiterTag,
@@ -39,10 +70,64 @@ from pydicom3.tag import (
 )
 import pydicom3.uid
 from pydicom3.util.hexutil import bytes2hex
-from pydicom3.valuerep import EXPLICIT_VR_LENGTH_32, VR as VR_
+from pydicom3.valuerep import EXPLICIT_VR_LENGTH_32, BUFFERABLE_VRS, VR as VR_
+
+
+# The encoded VRs and their decoded values, so each element with the same VR
+#   shares the same str rather than decoding a new one
+ENCODED_VR = {vr.encode(default_encoding): vr.value for vr in VR_}
+
+# The minimum length of a value for it to be returned as a memoryview rather
+#   than as bytes when reading from a DicomMemoryViewIO
+_MIN_VIEW_LENGTH = 1024
+# The size of the blocks read by _block_data_element_generator()
+_BLOCK_SIZE = 64 * 1024
+
 
+def _use_block_buffer(fp: BinaryIO) -> bool:
+    """Return ``True`` if :func:`data_element_generator` should read `fp` in
+    blocks rather than using a pair of reads for each element.
 
-ENCODED_VR = {vr.encode(default_encoding) for vr in VR_}
+    Memory-mapped files are excluded as their values may be returned as views.
+
+    Buffered and in-memory file-likes, such as :class:`io.BufferedReader`,
+    :class:`io.BytesIO` and range sources with their block cache, already
+    make small reads cheap, unlike raw, unbuffered or network-backed
+    file-likes where each read has a significant fixed cost.
+    """
+    if isinstance(fp, DicomIO):
+        fp = fp.parent
+
+    return not isinstance(
+        fp, io.BufferedIOBase | _MemoryViewBuffer | _InflateBuffer | _RangeBuffer
+    )
+
+
+def _is_viewable(tag: int, vr: str | None) -> bool:
+    """Return ``True`` if the value for the element with `tag` and `vr` can
+    be a :class:`memoryview`, ``False`` otherwise.
+    """
+    if vr in BUFFERABLE_VRS:
+        return True
+
+    if vr == VR_.SQ:
+        # Lazy sequences use a view of the encoded value rather than a copy
+        return config.settings.lazy_sequences
+
+    if vr is None or vr == VR_.UN:
+        # Implicit VR or UN, only use a view when the value will end up as
+        #   an OB, OW, etc, or a lazy sequence read using implicit VR
+        try:
+            dictionary_vr = _dictionary_vr_fast(tag)
+        except KeyError:
+            return False
+
+        if vr is None and dictionary_vr == VR_.SQ:
+            return config.settings.lazy_sequences
+
+        return dictionary_vr in BUFFERABLE_VRS
+
+    return False
 
 
 def data_element_generator(
@@ -108,6 +193,18 @@ def data_element_generator(
     #    data element
     from pydicom3.values import convert_string
 
+    if not config.debugging and _use_block_buffer(fp):
+        yield from _block_data_element_generator(
+            fp,
+            is_implicit_VR,
+            is_little_endian,
+            stop_when,
+            defer_size,
+            encoding,
+            specific_tags,
+        )
+        return
+
     endian_chr = "><"[is_little_endian]
 
     # assign implicit VR struct to variable as use later if VR assumed missing
@@ -123,6 +220,8 @@ def data_element_generator(
     fp_read = fp.read
     fp_seek = fp.seek
     fp_tell = fp.tell
+    # Only available when reading from a DicomMemoryViewIO
+    fp_read_view = getattr(fp, "read_view", None)
     logger_debug = logger.debug
     debugging = config.debugging
     defer_size = size_in_bytes(defer_size)
@@ -131,6 +230,9 @@ def data_element_generator(
     has_tag_set = bool(tag_set)
     if has_tag_set:
         tag_set.add(0x00080005)  # Specific Character Set
+    # Elements are in ascending tag order so there's no need to read past the
+    #   last of the specific tags
+    last_tag = max(tag_set, default=0xFFFFFFFF)
 
     while True:
         # VR: str | None
@@ -151,7 +253,7 @@ def data_element_generator(
             # issue 1067, issue 1035
 
             if vr in ENCODED_VR:  # try most likely solution first
-                vr = vr.decode(default_encoding)
+                vr = ENCODED_VR[vr]
                 if vr in EXPLICIT_VR_LENGTH_32:
                     bytes_read = fp_read(4)
                     length = extra_length_unpack(bytes_read)[0]
@@ -196,19 +298,21 @@ def data_element_generator(
             # If we hit this then we're at the end of the current dataset
             return
 
-        if stop_when is not None:
+        if tag > last_tag or (
             # XXX VR may be None here!! Should stop_when just take tag?
-            if stop_when(BaseTag(tag), vr, length):
-                if debugging:
-                    logger_debug(
-                        "Reading ended by stop_when callback. "
-                        "Rewinding to start of data element."
-                    )
-                rewind_length = 8
-                if not is_implicit_VR and vr in EXPLICIT_VR_LENGTH_32:
-                    rewind_length += 4
-                fp_seek(value_tell - rewind_length)
-                return
+            stop_when is not None
+            and stop_when(BaseTag(tag), vr, length)
+        ):
+            if debugging:
+                logger_debug(
+                    "Reading ended by stop_when callback or the last specific "
+                    "tag. Rewinding to start of data element."
+                )
+            rewind_length = 8
+            if not is_implicit_VR and vr in EXPLICIT_VR_LENGTH_32:
+                rewind_length += 4
+            fp_seek(value_tell - rewind_length)
+            return
 
         # Reading the value
         # First case (most common): reading a value with a defined length
@@ -232,6 +336,12 @@ def data_element_generator(
                         "Defer size exceeded. Skipping forward to next data element."
                     )
                 fp_seek(fp_tell() + length)
+            elif (
+                fp_read_view is not None
+                and length >= _MIN_VIEW_LENGTH
+                and _is_viewable(tag, vr)
+            ):
+                value = fp_read_view(length)
             else:
                 value = (
                     fp_read(length)
@@ -274,63 +384,326 @@ def data_element_generator(
         # unless is SQ type, in which case is easier to parse it, because
         # undefined length SQs and items of undefined lengths can be nested
         # and it would be error-prone to read to the correct outer delimiter
+        elif has_tag_set and tag not in tag_set:
+            # skip the element if not in specific tags
+            _skip_undefined_length_element(
+                fp, BaseTag(tag), vr, is_implicit_VR, is_little_endian
+            )
         else:
-            # VR UN with undefined length shall be handled as SQ
-            # see PS 3.5, section 6.2.2
-            if vr == VR_.UN and config.settings.infer_sq_for_un_vr:
-                vr = VR_.SQ
-            # Try to look up type to see if is a SQ
-            # if private tag, won't be able to look it up in dictionary,
-            #   in which case just ignore it and read the bytes unless it is
-            #   identified as a Sequence
-            if vr is None or vr == VR_.UN and config.replace_un_with_known_vr:
-                try:
-                    vr = _dictionary_vr_fast(tag)
-                except KeyError:
-                    # Look ahead to see if it consists of items
-                    # and is thus a SQ
-                    next_tag = _unpack_tag(fp_read(4), endian_chr)
-                    # Rewind the file
-                    fp_seek(fp_tell() - 4)
-                    if next_tag == ItemTag:
-                        vr = VR_.SQ
-
-            if vr == VR_.SQ:
-                if debugging:
-                    logger_debug(
-                        f"{fp_tell():08X}: Reading/parsing undefined length sequence"
-                    )
+            yield _read_undefined_length_element(
+                fp,
+                BaseTag(tag),
+                vr,
+                value_tell,
+                is_implicit_VR,
+                is_little_endian,
+                defer_size,
+                encoding,
+            )
 
-                seq = read_sequence(
-                    fp, is_implicit_VR, is_little_endian, length, encoding
-                )
-                if has_tag_set and tag not in tag_set:
-                    continue
 
-                yield DataElement(
-                    BaseTag(tag), vr, seq, value_tell, is_undefined_length=True
-                )
+def _block_data_element_generator(
+    fp: BinaryIO,
+    is_implicit_VR: bool,
+    is_little_endian: bool,
+    stop_when: Callable[[BaseTag, str | None, int], bool] | None = None,
+    defer_size: int | str | float | None = None,
+    encoding: str | MutableSequence[str] = default_encoding,
+    specific_tags: list[BaseTag | int] | None = None,
+) -> Iterator[RawDataElement | DataElement]:
+    """Return a generator that yields the same elements as
+    :func:`data_element_generator`, but reads `fp` in large blocks.
+
+    The element headers are decoded from the current block rather than with
+    a separate pair of reads for each element. The position of `fp` is only
+    guaranteed to be correct when an element is yielded or the generator
+    returns, and is used to resume reading.
+    """
+    from pydicom3.values import convert_string
+
+    endian_chr = "><"[is_little_endian]
+    implicit_VR_unpack_from = Struct(f"{endian_chr}HHL").unpack_from
+    if is_implicit_VR:
+        element_struct_unpack_from = implicit_VR_unpack_from
+    else:
+        element_struct_unpack_from = Struct(f"{endian_chr}HH2sH").unpack_from
+        extra_length_unpack_from = Struct(f"{endian_chr}L").unpack_from
+
+    fp_read = fp.read
+    fp_seek = fp.seek
+    fp_tell = fp.tell
+    defer_size = size_in_bytes(defer_size)
+
+    tag_set: set[int] = {tag for tag in specific_tags} if specific_tags else set()
+    has_tag_set = bool(tag_set)
+    if has_tag_set:
+        tag_set.add(0x00080005)  # Specific Character Set
+    # Elements are in ascending tag order so there's no need to read past the
+    #   last of the specific tags
+    last_tag = max(tag_set, default=0xFFFFFFFF)
+
+    # The current block and its offset in `fp`
+    buf = b""
+    buf_start = buf_length = 0
+    # The current position in `fp`
+    pos = fp_tell()
+    while True:
+        offset = pos - buf_start
+        # Refill if the block doesn't contain the longest possible header
+        if offset < 0 or offset + 12 > buf_length:
+            fp_seek(pos)
+            buf = fp_read(_BLOCK_SIZE)
+            buf_start, buf_length, offset = pos, len(buf), 0
+
+        if buf_length - offset < 8:
+            return  # at end of file
+
+        value_tell = pos + 8
+        if is_implicit_VR:
+            vr = None
+            group, elem, length = element_struct_unpack_from(buf, offset)
+        else:
+            group, elem, vr, length = element_struct_unpack_from(buf, offset)
+            if vr in ENCODED_VR:
+                vr = ENCODED_VR[vr]
+                if vr in EXPLICIT_VR_LENGTH_32:
+                    length = extra_length_unpack_from(buf, offset + 8)[0]
+                    value_tell += 4
+            elif not (b"AA" <= vr <= b"ZZ") and config.assume_implicit_vr_switch:
+                # invalid VR, must be 2 cap chrs, assume implicit and continue
+                vr = None
+                group, elem, length = implicit_VR_unpack_from(buf, offset)
             else:
-                if debugging:
-                    logger_debug("Reading undefined length data element")
+                # Either an unimplemented VR or implicit VR encoding
+                vr = vr.decode(default_encoding)
 
-                value = read_undefined_length_value(
-                    fp, is_little_endian, SequenceDelimiterTag, defer_size
-                )
+        tag = group << 16 | elem
+        if tag == 0xFFFEE00D:
+            # The item delimitation item of an undefined length dataset
+            fp_seek(value_tell)
+            return
 
-                # tags with undefined length are skipped after read
-                if has_tag_set and tag not in tag_set:
-                    continue
-
-                yield RawDataElement(
-                    BaseTag(tag),
-                    vr,
-                    length,
-                    value,
-                    value_tell,
-                    is_implicit_VR,
-                    is_little_endian,
+        if tag > last_tag or (
+            stop_when is not None and stop_when(BaseTag(tag), vr, length)
+        ):
+            # Rewind to the start of the element
+            fp_seek(pos)
+            return
+
+        if length == 0xFFFFFFFF:
+            fp_seek(value_tell)
+            if has_tag_set and tag not in tag_set:
+                _skip_undefined_length_element(
+                    fp, BaseTag(tag), vr, is_implicit_VR, is_little_endian
                 )
+                pos = fp_tell()
+                continue
+
+            raw = _read_undefined_length_element(
+                fp,
+                BaseTag(tag),
+                vr,
+                value_tell,
+                is_implicit_VR,
+                is_little_endian,
+                defer_size,
+                encoding,
+            )
+            yield raw
+
+            # The caller may have moved the file position
+            pos = fp_tell()
+            continue
+
+        pos = value_tell + length
+        if has_tag_set and tag not in tag_set:
+            continue
+
+        if defer_size is not None and length > defer_size and tag != 0x00080005:
+            value = None
+        elif length == 0:
+            value = cast(bytes | None, empty_value_for_VR(vr, raw=True))
+        elif (value_end := value_tell - buf_start + length) <= buf_length:
+            value = buf[value_end - length : value_end]
+        else:
+            # Values that don't fit in the block are read directly
+            fp_seek(value_tell)
+            value = fp_read(length)
+            pos = fp_tell()
+
+        if tag == 0x00080005:
+            # *Specific Character String* is b'' for empty value
+            encoding = convert_string(cast(bytes, value) or b"", is_little_endian)
+            encoding = convert_encodings(encoding)
+
+        fp_seek(pos)
+        yield RawDataElement(
+            BaseTag(tag),
+            vr,
+            length,
+            value,
+            value_tell,
+            is_implicit_VR,
+            is_little_endian,
+        )
+
+        # The caller may have moved the file position
+        pos = fp_tell()
+
+
+def _read_undefined_length_element(
+    fp: BinaryIO,
+    tag: BaseTag,
+    vr: str | None,
+    value_tell: int,
+    is_implicit_VR: bool,
+    is_little_endian: bool,
+    defer_size: int | float | None,
+    encoding: str | MutableSequence[str],
+) -> RawDataElement | DataElement:
+    """Return the undefined length element whose value starts at the current
+    position of `fp`, leaving `fp` positioned at the end of the element.
+
+    Used by :func:`data_element_generator`, returns a
+    :class:`~pydicom3.dataelem.DataElement` for a sequence and a
+    :class:`~pydicom3.dataelem.RawDataElement` otherwise.
+    """
+    vr = _undefined_length_vr(fp, tag, vr, is_little_endian)
+    if vr == VR_.SQ:
+        if config.debugging:
+            logger.debug(f"{fp.tell():08X}: Reading/parsing undefined length sequence")
+
+        seq = read_sequence(fp, is_implicit_VR, is_little_endian, 0xFFFFFFFF, encoding)
+        return DataElement(tag, vr, seq, value_tell, is_undefined_length=True)
+
+    if config.debugging:
+        logger.debug("Reading undefined length data element")
+
+    value = read_undefined_length_value(
+        fp, is_little_endian, SequenceDelimiterTag, defer_size
+    )
+    return RawDataElement(
+        tag,
+        vr,
+        0xFFFFFFFF,
+        value,
+        value_tell,
+        is_implicit_VR,
+        is_little_endian,
+    )
+
+
+def _undefined_length_vr(
+    fp: BinaryIO, tag: BaseTag, vr: str | None, is_little_endian: bool
+) -> str | None:
+    """Return the VR to use for the undefined length element with `tag` and
+    `vr` whose value starts at the current position of `fp`.
+    """
+    # VR UN with undefined length shall be handled as SQ
+    # see PS 3.5, section 6.2.2
+    if vr == VR_.UN and config.settings.infer_sq_for_un_vr:
+        vr = VR_.SQ
+    # Try to look up type to see if is a SQ
+    # if private tag, won't be able to look it up in dictionary,
+    #   in which case just ignore it and read the bytes unless it is
+    #   identified as a Sequence
+    if vr is None or vr == VR_.UN and config.replace_un_with_known_vr:
+        try:
+            vr = _dictionary_vr_fast(tag)
+        except KeyError:
+            # Look ahead to see if it consists of items
+            # and is thus a SQ
+            next_tag = _unpack_tag(fp.read(4), "><"[is_little_endian])
+            # Rewind the file
+            fp.seek(fp.tell() - 4)
+            if next_tag == ItemTag:
+                vr = VR_.SQ
+
+    return vr
+
+
+def _skip_undefined_length_element(
+    fp: BinaryIO,
+    tag: BaseTag,
+    vr: str | None,
+    is_implicit_VR: bool,
+    is_little_endian: bool,
+) -> None:
+    """Move `fp` from the start of the value of an undefined length element to
+    the end of the element without parsing or keeping the value.
+
+    Used by :func:`data_element_generator` for elements not in `specific_tags`.
+    Sequences are skipped using the lengths of their items, with only the
+    element headers of any undefined length items being read.
+    """
+    if _undefined_length_vr(fp, tag, vr, is_little_endian) != VR_.SQ:
+        read_undefined_length_value(
+            fp, is_little_endian, SequenceDelimiterTag, defer_size=0
+        )
+        return
+
+    tag_length_unpack = Struct("<HHL" if is_little_endian else ">HHL").unpack
+    while True:
+        item_start = fp.tell()
+        if len(bytes_read := fp.read(8)) < 8:
+            raise OSError(f"No tag to read at file position {item_start:X}")
+
+        group, elem, length = tag_length_unpack(bytes_read)
+        if (group, elem) == SequenceDelimiterTag:
+            return
+
+        if length != 0xFFFFFFFF:
+            fp.seek(length, os.SEEK_CUR)
+            continue
+
+        # Items may use implicit VR even if the dataset is explicit VR
+        item_is_implicit_VR = _is_implicit_vr(
+            fp, is_implicit_VR, is_little_endian, None, is_sequence=True
+        )
+        fp.seek(item_start + 8)
+        _skip_undefined_length_item(fp, item_is_implicit_VR, is_little_endian)
+
+
+def _skip_undefined_length_item(
+    fp: BinaryIO, is_implicit_VR: bool, is_little_endian: bool
+) -> None:
+    """Move `fp` from the start of an undefined length sequence item's dataset
+    to the end of its (FFFE,E00D) *Item Delimitation Item* by reading only the
+    header of each element.
+    """
+    endian_chr = "><"[is_little_endian]
+    implicit_VR_unpack = Struct(f"{endian_chr}HHL").unpack
+    explicit_VR_unpack = Struct(f"{endian_chr}HH2sH").unpack
+    extra_length_unpack = Struct(f"{endian_chr}L").unpack
+    while True:
+        if len(bytes_read := fp.read(8)) < 8:
+            raise OSError(f"No tag to read at file position {fp.tell():X}")
+
+        vr = None
+        if is_implicit_VR:
+            group, elem, length = implicit_VR_unpack(bytes_read)
+        else:
+            group, elem, vr, length = explicit_VR_unpack(bytes_read)
+            if vr in ENCODED_VR:
+                vr = ENCODED_VR[vr]
+                if vr in EXPLICIT_VR_LENGTH_32:
+                    length = extra_length_unpack(fp.read(4))[0]
+            elif not (b"AA" <= vr <= b"ZZ") and config.assume_implicit_vr_switch:
+                vr = None
+                group, elem, length = implicit_VR_unpack(bytes_read)
+            else:
+                vr = vr.decode(default_encoding)
+
+        tag = group << 16 | elem
+        if tag == 0xFFFEE00D:
+            return
+
+        if length == 0xFFFFFFFF:
+            _skip_undefined_length_element(
+                fp, BaseTag(tag), vr, is_implicit_VR, is_little_endian
+            )
+        else:
+            fp.seek(length, os.SEEK_CUR)
 
 
 def _is_implicit_vr(
@@ -506,6 +879,73 @@ def read_dataset(
     return ds
 
 
+def _read_indexed_dataset(
+    fp: BinaryIO,
+    is_implicit_VR: bool,
+    is_little_endian: bool,
+    element_index: ElementIndex,
+    specific_tags: list[BaseTag | int],
+    stop_when: Callable[[BaseTag, str | None, int], bool] | None = None,
+    defer_size: str | int | float | None = None,
+) -> Dataset:
+    """Return a :class:`~pydicom3.dataset.Dataset` containing the elements in
+    `specific_tags` read by seeking to their locations in `element_index`.
+
+    `fp` should be positioned at the start of the dataset, the parameters are
+    otherwise as for :func:`read_dataset`.
+    """
+    fp_start = fp.tell()
+    is_implicit_VR = _is_implicit_vr(
+        fp, is_implicit_VR, is_little_endian, stop_when, is_sequence=False
+    )
+    fp.seek(fp_start)
+
+    raw_data_elements: dict[BaseTag, RawDataElement | DataElement] = {}
+    encoding: str | MutableSequence[str] = default_encoding
+    # (0008,0005) *Specific Character Set* is always returned and is needed
+    #   first for decoding any undefined length sequences
+    for tag in sorted({Tag(t) for t in specific_tags} | {BaseTag(0x00080005)}):
+        location = element_index.get(tag)
+        if location is None:
+            continue
+
+        if stop_when is not None and stop_when(tag, location.VR, location.length):
+            break
+
+        fp.seek(location.offset)
+        elem = next(
+            data_element_generator(
+                fp,
+                is_implicit_VR,
+                is_little_endian,
+                defer_size=defer_size,
+                encoding=encoding,
+            ),
+            None,
+        )
+        if elem is None:
+            break
+
+        if elem.tag != tag:
+            raise ValueError(
+                f"Indexed read tag {elem.tag!r} does not match the "
+                f"requested tag {tag!r}, the index for '{element_index.filename}' "
+                "is out of date"
+            )
+
+        raw_data_elements[tag] = elem
+        if tag == 0x00080005:
+            char_set = cast(
+                str | MutableSequence[str] | None,
+                convert_raw_data_element(cast(RawDataElement, elem)).value,
+            )
+            encoding = convert_encodings(char_set)
+
+    ds = Dataset(raw_data_elements)
+    ds.set_original_encoding(is_implicit_VR, is_little_endian, encoding)
+    return ds
+
+
 def read_sequence(
     fp: BinaryIO,
     is_implicit_VR: bool,
@@ -516,7 +956,15 @@ def read_sequence(
 ) -> Sequence:
     """Read and return a :class:`~pydicom3.sequence.Sequence` -- i.e. a
     :class:`list` of :class:`Datasets<pydicom3.dataset.Dataset>`.
+
+    If :attr:`~pydicom3.config.Settings.lazy_sequences` is ``True`` then
+    a :class:`~pydicom3.sequence.LazySequence` is returned instead.
     """
+    if config.settings.lazy_sequences:
+        return _read_lazy_sequence(
+            fp, is_implicit_VR, is_little_endian, bytelength, encoding, offset
+        )
+
     seq = []  # use builtin list to start for speed, convert to Sequence at end
     is_undefined_length = False
     if bytelength != 0:  # SQ of length 0 possible (PS 3.5-2008 7.5.1a (p.40)
@@ -542,6 +990,73 @@ def read_sequence(
     return sequence
 
 
+def _read_lazy_sequence(
+    fp: BinaryIO,
+    is_implicit_VR: bool,
+    is_little_endian: bool,
+    bytelength: int,
+    encoding: str | MutableSequence[str],
+    offset: int = 0,
+) -> LazySequence:
+    """Return a :class:`~pydicom3.sequence.LazySequence` for the sequence
+    value at the current position of `fp`.
+
+    Only the tag and length of each item are read, with the exception of
+    undefined length items where the element headers are read to find their
+    end. If `fp` is memory-mapped or is the buffer of an enclosing
+    :class:`~pydicom3.sequence.LazySequence` then the sequence uses a view of
+    the encoded value rather than a copy.
+    """
+    items = []
+    is_undefined_length = bytelength == 0xFFFFFFFF
+    if is_undefined_length:
+        bytelength = 0
+
+    tag_length_unpack = Struct("<HHL" if is_little_endian else ">HHL").unpack
+    fp_tell = fp.tell
+    fp_start = fp_tell()
+    # SQ of length 0 possible (PS 3.5-2008 7.5.1a (p.40)
+    while (not bytelength and is_undefined_length) or (
+        fp_tell() - fp_start < bytelength
+    ):
+        item_start = fp_tell()
+        bytes_read = fp.read(8)
+        if len(bytes_read) < 8:
+            raise OSError(f"No tag to read at file position {item_start + offset:X}")
+
+        group, element, length = tag_length_unpack(bytes_read)
+        if (group, element) == SequenceDelimiterTag:
+            break
+
+        if length == 0xFFFFFFFF:
+            # Find the (FFFE,E00D) *Item Delimitation Item* using the element
+            #   headers, skipping over the values rather than reading them
+            item_is_implicit_VR = _is_implicit_vr(
+                fp, is_implicit_VR, is_little_endian, None, is_sequence=True
+            )
+            fp.seek(item_start + 8)
+            _skip_undefined_length_item(fp, item_is_implicit_VR, is_little_endian)
+        else:
+            fp.seek(length, os.SEEK_CUR)
+
+        items.append((item_start - fp_start, fp_tell() - item_start))
+
+    fp_end = fp_tell()
+    fp.seek(fp_start)
+    parent = fp.parent if isinstance(fp, DicomIO) else fp
+    buffer: bytes | memoryview
+    if isinstance(parent, _MemoryViewBuffer):
+        buffer = parent.read_view(fp_end - fp_start)
+    else:
+        buffer = fp.read(fp_end - fp_start)
+
+    seq = LazySequence(
+        buffer, items, is_implicit_VR, is_little_endian, encoding, fp_start + offset
+    )
+    seq.is_undefined_length = is_undefined_length
+    return seq
+
+
 def read_sequence_item(
     fp: BinaryIO,
     is_implicit_VR: bool,
@@ -804,6 +1319,7 @@ def read_partial(
     defer_size: int | str | float | None = None,
     force: bool = False,
     specific_tags: list[BaseTag | int] | None = None,
+    element_index: ElementIndex | None = None,
 ) -> FileDataset:
     """Parse a DICOM file until a condition is met.
 
@@ -819,6 +1335,12 @@ def read_partial(
         See :func:`dcmread` for parameter info.
     specific_tags : list or None
         See :func:`dcmread` for parameter info.
+    element_index : pydicom3.fileindex.ElementIndex, optional
+        If used with `specific_tags` then a current index for the file, which
+        will be used to seek directly to the requested elements rather than
+        parsing the dataset up to them.
+
+        .. versionadded:: 3.1
 
     Notes
     -----
@@ -897,15 +1419,10 @@ def read_partial(
         #     then "deflate" compression applied.
         #  All that is needed here is to decompress and then
         #     use as normal in a file-like object
-        zipped = fileobj.read()
-        name = getattr(fileobj, "name", None)
-
-        # -MAX_WBITS part is from comp.lang.python answer:
-        # groups.google.com/group/comp.lang.python/msg/e95b3b38a71e6799
-        unzipped = zlib.decompress(zipped, -zlib.MAX_WBITS)
-        buffer = DicomBytesIO(unzipped)
-        buffer.name = name
-        fileobj = cast(BinaryIO, buffer)  # a file-like object
+        # The data is inflated on demand so that stop_when, specific_tags
+        #   and defer_size avoid having to hold (or even inflate) the parts
+        #   of the dataset that aren't needed
+        fileobj = cast(BinaryIO, DicomInflateIO(fileobj))
         is_implicit_VR = False
     elif transfer_syntax in pydicom3.uid.PrivateTransferSyntaxes:
         # Replace with the registered UID as it has the encoding information
@@ -923,14 +1440,25 @@ def read_partial(
     #   By this point we should be at the start of the dataset and have
     #   the transfer syntax (whether read from the file meta or guessed at)
     try:
-        dataset = read_dataset(
-            fileobj,
-            is_implicit_VR,
-            is_little_endian,
-            stop_when=stop_when,
-            defer_size=defer_size,
-            specific_tags=specific_tags,
-        )
+        if element_index is not None and specific_tags:
+            dataset = _read_indexed_dataset(
+                fileobj,
+                is_implicit_VR,
+                is_little_endian,
+                element_index,
+                specific_tags,
+                stop_when=stop_when,
+                defer_size=defer_size,
+            )
+        else:
+            dataset = read_dataset(
+                fileobj,
+                is_implicit_VR,
+                is_little_endian,
+                stop_when=stop_when,
+                defer_size=defer_size,
+                specific_tags=specific_tags,
+            )
     except EOFError:
         if config.settings.reading_validation_mode == config.RAISE:
             raise
@@ -959,6 +1487,9 @@ def dcmread(
     stop_before_pixels: bool = False,
     force: bool = False,
     specific_tags: TagListType | None = None,
+    mmap: bool = False,
+    element_index: bool | MutableMapping[str, ElementIndex] = False,
+    pool: ElementPool | None = None,
 ) -> FileDataset:
     """Read and parse a DICOM dataset stored in the DICOM File Format.
 
@@ -986,6 +1517,24 @@ def dcmread(
     >>> with pydicom3.dcmread("rtplan.dcm") as ds:
     ...     ds.PatientName
 
+    Memory-map the file so that large binary values such as *Pixel Data*
+    aren't copied into memory:
+
+    >>> with pydicom3.dcmread("CT_small.dcm", mmap=True) as ds:
+    ...     arr = ds.pixel_array
+
+    Index the file so that later reads of specific elements can seek straight
+    to them:
+
+    >>> ds = pydicom3.dcmread(
+    ...     "CT_small.dcm", specific_tags=["PatientName"], element_index=True
+    ... )
+
+    Share the values that are the same across the datasets in a series:
+
+    >>> pool = ElementPool()
+    >>> series = [pydicom3.dcmread(path, pool=pool) for path in paths]
+
     Parameters
     ----------
     fp : str, PathLike, file-like or readable buffer
@@ -1012,7 +1561,42 @@ def dcmread(
         If used the only the supplied tags will be returned. The supplied
         elements can be tags or keywords. Note that the element (0008,0005)
         *Specific Character Set* is always returned if present - this ensures
-        correct decoding of returned text values.
+        correct decoding of returned text values. Reading stops once an
+        element with a tag larger than any of the supplied tags is reached,
+        and undefined length sequences that aren't required are skipped over
+        without being parsed.
+    mmap : bool, optional
+        If ``True`` then memory-map the file and return the values of large
+        elements with a VR of **OB**, **OD**, **OF**, **OL**, **OV**, **OW** or
+        **UN**, such as *Pixel Data*, as a :class:`memoryview` of the mapping
+        rather than as :class:`bytes`. The mapping is closed and the views
+        released on exit when the returned dataset is used as a context
+        manager, after which those values can no longer be used. Requires
+        that `fp` be a path or a file-like with a ``fileno()`` method, default
+        ``False``.
+
+        .. versionadded:: 3.1
+
+    element_index : bool or MutableMapping[str, ElementIndex], optional
+        If ``True`` or a mapping, and `specific_tags` is used, then use an
+        :class:`~pydicom3.fileindex.ElementIndex` of the location of each
+        element in the file to seek directly to the requested elements. The
+        file is indexed by reading it once with every value deferred, and
+        the index is stored either in a sidecar file alongside the DICOM file
+        (if ``True``) or in the supplied mapping (keyed by the absolute path
+        to the file) for use by later reads, and rebuilt whenever the size or
+        modification time of the file changes. Requires that `fp` be a path,
+        default ``False``. See
+        :func:`~pydicom3.fileindex.get_element_index` for more information.
+
+        .. versionadded:: 3.1
+
+    pool : pydicom3.pool.ElementPool, optional
+        If used then share the element values that are the same as those of
+        other datasets read using the same pool. See
+        :class:`~pydicom3.pool.ElementPool` for more information.
+
+        .. versionadded:: 3.1
 
     Returns
     -------
@@ -1025,7 +1609,9 @@ def dcmread(
     InvalidDicomError
         If `force` is ``False`` and the file is not a valid DICOM file.
     TypeError
-        If `fp` is ``None`` or of an unsupported type.
+        If `fp` is ``None`` or of an unsupported type, if `mmap` is ``True``
+        and `fp` can't be memory-mapped, or if `element_index` is used and
+        `fp` isn't a path.
 
     See Also
     --------
@@ -1037,6 +1623,20 @@ def dcmread(
     # Open file if not already a file object
     caller_owns_file = True
     fp = path_from_pathlike(fp)
+    index = None
+    if element_index is not False and specific_tags:
+        if not isinstance(fp, str):
+            raise TypeError(
+                "dcmread: 'element_index' requires a file path, but got "
+                f"{type(fp).__name__}"
+            )
+
+        index = get_element_index(
+            fp,
+            cache=None if element_index is True else element_index,
+            force=force,
+        )
+
     if isinstance(fp, str):
         # caller provided a file name; we own the file handle
         caller_owns_file = False
@@ -1076,21 +1676,283 @@ def dcmread(
     stop_when = None
     if stop_before_pixels:
         stop_when = _at_pixel_data
+    mapped = None
     try:
+        if mmap:
+            mapped = _memory_map(fp)
+
         dataset = read_partial(
-            fp,
+            cast(BinaryIO, mapped) if mapped is not None else fp,
             stop_when,
             defer_size=size_in_bytes(defer_size),
             force=force,
             specific_tags=specific_tags,
+            element_index=index,
         )
+    except Exception:
+        if mapped is not None:
+            mapped.close()
+
+        raise
     finally:
         if not caller_owns_file:
             fp.close()
+
+    if mapped is not None:
+        # Deferred reads use the mapping until it's closed, then the file
+        dataset.fileobj_type = open
+        dataset._mapping = mapped
+
+    if pool is not None:
+        pool.add(dataset)
+
     # XXX need to store transfer syntax etc.
     return dataset
 
 
+def _read_header(
+    path: PathType, kwargs: dict[str, Any]
+) -> tuple[FileDataset | None, Exception | None]:
+    """Return the result of ``dcmread(path, **kwargs)`` and any exception
+    raised when reading.
+    """
+    try:
+        return dcmread(path, **kwargs), None
+    except Exception as exc:
+        return None, exc
+
+
+def read_headers(
+    paths: Iterable[PathType],
+    workers: int | None = None,
+    stop_before_pixels: bool = True,
+    specific_tags: TagListType | None = None,
+    *,
+    defer_size: str | int | float | None = None,
+    force: bool = False,
+    ordered: bool = True,
+    use_processes: bool = False,
+    errors: MutableMapping[PathType, Exception] | None = None,
+) -> Iterator[FileDataset]:
+    """Concurrently read many DICOM files, yielding their datasets.
+
+    .. versionadded:: 3.1
+
+    Files are read with :func:`dcmread` using a pool of threads, or of
+    processes if `use_processes` is ``True``. By default only the part of each
+    file before the *Pixel Data* is read. Files that can't be read don't stop
+    the remaining files from being read and yielded, instead the exception is
+    added to `errors` (if used) or a warning issued.
+
+    Examples
+    --------
+
+    Read the headers of the files in a directory using 16 threads::
+
+        from pathlib import Path
+
+        from pydicom3 import read_headers
+
+        errors = {}
+        paths = Path("path/to/files").glob("**/*.dcm")
+        for ds in read_headers(paths, workers=16, errors=errors):
+            print(ds.filename, ds.PatientID)
+
+        for path, exc in errors.items():
+            print(f"Failed to read {path}: {exc}")
+
+    Parameters
+    ----------
+    paths : Iterable[str | PathLike]
+        The paths to the files to read, consumed as needed so that there are
+        never more than a few pending reads per worker.
+    workers : int, optional
+        The maximum number of threads or processes to use, defaults to the
+        :class:`~concurrent.futures.ThreadPoolExecutor` or
+        :class:`~concurrent.futures.ProcessPoolExecutor` default.
+    stop_before_pixels : bool, optional
+        If ``True`` (default) then stop reading each file before the (7FE0,0010)
+        *Pixel Data* element. See :func:`dcmread` for parameter info.
+    specific_tags : list of (int or str or 2-tuple of int), optional
+        See :func:`dcmread` for parameter info.
+    defer_size : int, str or float, optional
+        See :func:`dcmread` for parameter info.
+    force : bool, optional
+        See :func:`dcmread` for parameter info.
+    ordered : bool, optional
+        If ``True`` (default) then yield the datasets in the same order as
+        `paths`, otherwise yield them in the order that the reads complete.
+    use_processes : bool, optional
+        If ``True`` then use a pool of processes rather than threads, which
+        avoids contention for the GIL when parsing is the bottleneck, but at
+        the cost of pickling each dataset. Default ``False``.
+    errors : MutableMapping[str | PathLike, Exception], optional
+        If used then a mapping, such as a :class:`dict`, that the exception
+        raised when reading a file will be added to, using the path as the
+        key. If not used (default) then a warning will be issued for each
+        file that couldn't be read.
+
+    Yields
+    ------
+    FileDataset
+        The datasets of the files that were read successfully.
+    """
+    kwargs = {
+        "defer_size": defer_size,
+        "stop_before_pixels": stop_before_pixels,
+        "force": force,
+        "specific_tags": [Tag(t) for t in specific_tags] if specific_tags else None,
+    }
+
+    def _result(
+        path: PathType,
+        future: "Future[tuple[FileDataset | None, Exception | None]]",
+    ) -> FileDataset | None:
+        ds, exc = future.result()
+        if exc is not None:
+            if errors is not None:
+                errors[path] = exc
+            else:
+                warn_and_log(f"Unable to read the file at '{os.fsdecode(path)}': {exc}")
+
+        return ds
+
+    executor: Executor
+    if use_processes:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+    # Limit the number of pending reads so that `paths` is consumed lazily
+    max_pending = 4 * (workers or os.cpu_count() or 1)
+    paths = iter(paths)
+    pending: dict[Future, PathType] = {}
+    try:
+        for path in paths:
+            pending[executor.submit(_read_header, path, kwargs)] = path
+            if len(pending) < max_pending:
+                continue
+
+            if ordered:
+                # dicts are insertion ordered
+                done = {next(iter(pending))}
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                if (ds := _result(pending.pop(future), future)) is not None:
+                    yield ds
+
+        futures = list(pending) if ordered else as_completed(pending)
+        for future in futures:
+            if (ds := _result(pending.pop(future), future)) is not None:
+                yield ds
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def async_dcmread(
+    fp: AsyncReadableBuffer,
+    defer_size: str | int | float | None = None,
+    stop_before_pixels: bool = False,
+    force: bool = False,
+    specific_tags: TagListType | None = None,
+    *,
+    executor: Executor | None = None,
+) -> FileDataset:
+    """Read and parse a DICOM dataset from an asynchronous file-like without
+    blocking the event loop.
+
+    .. versionadded:: 3.1
+
+    The dataset is parsed by :func:`dcmread` running in `executor`, with each
+    read, seek and tell of `fp` awaited in the running event loop. Because
+    the parser reads in large blocks (see :func:`data_element_generator`) the
+    dataset is read incrementally, with the loop free to run other tasks
+    between reads.
+
+    Examples
+    --------
+
+    Read a dataset from a file opened using `aiofiles
+    <https://pypi.org/project/aiofiles/>`_::
+
+        import aiofiles
+
+        from pydicom3 import async_dcmread
+
+        async with aiofiles.open("path/to/file.dcm", "rb") as f:
+            ds = await async_dcmread(f, stop_before_pixels=True)
+
+    Parameters
+    ----------
+    fp : async file-like
+        An object with ``async`` ``read()``, ``seek()`` and ``tell()``
+        methods with the same signatures as those of
+        :class:`io.BufferedReader`, positioned at the start of the dataset.
+    defer_size : int, str or float, optional
+        See :func:`dcmread` for parameter info. The values of any deferred
+        elements are read from `fp` when accessed, which must happen from a
+        thread other than the event loop's while the loop is running.
+    stop_before_pixels : bool, optional
+        See :func:`dcmread` for parameter info.
+    force : bool, optional
+        See :func:`dcmread` for parameter info.
+    specific_tags : list of (int or str or 2-tuple of int), optional
+        See :func:`dcmread` for parameter info.
+    executor : concurrent.futures.Executor, optional
+        The thread-based executor to parse the dataset in, defaults to the
+        event loop's default executor.
+
+    Returns
+    -------
+    FileDataset
+        The dataset read from `fp`.
+
+    Raises
+    ------
+    TypeError
+        If `executor` is a :class:`~concurrent.futures.ProcessPoolExecutor`.
+    """
+    if isinstance(executor, ProcessPoolExecutor):
+        raise TypeError("async_dcmread: 'executor' must use threads, not processes")
+
+    buffer = await _AsyncBuffer.from_buffer(fp)
+    func = functools.partial(
+        dcmread,
+        buffer,
+        defer_size=defer_size,
+        stop_before_pixels=stop_before_pixels,
+        force=force,
+        specific_tags=specific_tags,
+    )
+    return await asyncio.get_running_loop().run_in_executor(executor, func)
+
+
+def _memory_map(fp: BinaryIO | ReadableBuffer) -> DicomMemoryViewIO:
+    """Return a :class:`~pydicom3.filebase.DicomMemoryViewIO` for a read-only
+    memory mapping of the file `fp`, positioned at the current offset of `fp`.
+    """
+    try:
+        fileno = fp.fileno()  # type: ignore[union-attr]
+    except (AttributeError, OSError) as exc:
+        raise TypeError(
+            "dcmread: 'mmap' requires a file path or a file-like with a "
+            f"'fileno()' method, but got {type(fp).__name__}"
+        ) from exc
+
+    # Empty files can't be mapped
+    mapping = (
+        _mmap.mmap(fileno, 0, access=_mmap.ACCESS_READ)
+        if os.fstat(fileno).st_size
+        else b""
+    )
+    mapped = DicomMemoryViewIO(mapping, getattr(fp, "name", None))
+    mapped.seek(fp.tell())
+
+    return mapped
+
+
 def data_element_offset_to_value(is_implicit_VR: bool, VR: str | None) -> int:
     """Return number of bytes from start of data element to start of value"""
     if is_implicit_VR:
@@ -1102,6 +1964,157 @@ def data_element_offset_to_value(is_implicit_VR: bool, VR: str | None) -> int:
     return 8  # tag 4 + 2 VR + 2 length
 
 
+class _DeferredFilePool:
+    """A bounded pool of idle file handles used to read deferred values.
+
+    Handles are keyed by the type used to open the file and its path, and are
+    removed from the pool while in use so that each is only ever used by one
+    thread at a time. The least recently used handles are closed once there
+    are more than :attr:`~pydicom3.config.Settings.deferred_read_pool_size`.
+    """
+
+    def __init__(self) -> None:
+        self._handles: OrderedDict[
+            tuple[Any, str], tuple[BinaryIO, tuple[int, int, float]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def open(
+        self, fileobj_type: Any, filename: str, statinfo: os.stat_result
+    ) -> Iterator[BinaryIO]:
+        """Return a context manager for a handle to `filename`, re-using an
+        idle handle to the same file if one is available.
+
+        Parameters
+        ----------
+        fileobj_type : type
+            The callable used to open `filename`.
+        filename : str
+            The path to the file.
+        statinfo : os.stat_result
+            The current status of the file, an idle handle is only used if the
+            file has the same device, inode and modification time as when the
+            handle was opened.
+        """
+        key = (fileobj_type, filename)
+        state = (statinfo.st_dev, statinfo.st_ino, statinfo.st_mtime)
+        with self._lock:
+            fp, fp_state = self._handles.pop(key, (None, None))
+
+        if fp is not None and fp_state != state:
+            fp.close()
+            fp = None
+
+        if fp is None:
+            fp = cast(BinaryIO, fileobj_type(filename, "rb"))
+
+        try:
+            yield fp
+        except BaseException:
+            fp.close()
+            raise
+
+        with self._lock:
+            is_duplicate = key in self._handles
+            if not is_duplicate:
+                self._handles[key] = (fp, state)
+
+        if is_duplicate:
+            # Another handle to the same file was returned first
+            fp.close()
+
+        self.trim()
+
+    def trim(self) -> None:
+        """Close the least recently used idle handles until there are no more
+        than :attr:`~pydicom3.config.Settings.deferred_read_pool_size`.
+        """
+        closing = []
+        with self._lock:
+            while len(self._handles) > config.settings.deferred_read_pool_size:
+                closing.append(self._handles.popitem(last=False)[1][0])
+
+        for fp in closing:
+            fp.close()
+
+
+_DEFERRED_FILES = _DeferredFilePool()
+
+
+@contextmanager
+def _open_deferred(
+    fileobj_type: Any,
+    filename_or_obj: PathType | BinaryIO | ReadableBuffer | None,
+    timestamp: float | None,
+) -> Iterator[BinaryIO]:
+    """Return a context manager for the file-like to read deferred values
+    from, checking that the file hasn't changed since it was read.
+    """
+    # If it wasn't read from a file, then return an error
+    if filename_or_obj is None:
+        raise OSError("Deferred read -- original filename not stored. Cannot re-open")
+
+    if not isinstance(filename_or_obj, str):
+        try:
+            yield cast(BinaryIO, filename_or_obj)
+        finally:
+            if isinstance(filename_or_obj, DicomInflateIO):
+                # Close the file if it had to be re-opened to inflate the value
+                filename_or_obj.close()
+
+        return
+
+    # Check that the file is the same as when originally read
+    try:
+        statinfo = os.stat(filename_or_obj)
+    except OSError:
+        raise OSError(f"Deferred read -- original file {filename_or_obj} is missing")
+
+    if timestamp is not None and statinfo.st_mtime != timestamp:
+        warn_and_log("Deferred read warning -- file modification time has changed")
+
+    if config.settings.deferred_read_pool_size:
+        with _DEFERRED_FILES.open(fileobj_type, filename_or_obj, statinfo) as fp:
+            yield fp
+    else:
+        fp = cast(BinaryIO, fileobj_type(filename_or_obj, "rb"))
+        try:
+            yield fp
+        finally:
+            fp.close()
+
+
+def _read_deferred(fp: BinaryIO, raw_data_elem: RawDataElement) -> RawDataElement:
+    """Return `raw_data_elem` with its value read from `fp`."""
+    is_implicit_VR = raw_data_elem.is_implicit_VR
+    is_little_endian = raw_data_elem.is_little_endian
+    offset = data_element_offset_to_value(is_implicit_VR, raw_data_elem.VR)
+    # Seek back to the start of the deferred element
+    fp.seek(raw_data_elem.value_tell - offset)
+    elem_gen = data_element_generator(
+        fp, is_implicit_VR, is_little_endian, defer_size=None
+    )
+
+    # Read the data element and check matches what was stored before
+    # The first element out of the iterator should be the same type as the
+    #   the deferred element == RawDataElement
+    elem = cast(RawDataElement, next(elem_gen))
+    if elem.VR != raw_data_elem.VR:
+        raise ValueError(
+            f"Deferred read VR {elem.VR} does not match original {raw_data_elem.VR}"
+        )
+
+    if elem.tag != raw_data_elem.tag:
+        raise ValueError(
+            f"Deferred read tag {elem.tag!r} does not match "
+            f"original {raw_data_elem.tag!r}"
+        )
+
+    # Everything is ok, now this object should act like usual DataElement
+    return elem
+
+
 def read_deferred_data_element(
     fileobj_type: Any,
     filename_or_obj: PathType | BinaryIO,
@@ -1116,6 +2129,12 @@ def read_deferred_data_element(
         This is called internally by pydicom3 and will normally not be
         needed in user code.
 
+    .. versionchanged:: 3.1
+
+        If :attr:`~pydicom3.config.Settings.deferred_read_pool_size` is
+        non-zero then the file is opened using a pool of handles shared with
+        other deferred reads.
+
     Parameters
     ----------
     fileobj_type : type
@@ -1146,55 +2165,59 @@ def read_deferred_data_element(
     """
     if config.debugging:
         logger.debug(f"Reading deferred element {raw_data_elem.tag}")
-    # If it wasn't read from a file, then return an error
-    if filename_or_obj is None:
-        raise OSError("Deferred read -- original filename not stored. Cannot re-open")
 
-    # Check that the file is the same as when originally read
-    is_filename = isinstance(filename_or_obj, str)
-    if isinstance(filename_or_obj, str):
-        if not os.path.exists(filename_or_obj):
-            raise OSError(
-                f"Deferred read -- original file {filename_or_obj} is missing"
-            )
+    with _open_deferred(fileobj_type, filename_or_obj, timestamp) as fp:
+        return _read_deferred(fp, raw_data_elem)
 
-        if timestamp is not None:
-            statinfo = os.stat(filename_or_obj)
-            if statinfo.st_mtime != timestamp:
-                warn_and_log(
-                    "Deferred read warning -- file modification time has changed"
-                )
 
-    # Open the file, position to the right place
-    fp = cast(
-        BinaryIO,
-        fileobj_type(filename_or_obj, "rb") if is_filename else filename_or_obj,
-    )
-    is_implicit_VR = raw_data_elem.is_implicit_VR
-    is_little_endian = raw_data_elem.is_little_endian
-    offset = data_element_offset_to_value(is_implicit_VR, raw_data_elem.VR)
-    # Seek back to the start of the deferred element
-    fp.seek(raw_data_elem.value_tell - offset)
-    elem_gen = data_element_generator(
-        fp, is_implicit_VR, is_little_endian, defer_size=None
-    )
+def read_deferred_data_elements(
+    fileobj_type: Any,
+    filename_or_obj: PathType | BinaryIO | ReadableBuffer | None,
+    timestamp: float | None,
+    raw_data_elems: Iterable[RawDataElement],
+) -> list[RawDataElement]:
+    """Read the previously deferred values of many elements from the file
+    into memory and return the raw data elements.
 
-    # Read the data element and check matches what was stored before
-    # The first element out of the iterator should be the same type as the
-    #   the deferred element == RawDataElement
-    elem = cast(RawDataElement, next(elem_gen))
-    if is_filename:
-        fp.close()
-    if elem.VR != raw_data_elem.VR:
-        raise ValueError(
-            f"Deferred read VR {elem.VR} does not match original {raw_data_elem.VR}"
-        )
+    .. versionadded:: 3.1
 
-    if elem.tag != raw_data_elem.tag:
-        raise ValueError(
-            f"Deferred read tag {elem.tag!r} does not match "
-            f"original {raw_data_elem.tag!r}"
-        )
+    Unlike calling :func:`read_deferred_data_element` for each element, the
+    file is only opened and checked once and the values are read in order of
+    their offset in the file.
 
-    # Everything is ok, now this object should act like usual DataElement
-    return elem
+    Parameters
+    ----------
+    fileobj_type : type
+        The type of the original file object.
+    filename_or_obj : str or file-like
+        The filename of the original file if one exists, or the file-like
+        object where the data elements persist.
+    timestamp : float or None
+        The time (as given by stat.st_mtime) the original file has been
+        read, if not a file-like.
+    raw_data_elems : Iterable[dataelem.RawDataElement]
+        The raw data elements with no values set.
+
+    Returns
+    -------
+    list[dataelem.RawDataElement]
+        The data elements with the values set, in order of their offset in
+        the file.
+
+    Raises
+    ------
+    OSError
+        If `filename_or_obj` is ``None``.
+    OSError
+        If `filename_or_obj` is a filename and the corresponding file does
+        not exist.
+    ValueError
+        If the VR or tag of any of the `raw_data_elems` does not match the
+        read value.
+    """
+    raw_data_elems = sorted(raw_data_elems, key=lambda elem: elem.value_tell)
+    if config.debugging:
+        logger.debug(f"Reading {len(raw_data_elems)} deferred elements")
+
+    with _open_deferred(fileobj_type, filename_or_obj, timestamp) as fp:
+        return [_read_deferred(fp, elem) for elem in raw_data_elems]
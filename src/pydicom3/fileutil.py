@@ -11,7 +11,7 @@ from typing import BinaryIO, cast
 from pydicom3.misc import size_in_bytes
 from pydicom3.tag import TupleTag, Tag, SequenceDelimiterTag, ItemTag, BaseTag
 from pydicom3.datadict import dictionary_description
-from pydicom3.filebase import ReadableBuffer, WriteableBuffer
+from pydicom3.filebase import DicomMemoryViewIO, ReadableBuffer, WriteableBuffer
 
 from pydicom3.config import logger, settings
 
@@ -52,11 +52,110 @@ def absorb_delimiter_item(
         )
 
 
+# The maximum size of the blocks read when scanning for a delimiter, the
+#   block size starts at `read_size` and doubles with each block read
+_MAX_SCAN_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+def _scan_for_bytes(
+    fp: BinaryIO,
+    bytes_to_find: bytes,
+    read_size: int,
+    chunks: list[bytes] | None = None,
+) -> int | None:
+    """Return the offset of the first `bytes_to_find` at or after the current
+    position of `fp`, or ``None`` if not found.
+
+    The data is read in blocks that start at `read_size` bytes and double in
+    size up to 4 MiB and is searched using :meth:`bytes.find`, so that short
+    values only need small reads and long values need few. Memory-mapped
+    buffers are searched directly without being read.
+
+    Parameters
+    ----------
+    fp : file-like
+        The file-like to search.
+    bytes_to_find : bytes
+        The bytes to find, in the correct endian order.
+    read_size : int
+        The number of bytes to read in the first block.
+    chunks : list[bytes], optional
+        If used then the data from the starting position up to the found
+        offset (or the end of the data) is appended to it.
+
+    Returns
+    -------
+    int | None
+        The offset of `bytes_to_find`, with `fp` positioned at the offset, or
+        ``None`` if not found, with `fp` positioned at the end of the data.
+    """
+    if isinstance(fp, DicomMemoryViewIO):
+        start = fp.tell()
+        found_at = fp.find(bytes_to_find)
+        end = fp.seek(0, os.SEEK_END) if found_at == -1 else found_at
+        if chunks is not None:
+            fp.seek(start)
+            chunks.append(fp.read(end - start))
+
+        fp.seek(end)
+        return None if found_at == -1 else found_at
+
+    overlap = len(bytes_to_find) - 1
+    block_size = max(read_size, 1)
+    position = fp.tell()  # The offset to the start of `tail`
+    tail = b""
+    while block := fp.read(block_size):
+        block_size = min(block_size * 2, max(read_size, _MAX_SCAN_BLOCK_SIZE))
+        if tail:
+            # Check for a match crossing the block boundary
+            index = (tail + block[:overlap]).find(bytes_to_find)
+            if index != -1:
+                if chunks is not None:
+                    chunks.append(tail[:index])
+
+                fp.seek(position + index)
+                return position + index
+
+            if chunks is not None:
+                chunks.append(tail)
+
+            position += len(tail)
+
+        index = block.find(bytes_to_find)
+        if index != -1:
+            if chunks is not None:
+                chunks.append(block[:index])
+
+            fp.seek(position + index)
+            return position + index
+
+        # Keep the end of the block in case of a match across the boundary
+        keep = max(len(block) - overlap, 0)
+        if chunks is not None and keep:
+            chunks.append(block[:keep] if keep < len(block) else block)
+
+        tail = block[keep:]
+        position += keep
+
+    if chunks is not None and tail:
+        chunks.append(tail)
+
+    return None
+
+
 def find_bytes(
-    fp: BinaryIO, bytes_to_find: bytes, read_size: int = 128, rewind: bool = True
+    fp: BinaryIO,
+    bytes_to_find: bytes,
+    read_size: int = 8 * 1024,
+    rewind: bool = True,
 ) -> int | None:
     """Read in the file until a specific byte sequence found.
 
+    .. versionchanged:: 3.1
+
+        The data is read in blocks that double in size from `read_size` up
+        to 4 MiB, and memory-mapped buffers are searched without reading.
+
     Parameters
     ----------
     fp : file-like
@@ -64,7 +163,7 @@ def find_bytes(
     bytes_to_find : bytes
         Contains the bytes to find. Must be in correct endian order already.
     read_size : int
-        Number of bytes to read at a time.
+        Number of bytes to read in the first block.
     rewind : bool
         Flag to rewind file reading position.
 
@@ -73,35 +172,9 @@ def find_bytes(
     found_at : int or None
         Position where byte sequence was found, else ``None``.
     """
-
     data_start = fp.tell()
-    search_rewind = len(bytes_to_find) - 1
-
-    found = False
-    eof = False
-    while not found:
-        chunk_start = fp.tell()
-        bytes_read = fp.read(read_size)
-        if len(bytes_read) < read_size:
-            # try again - if still don't get required amount,
-            # this is the last block
-            new_bytes = fp.read(read_size - len(bytes_read))
-            bytes_read += new_bytes
-            if len(bytes_read) < read_size:
-                eof = True  # but will still check whatever we did get
-        index = bytes_read.find(bytes_to_find)
-        if index != -1:
-            found = True
-        elif eof:
-            if rewind:
-                fp.seek(data_start)
-            return None
-        else:
-            # rewind a bit in case delimiter crossed read_size boundary
-            fp.seek(fp.tell() - search_rewind)
-    # if get here then have found the byte string
-    found_at = chunk_start + index
-    if rewind:
+    found_at = _scan_for_bytes(fp, bytes_to_find, read_size)
+    if rewind or found_at is None:
         fp.seek(data_start)
     else:
         fp.seek(found_at + len(bytes_to_find))
@@ -133,7 +206,8 @@ def read_undefined_length_value(
         Size to avoid loading large elements in memory. See
         :func:`~pydicom3.filereader.dcmread` for more parameter info.
     read_size : int, optional
-        Number of bytes to read at one time.
+        Number of bytes to read in the first block when scanning for the
+        delimiter, see :func:`find_bytes`.
 
     Returns
     -------
@@ -167,61 +241,42 @@ def read_undefined_length_value(
         if was_value_found:
             return value
 
-    search_rewind = 3
-
     if is_little_endian:
         bytes_format = b"<HH"
     else:
         bytes_format = b">HH"
     bytes_to_find = pack(bytes_format, delimiter_tag.group, delimiter_tag.elem)
 
-    found = False
-    eof = False
-    value_chunks = []
-    byte_count = 0  # for defer_size checks
-    while not found:
-        chunk_start = fp.tell()
-        bytes_read = fp.read(read_size)
-        if len(bytes_read) < read_size:
-            # try again - if still don't get required amount,
-            # this is the last block
-            new_bytes = fp.read(read_size - len(bytes_read))
-            bytes_read += new_bytes
-            if len(bytes_read) < read_size:
-                eof = True  # but will still check whatever we did get
-        index = bytes_read.find(bytes_to_find)
-        if index != -1:
-            found = True
-            new_bytes = bytes_read[:index]
-            byte_count += len(new_bytes)
-            if defer_size is None or byte_count < defer_size:
-                value_chunks.append(new_bytes)
-            fp.seek(chunk_start + index + 4)  # rewind to end of delimiter
-            length = fp.read(4)
-            if length != b"\0\0\0\0":
-                msg = (
-                    "Expected 4 zero bytes after undefined length delimiter"
-                    " at pos {0:04x}"
-                )
-                logger.error(msg.format(fp.tell() - 4))
-        elif eof:
-            fp.seek(data_start)
-            raise EOFError(
-                f"End of file reached before delimiter {delimiter_tag!r} found"
-            )
-        else:
-            # rewind a bit in case delimiter crossed read_size boundary
-            fp.seek(fp.tell() - search_rewind)
-            # accumulate the bytes read (not including the rewind)
-            new_bytes = bytes_read[:-search_rewind]
-            byte_count += len(new_bytes)
-            if defer_size is None or byte_count < defer_size:
-                value_chunks.append(new_bytes)
-    # if get here then have found the byte string
-    if defer_size is not None and byte_count >= defer_size:
+    # Only accumulate the value while scanning if it won't be deferred, as
+    #   rewinding can be expensive, e.g. for deflated datasets. If it might
+    #   be deferred or can be viewed then it's read once the length is known
+    chunks: list[bytes] | None = None
+    if defer_size is None and not hasattr(fp, "read_view"):
+        chunks = []
+
+    found_at = _scan_for_bytes(fp, bytes_to_find, read_size, chunks)
+    if found_at is None:
+        fp.seek(data_start)
+        raise EOFError(f"End of file reached before delimiter {delimiter_tag!r} found")
+
+    fp.seek(found_at + 4)  # rewind to end of delimiter
+    length = fp.read(4)
+    if length != b"\0\0\0\0":
+        msg = "Expected 4 zero bytes after undefined length delimiter at pos {0:04x}"
+        logger.error(msg.format(fp.tell() - 4))
+
+    if defer_size is not None and found_at - data_start >= defer_size:
         return None
-    else:
-        return b"".join(value_chunks)
+
+    if chunks is not None:
+        return b"".join(chunks)
+
+    data_end = fp.tell()
+    fp.seek(data_start)
+    # Avoid copying the value when reading from a DicomMemoryViewIO
+    value = getattr(fp, "read_view", fp.read)(found_at - data_start)
+    fp.seek(data_end)
+    return cast(bytes, value)
 
 
 def _try_read_encapsulated_pixel_data(
@@ -268,7 +323,9 @@ def _try_read_encapsulated_pixel_data(
     data_start = fp.tell()
     byte_count = 0
     while True:
-        tag_bytes = fp.read(4)
+        # Read each item's tag and length together
+        bytes_read = fp.read(8)
+        tag_bytes = bytes_read[:4]
         if len(tag_bytes) < 4:
             # End of file reached while scanning.
             # Maybe the sequence delimiter is missing or or maybe we read past
@@ -277,7 +334,7 @@ def _try_read_encapsulated_pixel_data(
                 "End of input encountered while parsing undefined length "
                 "value as encapsulated pixel data. Unable to find tag at "
                 "position 0x%x. Falling back to byte by byte scan.",
-                fp.tell() - len(tag_bytes),
+                fp.tell() - len(bytes_read),
             )
             fp.seek(data_start)
             return (False, None)
@@ -287,7 +344,7 @@ def _try_read_encapsulated_pixel_data(
             break
 
         if tag_bytes == item_bytes:
-            length_bytes = fp.read(4)
+            length_bytes = bytes_read[4:]
             if len(length_bytes) < 4:
                 # End of file reached while scanning.
                 # Maybe the sequence delimiter is missing or or maybe we read
@@ -325,21 +382,21 @@ def _try_read_encapsulated_pixel_data(
                 "while parsing undefined length value as encapsulated "
                 "pixel data. Falling back to byte-by-byte scan.",
                 tag_bytes.hex(),
-                fp.tell() - 4,
+                fp.tell() - len(bytes_read),
             )
             fp.seek(data_start)
             return (False, None)
 
-    length = fp.read(4)
-    if length != b"\0\0\0\0":
+    if bytes_read[4:] != b"\0\0\0\0":
         msg = "Expected 4 zero bytes after undefined length delimiter at pos {0:04x}"
-        logger.debug(msg.format(fp.tell() - 4))
+        logger.debug(msg.format(data_start + byte_count))
 
     if defer_size is not None and defer_size <= byte_count:
         value = None
     else:
         fp.seek(data_start)
-        value = fp.read(byte_count - 4)
+        # Avoid copying the value when reading from a DicomMemoryViewIO
+        value = getattr(fp, "read_view", fp.read)(byte_count - 4)
 
     fp.seek(data_start + byte_count + 4)
     return (True, value)
@@ -349,7 +406,7 @@ def find_delimiter(
     fp: BinaryIO,
     delimiter: BaseTag,
     is_little_endian: bool,
-    read_size: int = 128,
+    read_size: int = 8 * 1024,
     rewind: bool = True,
 ) -> int | None:
     """Return file position where 4-byte delimiter is located.
@@ -386,7 +443,7 @@ def length_of_undefined_length(
     fp: BinaryIO,
     delimiter: BaseTag,
     is_little_endian: bool,
-    read_size: int = 128,
+    read_size: int = 8 * 1024,
     rewind: bool = True,
 ) -> int | None:
     """Search through the file to find the delimiter and return the length
@@ -416,7 +473,9 @@ def length_of_undefined_length(
     the calling routine must handle that. Delimiter must be 4 bytes long.
     """
     data_start = fp.tell()
-    delimiter_pos = find_delimiter(fp, delimiter, is_little_endian, rewind=rewind)
+    delimiter_pos = find_delimiter(
+        fp, delimiter, is_little_endian, read_size=read_size, rewind=rewind
+    )
     if delimiter_pos is not None:
         return delimiter_pos - data_start
 
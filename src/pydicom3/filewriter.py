@@ -27,6 +27,7 @@ from pydicom3.fileutil import (
 )
 from pydicom3.misc import warn_and_log
 from pydicom3.multival import MultiValue
+from pydicom3.sequence import LazySequence
 from pydicom3.tag import (
     Tag,
     BaseTag,
@@ -53,8 +54,9 @@ from pydicom3.valuerep import (
     VR,
     AMBIGUOUS_VR,
     CUSTOMIZABLE_CHARSET_VR,
+    format_numbers_as_ds,
 )
-from pydicom3.values import convert_numbers
+from pydicom3.values import convert_numbers, _ARRAY_DTYPES
 
 if config.have_numpy:
     import numpy
@@ -336,6 +338,11 @@ def correct_ambiguous_vr(
                 ancestors.insert(0, item)
                 correct_ambiguous_vr(item, is_little_endian, ancestors)
         elif elem.VR in AMBIGUOUS_VR:
+            if not elem.is_raw:
+                # The element may be shared with a copy-on-write copy of `ds`
+                #   and its VR gets corrected in-place
+                elem = ds[elem.tag]
+
             correct_ambiguous_vr_element(elem, ds, is_little_endian, ancestors)
 
     del ancestors[0]
@@ -357,6 +364,10 @@ def write_numbers(fp: DicomIO, elem: DataElement, struct_format: str) -> None:
         The character format as used by the struct module.
     """
     value = elem.value
+    if config.have_numpy and isinstance(value, numpy.ndarray):
+        _write_array(fp, elem, struct_format)
+        return
+
     if value is None or value == "":
         return  # don't need to write anything for no or empty value
 
@@ -381,6 +392,39 @@ def write_numbers(fp: DicomIO, elem: DataElement, struct_format: str) -> None:
         raise OSError(f"{exc}\nfor data_element:\n{elem}")
 
 
+def _write_array(fp: DicomIO, elem: DataElement, struct_format: str) -> None:
+    """Write the :class:`numpy.ndarray` value of a numerical VR element.
+
+    Parameters
+    ----------
+    fp : file-like
+        The file-like to write the encoded data to.
+    elem : dataelem.DataElement
+        The element to encode.
+    struct_format : str
+        The character format as used by the struct module.
+    """
+    value = cast("numpy.ndarray", elem.value).ravel()
+    endianChar = "><"[fp.is_little_endian]
+    dtype = numpy.dtype(f"{endianChar}{_ARRAY_DTYPES[struct_format]}")
+    try:
+        # Some ambiguous VR elements ignore the VR for part of the value
+        if struct_format == "h" and elem.tag in _LUT_DESCRIPTOR_TAGS and value.size:
+            fp.write(pack(f"{endianChar}H", int(value[0])))
+            value = value[1:]
+
+        # No copy if the array already has the required dtype and endianness
+        encoded = value.astype(dtype, copy=False)
+        if dtype.kind != "f" and not numpy.array_equal(encoded, value):
+            raise ValueError(
+                f"The values are out of range for an array of dtype '{dtype.str}'"
+            )
+
+        fp.write(encoded.tobytes())
+    except Exception as exc:
+        raise OSError(f"{exc}\nfor data_element:\n{elem}")
+
+
 def write_OBvalue(fp: DicomIO, elem: DataElement) -> None:
     """Write a data_element with VR of 'other byte' (OB)."""
 
@@ -500,6 +544,10 @@ def write_number_string(fp: DicomIO, elem: DataElement) -> None:
     # unchanged data elements are written with exact string as when read from
     # file
     val = elem.value
+    if config.have_numpy and isinstance(val, numpy.ndarray):
+        _write_number_string_array(fp, elem)
+        return
+
     if _is_multi_value(val):
         val = cast(Sequence[IS] | Sequence[DSclass], val)
         val = "\\".join(
@@ -520,6 +568,23 @@ def write_number_string(fp: DicomIO, elem: DataElement) -> None:
     fp.write(val)
 
 
+def _write_number_string_array(fp: DicomIO, elem: DataElement) -> None:
+    """Write the :class:`numpy.ndarray` value of an IS or DS element, with
+    all the values formatted at once.
+    """
+    arr = cast("numpy.ndarray", elem.value)
+    if elem.VR == VR.IS and not numpy.array_equal(arr, numpy.rint(arr)):
+        raise ValueError("Non-integer values aren't allowed for VR IS")
+
+    # Integer values are formatted without a decimal point, so this also
+    #   works for IS
+    encoded = format_numbers_as_ds(arr)
+    if len(encoded) % 2 != 0:
+        encoded += b" "  # pad to even length
+
+    fp.write(encoded)
+
+
 def _format_DA(val: DA | None) -> str:
     if val is None:
         return ""
@@ -678,7 +743,7 @@ def write_data_element(
             with reset_buffer_position(value):
                 pixel_data_bytes = value.read(4)
         else:
-            pixel_data_bytes = cast(bytes, elem.value)[:4]
+            pixel_data_bytes = bytes(cast(bytes, elem.value)[:4])
 
         # Big endian encapsulation is non-conformant
         tag = b"\xFE\xFF\x00\xE0" if fp.is_little_endian else b"\xFF\xFE\xE0\x00"
@@ -842,7 +907,22 @@ def write_sequence(fp: DicomIO, elem: DataElement, encodings: list[str]) -> None
     """
     # write_data_element has already written the VR='SQ' (if needed) and
     #    a placeholder for length"""
-    for ds in cast(Iterable[Dataset], elem.value):
+    seq = elem.value
+    if (
+        isinstance(seq, LazySequence)
+        and seq.original_encoding == (fp.is_implicit_VR, fp.is_little_endian)
+        and seq.original_character_set == convert_encodings(encodings)
+    ):
+        # Items that haven't been parsed can be written as they were read
+        for idx in range(len(seq)):
+            if (item := seq.encoded_item(idx)) is not None:
+                fp.write(item)
+            else:
+                write_sequence_item(fp, seq[idx], encodings)
+
+        return
+
+    for ds in cast(Iterable[Dataset], seq):
         write_sequence_item(fp, ds, encodings)
 
 
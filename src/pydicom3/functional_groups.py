@@ -0,0 +1,323 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Extraction of per-frame attributes from multi-frame functional groups."""
+
+from collections.abc import Iterable
+from typing import Any, BinaryIO, cast
+
+try:
+    import numpy as np
+
+    HAVE_NP = True
+except ImportError:
+    HAVE_NP = False
+
+from pydicom3.charset import convert_encodings
+from pydicom3.datadict import dictionary_VM, dictionary_VR, tag_for_keyword
+from pydicom3.dataelem import RawDataElement
+from pydicom3.dataset import Dataset
+from pydicom3.fileutil import PathType, path_from_pathlike
+from pydicom3.filebase import ReadableBuffer
+from pydicom3.leanread import iter_elements
+from pydicom3.multival import MultiValue
+from pydicom3.tag import BaseTag
+from pydicom3.uid import UID
+from pydicom3.values import convert_value
+
+# (5200,9229) Shared Functional Groups Sequence
+_SHARED_TAG = 0x52009229
+# (5200,9230) Per-frame Functional Groups Sequence
+_PER_FRAME_TAG = 0x52009230
+# (0002,0010) Transfer Syntax UID, (0008,0005) Specific Character Set,
+#   (0028,0008) Number of Frames
+_TSYNTAX_TAG = 0x00020010
+_CHARSET_TAG = 0x00080005
+_NR_FRAMES_TAG = 0x00280008
+# (FFFE,E000) Item
+_ITEM = 0xFFFEE000
+
+# The dtype codes for the binary numeric VRs
+_BINARY_DTYPES = {
+    "FD": "f8",
+    "FL": "f4",
+    "OD": "f8",
+    "OF": "f4",
+    "OL": "u4",
+    "OV": "u8",
+    "OW": "u2",
+    "SL": "i4",
+    "SS": "i2",
+    "SV": "i8",
+    "UL": "u4",
+    "US": "u2",
+    "UV": "u8",
+}
+# The dtypes of the returned arrays for the numeric VRs, all other VRs are str
+_FLOAT_VRS = {"DS", "FD", "FL", "OD", "OF"}
+_UINT64_VRS = {"OV", "UV"}
+_INT_VRS = {"IS", "OL", "OW", "SL", "SS", "SV", "UL", "US"}
+
+
+def _decode(
+    vr: str,
+    value: bytes,
+    is_little_endian: bool,
+    encodings: list[str],
+) -> list[Any]:
+    """Return a list of the decoded values in the encoded `value`."""
+    if vr in _BINARY_DTYPES:
+        dtype = np.dtype(_BINARY_DTYPES[vr]).newbyteorder(
+            "<" if is_little_endian else ">"
+        )
+        return cast(list[Any], np.frombuffer(value, dtype=dtype).tolist())
+
+    if vr in ("DS", "IS"):
+        # Fast path for decimal and integer strings, fall back to the usual
+        #   conversion for any that need it
+        try:
+            func = float if vr == "DS" else int
+            return [func(v) for v in value.split(b"\\") if v.strip(b" \x00")]
+        except ValueError:
+            pass
+
+    raw = RawDataElement(BaseTag(0), vr, len(value), value, 0, False, is_little_endian)
+    return _as_list(convert_value(vr, raw, encodings))
+
+
+def _as_list(value: Any) -> list[Any]:
+    """Return the element `value` as a list of values."""
+    if value is None or (isinstance(value, str | bytes) and not value):
+        return []
+
+    if isinstance(value, MultiValue | list | tuple):
+        return list(value)
+
+    return [value]
+
+
+def _find(ds: Dataset, tag: int) -> Any:
+    """Return the value of the first element with `tag` in `ds` or the items
+    of its sequences, or ``None`` if not found.
+    """
+    if tag in ds:
+        return ds[tag].value
+
+    for elem in ds:
+        if elem.VR != "SQ":
+            continue
+
+        for item in elem.value:
+            if (value := _find(item, tag)) is not None:
+                return value
+
+    return None
+
+
+def _from_dataset(
+    ds: Dataset, tags: dict[int, str]
+) -> tuple[int, dict[int, list[Any]], dict[int, list[list[Any] | None]]]:
+    """Return the number of frames, the shared values and the per-frame values
+    in `ds`.
+    """
+    shared: dict[int, list[Any]] = {}
+    if shared_groups := ds.get(_SHARED_TAG):
+        for tag in tags:
+            if values := _as_list(_find(shared_groups.value[0], tag)):
+                shared[tag] = values
+
+    per_frame_groups = ds.get(_PER_FRAME_TAG)
+    if per_frame_groups is None:
+        nr_frames = int(ds.get("NumberOfFrames") or 1)
+        return nr_frames, shared, {tag: [None] * nr_frames for tag in tags}
+
+    per_frame: dict[int, list[list[Any] | None]] = {}
+    for tag in tags:
+        per_frame[tag] = [
+            _as_list(_find(item, tag)) or None for item in per_frame_groups.value
+        ]
+
+    return len(per_frame_groups.value), shared, per_frame
+
+
+def _from_buffer(
+    fp: PathType | BinaryIO | ReadableBuffer, tags: dict[int, str], force: bool
+) -> tuple[int, dict[int, list[Any]], dict[int, list[list[Any] | None]]]:
+    """Return the number of frames, the shared values and the per-frame values
+    in `fp` by scanning the encoded sequence items.
+    """
+    top_level = {_TSYNTAX_TAG, _CHARSET_TAG, _NR_FRAMES_TAG, _PER_FRAME_TAG}
+
+    def include(path: tuple[int, ...]) -> bool:
+        if len(path) == 1:
+            return path[0] in top_level
+
+        # The per-frame items and the elements to be returned
+        return path[-1] in tags or (path[0] == _PER_FRAME_TAG and path[2:] == (_ITEM,))
+
+    def exclude(path: tuple[int, ...]) -> bool:
+        # Skip all top-level sequences other than the functional groups and
+        #   all but the first shared functional groups item
+        if len(path) == 1:
+            return path[0] not in top_level and path[0] != _SHARED_TAG
+
+        return len(path) == 3 and path[0] == _SHARED_TAG and path[1] != 0
+
+    is_little_endian = True
+    encodings = convert_encodings(None)
+    nr_frames = 1
+    shared: dict[int, list[Any]] = {}
+    per_frame: dict[int, list[list[Any] | None]] = {}
+    for elem in iter_elements(
+        fp,
+        include=include,
+        exclude=exclude,
+        descend=True,
+        force=force,
+        stop_when=lambda path: path[0] > _PER_FRAME_TAG,
+    ):
+        path, value = elem.path, elem.value
+        if path == (_PER_FRAME_TAG,):
+            nr_frames = 0
+            per_frame = {tag: [] for tag in tags}
+        elif len(path) == 1:
+            if not value:
+                continue
+
+            value = value.strip(b" \x00")
+            if path[0] == _TSYNTAX_TAG:
+                tsyntax = UID(value.decode("ascii", "replace"))
+                if tsyntax.is_transfer_syntax:
+                    is_little_endian = tsyntax.is_little_endian
+            elif path[0] == _CHARSET_TAG:
+                encodings = convert_encodings(
+                    value.decode("ascii", "replace").split("\\")
+                )
+            elif path[0] == _NR_FRAMES_TAG and value.isdigit():
+                nr_frames = int(value)
+        elif path[2:] == (_ITEM,):
+            # The start of the next frame's per-frame functional groups item
+            nr_frames += 1
+            for frame_values in per_frame.values():
+                frame_values.append(None)
+        elif value is not None and elem.VR is not None:
+            if not (values := _decode(elem.VR[:2], value, is_little_endian, encodings)):
+                continue
+
+            if path[0] == _SHARED_TAG:
+                shared.setdefault(path[-1], values)
+            elif (frames := per_frame[path[-1]])[-1] is None:
+                frames[-1] = values
+
+    if not per_frame:
+        # No Per-frame Functional Groups Sequence
+        per_frame = {tag: [None] * nr_frames for tag in tags}
+
+    return nr_frames, shared, per_frame
+
+
+def extract_per_frame(
+    src: PathType | BinaryIO | ReadableBuffer | Dataset,
+    keywords: Iterable[str],
+    *,
+    force: bool = False,
+) -> dict[str, "np.ndarray"]:
+    """Return arrays of the per-frame values of elements in the functional
+    groups of an enhanced multi-frame dataset.
+
+    The value for each frame is taken from the first matching element in the
+    frame's item in the *Per-frame Functional Groups Sequence*, including any
+    nested sequences, or if it's not present then from the *Shared
+    Functional Groups Sequence*. When `src` is a file the values are
+    decoded directly from the encoded sequence items, without creating a
+    :class:`~pydicom3.dataset.Dataset` for each item, and the file is only
+    read as far as the end of the *Per-frame Functional Groups Sequence*.
+
+    .. versionadded:: 3.1
+
+    Examples
+    --------
+
+    >>> arrays = extract_per_frame(
+    ...     "liver_1frame.dcm", ["ImagePositionPatient", "SliceThickness"]
+    ... )
+    >>> arrays["ImagePositionPatient"]
+    array([[-235.2 , -226.8 , -128.69],
+           [-235.2 , -226.8 , -127.69],
+           [-235.2 , -226.8 , -126.69]])
+    >>> arrays["SliceThickness"]
+    array([1., 1., 1.])
+
+    Parameters
+    ----------
+    src : str, PathLike, file-like, readable buffer or Dataset
+        The dataset, or the path to the DICOM file or a file-like positioned
+        at the start of the DICOM data.
+    keywords : Iterable[str]
+        The keywords of the elements to return the values of, such as
+        ``"ImagePositionPatient"``.
+    force : bool, optional
+        If ``True`` then read a file that has no preamble and ``'DICM'``
+        prefix, default ``False``. Not used if `src` is a dataset.
+
+    Returns
+    -------
+    dict[str, numpy.ndarray]
+        The values for each keyword, as an array with shape
+        ``(number of frames,)`` if the element's VM is 1 or
+        ``(number of frames, VM)`` otherwise. The arrays are ``float64`` for
+        decimal and floating point VRs, ``int64`` (or ``uint64`` for *UV* and
+        *OV*) for the integer VRs and :class:`str` for all other VRs.
+
+    Raises
+    ------
+    ValueError
+        If a keyword isn't in the DICOM dictionary, if a frame has no value
+        for an element in either functional groups sequence or if the number
+        of values differs between frames.
+    """
+    if not HAVE_NP:
+        raise ImportError("NumPy is required for extract_per_frame()")
+
+    tags: dict[int, str] = {}
+    for keyword in keywords:
+        if (tag := tag_for_keyword(keyword)) is None:
+            raise ValueError(f"Unknown DICOM element keyword '{keyword}'")
+
+        tags[tag] = keyword
+
+    if isinstance(src, Dataset):
+        nr_frames, shared, per_frame = _from_dataset(src, tags)
+    else:
+        fp = path_from_pathlike(cast(PathType | BinaryIO | ReadableBuffer, src))
+        nr_frames, shared, per_frame = _from_buffer(fp, tags, force)
+
+    arrays = {}
+    for tag, keyword in tags.items():
+        values = []
+        for idx, frame_values in enumerate(per_frame[tag]):
+            if frame_values is None and (frame_values := shared.get(tag)) is None:
+                raise ValueError(
+                    f"No value for '{keyword}' found for frame {idx + 1} in the "
+                    "per-frame or shared functional groups"
+                )
+
+            values.append(frame_values)
+
+        if len({len(v) for v in values}) > 1:
+            raise ValueError(
+                f"The number of values for '{keyword}' differs between frames"
+            )
+
+        vr = dictionary_VR(tag)[:2]
+        if vr in _FLOAT_VRS:
+            dtype: Any = np.float64
+        elif vr in _UINT64_VRS:
+            dtype = np.uint64
+        elif vr in _INT_VRS:
+            dtype = np.int64
+        else:
+            dtype = str
+
+        shape = (nr_frames,) if dictionary_VM(tag) == "1" else (nr_frames, -1)
+        arrays[keyword] = np.asarray(values, dtype=dtype).reshape(shape)
+
+    return arrays
@@ -10,6 +10,9 @@ from pydicom3.misc import warn_and_log
 from pydicom3.tag import BaseTag, _LUT_DESCRIPTOR_TAGS
 from pydicom3.valuerep import VR
 
+if config.have_numpy:
+    import numpy
+
 
 if TYPE_CHECKING:  # pragma: no cover
     from pydicom3.dataset import Dataset
@@ -264,7 +267,10 @@ def raw_element_value(
 
     if raw.tag in _LUT_DESCRIPTOR_TAGS:
         # We only fix the first value as the third value is 8 or 16
-        if value and isinstance(value, list):
+        if config.have_numpy and isinstance(value, numpy.ndarray):
+            value = value.tolist()
+
+        if isinstance(value, list) and value:
             try:
                 if value[0] < 0:
                     value[0] += 65536
@@ -0,0 +1,480 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Fast iteration over the raw encoded elements in DICOM files."""
+
+from collections.abc import Callable, Iterator
+import os
+from struct import Struct
+from typing import BinaryIO, NamedTuple, cast
+
+from pydicom3 import config
+from pydicom3.datadict import _dictionary_vr_fast
+from pydicom3.errors import InvalidDicomError
+from pydicom3.filebase import DicomInflateIO, ReadableBuffer
+from pydicom3.filereader import (
+    ENCODED_VR,
+    _is_implicit_vr,
+    _skip_undefined_length_element,
+    _skip_undefined_length_item,
+    _undefined_length_vr,
+)
+from pydicom3.fileutil import PathType, path_from_pathlike, read_undefined_length_value
+from pydicom3.misc import size_in_bytes
+from pydicom3.tag import BaseTag, SequenceDelimiterTag
+from pydicom3.uid import UID, PrivateTransferSyntaxes
+from pydicom3.valuerep import EXPLICIT_VR_LENGTH_32
+
+
+_EXTRA_LENGTH_VRS = {vr.encode("ascii") for vr in EXPLICIT_VR_LENGTH_32}
+_UNDEFINED_LENGTH = 0xFFFFFFFF
+# (FFFE,E000) Item and (FFFE,E00D) Item Delimitation Item
+_ITEM_TAG = 0xFFFEE000
+_ITEM_DELIMITER_TAG = 0xFFFEE00D
+
+PathPredicate = Callable[[tuple[int, ...]], bool]
+
+
+class LeanElement(NamedTuple):
+    """An encoded element yielded by :func:`iter_elements`.
+
+    .. versionadded:: 3.1
+    """
+
+    path: tuple[int, ...]
+    """The element's tag path, which is the tag of each sequence element and
+    the index of the sequence item containing the element, followed by the
+    element's tag, such as ``(0x300A00B0, 0, 0x300A00C2)`` for the *Beam
+    Name* in the first item of the *Beam Sequence*. Sequence items have
+    the (FFFE,E000) *Item* tag as the last tag, such as
+    ``(0x300A00B0, 0, 0xFFFEE000)``.
+    """
+    VR: str | None
+    """The element's VR, if implicit VR then the VR from the DICOM dictionary
+    or ``None`` for unknown private elements. Sequences that are descended
+    into are always ``'SQ'`` and sequence items are ``None``.
+    """
+    offset: int
+    """The offset to the start of the element's value."""
+    length: int
+    """The element's encoded value length, ``0xFFFFFFFF`` if undefined."""
+    value: bytes | None
+    """The element's encoded value, ``None`` for sequences, sequence items
+    and deferred values.
+    """
+
+
+def _dataset_encoding(fp: BinaryIO, tsyntax: UID | None) -> tuple[bool, bool, bool]:
+    """Return the (is implicit VR, is little endian, is deflated) encoding of
+    the dataset that starts at the current position of `fp`, using the same
+    rules as :func:`~pydicom3.filereader.read_partial`.
+    """
+    peek = fp.read(6)
+    fp.seek(-len(peek), os.SEEK_CUR)
+    # Only the first element's VR is checked, as in _is_implicit_vr()
+    has_vr = len(peek) == 6 and b"AA" <= peek[4:] <= b"ZZ"
+    if tsyntax is None:
+        # Big endian can only be explicit VR
+        little = int.from_bytes(peek[:2], "little") < 1024
+        return not has_vr, not has_vr or little, False
+
+    if tsyntax in PrivateTransferSyntaxes:
+        # Use the registered UID as it has the encoding information
+        tsyntax = PrivateTransferSyntaxes[PrivateTransferSyntaxes.index(tsyntax)]
+
+    if not tsyntax.is_transfer_syntax:
+        # Any other syntax should be explicit VR little endian
+        return not has_vr, True, False
+
+    if tsyntax.is_deflated:
+        return False, True, True
+
+    return not has_vr, tsyntax.is_little_endian, False
+
+
+def _read_preamble(fp: BinaryIO, force: bool) -> bool:
+    """Return ``True`` if `fp` has a preamble and ``'DICM'`` prefix, leaving
+    `fp` positioned after them, or at the start if they're missing.
+    """
+    start = fp.tell()
+    if fp.read(132)[128:] == b"DICM":
+        return True
+
+    if not force:
+        raise InvalidDicomError(
+            "File is missing DICOM File Meta Information header or the "
+            "'DICM' prefix is missing from the header. Use force=True to "
+            "force reading."
+        )
+
+    fp.seek(start)
+    return False
+
+
+class _LeanReader:
+    """Parse the element headers in a file-like and yield its elements."""
+
+    def __init__(
+        self,
+        fp: BinaryIO,
+        is_little_endian: bool,
+        include: PathPredicate | None = None,
+        exclude: PathPredicate | None = None,
+        descend: bool = False,
+        defer_size: int | float | None = None,
+        stop_when: PathPredicate | None = None,
+    ) -> None:
+        self.fp = fp
+        self.is_little_endian = is_little_endian
+        self.include = include
+        self.exclude = exclude
+        self.descend = descend
+        self.defer_size = defer_size
+        self.stop_when = stop_when
+        # If the iteration was stopped by `stop_when`
+        self.stopped = False
+
+        endian_chr = "><"[is_little_endian]
+        self.unpack_implicit = Struct(f"{endian_chr}HHL").unpack
+        self.unpack_explicit = Struct(f"{endian_chr}HH2sH").unpack
+        self.unpack_length = Struct(f"{endian_chr}L").unpack
+
+    def _read_header(self, is_implicit_VR: bool) -> tuple[int, str | None, int] | None:
+        """Return the (tag, VR, length) of the element at the current
+        position, or ``None`` at the end of the data.
+        """
+        fp = self.fp
+        if len(bytes_read := fp.read(8)) < 8:
+            return None
+
+        if not is_implicit_VR:
+            group, elem, vr, length = self.unpack_explicit(bytes_read)
+            if vr in ENCODED_VR:
+                if vr in _EXTRA_LENGTH_VRS:
+                    length = self.unpack_length(fp.read(4))[0]
+
+                return group << 16 | elem, ENCODED_VR[vr], length
+
+            if not config.assume_implicit_vr_switch:
+                return group << 16 | elem, vr.decode("ascii", "replace"), length
+
+        group, elem, length = self.unpack_implicit(bytes_read)
+        tag = group << 16 | elem
+        try:
+            return tag, _dictionary_vr_fast(tag), length
+        except KeyError:
+            return tag, None, length
+
+    def _is_sequence(self, tag: int, vr: str | None, length: int) -> bool:
+        """Return ``True`` if the defined length element with `tag` and `vr`
+        whose value starts at the current position is a sequence.
+        """
+        if vr == "UN" and config.replace_un_with_known_vr:
+            try:
+                return _dictionary_vr_fast(tag) == "SQ"
+            except KeyError:
+                return False
+
+        if vr is not None:
+            return vr == "SQ"
+
+        if length < 8:
+            return False
+
+        # Private implicit VR elements are sequences if they contain items
+        peek = self.fp.read(4)
+        self.fp.seek(-len(peek), os.SEEK_CUR)
+        return peek == (
+            b"\xfe\xff\x00\xe0" if self.is_little_endian else b"\xff\xfe\xe0\x00"
+        )
+
+    def elements(
+        self,
+        path: tuple[int, ...],
+        end: int | None,
+        is_implicit_VR: bool,
+        group: int | None = None,
+    ) -> Iterator[LeanElement]:
+        """Yield the elements of the dataset at the current position.
+
+        Parameters
+        ----------
+        path : tuple[int, ...]
+            The tag path to the dataset.
+        end : int | None
+            The offset to the end of the dataset, or ``None`` to read until the
+            end of the data or the (FFFE,E00D) *Item Delimitation Item*.
+        is_implicit_VR : bool
+            ``True`` if the dataset is implicit VR, ``False`` otherwise.
+        group : int | None
+            If used then stop at the first element not in `group`.
+        """
+        fp = self.fp
+        include, exclude = self.include, self.exclude
+        defer_size = self.defer_size
+        while end is None or fp.tell() < end:
+            start = fp.tell()
+            if (header := self._read_header(is_implicit_VR)) is None:
+                return
+
+            tag, vr, length = header
+            if tag == _ITEM_DELIMITER_TAG:
+                return
+
+            if group is not None and tag >> 16 != group:
+                fp.seek(start)
+                return
+
+            offset = fp.tell()
+            elem_path = path + (tag,)
+            if self.stop_when is not None and self.stop_when(elem_path):
+                fp.seek(start)
+                self.stopped = True
+                return
+
+            excluded = exclude is not None and exclude(elem_path)
+            wanted = not excluded and (include is None or include(elem_path))
+            if length == _UNDEFINED_LENGTH:
+                vr = _undefined_length_vr(fp, BaseTag(tag), vr, self.is_little_endian)
+                if vr == "SQ":
+                    if wanted:
+                        yield LeanElement(elem_path, vr, offset, length, None)
+
+                    if self.descend and not excluded:
+                        yield from self.items(elem_path, None, is_implicit_VR)
+                        if self.stopped:
+                            return
+                    else:
+                        _skip_undefined_length_element(
+                            fp, BaseTag(tag), vr, is_implicit_VR, self.is_little_endian
+                        )
+
+                    continue
+
+                value = read_undefined_length_value(
+                    fp,
+                    self.is_little_endian,
+                    SequenceDelimiterTag,
+                    defer_size if wanted else 0,
+                )
+                if wanted:
+                    yield LeanElement(elem_path, vr, offset, length, value)
+
+                continue
+
+            if self.descend and not excluded and self._is_sequence(tag, vr, length):
+                if wanted:
+                    yield LeanElement(elem_path, "SQ", offset, length, None)
+
+                yield from self.items(elem_path, offset + length, is_implicit_VR)
+                if self.stopped:
+                    return
+
+                fp.seek(offset + length)
+                continue
+
+            if wanted and vr != "SQ" and (defer_size is None or length <= defer_size):
+                yield LeanElement(elem_path, vr, offset, length, fp.read(length))
+                continue
+
+            fp.seek(length, os.SEEK_CUR)
+            if wanted:
+                yield LeanElement(elem_path, vr, offset, length, None)
+
+    def items(
+        self, path: tuple[int, ...], end: int | None, is_implicit_VR: bool
+    ) -> Iterator[LeanElement]:
+        """Yield the items of the sequence at `path` whose value starts at the
+        current position and ends at `end`, or the (FFFE,E0DD) *Sequence
+        Delimitation Item* if ``None``, followed by each item's elements.
+        """
+        fp = self.fp
+        include, exclude = self.include, self.exclude
+        index = 0
+        while end is None or fp.tell() < end:
+            if len(bytes_read := fp.read(8)) < 8:
+                return
+
+            group, elem, length = self.unpack_implicit(bytes_read)
+            tag = group << 16 | elem
+            if tag != _ITEM_TAG:
+                # (FFFE,E0DD) Sequence Delimitation Item or non-conformant
+                return
+
+            offset = fp.tell()
+            # Items may use implicit VR even if the dataset is explicit VR
+            item_is_implicit_VR = is_implicit_VR
+            if not is_implicit_VR and length != 0:
+                item_is_implicit_VR = _is_implicit_vr(
+                    fp, False, self.is_little_endian, None, is_sequence=True
+                )
+                fp.seek(offset)
+
+            item_path = path + (index, _ITEM_TAG)
+            index += 1
+            if exclude is not None and exclude(item_path):
+                if length != _UNDEFINED_LENGTH:
+                    fp.seek(length, os.SEEK_CUR)
+                else:
+                    _skip_undefined_length_item(
+                        fp, item_is_implicit_VR, self.is_little_endian
+                    )
+
+                continue
+
+            if include is None or include(item_path):
+                yield LeanElement(item_path, None, offset, length, None)
+
+            if length == _UNDEFINED_LENGTH:
+                yield from self.elements(item_path[:-1], None, item_is_implicit_VR)
+            else:
+                yield from self.elements(
+                    item_path[:-1], offset + length, item_is_implicit_VR
+                )
+                if not self.stopped:
+                    fp.seek(offset + length)
+
+            if self.stopped:
+                return
+
+
+def _iter_elements(
+    fp: BinaryIO,
+    include: PathPredicate | None,
+    exclude: PathPredicate | None,
+    descend: bool,
+    defer_size: int | float | None,
+    force: bool,
+    stop_when: PathPredicate | None = None,
+) -> Iterator[LeanElement]:
+    """Yield the elements in `fp` for :func:`iter_elements`."""
+    _read_preamble(fp, force)
+
+    # The File Meta Information is always read so the transfer syntax is known
+    tsyntax = None
+    for elem in _LeanReader(fp, True).elements((), None, False, group=0x0002):
+        if elem.path[0] == 0x00020010 and elem.value:
+            tsyntax = UID(elem.value.strip(b"\x00 ").decode("ascii", "replace"))
+
+        if stop_when is not None and stop_when(elem.path):
+            return
+
+        if exclude is not None and exclude(elem.path):
+            continue
+
+        if include is None or include(elem.path):
+            if defer_size is not None and elem.length > defer_size:
+                elem = elem._replace(value=None)
+
+            yield elem
+
+    # Command Set elements are always implicit VR little endian
+    reader = _LeanReader(fp, True, include, exclude, descend, defer_size, stop_when)
+    yield from reader.elements((), None, True, group=0x0000)
+    if reader.stopped:
+        return
+
+    is_implicit_VR, is_little_endian, is_deflated = _dataset_encoding(fp, tsyntax)
+    if is_deflated:
+        fp = cast(BinaryIO, DicomInflateIO(fp))
+
+    reader = _LeanReader(
+        fp, is_little_endian, include, exclude, descend, defer_size, stop_when
+    )
+    yield from reader.elements((), None, is_implicit_VR)
+
+
+def iter_elements(
+    fp: PathType | BinaryIO | ReadableBuffer,
+    include: PathPredicate | None = None,
+    exclude: PathPredicate | None = None,
+    descend: bool = False,
+    defer_size: int | str | float | None = None,
+    force: bool = False,
+    stop_when: PathPredicate | None = None,
+) -> Iterator[LeanElement]:
+    """Yield the encoded elements in a DICOM file.
+
+    Only the element headers are parsed, with no
+    :class:`~pydicom3.dataset.Dataset` or
+    :class:`~pydicom3.dataelem.DataElement` created and no value conversion
+    or validation, which makes :func:`iter_elements` much faster than
+    :func:`~pydicom3.dcmread` when only a few values are needed or when
+    indexing the locations of elements. The encoding of the dataset is
+    determined in the same way as :func:`~pydicom3.dcmread`, including
+    datasets with missing or incorrect transfer syntaxes and sequence items
+    encoded as implicit VR in explicit VR datasets.
+
+    .. versionadded:: 3.1
+
+    Examples
+    --------
+
+    Get the location of the *Pixel Data* value:
+
+    >>> for elem in iter_elements("CT_small.dcm", defer_size=0):
+    ...     if elem.path == (0x7FE00010,):
+    ...         print(elem.offset, elem.length)
+    ...
+    6300 32768
+
+    Get the *Beam Name* of each beam without descending into the other
+    sequences:
+
+    >>> for elem in iter_elements(
+    ...     "rtplan.dcm",
+    ...     include=lambda path: path[-1] == 0x300A00C2,
+    ...     exclude=lambda path: path[0] != 0x300A00B0,
+    ...     descend=True,
+    ... ):
+    ...     print(elem.path[1], elem.value)
+    ...
+    0 b'Field 1 '
+
+    Parameters
+    ----------
+    fp : str, PathLike, file-like or readable buffer
+        The path to the DICOM file, or a file-like positioned at the start of
+        the DICOM data.
+    include : Callable[[tuple[int, ...]], bool], optional
+        If used then a callable that takes an element's tag path and returns
+        ``True`` if the element should be yielded. Elements that aren't
+        yielded don't have their values read, however sequences are still
+        descended into if `descend` is ``True``.
+    exclude : Callable[[tuple[int, ...]], bool], optional
+        If used then a callable that takes an element's tag path and returns
+        ``True`` if the element should be skipped. Skipped sequences and
+        sequence items aren't descended into, so none of their elements are
+        yielded.
+    descend : bool, optional
+        If ``True`` then also yield the items of each sequence and their
+        elements, otherwise (default) only yield the top-level elements.
+    defer_size : int, str or float, optional
+        If used then the values of elements larger than `defer_size` aren't
+        read and are yielded as ``None``. See :func:`~pydicom3.dcmread` for
+        more information.
+    force : bool, optional
+        If ``False`` (default) then raise an
+        :class:`~pydicom3.errors.InvalidDicomError` if the file has no preamble
+        and ``'DICM'`` prefix, otherwise read it anyway.
+    stop_when : Callable[[tuple[int, ...]], bool], optional
+        If used then a callable that takes an element's tag path and returns
+        ``True`` if the iteration should stop before the element, such as
+        ``lambda path: path[0] > 0x0028FFFF`` to stop after group ``0x0028``.
+
+    Yields
+    ------
+    LeanElement
+        The encoded elements in the order they're encoded in. The offsets of
+        elements in deflated datasets are relative to the start of the
+        inflated dataset.
+    """
+    fp = path_from_pathlike(fp)
+    defer_size = size_in_bytes(defer_size)
+    if isinstance(fp, str):
+        with open(fp, "rb") as f:
+            yield from _iter_elements(
+                f, include, exclude, descend, defer_size, force, stop_when
+            )
+    else:
+        yield from _iter_elements(
+            cast(BinaryIO, fp), include, exclude, descend, defer_size, force, stop_when
+        )
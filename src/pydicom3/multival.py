@@ -14,6 +14,8 @@ Self = TypeVar("Self", bound="ConstrainedList")
 class ConstrainedList(MutableSequence[T]):
     """A list of items that must all be of the same type."""
 
+    __slots__ = ("_list",)
+
     def __init__(self, iterable: Iterable[T] | None = None) -> None:
         """Create a new ConstrainedList.
 
@@ -70,10 +72,23 @@ class ConstrainedList(MutableSequence[T]):
         """Insert an `item` at `position`."""
         self._list.insert(position, self._validate(item))
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state to be pickled."""
+        # Required to pickle with protocols 0 and 1 as the class uses slots
+        state = getattr(self, "__dict__", {}).copy()
+        state["_list"] = self._list
+        return state
+
     def __iter__(self) -> Iterator[T]:
         """Yield items."""
         yield from self._list
 
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the pickled state."""
+        self._list = state.pop("_list")
+        if state:
+            self.__dict__.update(state)
+
     def __len__(self) -> int:
         """Return the number of contained items."""
         return len(self._list)
@@ -120,6 +135,8 @@ class MultiValue(ConstrainedList[T]):
     than an instance of their classes.
     """
 
+    __slots__ = ("_constructor",)
+
     def __init__(
         self,
         type_constructor: Callable[[Any], T],
@@ -145,6 +162,17 @@ class MultiValue(ConstrainedList[T]):
 
         super().__init__(iterable)
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state to be pickled."""
+        state = super().__getstate__()
+        state["_constructor"] = self._constructor
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the pickled state."""
+        self._constructor = state.pop("_constructor")
+        super().__setstate__(state)
+
     def _validate(self, item: Any | T) -> T:
         return self._constructor(item)
 
@@ -15,6 +15,7 @@ from pydicom3.pixels.processing import (
     create_icc_transform,
 )
 from pydicom3.pixels.utils import (
+    aiter_pixels,
     as_pixel_options,
     compress,
     decompress,
@@ -1,7 +1,9 @@
 # Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
 """Utilities for pixel data handling."""
 
-from collections.abc import Iterable, Iterator
+import asyncio
+from collections.abc import AsyncIterator, Generator, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
 
 try:
     from collections.abc import Buffer  # type: ignore[attr-defined]
@@ -24,6 +26,7 @@ except ImportError:
 from pydicom3.charset import default_encoding
 from pydicom3._dicom_dict import DicomDictionary
 from pydicom3.encaps import encapsulate, encapsulate_extended
+from pydicom3.filebase import AsyncReadableBuffer, _AsyncBuffer
 from pydicom3.misc import warn_and_log
 from pydicom3.tag import BaseTag
 from pydicom3.uid import (
@@ -1275,6 +1278,113 @@ def iter_pixels(
             f.seek(file_offset)
 
 
+async def aiter_pixels(
+    src: "AsyncReadableBuffer | Dataset",
+    *,
+    ds_out: "Dataset | None" = None,
+    specific_tags: list[BaseTag | int] | None = None,
+    indices: Iterable[int] | None = None,
+    raw: bool = False,
+    decoding_plugin: str = "",
+    executor: Executor | None = None,
+    **kwargs: Any,
+) -> AsyncIterator["np.ndarray"]:
+    """Asynchronously yield decoded pixel data frames from `src` as
+    :class:`~numpy.ndarray` without blocking the event loop.
+
+    .. versionadded:: 3.1
+
+    The frames are read and decoded by :func:`iter_pixels` running in
+    `executor`, one frame at a time. When `src` is an asynchronous file-like
+    each read, seek and tell is awaited in the running event loop, so only
+    the dataset up to the pixel data and the current frame are read.
+
+    Examples
+    --------
+
+    Iterate through the frames of a dataset opened using `aiofiles
+    <https://pypi.org/project/aiofiles/>`_::
+
+        import aiofiles
+
+        from pydicom3.pixels import aiter_pixels
+
+        async with aiofiles.open("path/to/dataset.dcm", "rb") as f:
+            async for arr in aiter_pixels(f):
+                print(arr.shape)
+
+    Parameters
+    ----------
+    src : async file-like | pydicom3.dataset.Dataset
+
+        * async file-like: an object with ``async`` ``read()``, ``seek()`` and
+          ``tell()`` methods with the same signatures as those of
+          :class:`io.BufferedReader`, containing the dataset.
+        * :class:`~pydicom3.dataset.Dataset`: a dataset instance
+    ds_out : pydicom3.dataset.Dataset, optional
+        See :func:`iter_pixels` for parameter info. **Only available when
+        `src` is an async file-like.**
+    specific_tags : list[int | pydicom3.tag.BaseTag], optional
+        See :func:`iter_pixels` for parameter info.
+    indices : Iterable[int] | None, optional
+        See :func:`iter_pixels` for parameter info.
+    raw : bool, optional
+        See :func:`iter_pixels` for parameter info.
+    decoding_plugin : str, optional
+        See :func:`iter_pixels` for parameter info.
+    executor : concurrent.futures.Executor, optional
+        The thread-based executor to read and decode the frames in, defaults
+        to the event loop's default executor.
+    **kwargs
+        Optional keyword parameters for controlling decoding are also
+        available, please see the :doc:`decoding options documentation
+        </guides/decoding/decoder_options>` for more information.
+
+    Yields
+    -------
+    numpy.ndarray
+        A single frame of decoded pixel data, see :func:`iter_pixels` for
+        more information.
+
+    Raises
+    ------
+    TypeError
+        If `executor` is a :class:`~concurrent.futures.ProcessPoolExecutor`.
+    """
+    from pydicom3.dataset import Dataset
+
+    if isinstance(executor, ProcessPoolExecutor):
+        raise TypeError("aiter_pixels: 'executor' must use threads, not processes")
+
+    loop = asyncio.get_running_loop()
+    source: BinaryIO | Dataset
+    if isinstance(src, Dataset):
+        source = src
+    else:
+        source = cast(BinaryIO, await _AsyncBuffer.from_buffer(src))
+
+    iterator = cast(
+        Generator["np.ndarray", None, None],
+        iter_pixels(
+            source,
+            ds_out=ds_out,
+            specific_tags=specific_tags,
+            indices=indices,
+            raw=raw,
+            decoding_plugin=decoding_plugin,
+            **kwargs,
+        ),
+    )
+    try:
+        while (
+            arr := await loop.run_in_executor(executor, next, iterator, None)
+        ) is not None:
+            yield arr
+    finally:
+        # Closing the iterator restores the position of `src`
+        await loop.run_in_executor(executor, iterator.close)
+
+
 def pack_bits(arr: "np.ndarray", pad: bool = True) -> bytes:
     """Pack a binary :class:`numpy.ndarray` for use with *Pixel Data*.
 
@@ -0,0 +1,219 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Sharing of element values between datasets, such as those in a series."""
+
+import copy
+import sys
+from collections.abc import MutableSequence
+from typing import Any
+
+from pydicom3 import config
+from pydicom3.dataelem import DataElement, RawDataElement, convert_raw_data_element
+from pydicom3.dataset import Dataset, _cow_value, _is_mutable
+from pydicom3.multival import MultiValue
+from pydicom3.sequence import LazySequence
+from pydicom3.valuerep import VR
+
+
+def _intern(value: Any) -> Any:
+    """Return `value` with any :class:`str` values interned."""
+    if type(value) is str:
+        return sys.intern(value)
+
+    if isinstance(value, MultiValue):
+        value._list = [sys.intern(v) if type(v) is str else v for v in value._list]
+
+    return value
+
+
+def _sizeof(value: Any) -> int:
+    """Return the approximate memory used by the shared parts of an element
+    `value`.
+    """
+    if isinstance(value, MultiValue):
+        return sum(sys.getsizeof(v) for v in value._list)
+
+    return sys.getsizeof(value)
+
+
+class ElementPool:
+    """A pool of element values shared by the datasets read using it.
+
+    When a dataset is read using :func:`~pydicom3.filereader.dcmread` with
+    a pool, the encoded values of its raw elements are replaced by those of
+    any equal values already in the pool. When the elements are later
+    converted, those with the same tag, VR, encoding and encoded value as a
+    previously converted element share its value and :class:`str` values
+    are interned. Datasets in a series, which repeat many of the same values
+    such as the *Study Instance UID* and *Image Orientation (Patient)*,
+    then only hold a single copy of each.
+
+    Only immutable values are shared, mutable values such as those of
+    multi-valued elements are copied on conversion while sharing their
+    items, so modifying the value of one dataset's element never affects
+    another dataset. Values converted while a
+    :attr:`~pydicom3.config.data_element_callback` is in use aren't shared.
+
+    .. versionadded:: 3.1
+
+    Examples
+    --------
+
+    >>> pool = ElementPool()
+    >>> series = [dcmread(path, pool=pool) for path in paths]
+    >>> print(pool.bytes_saved)
+
+    Attributes
+    ----------
+    max_length : int
+        The maximum length of the encoded values that are shared.
+    hits : int
+        The number of values that have been shared.
+    bytes_saved : int
+        The approximate memory saved by sharing values, in bytes.
+    """
+
+    def __init__(self, max_length: int = 1024) -> None:
+        """Create a new :class:`ElementPool`.
+
+        Parameters
+        ----------
+        max_length : int, optional
+            The maximum length of the encoded values that are shared, default
+            ``1024``. Larger values, such as *Pixel Data*, are rarely the
+            same between datasets.
+        """
+        self.max_length = max_length
+        self.hits = 0
+        self.bytes_saved = 0
+        # The encoded values, keyed by themselves
+        self._encoded: dict[bytes, bytes] = {}
+        # The converted elements, keyed by the raw element's tag, VR, encoded
+        #   value and encoding
+        self._elements: dict[tuple[Any, ...], DataElement] = {}
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "ElementPool":
+        """Return the pool, as copies of datasets still share it."""
+        return self
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Return the information needed to pickle the pool.
+
+        The values aren't included, so unpickled datasets share a new empty
+        pool.
+        """
+        return ElementPool, (self.max_length,)
+
+    def __len__(self) -> int:
+        """Return the number of encoded values in the pool."""
+        return len(self._encoded)
+
+    def add(self, ds: Dataset) -> None:
+        """Share the encoded values of the raw elements in `ds` and in the
+        items of its sequences with those in the pool.
+
+        Elements of `ds` converted afterwards also share their values with
+        those in the pool.
+
+        Parameters
+        ----------
+        ds : pydicom3.dataset.Dataset
+            The dataset to add.
+        """
+        ds._pool = self
+        for tag, elem in ds._dict.items():
+            if isinstance(elem, DataElement):
+                if elem.VR == VR.SQ:
+                    self._add_items(elem.value)
+
+                continue
+
+            value = elem.value
+            if type(value) is not bytes or not value or len(value) > self.max_length:
+                continue
+
+            shared = self._encoded.setdefault(value, value)
+            if shared is not value:
+                ds._dict[tag] = elem._replace(value=shared)
+                self.hits += 1
+                self.bytes_saved += sys.getsizeof(value)
+
+    def _add_items(self, items: MutableSequence[Dataset]) -> None:
+        """Add the sequence `items`, those not yet parsed are added when they
+        are.
+        """
+        if isinstance(items, LazySequence):
+            items._pool = self
+            items = [item for item in items._list if isinstance(item, Dataset)]
+
+        for item in items:
+            self.add(item)
+
+    def clear(self) -> None:
+        """Remove all the values from the pool.
+
+        Datasets that were read using the pool keep the values they share.
+        """
+        self._encoded.clear()
+        self._elements.clear()
+
+    def convert(
+        self, raw: RawDataElement, encoding: str | MutableSequence[str], ds: Dataset
+    ) -> DataElement:
+        """Return a :class:`~pydicom3.dataelem.DataElement` converted from
+        `raw`, sharing its value with any equal element in the pool.
+
+        Parameters
+        ----------
+        raw : pydicom3.dataelem.RawDataElement
+            The raw element to convert.
+        encoding : str | MutableSequence[str]
+            The character set encodings for the element.
+        ds : pydicom3.dataset.Dataset
+            The dataset containing `raw`.
+
+        Returns
+        -------
+        pydicom3.dataelem.DataElement
+            The converted element.
+        """
+        value = raw.value
+        if (
+            type(value) is not bytes
+            or len(value) > self.max_length
+            or config.data_element_callback
+            # The VR of private elements may depend on the private creator
+            or raw.tag.is_private
+        ):
+            elem = convert_raw_data_element(raw, encoding=encoding, ds=ds)
+            if elem.VR == VR.SQ:
+                self._add_items(elem.value)
+
+            return elem
+
+        key = (
+            raw.tag,
+            raw.VR,
+            value,
+            raw.is_implicit_VR,
+            raw.is_little_endian,
+            encoding if isinstance(encoding, str) else tuple(encoding),
+        )
+        if (shared := self._elements.get(key)) is None:
+            elem = convert_raw_data_element(raw, encoding=encoding, ds=ds)
+            if elem.VR == VR.SQ:
+                self._add_items(elem.value)
+            elif not _is_mutable(elem.value) or isinstance(elem.value, MultiValue):
+                elem._value = _intern(elem.value)
+                self._elements[key] = copy.copy(elem)
+                elem._value = _cow_value(elem.value)
+
+            return elem
+
+        # Mutable containers are copied, but their items are shared
+        elem = copy.copy(shared)
+        elem._value = _cow_value(shared.value)
+        elem.file_tell = raw.value_tell
+        self.hits += 1
+        self.bytes_saved += _sizeof(shared.value)
+
+        return elem
@@ -3,11 +3,24 @@
 
 Sequence is a list of pydicom3 Dataset objects.
 """
-from typing import cast, Any, TypeVar
-from collections.abc import Iterable
+from typing import (
+    cast,
+    overload,
+    Any,
+    BinaryIO,
+    NamedTuple,
+    TypeVar,
+    TYPE_CHECKING,
+)
+from collections.abc import Iterable, Iterator, MutableSequence
 
+from pydicom3.charset import convert_encodings
 from pydicom3.dataset import Dataset
 from pydicom3.multival import ConstrainedList
+from pydicom3.tag import TAG_PIXREP
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydicom3.pool import ElementPool
 
 
 # Python 3.11 adds typing.Self, until then...
@@ -81,3 +94,167 @@ class Sequence(ConstrainedList[Dataset]):
             return item
 
         raise TypeError("Sequence contents must be 'Dataset' instances.")
+
+
+class _UnparsedItem(NamedTuple):
+    """The location of an encoded sequence item that hasn't been parsed yet."""
+
+    # Offset to the start of the item's (FFFE,E000) tag in the encoded value
+    start: int
+    # The length of the encoded item, including the item tag and length
+    #   and any (FFFE,E00D) *Item Delimitation Item*
+    length: int
+
+
+class LazySequence(Sequence):
+    """A :class:`Sequence` where each item is only parsed from its encoded
+    form the first time it's accessed.
+
+    Used when reading a sequence with the
+    :attr:`~pydicom3.config.Settings.lazy_sequences` option enabled.
+
+    .. versionadded:: 3.1
+    """
+
+    # Set by Dataset._set_pixel_representation() for the items not yet parsed
+    _pixel_rep: int
+    # Set by ElementPool for the items not yet parsed
+    _pool: "ElementPool | None" = None
+
+    def __init__(
+        self,
+        buffer: bytes | memoryview,
+        items: Iterable[tuple[int, int]],
+        is_implicit_VR: bool,
+        is_little_endian: bool,
+        encoding: str | MutableSequence[str],
+        offset: int = 0,
+    ) -> None:
+        """Create a new :class:`LazySequence`.
+
+        Parameters
+        ----------
+        buffer : bytes | memoryview
+            The encoded sequence value.
+        items : Iterable[tuple[int, int]]
+            The offset to the start of each item in `buffer` and the length
+            of the encoded item, including the item tag and length and any
+            *Item Delimitation Item*.
+        is_implicit_VR : bool
+            ``True`` if the sequence is encoded using implicit VR, ``False``
+            otherwise.
+        is_little_endian : bool
+            ``True`` if the sequence is encoded using little endian, ``False``
+            otherwise.
+        encoding : str | MutableSequence[str]
+            The character encoding(s) used to encode the sequence's items.
+        offset : int, optional
+            The offset to the start of `buffer` in the file it was read from.
+        """
+        super().__init__()
+
+        self._buffer = buffer
+        self._list = cast(list[Dataset], [_UnparsedItem(*item) for item in items])
+        self._offset = offset
+        self.original_encoding = (is_implicit_VR, is_little_endian)
+        self.original_character_set = convert_encodings(encoding)
+
+    def encoded_item(self, index: int) -> bytes | memoryview | None:
+        """Return the encoded item at `index`, including the item tag and
+        length, or ``None`` if the item has been parsed.
+        """
+        item = self._list[index]
+        if isinstance(item, _UnparsedItem):
+            return self._buffer[item.start : item.start + item.length]
+
+        return None
+
+    def __eq__(self, other: Any) -> Any:
+        """Return ``True`` if `other` is equal to self."""
+        self._parse_all()
+        return super().__eq__(other)
+
+    @overload
+    def __getitem__(self, index: int) -> Dataset:
+        pass  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> MutableSequence[Dataset]:
+        pass  # pragma: no cover
+
+    def __getitem__(self, index: slice | int) -> MutableSequence[Dataset] | Dataset:
+        """Return item(s) from self, parsing them if required."""
+        if isinstance(index, slice):
+            return [self._parse(idx) for idx in range(*index.indices(len(self)))]
+
+        return self._parse(index)
+
+    def __iter__(self) -> Iterator[Dataset]:
+        """Yield items, parsing them if required."""
+        for idx in range(len(self._list)):
+            yield self._parse(idx)
+
+    def __ne__(self, other: Any) -> Any:
+        """Return ``True`` if `other` is not equal to self."""
+        self._parse_all()
+        return super().__ne__(other)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state to be pickled."""
+        state = super().__getstate__()
+        # Views of an enclosing sequence or memory-mapped file can't be pickled
+        state["_buffer"] = bytes(self._buffer)
+        return state
+
+    @property
+    def is_parsed(self) -> bool:
+        """Return ``True`` if every item has been parsed, ``False`` otherwise."""
+        return not any(isinstance(item, _UnparsedItem) for item in self._list)
+
+    def _parse(self, index: int) -> Dataset:
+        """Return the item at `index`, parsing it first if required."""
+        item = self._list[index]
+        if not isinstance(item, _UnparsedItem):
+            return item
+
+        from pydicom3.filebase import _MemoryViewBuffer
+        from pydicom3.filereader import read_sequence_item
+
+        # Any nested lazy sequences use views of the buffer rather than copies
+        fp = cast(BinaryIO, _MemoryViewBuffer(self._buffer, None))
+        fp.seek(item.start)
+        is_implicit_VR, is_little_endian = self.original_encoding
+        ds = cast(
+            Dataset,
+            read_sequence_item(
+                fp,
+                is_implicit_VR,
+                is_little_endian,
+                self.original_character_set,
+                self._offset,
+            ),
+        )
+        ds.file_tell = item.start + self._offset
+
+        # Update the item's *Pixel Representation* as
+        #   Dataset._set_pixel_representation() would've done
+        if TAG_PIXREP in ds._dict:
+            pr = ds._dict[TAG_PIXREP].value
+            if pr is not None:
+                ds._pixel_rep = int(b"\x01" in pr) if isinstance(pr, bytes) else pr
+            elif hasattr(self, "_pixel_rep"):
+                ds._pixel_rep = self._pixel_rep
+        elif hasattr(self, "_pixel_rep"):
+            ds._pixel_rep = self._pixel_rep
+
+        if self._pool is not None:
+            self._pool.add(ds)
+
+        self._list[index] = ds
+
+        return ds
+
+    def _parse_all(self) -> None:
+        """Parse all the items that haven't been parsed yet."""
+        for idx in range(len(self._list)):
+            self._parse(idx)
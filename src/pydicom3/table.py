@@ -0,0 +1,413 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Column-oriented tables of element values from many datasets."""
+
+from collections.abc import Callable, Iterable, Iterator
+import re
+from typing import Any, BinaryIO, cast
+
+try:
+    import numpy as np
+
+    HAVE_NP = True
+except ImportError:
+    HAVE_NP = False
+
+from pydicom3.datadict import (
+    dictionary_VM,
+    dictionary_VR,
+    keyword_for_tag,
+    tag_for_keyword,
+)
+from pydicom3.dataelem import DataElement
+from pydicom3.dataset import Dataset
+from pydicom3.filebase import ReadableBuffer
+from pydicom3.filereader import dcmread
+from pydicom3.fileutil import PathType
+from pydicom3.multival import MultiValue
+from pydicom3.tag import BaseTag, Tag
+from pydicom3.valuerep import AMBIGUOUS_VR, PersonName
+
+# (0008,0005) Specific Character Set, (0028,0103) Pixel Representation
+_CHARSET_TAG = 0x00080005
+_PIXREP_TAG = 0x00280103
+
+# The dtypes of the columns for the numeric VRs, all other VRs are object
+_DTYPES = {
+    "DS": "f8",
+    "FD": "f8",
+    "FL": "f8",
+    "IS": "i8",
+    "SL": "i8",
+    "SS": "i8",
+    "SV": "i8",
+    "UL": "i8",
+    "US": "i8",
+    "US or SS": "i8",
+    "UV": "u8",
+}
+
+# A path component, either a keyword or tag with an optional item index
+_COMPONENT = re.compile(r"^(\w+)(?:\[(\d+)\])?$")
+
+
+class _Column:
+    """The location and values of a single column."""
+
+    def __init__(self, spec: str | int) -> None:
+        # The (sequence tag, item index) pairs leading to the element
+        self.items: list[tuple[int, int]] = []
+        if isinstance(spec, str):
+            self.name = spec
+            components = spec.split(".")
+            for component in components[:-1]:
+                tag, index = _parse_component(spec, component)
+                self.items.append((tag, 0 if index is None else index))
+
+            self.tag, index = _parse_component(spec, components[-1])
+            if index is not None:
+                raise ValueError(
+                    f"Invalid column '{spec}', the last element in a path must "
+                    "not have an item index"
+                )
+        else:
+            self.tag = Tag(spec)
+            self.name = keyword_for_tag(self.tag) or f"{self.tag:08X}"
+
+        try:
+            self.VR: str | None = dictionary_VR(self.tag)
+            self.VM = dictionary_VM(self.tag)
+        except KeyError:
+            # Private or unknown elements, use the VR of the first element
+            self.VR = None
+            self.VM = "1-n"
+
+        self.values: list[Any] = []
+
+    @property
+    def top_level_tag(self) -> int:
+        """Return the tag of the top-level element for the column."""
+        return self.items[0][0] if self.items else self.tag
+
+
+def _parse_component(spec: str, component: str) -> tuple[int, int | None]:
+    """Return the tag and item index (if any) for a `component` of a column
+    path.
+    """
+    if not (match := _COMPONENT.match(component)):
+        raise ValueError(f"Invalid column '{spec}'")
+
+    name, index = match.groups()
+    tag = tag_for_keyword(name)
+    if tag is None:
+        if len(name) != 8:
+            raise ValueError(
+                f"Invalid column '{spec}', '{name}' is not a known element "
+                "keyword or an 8 character hex tag"
+            )
+
+        try:
+            tag = int(name, 16)
+        except ValueError:
+            raise ValueError(
+                f"Invalid column '{spec}', '{name}' is not a known element "
+                "keyword or an 8 character hex tag"
+            )
+
+    return tag, None if index is None else int(index)
+
+
+def _find(ds: Dataset, column: _Column) -> DataElement | None:
+    """Return the element for `column` in `ds` or ``None`` if not found."""
+    if column.top_level_tag >> 16 == 0x0002:
+        ds = getattr(ds, "file_meta", None) or Dataset()
+
+    for tag, index in column.items:
+        if tag not in ds or (elem := ds[tag]).VR != "SQ":
+            return None
+
+        if index >= len(items := elem.value):
+            return None
+
+        ds = items[index]
+
+    if column.tag not in ds:
+        return None
+
+    return ds[column.tag]
+
+
+def _as_tuple(value: Any) -> tuple[Any, ...]:
+    """Return the element `value` as a tuple of values."""
+    if value is None or (isinstance(value, str | bytes) and not value):
+        return ()
+
+    if isinstance(value, MultiValue | list | tuple):
+        return tuple(str(v) if isinstance(v, PersonName) else v for v in value)
+
+    return (str(value) if isinstance(value, PersonName) else value,)
+
+
+class DatasetTable:
+    """A column-oriented table of element values from many datasets.
+
+    Each column is a :class:`numpy.ndarray` with one row per dataset, in the
+    order the datasets were tabulated. Columns for the decimal and floating
+    point VRs are ``float64``, the integer VRs are ``int64`` (or ``uint64``
+    for *UV*) and all other VRs are ``object``. Numeric columns for elements
+    with a fixed VM greater than 1, such as *Image Position (Patient)*, have
+    shape ``(rows, VM)``, while elements with a variable VM have ``object``
+    columns containing a :class:`tuple` of the values.
+
+    Values that are missing, empty or have the wrong number of values are
+    ``NaN`` in ``float64`` columns, ``0`` in integer columns and ``None`` in
+    ``object`` columns, and are ``True`` in the column's :meth:`mask`.
+
+    .. versionadded:: 3.1
+
+    Examples
+    --------
+
+    Find the series with thin CT slices:
+
+    >>> table = tabulate(
+    ...     paths, ["Modality", "SliceThickness", "SeriesInstanceUID"]
+    ... )
+    >>> thin = (table["Modality"] == "CT") & (table["SliceThickness"] < 1)
+    >>> series = set(table[thin]["SeriesInstanceUID"])
+    """
+
+    def __init__(
+        self, columns: dict[str, "np.ndarray"], masks: dict[str, "np.ndarray"]
+    ) -> None:
+        """Create a new :class:`DatasetTable`.
+
+        Parameters
+        ----------
+        columns : dict[str, numpy.ndarray]
+            The arrays for each column, with the same number of rows.
+        masks : dict[str, numpy.ndarray]
+            The boolean arrays for each column, with shape ``(rows,)``, that
+            are ``True`` where a value is missing.
+        """
+        self._columns = columns
+        self._masks = masks
+
+    @property
+    def columns(self) -> list[str]:
+        """Return the names of the columns."""
+        return list(self._columns)
+
+    def __contains__(self, name: str) -> bool:
+        """Return ``True`` if `name` is the name of a column."""
+        return name in self._columns
+
+    def __getitem__(self, key: Any) -> Any:
+        """Return a column or a table with a subset of the rows.
+
+        Parameters
+        ----------
+        key : str | slice | numpy.ndarray
+            The name of the column to return, or any index supported by
+            :class:`numpy.ndarray`, such as a slice or a boolean array, for the
+            rows to return.
+
+        Returns
+        -------
+        numpy.ndarray | DatasetTable
+            If `key` is a :class:`str` then the column, otherwise a new table
+            with only the rows in `key`.
+        """
+        if isinstance(key, str):
+            return self._columns[key]
+
+        return DatasetTable(
+            {name: arr[key] for name, arr in self._columns.items()},
+            {name: arr[key] for name, arr in self._masks.items()},
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield the names of the columns."""
+        yield from self._columns
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(next(iter(self._masks.values()), ()))
+
+    def __repr__(self) -> str:
+        """Return a string representation of the table."""
+        return f"<DatasetTable: {len(self)} rows, columns {self.columns}>"
+
+    def mask(self, name: str) -> "np.ndarray":
+        """Return a boolean array with shape ``(rows,)`` that's ``True`` for
+        rows where the value for the column `name` is missing.
+        """
+        return self._masks[name]
+
+    def masked(self, name: str) -> "np.ma.MaskedArray":
+        """Return the column `name` as a :class:`numpy.ma.MaskedArray` with
+        the missing values masked.
+        """
+        arr = self._columns[name]
+        mask = self._masks[name].reshape((-1,) + (1,) * (arr.ndim - 1))
+
+        return np.ma.MaskedArray(arr, mask=np.broadcast_to(mask, arr.shape))
+
+    def to_structured(self) -> "np.ndarray":
+        """Return the table as a structured array with a field for each
+        column.
+        """
+        dtype = [
+            (name, arr.dtype, arr.shape[1:]) for name, arr in self._columns.items()
+        ]
+        arr = np.empty(len(self), dtype=dtype)
+        for name, column in self._columns.items():
+            arr[name] = column
+
+        return arr
+
+
+def _to_arrays(column: _Column) -> tuple["np.ndarray", "np.ndarray"]:
+    """Return the array and mask for `column`."""
+    vr, vm = column.VR or "UN", column.VM
+    nr_rows = len(column.values)
+    mask = np.zeros(nr_rows, dtype=bool)
+
+    if vm.isdigit() and (dtype := _DTYPES.get(vr)):
+        func: Callable[[Any], float | int] = float if dtype == "f8" else int
+        nr_values = int(vm)
+        empty = [float("nan") if dtype == "f8" else 0] * nr_values
+        rows = []
+        for idx, values in enumerate(column.values):
+            try:
+                if len(values) == nr_values:
+                    rows.append([func(v) for v in values])
+                    continue
+            except (TypeError, ValueError):
+                pass
+
+            mask[idx] = True
+            rows.append(empty)
+
+        arr = np.asarray(rows, dtype=dtype).reshape(nr_rows, nr_values)
+        return (arr.reshape(nr_rows) if nr_values == 1 else arr), mask
+
+    objects = np.empty(nr_rows, dtype=object)
+    for idx, values in enumerate(column.values):
+        if not values:
+            mask[idx] = True
+        elif vm == "1" and len(values) == 1:
+            objects[idx] = values[0]
+        else:
+            objects[idx] = values
+
+    return objects, mask
+
+
+def tabulate(
+    sources: Iterable[PathType | BinaryIO | ReadableBuffer | Dataset],
+    columns: Iterable[str | int],
+    *,
+    force: bool = False,
+) -> DatasetTable:
+    """Return a column-oriented table of element values from many datasets.
+
+    Files are read using :func:`~pydicom3.filereader.dcmread` with
+    `specific_tags` so only the top-level elements needed for the columns are
+    parsed, and each dataset is discarded once its values have been taken.
+
+    .. versionadded:: 3.1
+
+    Examples
+    --------
+
+    >>> from pathlib import Path
+    >>> paths = Path("archive").glob("**/*.dcm")
+    >>> table = tabulate(
+    ...     paths,
+    ...     [
+    ...         "Modality",
+    ...         "SliceThickness",
+    ...         "ImagePositionPatient",
+    ...         "ReferencedImageSequence[0].ReferencedSOPInstanceUID",
+    ...     ],
+    ... )
+    >>> table["ImagePositionPatient"].shape
+    (1024, 3)
+    >>> ct = table[table["Modality"] == "CT"]
+
+    Parameters
+    ----------
+    sources : Iterable[str | PathLike | file-like | readable buffer | Dataset]
+        The datasets, or the DICOM files to read them from.
+    columns : Iterable[str | int]
+        The elements to use for the columns, as either:
+
+        * An element keyword such as ``"PatientID"`` or tag such as
+          ``0x00100020``.
+        * A path to an element in a sequence item, made up of keywords or 8
+          character hex tags separated by ``"."``, where each sequence has the
+          index of the item such as
+          ``"SharedFunctionalGroupsSequence[0].PixelMeasuresSequence[0].SliceThickness"``.
+          The first item is used if a sequence has no index.
+
+        The name of the column is the keyword or path, or for a tag its
+        keyword if known or otherwise its 8 character hex form.
+    force : bool, optional
+        If ``True`` then read files that have no preamble and ``'DICM'``
+        prefix, default ``False``.
+
+    Returns
+    -------
+    DatasetTable
+        The table with one row for each of the `sources`.
+
+    Raises
+    ------
+    ValueError
+        If a column isn't a valid keyword, tag or path, or if the same column
+        is given more than once.
+    """
+    if not HAVE_NP:
+        raise ImportError("NumPy is required for tabulate()")
+
+    table: dict[str, _Column] = {}
+    for spec in columns:
+        column = _Column(spec)
+        if column.name in table:
+            raise ValueError(f"The column '{column.name}' is included more than once")
+
+        table[column.name] = column
+
+    # The top-level elements to read, excluding the File Meta Information
+    tags: set[int] = {_CHARSET_TAG}
+    for column in table.values():
+        if column.top_level_tag >> 16 != 0x0002:
+            tags.add(column.top_level_tag)
+
+        if column.VR in AMBIGUOUS_VR:
+            # Required to correct ambiguous VRs
+            tags.add(_PIXREP_TAG)
+
+    specific_tags = cast(list[BaseTag | int], sorted(tags))
+    for src in sources:
+        if isinstance(src, Dataset):
+            ds = src
+        else:
+            ds = dcmread(src, force=force, specific_tags=specific_tags)
+
+        for column in table.values():
+            if (elem := _find(ds, column)) is None:
+                column.values.append(())
+                continue
+
+            if column.VR is None:
+                column.VR = elem.VR
+
+            column.values.append(_as_tuple(elem.value))
+
+    columns_: dict[str, np.ndarray] = {}
+    masks: dict[str, np.ndarray] = {}
+    for name, column in table.items():
+        columns_[name], masks[name] = _to_arrays(column)
+
+    return DatasetTable(columns_, masks)
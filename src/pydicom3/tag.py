@@ -9,7 +9,7 @@ stored as a single number and separated to (group, element) as required.
 #       element
 from contextlib import contextmanager
 import traceback
-from typing import Any, TypeAlias
+from typing import Any, SupportsIndex, TypeAlias
 from collections.abc import Iterator
 
 
@@ -144,6 +144,13 @@ class BaseTag(int):
     Tags are represented as an :class:`int`.
     """
 
+    __slots__ = ()
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        """Return the information needed to pickle the tag."""
+        # Much faster than the default for int subclasses
+        return type(self), (int(self),)
+
     # Override comparisons so can convert "other" to Tag as necessary
     #   See Ordering Comparisons at:
     #   https://docs.python.org/3/whatsnew/3.0.html#ordering-comparisons
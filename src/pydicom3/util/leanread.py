@@ -25,7 +25,11 @@ _ElementType = tuple[tuple[int, int], bytes | None, int, bytes | None, int]
 
 
 class dicomfile:
-    """Context-manager based DICOM file object with data element iteration"""
+    """Context-manager based DICOM file object with data element iteration
+
+    See :func:`pydicom3.leanread.iter_elements` for a supported alternative
+    with tag filtering and sequence descent.
+    """
 
     def __init__(self, filename: str | bytes | os.PathLike) -> None:
         self.fobj = fobj = open(filename, "rb")
@@ -13,6 +13,9 @@ from collections.abc import Callable, Sequence, Iterator
 from pydicom3 import config
 from pydicom3.misc import warn_and_log
 
+if config.have_numpy:
+    import numpy
+
 
 # can't import from charset or get circular import
 default_encoding = "iso8859"
@@ -73,7 +76,7 @@ BYTE_VR_REGEXES = {vr: re.compile(regex.encode()) for (vr, regex) in VR_REGEXES.
 
 
 def validate_type(
-    vr: str, value: Any, types: type | tuple[type, type]
+    vr: str, value: Any, types: type | tuple[type, ...]
 ) -> tuple[bool, str]:
     """Checks for valid types for a given VR.
 
@@ -377,12 +380,12 @@ VALIDATORS = {
     "IS": validate_length_and_type_and_regex,
     "LO": validate_type_and_length,
     "LT": validate_type_and_length,
-    "OB": lambda vr, value: validate_type(vr, value, (bytes, bytearray)),
-    "OD": lambda vr, value: validate_type(vr, value, (bytes, bytearray)),
-    "OF": lambda vr, value: validate_type(vr, value, (bytes, bytearray)),
-    "OL": lambda vr, value: validate_type(vr, value, (bytes, bytearray)),
-    "OW": lambda vr, value: validate_type(vr, value, (bytes, bytearray)),
-    "OV": lambda vr, value: validate_type(vr, value, (bytes, bytearray)),
+    "OB": lambda vr, value: validate_type(vr, value, (bytes, bytearray, memoryview)),
+    "OD": lambda vr, value: validate_type(vr, value, (bytes, bytearray, memoryview)),
+    "OF": lambda vr, value: validate_type(vr, value, (bytes, bytearray, memoryview)),
+    "OL": lambda vr, value: validate_type(vr, value, (bytes, bytearray, memoryview)),
+    "OW": lambda vr, value: validate_type(vr, value, (bytes, bytearray, memoryview)),
+    "OV": lambda vr, value: validate_type(vr, value, (bytes, bytearray, memoryview)),
     "PN": validate_pn,
     "SH": validate_type_and_length,
     "SL": lambda vr, value: validate_number(vr, value, -0x80000000, 0x7FFFFFFF),
@@ -998,6 +1001,182 @@ def format_number_as_ds(val: float | Decimal) -> str:
         return f"{val:.{remaining_chars}f}"
 
 
+def format_numbers_as_ds(values: "numpy.ndarray") -> bytes:
+    """Return an encoded Decimal String (DS) value for an array of floats.
+
+    Values from 1e-4 up to 1e14 (1e13 if negative) are formatted together
+    using fixed-point notation, with as many significant digits as fit in 16
+    characters and with any trailing zeros removed. Other values are
+    formatted individually using :func:`format_number_as_ds`.
+
+    .. versionadded:: 3.1
+
+    Parameters
+    ----------
+    values: numpy.ndarray
+        The values to encode, which will be converted to float64.
+
+    Returns
+    -------
+    bytes
+        The backslash separated values, without any trailing padding.
+
+    Raises
+    ------
+    ValueError
+        If any of the values are not finite.
+    """
+    arr = numpy.asarray(values, dtype="f8").ravel()
+    if not numpy.isfinite(arr).all():
+        raise ValueError(
+            "Cannot encode non-finite floats as DICOM decimal strings. Got "
+            f"'{arr[~numpy.isfinite(arr)][0]}'"
+        )
+
+    if not arr.size:
+        return b""
+
+    # Each row is the characters for one value, with 0 for unused characters
+    #   and the last column for the delimiter
+    chars = numpy.zeros((arr.size, 18), dtype="u1")
+    chars[:, 17] = 0x5C
+
+    absval = numpy.abs(arr)
+    negative = arr < 0
+    sign_chars = negative.astype("i8")
+    with numpy.errstate(divide="ignore"):
+        exponent = numpy.floor(numpy.log10(absval))
+
+    # The same choice of notation as format_number_as_ds()
+    fixed = (absval == 0) | ((exponent >= -4) & (exponent < 14 - sign_chars))
+    if not fixed.all():
+        scientific = [format_number_as_ds(v) for v in arr[~fixed].tolist()]
+        encoded = numpy.array(scientific, dtype="S16").view("u1")
+        chars[~fixed, :16] = encoded.reshape(-1, 16)
+
+    if fixed.any():
+        chars[fixed, :17] = _format_fixed_point(
+            absval[fixed],
+            negative[fixed],
+            numpy.maximum(exponent[fixed], 0).astype("i8"),
+        )
+
+    return cast(bytes, chars[chars != 0].tobytes()[:-1])
+
+
+def _round_scaled(
+    absval: "numpy.ndarray", precision: "numpy.ndarray"
+) -> "numpy.ndarray":
+    """Return `absval` * 10**`precision` correctly rounded to the nearest
+    integer, with ties rounded to even as by :func:`format`.
+
+    Parameters
+    ----------
+    absval : numpy.ndarray
+        The absolute values to be scaled, less than 1e15.
+    precision : numpy.ndarray
+        The number of decimal places to keep for each value, from 0 to 15.
+
+    Returns
+    -------
+    numpy.ndarray
+        The scaled and rounded values as int64.
+    """
+    # Dekker's algorithm for the exact product `high` + `low`, as rounding the
+    #   product before rounding to an integer may round the wrong way
+    scale = 10.0**precision
+    high = absval * scale
+    tmp = absval * 134217729.0  # 2**27 + 1
+    a_high = tmp - (tmp - absval)
+    a_low = absval - a_high
+    tmp = scale * 134217729.0
+    s_high = tmp - (tmp - scale)
+    s_low = scale - s_high
+    low = (
+        ((a_high * s_high - high) + a_high * s_low + a_low * s_high) + a_low * s_low
+    )
+
+    # `high` - `digits` is exact and no more than 0.5, so only an exact
+    #   half needs `low` to decide the rounding direction
+    digits = numpy.rint(high)
+    remainder = high - digits
+    digits += (remainder == 0.5) & (low > 0)
+    digits -= (remainder == -0.5) & (low < 0)
+
+    return digits.astype("i8")
+
+
+def _format_fixed_point(
+    absval: "numpy.ndarray", negative: "numpy.ndarray", exponent: "numpy.ndarray"
+) -> "numpy.ndarray":
+    """Return the characters for the fixed-point DS representation of each
+    of the values in `absval`.
+
+    Parameters
+    ----------
+    absval : numpy.ndarray
+        The absolute values to be formatted, less than 1e14.
+    negative : numpy.ndarray
+        Whether each value is negative.
+    exponent : numpy.ndarray
+        The base 10 exponent of each value, or 0 if less than 1.
+
+    Returns
+    -------
+    numpy.ndarray
+        A uint8 array of shape (N, 17) with the characters for each value,
+        0 for unused characters.
+    """
+    pow10 = 10 ** numpy.arange(16, dtype="i8")
+    # The number of significant digits that fit in 16 characters
+    nr_digits = 15 - negative.astype("i8")
+    # The number of digits after the decimal point
+    precision = nr_digits - 1 - exponent
+    digits = _round_scaled(absval, precision)
+    # Rounding may add an extra digit, e.g. 9.9999999999999995
+    while (overflow := digits >= pow10[nr_digits]).any():
+        precision[overflow] -= 1
+        digits[overflow] = _round_scaled(absval[overflow], precision[overflow])
+
+    nr_integer = numpy.ones(digits.size, dtype="i8")
+    for idx in range(1, 16):
+        nr_integer += digits >= pow10[idx]
+
+    nr_integer = numpy.maximum(nr_integer - precision, 1)
+
+    # Each of the 15 digits, most significant first, and the number of
+    #   trailing zeros
+    columns = numpy.empty((15, digits.size), dtype="u1")
+    digit = numpy.empty_like(digits)
+    zeros = numpy.zeros(digits.size, dtype="i8")
+    trailing = numpy.ones(digits.size, dtype=bool)
+    for idx in range(14, -1, -1):
+        numpy.divmod(digits, 10, out=(digits, digit))
+        columns[idx] = digit
+        trailing &= digit == 0
+        zeros += trailing
+
+    # Trailing zeros after the decimal point are removed
+    places = numpy.arange(14, -1, -1)[:, None]
+    is_integer = places >= precision
+    keep_integer = is_integer & (places < precision + nr_integer)
+    keep_fraction = ~is_integer & (places >= numpy.minimum(zeros, precision))
+    columns += 0x30
+
+    # Integer digits never share a column with fraction digits, as the
+    #   fraction digits are shifted by one for the decimal point
+    chars = numpy.zeros((17, digits.size), dtype="u1")
+    chars[0] = numpy.where(negative, 0x2D, 0)
+    chars[1:16] = numpy.where(keep_integer, columns, 0)
+    chars[2:17] += numpy.where(keep_fraction, columns, 0)
+    has_fraction = zeros < precision
+    chars[16 - precision, numpy.arange(digits.size)] = numpy.where(
+        has_fraction, 0x2E, 0
+    )
+
+    return cast("numpy.ndarray", chars.T)
+
+
 class DSfloat(float):
     """Store value for an element with VR **DS** as :class:`float`.
 
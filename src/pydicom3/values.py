@@ -15,6 +15,7 @@ from pydicom3.charset import default_encoding, decode_bytes
 from pydicom3.config import logger, have_numpy
 from pydicom3.dataelem import empty_value_for_VR, RawDataElement
 from pydicom3.errors import BytesLengthException
+from pydicom3.filebase import _MemoryViewBuffer
 from pydicom3.filereader import read_sequence
 from pydicom3.multival import MultiValue
 from pydicom3.sequence import Sequence
@@ -41,6 +42,25 @@ from pydicom3.valuerep import PersonName
 
 _T = TypeVar("_T")
 
+# The NumPy dtypes for each of the struct formats used by convert_numbers()
+_ARRAY_DTYPES = {
+    "d": "f8",
+    "f": "f4",
+    "h": "i2",
+    "H": "u2",
+    "l": "i4",
+    "L": "u4",
+    "q": "i8",
+    "Q": "u8",
+}
+
+# The characters allowed in the encoded values of DS and IS elements, NumPy
+#   ignores many others when parsing
+_NUMERIC_STRING_CHARS: dict[str, re.Pattern[str]] = {
+    VR_.DS: re.compile(r"[ \\0-9\.+eE-]*"),
+    VR_.IS: re.compile(r"[ \\0-9\.+-]*"),
+}
+
 
 def multi_string(
     val: str, valtype: Callable[[str], _T] | None = None
@@ -250,31 +270,172 @@ def convert_DS_string(
         If :data:`~pydicom3.config.use_DS_numpy` is ``True`` and numpy is not
         available
     """
-    num_string = byte_string.decode(default_encoding)
-    # Below, go directly to DS class instance
-    # rather than factory DS, but need to
-    # ensure last string doesn't have
-    # blank padding (use strip())
     if config.use_DS_numpy:
         if not have_numpy:
             raise ImportError("use_DS_numpy set but numpy not installed")
-        # Check for valid characters. Numpy ignores many
-        regex = r"[ \\0-9\.+eE-]*\Z"
-        if re.match(regex, num_string) is None:
-            raise ValueError(
-                "DS: char(s) not in repertoire: '{}'".format(
-                    re.sub(regex[:-2], "", num_string)
-                )
-            )
-        value = numpy.fromstring(num_string, dtype="f8", sep="\\")
+
+        value = convert_DS_array(byte_string)
         if len(value) == 1:  # Don't use array for one number
             return value[0]
 
         return value
 
+    num_string = byte_string.decode(default_encoding)
+    # Below, go directly to DS class instance
+    # rather than factory DS, but need to
+    # ensure last string doesn't have
+    # blank padding (use strip())
     return multi_string(num_string.strip(), valtype=pydicom3.valuerep.DSclass)
 
 
+def _validate_numeric_string(vr: str, value: bytes) -> tuple[bool, str]:
+    """Validate the length of each of the values in the encoded **DS** or
+    **IS** `value`.
+    """
+    encoded = numpy.frombuffer(value.rstrip(b" \x00"), dtype="u1")
+    # The length of each value is the distance between the delimiters
+    delimiters = numpy.flatnonzero(encoded == 0x5C)
+    lengths = numpy.diff(delimiters, prepend=-1, append=len(encoded)) - 1
+    max_length = pydicom3.valuerep.MAX_VALUE_LEN[vr]
+    if lengths.size and (value_length := lengths.max()) > max_length:
+        return False, (
+            f"The value length ({value_length}) exceeds the maximum length of "
+            f"{max_length} allowed for VR {vr}."
+        )
+
+    return True, ""
+
+
+def _validate_IS_range(vr: str, value: "numpy.ndarray") -> tuple[bool, str]:
+    """Validate the range of the decoded **IS** `value`."""
+    if value.size and (value.min() < -(2**31) or value.max() >= 2**31):
+        return False, (
+            "Elements with a VR of IS must have a value between -2**31 and "
+            "(2**31 - 1)"
+        )
+
+    return True, ""
+
+
+def _convert_numeric_string_array(
+    byte_string: bytes, vr: str, validation_mode: int | None
+) -> "numpy.ndarray":
+    """Return the encoded **DS** or **IS** `byte_string` as an array."""
+    if not have_numpy:
+        raise ImportError(f"NumPy is required to convert {vr} values to an array")
+
+    if validation_mode is None:
+        validation_mode = config.settings.reading_validation_mode
+
+    num_string = byte_string.decode(default_encoding)
+    regex = _NUMERIC_STRING_CHARS[vr]
+    if regex.fullmatch(num_string) is None:
+        raise ValueError(
+            f"{vr}: char(s) not in repertoire: '{regex.sub('', num_string)}'"
+        )
+
+    dtype = "f8" if vr == VR_.DS else "i8"
+    if not num_string.strip():
+        return numpy.empty(0, dtype=dtype)
+
+    # Parse every value in a single pass, rather than one value at a time
+    try:
+        value = numpy.fromstring(num_string, dtype=dtype, sep="\\")
+    except ValueError:
+        value = None
+
+    # Depending on the version, NumPy may stop parsing at an invalid value
+    #   rather than raising an exception
+    if value is None or len(value) != num_string.count("\\") + 1:
+        raise ValueError(
+            f"Unable to convert the {vr} value to an array as it contains empty "
+            "or invalid values"
+        )
+
+    if validation_mode != config.IGNORE:
+        validate_value(vr, byte_string, validation_mode, _validate_numeric_string)
+        if vr == VR_.IS:
+            validate_value(vr, value, validation_mode, _validate_IS_range)
+
+    return value
+
+
+def convert_DS_array(
+    byte_string: bytes, validation_mode: int | None = None
+) -> "numpy.ndarray":
+    """Return an encoded 'DS' value as a :class:`numpy.ndarray` of float64.
+
+    Every value is parsed in a single pass, rather than individually, which
+    is much faster for elements with many values such as *Contour Data*.
+
+    .. versionadded:: 3.1
+
+    Parameters
+    ----------
+    byte_string : bytes
+        The encoded 'DS' element value.
+    validation_mode : int, optional
+        If ``config.IGNORE`` then don't check the length of each value,
+        otherwise the values are validated and invalid values either warn
+        or raise an exception. If not used then
+        :attr:`~pydicom3.config.Settings.reading_validation_mode` will be
+        used instead.
+
+    Returns
+    -------
+    numpy.ndarray
+        The decoded values as float64, one per value in `byte_string`.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not available.
+    ValueError
+        If `byte_string` contains characters not allowed for **DS**, empty
+        values or values that can't be parsed, or if `validation_mode` is
+        ``config.RAISE`` and a value is invalid.
+    """
+    return _convert_numeric_string_array(byte_string, VR_.DS, validation_mode)
+
+
+def convert_IS_array(
+    byte_string: bytes, validation_mode: int | None = None
+) -> "numpy.ndarray":
+    """Return an encoded 'IS' value as a :class:`numpy.ndarray` of int64.
+
+    Every value is parsed in a single pass, rather than individually, which
+    is much faster for elements with many values.
+
+    .. versionadded:: 3.1
+
+    Parameters
+    ----------
+    byte_string : bytes
+        The encoded 'IS' element value.
+    validation_mode : int, optional
+        If ``config.IGNORE`` then don't check the length and range of each
+        value, otherwise the values are validated and invalid values either
+        warn or raise an exception. If not used then
+        :attr:`~pydicom3.config.Settings.reading_validation_mode` will be
+        used instead.
+
+    Returns
+    -------
+    numpy.ndarray
+        The decoded values as int64, one per value in `byte_string`.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not available.
+    ValueError
+        If `byte_string` contains characters not allowed for **IS**, empty
+        values or values that can't be parsed, or if `validation_mode` is
+        ``config.RAISE`` and a value is invalid.
+    """
+    return _convert_numeric_string_array(byte_string, VR_.IS, validation_mode)
+
+
 def _DT_from_str(value: str) -> DT:
     value = value.rstrip()
     length = len(value)
@@ -353,36 +514,37 @@ def convert_IS_string(
         If :data:`~pydicom3.config.use_IS_numpy` is ``True`` and numpy is not
         available
     """
-    num_string = byte_string.decode(default_encoding)
-
     if config.use_IS_numpy:
         if not have_numpy:
             raise ImportError("use_IS_numpy set but numpy not installed")
-        # Check for valid characters. Numpy ignores many
-        regex = r"[ \\0-9\.+-]*\Z"
-        if re.match(regex, num_string) is None:
-            raise ValueError(
-                "IS: char(s) not in repertoire: '{}'".format(
-                    re.sub(regex[:-2], "", num_string)
-                )
-            )
-        value = numpy.fromstring(num_string, dtype="i8", sep=chr(92))  # 92:'\'
+
+        value = convert_IS_array(byte_string)
         if len(value) == 1:  # Don't use array for one number
             return cast("numpy.int64", value[0])
 
-        return cast("numpy.ndarray", value)
+        return value
 
+    num_string = byte_string.decode(default_encoding)
     return multi_string(num_string, valtype=pydicom3.valuerep.IS)
 
 
 def convert_numbers(
-    byte_string: bytes, is_little_endian: bool, struct_format: str
-) -> str | int | float | MutableSequence[int] | MutableSequence[float]:
+    byte_string: bytes,
+    is_little_endian: bool,
+    struct_format: str,
+    array_threshold: int | None = None,
+) -> Union[
+    str, int, float, MutableSequence[int], MutableSequence[float], "numpy.ndarray"
+]:
     """Return a decoded numerical VR value.
 
     Given an encoded DICOM Element value, use `struct_format` and the
     endianness of the data to decode it.
 
+    .. versionchanged:: 3.1
+
+        Added the `array_threshold` keyword parameter.
+
     Parameters
     ----------
     byte_string : bytes
@@ -392,6 +554,11 @@ def convert_numbers(
     struct_format : str
         The format of the numerical data encoded in `byte_string`. Should be a
         valid format for :func:`struct.unpack()` without the endianness.
+    array_threshold : int, optional
+        If greater than 0 then return multiple values as a
+        :class:`numpy.ndarray` when there are at least this many. If not used
+        then :attr:`~pydicom3.config.Settings.numeric_array_threshold` will be
+        used instead.
 
     Returns
     -------
@@ -403,6 +570,10 @@ def convert_numbers(
     list
         If `byte_string` encodes multiple values then a list of the decoded
         values will be returned.
+    numpy.ndarray
+        If `byte_string` encodes at least `array_threshold` values then a
+        read-only array that's a view of `byte_string` will be returned, with
+        a dtype matching `struct_format` and the endianness.
     """
     endianChar = "><"[is_little_endian]
 
@@ -420,7 +591,22 @@ def convert_numbers(
             f"value of {bytes_per_value}."
         )
 
-    format_string = f"{endianChar}{length // bytes_per_value}{struct_format}"
+    nr_values = length // bytes_per_value
+    if array_threshold is None:
+        array_threshold = config.settings.numeric_array_threshold
+
+    if array_threshold and 1 < nr_values >= array_threshold:
+        if not have_numpy:
+            raise ImportError("NumPy is required to return the values as an array")
+
+        # A view of the encoded value, without unpacking each value
+        arr = numpy.frombuffer(
+            byte_string, dtype=f"{endianChar}{_ARRAY_DTYPES[struct_format]}"
+        )
+        arr.flags.writeable = False
+        return arr
+
+    format_string = f"{endianChar}{nr_values}{struct_format}"
     value: tuple[int, ...] | tuple[float, ...] = unpack(format_string, byte_string)
 
     # if the number is empty, then return the empty
@@ -617,7 +803,11 @@ def convert_SQ(
         The decoded sequence.
     """
     encodings = encoding or [default_encoding]
-    fp = BytesIO(byte_string)
+    fp: Any = BytesIO(byte_string)
+    if config.settings.lazy_sequences:
+        # Lazy sequences use a view of the value rather than a copy
+        fp = _MemoryViewBuffer(byte_string, None)
+
     seq = read_sequence(
         fp, is_implicit_VR, is_little_endian, len(byte_string), encodings, offset
     )
@@ -72,6 +72,14 @@ def dont_replace_un_with_sq_vr():
     config.settings.infer_sq_for_un_vr = old_value
 
 
+@pytest.fixture
+def lazy_sequences():
+    old_value = config.settings.lazy_sequences
+    config.settings.lazy_sequences = True
+    yield
+    config.settings.lazy_sequences = old_value
+
+
 @pytest.fixture
 def dont_raise_on_writing_invalid_value():
     old_value = config.settings.writing_validation_mode
@@ -1,6 +1,8 @@
 # Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
 """Tests for the pixels.utils module."""
 
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import importlib
 from io import BytesIO
 import logging
@@ -8,6 +10,7 @@ import os
 import random
 from struct import pack, unpack
 from sys import byteorder
+import threading
 
 import pytest
 
@@ -19,9 +22,15 @@ except ImportError:
     HAVE_NP = False
 
 from pydicom3 import dcmread, config
+from pydicom3.data import get_testdata_file
 from pydicom3.dataset import Dataset, FileMetaDataset
 from pydicom3.encaps import get_frame, encapsulate
-from pydicom3.pixels import pixel_array, iter_pixels, convert_color_space
+from pydicom3.pixels import (
+    aiter_pixels,
+    pixel_array,
+    iter_pixels,
+    convert_color_space,
+)
 from pydicom3.pixels.decoders.base import _PIXEL_DATA_DECODERS
 from pydicom3.pixels.encoders import RLELosslessEncoder
 from pydicom3.pixels.encoders.base import EncodeRunner
@@ -86,7 +95,7 @@ from .pixels_reference import (
     EXPL_1_1_3F,
     EXPL_1_1_3F_NONALIGNED,
 )
-from ..test_helpers import assert_no_warning
+from ..test_helpers import AsyncBytesIO, assert_no_warning
 
 
 HAVE_PYLJ = bool(importlib.util.find_spec("pylibjpeg"))
@@ -490,6 +499,79 @@ class TestIterPixels:
             next(iter_pixels(b))
 
 
+@pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+class TestAiterPixels:
+    """Tests for aiter_pixels()"""
+
+    def collect(self, src, **kwargs):
+        """Return a list of the frames yielded by aiter_pixels(src)"""
+
+        async def frames():
+            return [arr async for arr in aiter_pixels(src, **kwargs)]
+
+        return asyncio.run(frames())
+
+    def test_async_src(self):
+        """Test an async file-like src"""
+        path = get_testdata_file("rtdose.dcm")
+        with open(path, "rb") as f:
+            src = AsyncBytesIO(f.read())
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            frames = self.collect(src, executor=executor)
+
+        reference = list(iter_pixels(path))
+        assert 15 == len(frames)
+        for arr, ref in zip(frames, reference):
+            assert np.array_equal(arr, ref)
+
+        # All the I/O happens in the event loop
+        assert src.threads == {threading.get_ident()}
+
+    def test_dataset(self):
+        """Test a Dataset src"""
+        ds = dcmread(get_testdata_file("rtdose.dcm"))
+        frames = self.collect(ds, indices=[0, 5, 14])
+        reference = list(iter_pixels(ds, indices=[0, 5, 14]))
+        assert 3 == len(frames)
+        for arr, ref in zip(frames, reference):
+            assert np.array_equal(arr, ref)
+
+    def test_ds_out(self):
+        """Test the `ds_out` and `specific_tags` kwargs"""
+        with open(get_testdata_file("rtdose.dcm"), "rb") as f:
+            src = AsyncBytesIO(f.read())
+
+        ds = Dataset()
+        frames = self.collect(src, ds_out=ds, specific_tags=[0x00100010], indices=[1])
+        assert 1 == len(frames)
+        assert ds.NumberOfFrames == 15
+        assert "PatientName" in ds
+
+    def test_early_exit(self):
+        """Test the position of `src` is restored when iteration stops early"""
+        with open(get_testdata_file("rtdose.dcm"), "rb") as f:
+            src = AsyncBytesIO(f.read())
+
+        async def first():
+            await src.seek(12)
+            frames = aiter_pixels(src)
+            arr = await anext(frames)
+            await frames.aclose()
+            return arr, await src.tell()
+
+        arr, position = asyncio.run(first())
+        assert np.array_equal(next(iter_pixels(get_testdata_file("rtdose.dcm"))), arr)
+        assert 12 == position
+
+    def test_invalid_executor_raises(self):
+        """Test using a process pool raises"""
+        msg = "aiter_pixels: 'executor' must use threads, not processes"
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            with pytest.raises(TypeError, match=msg):
+                self.collect(AsyncBytesIO(b""), executor=executor)
+
+
 def test_version_check_debugging(caplog):
     """Test _passes_version_check() when the package is absent and debugging on"""
     with caplog.at_level(logging.DEBUG, logger="pydicom3"):
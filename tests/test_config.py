@@ -12,6 +12,7 @@ from pydicom3.data import get_testdata_file
 from pydicom3 import config
 from pydicom3.dataelem import RawDataElement, convert_raw_data_element
 from pydicom3.dataset import Dataset
+from pydicom3.filereader import _DEFERRED_FILES
 from pydicom3.tag import Tag
 
 DS_PATH = get_testdata_file("CT_small.dcm")
@@ -153,3 +154,43 @@ class TestSettings:
         msg = r"VR lookup failed for the raw element with tag \(8888,0002\)"
         with pytest.raises(KeyError, match=msg):
             convert_raw_data_element(raw)
+
+    def test_deferred_read_pool_size(self):
+        """Test setting the size of the pool of deferred read handles"""
+        assert 0 == config.settings.deferred_read_pool_size
+        msg = "The pool size must be at least 0"
+        with pytest.raises(ValueError, match=msg):
+            config.settings.deferred_read_pool_size = -1
+
+        config.settings.deferred_read_pool_size = 1
+        ds = dcmread(DS_PATH, defer_size=1024)
+        ds.PixelData
+        fp = next(iter(_DEFERRED_FILES._handles.values()))[0]
+        assert not fp.closed
+
+        # Reducing the size closes any idle handles over the limit
+        config.settings.deferred_read_pool_size = 0
+        assert fp.closed
+
+    def test_numeric_array_threshold(self):
+        """Test setting the threshold for numeric array values"""
+        assert 0 == config.settings.numeric_array_threshold
+        msg = "The threshold must be at least 0"
+        with pytest.raises(ValueError, match=msg):
+            config.settings.numeric_array_threshold = -1
+
+        if not config.have_numpy:
+            msg = "NumPy is required for 'numeric_array_threshold'"
+            with pytest.raises(ImportError, match=msg):
+                config.settings.numeric_array_threshold = 1
+
+            return
+
+        config.settings.numeric_array_threshold = 3
+        try:
+            ds = dcmread(get_testdata_file("liver_expb_1frame.dcm"))
+            value = ds.SegmentSequence[0].RecommendedDisplayCIELabValue
+            assert ">u2" == value.dtype.str
+            assert [41661, 41167, 40792] == value.tolist()
+        finally:
+            config.settings.numeric_array_threshold = 0
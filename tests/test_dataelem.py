@@ -6,6 +6,7 @@ import copy
 import datetime
 import math
 import io
+import pickle
 import platform
 import re
 import tempfile
@@ -166,6 +167,102 @@ class TestDataElement:
         elem = DataElement(0x00000004, "LO", 12345)
         assert "" == elem.name
 
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, protocol):
+        """Test pickling an element"""
+        elem = DataElement(0x00280030, "DS", [1.5, "2"], file_value_tell=20)
+        elem.private_creator = "Foo"
+        unpickled = pickle.loads(pickle.dumps(elem, protocol=protocol))
+        assert elem == unpickled
+        assert isinstance(unpickled.tag, BaseTag)
+        assert 20 == unpickled.file_tell
+        assert "Foo" == unpickled.private_creator
+        assert elem.validation_mode == unpickled.validation_mode
+
+    def test_pickle_out_of_band(self):
+        """Test large values are transferred out-of-band with protocol 5"""
+        value = bytes(range(256)) * 1024
+        elem = DataElement(0x7FE00010, "OB", value)
+        buffers = []
+        data = pickle.dumps(elem, protocol=5, buffer_callback=buffers.append)
+        assert len(data) < 1024
+        assert 1 == len(buffers)
+        unpickled = pickle.loads(data, buffers=buffers)
+        assert isinstance(unpickled.value, bytes)
+        assert elem == unpickled
+
+        # Small values are in-band
+        elem.value = b"\x00\x01"
+        buffers = []
+        data = pickle.dumps(elem, protocol=5, buffer_callback=buffers.append)
+        assert [] == buffers
+        assert b"\x00\x01" == pickle.loads(data).value
+
+    def test_slots(self):
+        """Test elements use slots, with per-element display options"""
+        elem = DataElement(0x00100010, "PN", "ANON")
+        assert "_value" in DataElement.__slots__
+        elem.showVR = False
+        elem.descripWidth = 10
+        assert not elem.showVR
+        assert 10 == elem.descripWidth
+        assert 16 == elem.maxBytesToDisplay
+        assert DataElement.showVR
+        assert DataElement(0x00100010, "PN", "ANON").showVR
+        assert "(0010,0010) Patient's  'ANON'" == str(elem)
+
+        unpickled = pickle.loads(pickle.dumps(elem))
+        assert not unpickled.showVR
+        assert 10 == unpickled.descripWidth
+        assert not copy.deepcopy(elem).showVR
+        elem_copy = copy.copy(elem)
+        elem_copy.showVR = True
+        assert elem_copy.showVR
+        assert not elem.showVR
+
+        # Other attributes may be added
+        elem.foo = "bar"
+        assert "bar" == copy.copy(elem).foo
+        assert "bar" == copy.deepcopy(elem).foo
+        assert "bar" == pickle.loads(pickle.dumps(elem)).foo
+
+        # Subclasses without slots may add attributes
+        class DataElementPlus(DataElement):
+            pass
+
+        elem = DataElementPlus(0x00100010, "PN", "ANON")
+        elem.foo = "bar"
+        assert "bar" == copy.copy(elem).foo
+        assert "bar" == copy.deepcopy(elem).foo
+
+    def test_display_options_class_and_instance(self):
+        """Test the display options may be set on the class and an element"""
+        elem = DataElement(0x00100010, "PN", "ANON")
+        DataElement.showVR = False
+        try:
+            assert not elem.showVR
+            elem.showVR = True
+            assert elem.showVR
+            assert not DataElement(0x00100010, "PN", "ANON").showVR
+            DataElement.descripWidth = 10
+            assert 10 == elem.descripWidth
+        finally:
+            DataElement.showVR = True
+            DataElement.descripWidth = 35
+
+        assert elem.showVR
+        assert 35 == DataElement(0x00100010, "PN", "ANON").descripWidth
+
+    def test_copy_shares_value(self):
+        """Test a shallow copy shares the element value"""
+        value = memoryview(b"\x00\x01")
+        elem = DataElement(0x7FE00010, "OB", value)
+        elem.showVR = False
+        elem_copy = copy.copy(elem)
+        assert elem_copy._value is value
+        assert not elem_copy.showVR
+        assert elem == elem_copy
+
     def test_equality_standard_element(self):
         """DataElement: equality returns correct value for simple elements"""
         dd = DataElement(0x00100010, "PN", "ANON")
@@ -602,6 +699,38 @@ class TestDataElement:
 class TestRawDataElement:
     """Tests for dataelem.RawDataElement."""
 
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, protocol):
+        """Test pickling keeps the element raw"""
+        raw = RawDataElement(Tag(0x00100010), "PN", 4, b"Jan ", 12, False, True)
+        unpickled = pickle.loads(pickle.dumps(raw, protocol=protocol))
+        assert isinstance(unpickled, RawDataElement)
+        assert isinstance(unpickled.tag, BaseTag)
+        assert raw == unpickled
+
+        view = memoryview(b"\x00\x01\x02\x03")
+        raw = raw._replace(value=view)
+        assert b"\x00\x01\x02\x03" == pickle.loads(pickle.dumps(raw, protocol)).value
+
+    def test_pickle_out_of_band(self):
+        """Test large values are transferred out-of-band with protocol 5"""
+        value = bytes(range(256)) * 1024
+        raw = RawDataElement(Tag(0x7FE00010), "OB", len(value), value, 12, False, True)
+        buffers = []
+        data = pickle.dumps(raw, protocol=5, buffer_callback=buffers.append)
+        assert len(data) < 1024
+        assert 1 == len(buffers)
+
+        unpickled = pickle.loads(data, buffers=buffers)
+        assert isinstance(unpickled.value, memoryview)
+        assert value == unpickled.value
+        assert raw._replace(value=None) == unpickled._replace(value=None)
+
+        # In-band
+        unpickled = pickle.loads(pickle.dumps(raw, protocol=5))
+        assert value == unpickled.value
+        assert isinstance(unpickled.value, bytes)
+
     def test_invalid_tag_warning(self, allow_reading_invalid_values):
         """RawDataElement: conversion of unknown tag warns..."""
         raw = RawDataElement(Tag(0x88880088), None, 4, b"unknown", 0, True, True)
@@ -7,6 +7,7 @@ import math
 from pathlib import Path
 import pickle
 from platform import python_implementation
+from struct import pack
 import sys
 import weakref
 import tempfile
@@ -27,10 +28,12 @@ import pydicom3
 from pydicom3 import config
 from pydicom3 import dcmread
 from pydicom3.data import get_testdata_file
+from pydicom3.data.data_manager import DATA_ROOT
 from pydicom3.dataelem import DataElement, RawDataElement
 from pydicom3.dataset import Dataset, FileDataset, validate_file_meta, FileMetaDataset
 from pydicom3.encaps import encapsulate
-from pydicom3.filebase import DicomBytesIO
+from pydicom3.filebase import DicomBytesIO, DicomInflateIO
+from pydicom3.filewriter import correct_ambiguous_vr, write_dataset
 from pydicom3.pixels.utils import get_image_pixel_ids
 from pydicom3.sequence import Sequence
 from pydicom3.tag import Tag
@@ -58,6 +61,28 @@ def clear_pixel_data_handlers():
     pydicom3.config.pixel_data_handlers = orig_handlers
 
 
+def un_sequence_dataset():
+    """Return a dataset with a *Referenced Series Sequence* encoded with VR UN
+    that has an item containing a private element.
+    """
+    item = Dataset()
+    item.ReferencedSOPInstanceUID = "1.2.3"
+    item.private_block(0x0009, "TEST", create=True).add_new(0x01, "LO", "SECRET")
+    fp = DicomBytesIO()
+    fp.is_little_endian = True
+    fp.is_implicit_VR = True
+    write_dataset(fp, item)
+    encoded = fp.getvalue()
+    value = b"\xfe\xff\x00\xe0" + pack("<L", len(encoded)) + encoded
+
+    ds = Dataset()
+    ds.PatientName = "CITIZEN^Jan"
+    ds[0x00081115] = RawDataElement(
+        Tag(0x00081115), "UN", len(value), value, 0, False, True
+    )
+    return ds
+
+
 class TestDataset:
     """Tests for dataset.Dataset."""
 
@@ -701,6 +726,36 @@ class TestDataset:
         e.SOPInstanceUID = "1.2.3.4"
         assert d == e
 
+    def test_equality_raw(self):
+        """Test equal raw elements aren't converted when comparing"""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        other = dcmread(get_testdata_file("rtplan.dcm"))
+        raw = [tag for tag in ds.keys() if isinstance(ds.get_item(tag), RawDataElement)]
+        assert raw
+        assert ds == other
+        for tag in raw:
+            assert isinstance(ds.get_item(tag), RawDataElement)
+            assert isinstance(other.get_item(tag), RawDataElement)
+
+        # Different encoded values are compared after conversion
+        ds = dcmread(get_testdata_file("CT_small.dcm"))
+        other = dcmread(get_testdata_file("CT_small.dcm"))
+        other.SliceLocation = "-77.2040634155"
+        assert ds == other
+        assert isinstance(ds.get_item("SliceLocation"), DataElement)
+        assert isinstance(ds.get_item("PatientName"), RawDataElement)
+        other.PatientName = "Anonymous"
+        assert ds != other
+
+        # Implicit and explicit VR encodings are compared after conversion
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        fp = DicomBytesIO()
+        ds.save_as(fp, implicit_vr=True)
+        fp.seek(0)
+        other = dcmread(fp, force=True)
+        assert other.get_item("PatientName").is_implicit_VR
+        assert ds == other
+
     def test_inequality(self):
         """Test inequality operator"""
         d = Dataset()
@@ -1396,6 +1451,21 @@ class TestDataset:
         assert "SkipFrameRangeFlag" in ds
         assert "PatientName" in ds
 
+    def test_remove_private_tags_raw(self):
+        """Test Dataset.remove_private_tags doesn't convert public elements"""
+        ds = dcmread(get_testdata_file("priv_SQ.dcm"))
+        ds.remove_private_tags()
+        assert not any(tag.is_private for tag in ds.keys())
+        assert all(isinstance(ds.get_item(tag), RawDataElement) for tag in ds.keys())
+
+    def test_remove_private_tags_un_sequence(self):
+        """Test Dataset.remove_private_tags removes elements in UN sequences"""
+        ds = un_sequence_dataset()
+        ds.remove_private_tags()
+        item = ds.ReferencedSeriesSequence[0]
+        assert [0x00081155] == list(item.keys())
+        assert "PatientName" in ds
+
     def test_data_element(self):
         """Test Dataset.data_element."""
         ds = Dataset()
@@ -1617,6 +1687,166 @@ class TestDataset:
         assert "FIXED" == ds.BeamSequence[1].PatientID
         assert "Other^Name" == ds.BeamSequence[1].PatientName
 
+    def test_traverse(self):
+        """Test Dataset.traverse visits elements depth-first in tag order"""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        elems = [elem for _, elem in ds.traverse()]
+        ref = []
+
+        def visit(dataset):
+            for elem in dataset:
+                ref.append(elem)
+                if elem.VR == "SQ":
+                    for item in elem.value:
+                        visit(item)
+
+        visit(dcmread(get_testdata_file("rtplan.dcm")))
+        assert [e.tag for e in ref] == [e.tag for e in elems]
+        assert ref == elems
+
+        # The containing dataset is yielded with each element
+        for dataset, elem in ds.traverse():
+            assert dataset[elem.tag] is elem
+
+        # Only the top-level elements
+        assert list(ds.keys()) == [e.tag for _, e in ds.traverse(recursive=False)]
+
+    def test_traverse_prune(self):
+        """Test Dataset.traverse doesn't visit pruned subtrees"""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        seen = []
+
+        def prune(dataset, elem):
+            seen.append(elem.tag)
+            return elem.tag == 0x300A00B0
+
+        tags = [elem.tag for _, elem in ds.traverse(prune=prune)]
+        assert 0x300A00B0 not in tags
+        # The Beam Sequence items aren't visited
+        assert 0x300A011E not in seen
+        assert 0x300A00C2 not in seen
+        # The other sequences are
+        assert 0x300A0010 in tags
+        assert isinstance(ds.get_item(0x300A00B0), RawDataElement)
+
+    def test_traverse_filters(self):
+        """Test Dataset.traverse only converts the yielded elements"""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        elems = list(ds.traverse(tags=["GantryAngle", 0x300A00C2]))
+        assert len(elems) == 2
+        assert {0x300A011E, 0x300A00C2} == {elem.tag for _, elem in elems}
+        assert all(isinstance(elem, DataElement) for _, elem in elems)
+        assert isinstance(ds.get_item("PatientName"), RawDataElement)
+        beam = ds.BeamSequence[0]
+        assert isinstance(beam.get_item("BeamType"), RawDataElement)
+
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        elems = [elem for _, elem in ds.traverse(VRs=["DS"])]
+        assert elems
+        assert all(elem.VR == "DS" for elem in elems)
+        assert isinstance(ds.get_item("PatientName"), RawDataElement)
+
+    def test_traverse_raw(self):
+        """Test Dataset.traverse with raw elements"""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        elems = [elem for _, elem in ds.traverse(raw=True)]
+        ref = [elem for _, elem in dcmread(get_testdata_file("rtplan.dcm")).traverse()]
+        assert [e.tag for e in ref] == [e.tag for e in elems]
+        assert isinstance(ds.get_item("PatientName"), RawDataElement)
+        assert any(isinstance(elem, RawDataElement) for elem in elems)
+
+        # Implicit VR raw elements use the dictionary VR
+        ds = dcmread(get_testdata_file("MR_small_implicit.dcm"))
+        elems = [elem for _, elem in ds.traverse(VRs=["US"], raw=True)]
+        assert elems
+        assert all(elem.VR is None for elem in elems)
+        assert all(isinstance(elem, RawDataElement) for elem in elems)
+
+    def test_traverse_un_sequence(self):
+        """Test Dataset.traverse visits the items of sequences with VR UN"""
+        ds = un_sequence_dataset()
+        elems = [elem for _, elem in ds.traverse(tags=["ReferencedSOPInstanceUID"])]
+        assert ["1.2.3"] == [elem.value for elem in elems]
+        assert [e.tag for e in ds.iterall()] == [e.tag for _, e in ds.traverse()]
+
+        ds = un_sequence_dataset()
+        tags = [elem.tag for _, elem in ds.traverse(raw=True)]
+        assert [0x00081115, 0x00081155, 0x00090010, 0x00091001, 0x00100010] == tags
+        assert "SQ" == ds.get_item(0x00081115).VR
+        item = ds.ReferencedSeriesSequence[0]
+        assert isinstance(item.get_item(0x00081155), RawDataElement)
+
+    def test_traverse_modify(self):
+        """Test modifying the dataset while traversing"""
+        ds = Dataset()
+        ds.PatientName = "CITIZEN^Jan"
+        ds.PatientID = "12345"
+        ds.BeamSequence = [Dataset(), Dataset()]
+        ds.BeamSequence[0].PatientID = "1"
+        ds.BeamSequence[1].PatientID = "2"
+        ds.BeamSequence[1].PatientName = "Other^Name"
+
+        tags = []
+        for dataset, elem in ds.traverse():
+            tags.append(elem.tag)
+            if elem.tag == 0x00100010:
+                del dataset.PatientName
+                del dataset.PatientID
+
+        assert [0x00100010, 0x300A00B0, 0x00100020, 0x00100010] == tags
+        assert "PatientName" not in ds
+        assert "PatientName" not in ds.BeamSequence[1]
+        assert "PatientID" in ds.BeamSequence[0]
+
+    def test_diff(self):
+        """Test Dataset.diff"""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        other = dcmread(get_testdata_file("rtplan.dcm"))
+        assert [] == list(ds.diff(other))
+
+        other.PatientName = "Anonymous"
+        del other.PatientID
+        other.PatientAge = "042Y"
+        other.BeamSequence[0].ControlPointSequence[1].NominalBeamEnergy = 12
+        diffs = list(ds.diff(other))
+        assert [
+            (0x00100010,),
+            (0x00100020,),
+            (0x00101010,),
+            (0x300A00B0, 0, 0x300A0111, 1, 0x300A0114),
+        ] == [d.path for d in diffs]
+        assert diffs[0].left.value == "Last^First^mid^pre"
+        assert diffs[0].right.value == "Anonymous"
+        assert diffs[1].right is None
+        assert diffs[2].left is None
+        assert diffs[2].right.value == "042Y"
+        assert diffs[3].right.value == 12
+
+        # Only the differing elements are converted
+        assert isinstance(ds.get_item("PatientSex"), RawDataElement)
+        beam = ds.BeamSequence[0]
+        assert isinstance(beam.get_item("BeamType"), RawDataElement)
+
+        # Non-recursive comparison yields the sequence element
+        diffs = list(ds.diff(other, recursive=False))
+        assert (0x300A00B0,) == diffs[-1].path
+        assert diffs[-1].left is ds["BeamSequence"]
+
+        # Sequences with a different number of items
+        del other.BeamSequence[0]
+        assert (0x300A00B0,) == list(ds.diff(other))[-1].path
+
+    def test_diff_character_set(self):
+        """Test Dataset.diff with different character sets"""
+        ds = dcmread(get_testdata_file("CT_small.dcm"))
+        other = dcmread(get_testdata_file("CT_small.dcm"))
+        other.SpecificCharacterSet = "ISO_IR 192"
+        diffs = list(ds.diff(other))
+        assert [(0x00080005,)] == [d.path for d in diffs]
+        # Text elements are converted as the encoded values may differ
+        assert isinstance(ds.get_item("PatientName"), DataElement)
+        assert isinstance(ds.get_item("Rows"), RawDataElement)
+
     def test_update_with_dataset(self):
         """Regression test for #779"""
         ds = Dataset()
@@ -1765,6 +1995,226 @@ class TestDataset:
         assert ds == ds1
         assert ds1.LUTDescriptor == [1, 2]
 
+    def test_copy_cow(self):
+        """Test Dataset.copy(cow=True)"""
+        ds = Dataset()
+        ds.PatientName = "Citizen^Jan"
+        ds.ImageType = ["ORIGINAL", "PRIMARY"]
+        ds.Rows = 1
+
+        ds_copy = ds.copy(cow=True)
+        assert ds == ds_copy
+        tag = Tag("PatientName")
+        assert ds_copy._dict[tag] is ds._dict[tag]
+
+        # Modifying the copy doesn't change the original
+        ds_copy.PatientName = "Anonymous"
+        ds_copy.ImageType.append("AXIAL")
+        del ds_copy.Rows
+        assert "Citizen^Jan" == ds.PatientName
+        assert ["ORIGINAL", "PRIMARY"] == ds.ImageType
+        assert ["ORIGINAL", "PRIMARY", "AXIAL"] == ds_copy.ImageType
+        assert 1 == ds.Rows
+
+        # Or the other way around
+        ds_copy = ds.copy(cow=True)
+        ds.ImageType[0] = "DERIVED"
+        ds.PatientName = "Anonymous"
+        assert ["ORIGINAL", "PRIMARY"] == ds_copy.ImageType
+        assert "Citizen^Jan" == ds_copy.PatientName
+
+        # A copy of a copy
+        ds_copy2 = ds_copy.copy(cow=True)
+        ds_copy.Rows = 2
+        ds_copy2.ImageType[1] = "SECONDARY"
+        assert 1 == ds.Rows == ds_copy2.Rows
+        assert ["ORIGINAL", "PRIMARY"] == ds_copy.ImageType
+
+        # Deep copies and unpickled datasets don't share elements
+        for other in (copy.deepcopy(ds_copy), pickle.loads(pickle.dumps(ds_copy))):
+            assert ds_copy == other
+            assert "_cow" not in other.__dict__
+
+    @pytest.mark.parametrize(
+        "accessor",
+        [
+            lambda ds: ds.get_item("ImageType"),
+            lambda ds: next(e for e in ds.elements() if e.tag == 0x00080008),
+            lambda ds: next(e for e in ds.values() if e.tag == 0x00080008),
+            lambda ds: next(e for t, e in ds.items() if t == 0x00080008),
+            lambda ds: next(e for _, e in ds.traverse(raw=True) if e.tag == 0x00080008),
+            lambda ds: ds.pop("ImageType"),
+        ],
+    )
+    def test_copy_cow_accessors(self, accessor):
+        """Test elements from other accessors aren't shared after copy(cow=True)"""
+        ds = Dataset()
+        ds.ImageType = ["ORIGINAL", "PRIMARY"]
+        ds.PatientName = "Citizen^Jan"
+
+        # Modifying the copy doesn't change the original
+        ds_copy = ds.copy(cow=True)
+        accessor(ds_copy).value.append("Z")
+        assert ["ORIGINAL", "PRIMARY"] == ds.ImageType
+
+        # Or the other way around
+        ds_copy = ds.copy(cow=True)
+        accessor(ds).value.append("Z")
+        assert ["ORIGINAL", "PRIMARY"] == ds_copy.ImageType
+
+    def test_copy_cow_popitem(self):
+        """Test Dataset.popitem() after copy(cow=True)"""
+        ds = Dataset()
+        ds.ImageType = ["ORIGINAL", "PRIMARY"]
+        ds_copy = ds.copy(cow=True)
+        tag, elem = ds_copy.popitem()
+        elem.value.append("Z")
+        assert ["ORIGINAL", "PRIMARY"] == ds.ImageType
+
+    def test_copy_cow_sequence(self):
+        """Test Dataset.copy(cow=True) with nested sequences"""
+        ds = Dataset()
+        ds.BeamSequence = [Dataset(), Dataset()]
+        ds.BeamSequence[0].BeamName = "Field 1"
+        ds.BeamSequence[0].ControlPointSequence = [Dataset()]
+        ds.BeamSequence[0].ControlPointSequence[0].GantryAngle = 0
+        ds.BeamSequence[1].BeamName = "Field 2"
+
+        ds_copy = ds.copy(cow=True)
+        ds_copy.BeamSequence[0].ControlPointSequence[0].GantryAngle = 180
+        ds_copy.BeamSequence[1].BeamName = "Changed"
+        ds_copy.BeamSequence.append(Dataset())
+        assert 0 == ds.BeamSequence[0].ControlPointSequence[0].GantryAngle
+        assert "Field 2" == ds.BeamSequence[1].BeamName
+        assert 2 == len(ds.BeamSequence)
+        assert 3 == len(ds_copy.BeamSequence)
+        # Unmodified items are still shared
+        assert ds.BeamSequence[1].get_item(
+            "ControlPointSequence"
+        ) is ds_copy.BeamSequence[1].get_item("ControlPointSequence")
+
+        # Modifying the original
+        ds.BeamSequence[0].ControlPointSequence[0].GantryAngle = 90
+        assert 180 == ds_copy.BeamSequence[0].ControlPointSequence[0].GantryAngle
+        assert "Field 1" == ds_copy.BeamSequence[0].BeamName
+
+    def test_copy_cow_file(self):
+        """Test Dataset.copy(cow=True) with a file dataset"""
+        ds = dcmread(get_testdata_file("MR_small.dcm"))
+        assert ds.get_item("SmallestImagePixelValue").is_raw
+        ds_copy = ds.copy(cow=True)
+        assert isinstance(ds_copy, FileDataset)
+        assert ds.filename == ds_copy.filename
+        ds_copy.file_meta.MediaStorageSOPInstanceUID = "1.2.3"
+        assert "1.2.3" != ds.file_meta.MediaStorageSOPInstanceUID
+
+        # Ambiguous VR correction doesn't change the original
+        ds["SmallestImagePixelValue"].VR = "US or SS"
+        ds_copy = ds.copy(cow=True)
+        ds_copy.PixelRepresentation = 1
+        correct_ambiguous_vr(ds_copy, True)
+        assert "SS" == ds_copy["SmallestImagePixelValue"].VR
+        assert "US or SS" == ds.get_item("SmallestImagePixelValue").VR
+
+    @pytest.mark.parametrize(
+        "name", sorted(p.name for p in Path(DATA_ROOT, "test_files").glob("*.dcm"))
+    )
+    def test_fingerprint_stable(self, name):
+        """Test Dataset.fingerprint() doesn't depend on the element state"""
+        path = Path(DATA_ROOT, "test_files", name)
+        ds = dcmread(path, force=True)
+        fingerprint = ds.fingerprint()
+        assert 32 == len(fingerprint)
+        assert fingerprint == ds.fingerprint()
+        assert fingerprint == dcmread(path, force=True, defer_size=64).fingerprint()
+
+        converted = dcmread(path, force=True)
+        for elem in converted.iterall():
+            pass
+
+        assert fingerprint == converted.fingerprint()
+        assert fingerprint == copy.deepcopy(converted).fingerprint()
+        assert fingerprint == pickle.loads(pickle.dumps(ds)).fingerprint()
+        assert fingerprint == ds.copy(cow=True).fingerprint()
+
+    def test_fingerprint_changes(self):
+        """Test changes to the dataset change the fingerprint"""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        seen = {ds.fingerprint()}
+
+        def check():
+            fingerprint = ds.fingerprint()
+            assert fingerprint not in seen
+            seen.add(fingerprint)
+
+        ds.PatientName = "Citizen^Jan"
+        check()
+        ds["PatientName"].value = "Citizen^Jen"
+        check()
+        ds.ImageType = ["ORIGINAL", "PRIMARY"]
+        check()
+        ds.ImageType[1] = "SECONDARY"
+        check()
+        ds.BeamSequence[0].BeamName = "Field 2"
+        check()
+        ds.BeamSequence[0].ControlPointSequence[1].CumulativeMetersetWeight = 0.5
+        check()
+        ds.BeamSequence.append(Dataset())
+        check()
+        del ds.BeamSequence[0].ControlPointSequence[0].GantryAngle
+        check()
+        del ds.PatientName
+        check()
+
+        # Reverting a change gives the same fingerprint
+        ds.PatientName = "Citizen^Jen"
+        assert ds.fingerprint() in seen
+
+    def test_fingerprint_exclude(self):
+        """Test excluding elements from the fingerprint"""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        other = dcmread(get_testdata_file("rtplan.dcm"))
+        other.SOPInstanceUID = "1.2.3"
+        other.BeamSequence[0].BeamName = "Field 2"
+        assert ds.fingerprint() != other.fingerprint()
+        exclude = ["SOPInstanceUID", 0x300A00C2]
+        assert ds.fingerprint(exclude) == other.fingerprint(exclude)
+        assert ds.fingerprint(exclude) != ds.fingerprint()
+
+    def test_fingerprint_cached(self, monkeypatch):
+        """Test only the changed elements are encoded again"""
+        ds = Dataset()
+        ds.PatientName = "Citizen^Jan"
+        ds.PatientID = "12345"
+        ds.ImageType = ["ORIGINAL", "PRIMARY"]
+        ds.BeamSequence = [Dataset(), Dataset()]
+        ds.BeamSequence[0].BeamName = "Field 1"
+        ds.BeamSequence[1].BeamName = "Field 2"
+        # Odd length bytes are hashed with their padding
+        ds.add_new(0x7FE00010, "OB", b"\x00\x01\x02")
+        fingerprint = ds.fingerprint()
+        ds.PixelData = b"\x00\x01\x02\x00"
+        assert fingerprint == ds.fingerprint()
+
+        encoded = []
+        original = Dataset._element_digest
+
+        def element_digest(self, elem, exclude):
+            encoded.append(elem.tag)
+            return original(self, elem, exclude)
+
+        monkeypatch.setattr(Dataset, "_element_digest", element_digest)
+        assert fingerprint == ds.fingerprint()
+        # The sequence digest is always combined from its items
+        assert [0x300A00B0] == encoded
+
+        encoded.clear()
+        ds.PatientID = "54321"
+        ds.ImageType[0] = "DERIVED"
+        ds.BeamSequence[1].BeamName = "Field 3"
+        ds.fingerprint()
+        assert [0x00080008, 0x00100020, 0x300A00B0, 0x300A00C2] == sorted(encoded)
+
 
 class TestDatasetSaveAs:
     def test_no_transfer_syntax(self):
@@ -2251,6 +2701,60 @@ class TestFileDataset:
         ds1.PixelSpacing.insert(1, 2)
         assert [1, 2, 1] == ds1.PixelSpacing
 
+    def test_pickle_elements_raw(self):
+        """Test pickling doesn't convert raw elements"""
+        ds = pydicom3.dcmread(self.test_file)
+        ds.PatientName
+        ds1 = pickle.loads(pickle.dumps(ds, protocol=5))
+        assert list(ds1.keys()) == list(ds.keys())
+        assert isinstance(ds1._dict, dict)
+        assert not ds1["PatientName"].is_raw
+        assert [ds.get_item(tag).is_raw for tag in ds.keys()] == [
+            ds1.get_item(tag).is_raw for tag in ds.keys()
+        ]
+        assert ds1.get_item("PixelData").is_raw
+        assert self.test_file == ds1.filename
+        assert ds == ds1
+
+    @pytest.mark.parametrize("mmap", [False, True])
+    def test_pickle_out_of_band(self, mmap, tmp_path):
+        """Test pickling with out-of-band buffers"""
+        ds = pydicom3.dcmread(self.test_file)
+        ds.PixelData = ds.PixelData * 4
+        ds.NumberOfFrames = 4
+        ds.save_as(tmp_path / "ct.dcm")
+        ds = pydicom3.dcmread(tmp_path / "ct.dcm", mmap=mmap)
+        length = len(ds.get_item("PixelData").value)
+        assert length == 4 * 32768
+        buffers = []
+        data = pickle.dumps(ds, protocol=5, buffer_callback=buffers.append)
+        assert len(data) < length // 4
+        assert [length] == [b.raw().nbytes for b in buffers]
+
+        ds1 = pickle.loads(data, buffers=buffers)
+        assert isinstance(ds1.get_item("PixelData").value, memoryview)
+        assert ds1._mapping is None
+        assert ds1.buffer is None
+        assert ds.PixelData == ds1.PixelData
+        ds.close()
+
+    def test_pickle_keep_open(self):
+        """Test pickling a dataset keeping its file open"""
+        with pydicom3.dcmread(self.test_file, defer_size=100).keep_open() as ds:
+            ds1 = pickle.loads(pickle.dumps(ds))
+
+        assert ds1._deferred_fp is None
+        assert ds1.PixelData == pydicom3.dcmread(self.test_file).PixelData
+
+    def test_deepcopy_keep_open(self):
+        """Test deep copying a dataset keeping its file open"""
+        with pydicom3.dcmread(self.test_file, defer_size=100).keep_open() as ds:
+            ds1 = copy.deepcopy(ds)
+            assert ds._deferred_fp is not None
+
+        assert ds1._deferred_fp is None
+        assert ds1.PixelData == pydicom3.dcmread(self.test_file).PixelData
+
     def test_equality_file_meta(self):
         """Dataset: equality ignores metadata"""
         d = dcmread(self.test_file)
@@ -2533,11 +3037,11 @@ class TestFileDataset:
         assert ds.buffer is buffer
         assert ds.fileobj_type == io.BytesIO
 
-        # Deflated datasets get inflated to a DicomBytesIO() buffer
+        # Deflated datasets get inflated by a DicomInflateIO() buffer
         ds = dcmread(get_testdata_file("image_dfl.dcm"))
         assert ds.filename.endswith("image_dfl.dcm")
-        assert isinstance(ds.buffer, DicomBytesIO)
-        assert ds.fileobj_type == DicomBytesIO
+        assert isinstance(ds.buffer, DicomInflateIO)
+        assert ds.fileobj_type == DicomInflateIO
 
 
 class TestDatasetOverlayArray:
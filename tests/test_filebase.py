@@ -1,14 +1,34 @@
 # Copyright 2008-2018 pydicom3 authors. See LICENSE file for details.
 """Test for filebase.py"""
 
+import asyncio
 from io import BytesIO
+import mmap
+import os
+import pickle
+import threading
+import zlib
 
 import pytest
 
 from pydicom3.data import get_testdata_file
-from pydicom3.filebase import DicomIO, DicomFileLike, DicomFile, DicomBytesIO
+from pydicom3.filebase import (
+    DicomIO,
+    DicomFileLike,
+    DicomFile,
+    DicomBytesIO,
+    DicomInflateIO,
+    DicomMemoryViewIO,
+    DicomRangeIO,
+    CountingRangeSource,
+    LocalRangeSource,
+    _AsyncBuffer,
+)
+from pydicom3.filereader import dcmread
 from pydicom3.tag import Tag
 
+from .test_helpers import AsyncBytesIO
+
 
 TEST_FILE = get_testdata_file("CT_small.dcm")
 
@@ -287,6 +307,383 @@ class TestDicomBytesIO:
         assert fp.getvalue() == b"\x00\x01\x00\x02"
 
 
+def deflate(data):
+    """Return `data` as a raw deflate stream"""
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+class TestDicomInflateIO:
+    """Test filebase.DicomInflateIO class"""
+
+    def setup_method(self):
+        self.data = bytes(range(256)) * 1000
+
+    def test_read(self):
+        """Test reading the inflated data"""
+        fp = DicomInflateIO(BytesIO(deflate(self.data)), chunk_size=128)
+        assert fp.read(4) == b"\x00\x01\x02\x03"
+        assert fp.tell() == 4
+        assert fp.read(252) == self.data[4:256]
+        assert fp.read() == self.data[256:]
+        assert fp.tell() == len(self.data)
+        assert fp.read(10) == b""
+
+    def test_read_offset(self):
+        """Test the deflate stream doesn't have to start at the beginning"""
+        buffer = BytesIO(b"\x00" * 10 + deflate(self.data))
+        buffer.seek(10)
+        fp = DicomInflateIO(buffer, chunk_size=128)
+        assert fp.read() == self.data
+        fp.seek(0)
+        assert fp.read(3) == b"\x00\x01\x02"
+
+    def test_trailing_padding(self):
+        """Test data after the end of the deflate stream is ignored"""
+        fp = DicomInflateIO(BytesIO(deflate(self.data) + b"\x00"))
+        assert fp.read() == self.data
+
+    def test_seek(self):
+        """Test seeking within the inflated data"""
+        fp = DicomInflateIO(BytesIO(deflate(self.data)), chunk_size=128, history=256)
+        assert fp.seek(100_000) == 100_000
+        assert fp.read(4) == self.data[100_000:100_004]
+        # Within the kept history
+        assert fp.seek(-8, os.SEEK_CUR) == 99_996
+        assert fp.read(4) == self.data[99_996:100_000]
+        # Outside the kept history, inflate again from the start
+        fp.seek(10)
+        assert fp.read(4) == self.data[10:14]
+        assert fp.seek(-4, os.SEEK_END) == len(self.data) - 4
+        assert fp.read() == self.data[-4:]
+
+        with pytest.raises(ValueError, match="Negative seek position -1"):
+            fp.seek(-1)
+
+    def test_seek_checkpoints(self):
+        """Test seeking backwards restarts from the nearest checkpoint"""
+        data = os.urandom(1024 * 1024)
+
+        class Counter(BytesIO):
+            nr_bytes = 0
+
+            def read(self, size=-1):
+                b = super().read(size)
+                self.nr_bytes += len(b)
+                return b
+
+        buffer = Counter(deflate(data))
+        fp = DicomInflateIO(buffer, chunk_size=1024, history=0, checkpoint=65536)
+        fp.seek(len(data) - 4)
+        assert fp.read() == data[-4:]
+        assert len(fp.parent._checkpoints) == 15
+
+        buffer.nr_bytes = 0
+        fp.seek(900_000)
+        assert fp.read(4) == data[900_000:900_004]
+        assert buffer.nr_bytes < 65536 + 2048
+        fp.seek(100)
+        assert fp.read(4) == data[100:104]
+        fp.seek(70_000)
+        assert fp.read() == data[70_000:]
+
+        # Checkpoints disabled
+        buffer = Counter(deflate(data))
+        fp = DicomInflateIO(buffer, chunk_size=1024, history=0, checkpoint=0)
+        fp.seek(len(data) - 4)
+        fp.read()
+        assert fp.parent._checkpoints == []
+        buffer.nr_bytes = 0
+        fp.seek(900_000)
+        assert fp.read(4) == data[900_000:900_004]
+        assert buffer.nr_bytes > 900_000
+
+    def test_window_is_bounded(self):
+        """Test only a bounded amount of inflated data is kept"""
+        fp = DicomInflateIO(BytesIO(deflate(self.data)), chunk_size=128, history=256)
+        fp.seek(200_000)
+        fp.read(8)
+        assert len(fp.parent._window) < 1024
+
+    def test_reopen_closed_file(self, tmp_path):
+        """Test the source file is re-opened if closed by its owner"""
+        path = tmp_path / "deflated"
+        path.write_bytes(deflate(self.data))
+        with open(path, "rb") as f:
+            fp = DicomInflateIO(f, history=0)
+            assert fp.name == str(path)
+            assert fp.read(4) == self.data[:4]
+
+        fp.seek(0)
+        assert fp.read(4) == self.data[:4]
+        fp.close()
+        assert fp.parent._source.closed
+
+        # Re-opened again if inflation needs to restart after closing
+        fp.seek(200_000)
+        assert fp.read(4) == self.data[200_000:200_004]
+        fp.seek(0)
+        assert fp.read(4) == self.data[:4]
+        assert not fp.parent._source.closed
+        fp.close()
+        assert fp.parent._source.closed
+        assert fp.read(4) == self.data[4:8]
+        assert not fp.parent._source.closed
+        fp.close()
+        assert fp.parent._source.closed
+
+    def test_pickle(self, tmp_path):
+        """Test pickling and unpickling"""
+        fp = DicomInflateIO(BytesIO(deflate(self.data)))
+        fp.seek(100_000)
+        fp = pickle.loads(pickle.dumps(fp))
+        assert fp.tell() == 100_000
+        assert fp.read(4) == self.data[100_000:100_004]
+
+        # Files are re-opened on the first read after unpickling
+        path = tmp_path / "deflated"
+        path.write_bytes(deflate(self.data))
+        with open(path, "rb") as f:
+            fp = DicomInflateIO(f)
+            fp.read(4)
+            fp = pickle.loads(pickle.dumps(fp))
+
+        assert fp.parent._source is None
+        assert fp.read(4) == self.data[4:8]
+        fp.close()
+
+
+class TestDicomMemoryViewIO:
+    """Test filebase.DicomMemoryViewIO class"""
+
+    def test_read(self):
+        """Test reading copies and views"""
+        fp = DicomMemoryViewIO(b"\x00\x01\x02\x03\x04", name="foo")
+        assert fp.name == "foo"
+        assert fp.read(2) == b"\x00\x01"
+        view = fp.read_view(2)
+        assert isinstance(view, memoryview)
+        assert view == b"\x02\x03"
+        assert fp.tell() == 4
+        assert fp.read() == b"\x04"
+        assert fp.read_view(2) == b""
+        assert fp.tell() == 5
+
+    def test_seek(self):
+        """Test seeking"""
+        fp = DicomMemoryViewIO(bytearray(b"\x00\x01\x02\x03\x04"))
+        assert fp.seek(3) == 3
+        assert fp.read(1) == b"\x03"
+        assert fp.seek(-2, os.SEEK_CUR) == 2
+        assert fp.seek(-1, os.SEEK_END) == 4
+        assert fp.read(2) == b"\x04"
+        with pytest.raises(ValueError, match="Negative seek position -1"):
+            fp.seek(-1)
+
+    def test_close(self):
+        """Test closing the buffer closes the source"""
+        fp = DicomMemoryViewIO(b"\x00\x01")
+        assert not fp.closed
+        fp.close()
+        assert fp.closed
+        fp.close()
+
+        with open(TEST_FILE, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        fp = DicomMemoryViewIO(mapping)
+        view = fp.read_view(128)
+        fp.close()
+        # Still in use, so not closed until garbage collected
+        assert not mapping.closed
+        del view
+        mapping.close()
+        assert mapping.closed
+
+    def test_find(self):
+        """Test finding bytes from the current position"""
+        data = b"\x00\x01\x02\x00\x01\x02"
+        for src in (data, bytearray(data), memoryview(data)):
+            fp = DicomMemoryViewIO(src)
+            assert fp.find(b"\x01\x02") == 1
+            fp.seek(2)
+            assert fp.find(b"\x01\x02") == 4
+            assert fp.tell() == 2
+            assert fp.find(b"\x03") == -1
+
+
+class BytesRangeSource:
+    """A range source for bytes, with no size"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def read_range(self, offset, length):
+        return self.data[offset : offset + length]
+
+
+class TestDicomRangeIO:
+    """Test filebase.DicomRangeIO class"""
+
+    def setup_method(self):
+        self.data = bytes(range(256)) * 16
+        self.source = CountingRangeSource(BytesRangeSource(self.data))
+
+    def test_read(self):
+        """Test reading and seeking"""
+        fp = DicomRangeIO(self.source, size=len(self.data), block_size=100)
+        assert fp.read(5) == self.data[:5]
+        assert fp.tell() == 5
+        assert fp.seek(250) == 250
+        assert fp.read(300) == self.data[250:550]
+        assert fp.seek(-10, os.SEEK_CUR) == 540
+        assert fp.read(20) == self.data[540:560]
+        assert fp.seek(-5, os.SEEK_END) == len(self.data) - 5
+        assert fp.read(10) == self.data[-5:]
+        assert fp.read(10) == b""
+        fp.seek(4000)
+        assert fp.read() == self.data[4000:]
+        fp.seek(5000)
+        assert fp.read(10) == b""
+        with pytest.raises(ValueError, match="Negative seek position -1"):
+            fp.seek(-1)
+
+    def test_unknown_size(self):
+        """Test reading when the size isn't known"""
+        fp = DicomRangeIO(self.source, block_size=100, cache_size=200)
+        with pytest.raises(OSError, match="Unable to seek relative to the end"):
+            fp.seek(0, os.SEEK_END)
+
+        fp.seek(10)
+        assert fp.read() == self.data[10:]
+        # The size is known once the end has been read
+        assert fp.seek(0, os.SEEK_END) == len(self.data)
+
+    def test_coalesce(self):
+        """Test small reads only need one request"""
+        fp = DicomRangeIO(self.source, block_size=100, read_ahead=0)
+        for _ in range(50):
+            fp.read(2)
+
+        assert [(0, 100)] == self.source.requests
+
+        # The missing blocks for a read are fetched in one request
+        fp.seek(250)
+        assert fp.read(300) == self.data[250:550]
+        assert [(0, 100), (200, 400)] == self.source.requests
+
+        # Cached blocks are reused
+        fp.seek(210)
+        assert fp.read(50) == self.data[210:260]
+        assert 2 == self.source.count
+
+    def test_read_ahead(self):
+        """Test reading ahead"""
+        fp = DicomRangeIO(
+            self.source, size=len(self.data), block_size=100, read_ahead=150
+        )
+        assert fp.read(10) == self.data[:10]
+        assert [(0, 300)] == self.source.requests
+        fp.seek(250)
+        assert fp.read(100) == self.data[250:350]
+        assert [(0, 300), (300, 300)] == self.source.requests
+
+        # Read-ahead stops at the end of the data
+        fp.seek(4050)
+        assert fp.read(10) == self.data[4050:4060]
+        assert (4000, 100) == self.source.requests[-1]
+
+    def test_eviction(self):
+        """Test the least recently used blocks are evicted"""
+        fp = DicomRangeIO(self.source, block_size=100, cache_size=200, read_ahead=0)
+        fp.read(1)
+        fp.seek(100)
+        fp.read(1)
+        fp.seek(0)
+        fp.read(1)
+        assert 2 == self.source.count
+        # Evicts block 1
+        fp.seek(200)
+        fp.read(1)
+        fp.seek(0)
+        fp.read(1)
+        assert 3 == self.source.count
+        fp.seek(100)
+        fp.read(1)
+        assert 4 == self.source.count
+
+    def test_large_read(self):
+        """Test reads larger than the cache bypass it"""
+        fp = DicomRangeIO(self.source, block_size=100, cache_size=200)
+        fp.seek(10)
+        assert fp.read(1000) == self.data[10:1010]
+        assert [(10, 1000)] == self.source.requests
+        assert fp.tell() == 1010
+
+    def test_close(self):
+        """Test closing the buffer closes the source"""
+        source = LocalRangeSource(TEST_FILE)
+        fp = DicomRangeIO(source)
+        assert source.size == os.path.getsize(TEST_FILE)
+        fp.close()
+        assert source._fp.closed
+
+    def test_dcmread(self):
+        """Test the number of requests needed by dcmread()"""
+        ref = dcmread(TEST_FILE)
+        source = CountingRangeSource(LocalRangeSource(TEST_FILE))
+        with DicomRangeIO(source) as fp:
+            ds = dcmread(fp)
+            assert ref == ds
+            assert 1 == source.count
+            assert os.path.getsize(TEST_FILE) == source.nr_bytes
+
+        source = CountingRangeSource(LocalRangeSource(TEST_FILE))
+        with DicomRangeIO(source, block_size=4096, read_ahead=0) as fp:
+            ds = dcmread(fp, defer_size=1024, specific_tags=["PatientName"])
+            assert ref.PatientName == ds.PatientName
+            assert [(0, 4096)] == source.requests
+
+
+class TestAsyncBuffer:
+    """Test filebase._AsyncBuffer class"""
+
+    def test_read(self):
+        """Test reading from another thread while the loop runs"""
+
+        async def read():
+            src = AsyncBytesIO(b"\x00\x01\x02\x03\x04")
+            await src.seek(1)
+            fp = await _AsyncBuffer.from_buffer(src)
+            assert fp.tell() == 1
+
+            def func():
+                assert fp.read(2) == b"\x01\x02"
+                assert fp.tell() == 3
+                assert fp.seek(-1, os.SEEK_END) == 4
+                assert fp.read() == b"\x04"
+                return fp.tell()
+
+            assert await asyncio.get_running_loop().run_in_executor(None, func) == 5
+            assert src.threads == {threading.get_ident()}
+
+        asyncio.run(read())
+
+    def test_read_from_loop_raises(self):
+        """Test reading from the event loop's thread raises"""
+
+        async def read():
+            fp = await _AsyncBuffer.from_buffer(AsyncBytesIO(b"\x00"))
+            msg = "An async buffer can't be read from the thread running its event"
+            with pytest.raises(RuntimeError, match=msg):
+                fp.read(1)
+
+            with pytest.raises(RuntimeError, match=msg):
+                fp.seek(0)
+
+        asyncio.run(read())
+
+
 class TestDicomFile:
     """Test filebase.DicomFile() function"""
 
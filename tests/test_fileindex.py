@@ -0,0 +1,299 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Tests for the pydicom3.fileindex module."""
+
+import os
+import shutil
+import sys
+import warnings
+
+import pytest
+
+from pydicom3 import dcmread
+from pydicom3.data import get_testdata_file
+from pydicom3.fileindex import (
+    ElementIndex,
+    IndexedElement,
+    SIDECAR_SUFFIX,
+    get_element_index,
+)
+
+
+CT_SMALL = get_testdata_file("CT_small.dcm")
+MR_BIG = get_testdata_file("MR_small_bigendian.dcm")
+DEFLATED = get_testdata_file("image_dfl.dcm")
+RTPLAN = get_testdata_file("rtplan.dcm")
+
+
+@pytest.fixture
+def ct_small(tmp_path):
+    """Return the path to a copy of CT_small.dcm"""
+    return shutil.copy(CT_SMALL, tmp_path)
+
+
+class TestElementIndex:
+    """Tests for ElementIndex"""
+
+    def test_from_file(self, ct_small):
+        """Test indexing a file."""
+        index = ElementIndex.from_file(ct_small)
+        assert os.fspath(ct_small) == index.filename
+        assert os.stat(ct_small).st_size == index.size
+        assert os.stat(ct_small).st_mtime == index.mtime
+        assert IndexedElement(922, "PN", 22) == index[0x00100010]
+        assert index["PatientName"] == index[0x00100010]
+        assert "PixelData" in index
+        assert 0x00020010 not in index
+        assert "not a tag" not in index
+        assert index.get(0x00020010) is None
+
+        ds = dcmread(ct_small)
+        assert len(ds) == len(index)
+        assert list(ds.keys()) == list(index)
+
+    def test_offsets(self):
+        """Test the offsets are the start of the elements."""
+        for path in (CT_SMALL, MR_BIG, RTPLAN):
+            index = ElementIndex.from_file(path, force=True)
+            ds = dcmread(path, defer_size=0, force=True)
+            with open(path, "rb") as f:
+                for tag in index:
+                    f.seek(index[tag].offset)
+                    group, elem = f.read(4), tag
+                    order = "little" if ds.is_little_endian else "big"
+                    assert int.from_bytes(group[:2], order) == elem >> 16
+                    assert int.from_bytes(group[2:], order) == elem & 0xFFFF
+
+    def test_json_roundtrip(self, ct_small, tmp_path):
+        """Test encoding and decoding as JSON."""
+        index = ElementIndex.from_file(ct_small)
+        assert index == ElementIndex.from_json(index.to_json())
+
+        path = tmp_path / "index.json"
+        index.save(path)
+        assert index == ElementIndex.load(path)
+        assert index != ElementIndex(index.filename, index.size + 1, index.mtime, {})
+        assert index != "index"
+
+    def test_is_current(self, ct_small):
+        """Test the index is invalidated by changes to the file."""
+        index = ElementIndex.from_file(ct_small)
+        assert index.is_current()
+
+        st = os.stat(ct_small)
+        os.utime(ct_small, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert not index.is_current()
+
+        index = ElementIndex.from_file(ct_small)
+        assert index.is_current()
+        with open(ct_small, "ab") as f:
+            f.write(b"\x00" * 4)
+
+        os.utime(ct_small, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert not index.is_current()
+
+        os.remove(ct_small)
+        assert not index.is_current()
+
+
+class TestGetElementIndex:
+    """Tests for get_element_index()"""
+
+    def test_sidecar(self, ct_small):
+        """Test storing the index in a sidecar file."""
+        sidecar = f"{ct_small}{SIDECAR_SUFFIX}"
+        assert not os.path.exists(sidecar)
+        index = get_element_index(ct_small)
+        assert os.path.exists(sidecar)
+        assert index == ElementIndex.load(sidecar)
+        assert index == get_element_index(ct_small)
+
+        # Rebuilt and replaced when the file changes
+        st = os.stat(ct_small)
+        os.utime(ct_small, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        new_index = get_element_index(ct_small)
+        assert new_index.is_current()
+        assert new_index != index
+        assert new_index == ElementIndex.load(sidecar)
+
+    def test_sidecar_invalid(self, ct_small):
+        """Test an unreadable sidecar is replaced."""
+        sidecar = f"{ct_small}{SIDECAR_SUFFIX}"
+        with open(sidecar, "w") as f:
+            f.write("{not json")
+
+        index = get_element_index(ct_small)
+        assert index == ElementIndex.load(sidecar)
+
+    def test_sidecar_unwritable(self, ct_small, monkeypatch):
+        """Test failing to write the sidecar warns."""
+
+        def save(self, filename):
+            raise PermissionError("denied")
+
+        monkeypatch.setattr(ElementIndex, "save", save)
+        msg = "Unable to write the element index to .*: denied"
+        with pytest.warns(UserWarning, match=msg):
+            index = get_element_index(ct_small)
+
+        assert index.is_current()
+
+        # The index is kept in memory and the warning only issued once
+        def from_file(*args, **kwargs):
+            raise AssertionError("index rebuilt")
+
+        with monkeypatch.context() as m:
+            m.setattr(ElementIndex, "from_file", from_file)
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                assert get_element_index(ct_small) is index
+
+        # A modified file gets a new index, still without warning
+        st = os.stat(ct_small)
+        os.utime(ct_small, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            new_index = get_element_index(ct_small)
+
+        assert new_index is not index
+        assert new_index.is_current()
+        assert get_element_index(ct_small) is new_index
+
+    @pytest.mark.skipif(
+        sys.platform == "win32" or os.geteuid() == 0,
+        reason="Directory permissions not enforced",
+    )
+    def test_sidecar_read_only_directory(self, ct_small, monkeypatch):
+        """Test indexing a file in a read-only directory."""
+        calls = []
+        from_file = ElementIndex.from_file
+
+        def counted(*args, **kwargs):
+            calls.append(args)
+            return from_file(*args, **kwargs)
+
+        monkeypatch.setattr(ElementIndex, "from_file", counted)
+        directory = os.path.dirname(ct_small)
+        mode = os.stat(directory).st_mode
+        os.chmod(directory, 0o555)
+        try:
+            msg = "Unable to write the element index to "
+            with pytest.warns(UserWarning, match=msg):
+                index = get_element_index(ct_small)
+
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                assert get_element_index(ct_small) is index
+                ds = dcmread(
+                    ct_small, specific_tags=["PatientName"], element_index=True
+                )
+                assert ds.PatientName == "CompressedSamples^CT1"
+        finally:
+            os.chmod(directory, mode)
+
+        assert not os.path.exists(f"{ct_small}{SIDECAR_SUFFIX}")
+        assert 1 == len(calls)
+
+    def test_cache(self, ct_small):
+        """Test storing the index in a user-supplied cache."""
+        cache = {}
+        index = get_element_index(ct_small, cache=cache)
+        assert not os.path.exists(f"{ct_small}{SIDECAR_SUFFIX}")
+        assert {os.path.abspath(ct_small): index} == cache
+        assert get_element_index(ct_small, cache=cache) is index
+
+        st = os.stat(ct_small)
+        os.utime(ct_small, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        new_index = get_element_index(ct_small, cache=cache)
+        assert new_index is not index
+        assert cache[os.path.abspath(ct_small)] is new_index
+
+
+class TestDcmread:
+    """Tests for dcmread(element_index=...)"""
+
+    @pytest.mark.parametrize("path", [CT_SMALL, MR_BIG, DEFLATED, RTPLAN])
+    def test_matches_specific_tags(self, path, tmp_path):
+        """Test indexed reads match reading with specific_tags."""
+        path = shutil.copy(path, tmp_path)
+        ds = dcmread(path, force=True)
+        cache = {}
+        for tag in ds.keys():
+            if tag.group in (0x0000, 0x0002):
+                continue
+
+            ref = dcmread(path, specific_tags=[tag], force=True)
+            indexed = dcmread(
+                path, specific_tags=[tag], force=True, element_index=cache
+            )
+            assert ref == indexed
+            assert ref.original_encoding == indexed.original_encoding
+            assert ref.file_meta == indexed.file_meta
+
+    def test_sequences(self, tmp_path):
+        """Test reading sequences with an index."""
+        path = shutil.copy(RTPLAN, tmp_path)
+        tags = ["BeamSequence", "PatientName", 0x00080005]
+        ref = dcmread(path, specific_tags=tags)
+        ds = dcmread(path, specific_tags=tags, element_index=True)
+        assert ref == ds
+        assert len(ref.BeamSequence) == len(ds.BeamSequence)
+
+    def test_stop_before_pixels(self, ct_small):
+        """Test stop_before_pixels with an index."""
+        tags = ["PatientName", "PixelData", "Rows"]
+        ds = dcmread(
+            ct_small, specific_tags=tags, stop_before_pixels=True, element_index=True
+        )
+        assert ["SpecificCharacterSet", "PatientName", "Rows"] == [
+            elem.keyword for elem in ds
+        ]
+
+    def test_deferred(self, ct_small):
+        """Test deferred reads of indexed elements."""
+        ref = dcmread(ct_small)
+        ds = dcmread(
+            ct_small, specific_tags=["PixelData"], defer_size=1024, element_index=True
+        )
+        assert ds["PixelData"].value == ref.PixelData
+
+    def test_sidecar(self, ct_small):
+        """Test the sidecar index is used and updated."""
+        dcmread(ct_small, specific_tags=["PatientName"], element_index=True)
+        sidecar = f"{ct_small}{SIDECAR_SUFFIX}"
+        index = ElementIndex.load(sidecar)
+
+        # Replace with a bad index that would be used if still current
+        bad = ElementIndex(
+            index.filename,
+            index.size,
+            index.mtime,
+            {0x00100010: index[0x00100020]},
+        )
+        bad.save(sidecar)
+        msg = "Indexed read tag .* does not match the requested tag"
+        with pytest.raises(ValueError, match=msg):
+            dcmread(ct_small, specific_tags=["PatientName"], element_index=True)
+
+        # But isn't used once the file changes
+        st = os.stat(ct_small)
+        os.utime(ct_small, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        ds = dcmread(ct_small, specific_tags=["PatientName"], element_index=True)
+        assert "CompressedSamples^CT1" == ds.PatientName
+        assert ElementIndex.load(sidecar).is_current()
+
+    def test_missing_tags(self, ct_small):
+        """Test requesting tags that aren't in the file."""
+        ds = dcmread(ct_small, specific_tags=[0x00100011], element_index=True)
+        assert ["SpecificCharacterSet"] == [elem.keyword for elem in ds]
+
+    def test_not_used(self, ct_small):
+        """Test the index isn't built without specific_tags."""
+        dcmread(ct_small, element_index=True)
+        assert not os.path.exists(f"{ct_small}{SIDECAR_SUFFIX}")
+
+    def test_requires_path(self):
+        """Test using an index with a file-like raises."""
+        msg = "dcmread: 'element_index' requires a file path, but got BufferedReader"
+        with open(CT_SMALL, "rb") as f:
+            with pytest.raises(TypeError, match=msg):
+                dcmread(f, specific_tags=["PatientName"], element_index=True)
@@ -0,0 +1,129 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Tests for the pydicom3.fileprobe module."""
+
+from io import BytesIO
+
+import pytest
+
+import pydicom3
+from pydicom3 import dcmread
+from pydicom3.data import get_testdata_file
+from pydicom3.errors import InvalidDicomError
+from pydicom3.fileprobe import ProbeResult, probe
+from pydicom3.uid import (
+    DeflatedExplicitVRLittleEndian,
+    ExplicitVRBigEndian,
+    ImplicitVRLittleEndian,
+    RLELossless,
+)
+
+
+CT_SMALL = get_testdata_file("CT_small.dcm")
+DEFLATED = get_testdata_file("image_dfl.dcm")
+MR_BIG = get_testdata_file("MR_small_bigendian.dcm")
+NO_META = get_testdata_file("no_meta.dcm")
+RTDOSE_RLE = get_testdata_file("rtdose_rle.dcm")
+RTPLAN = get_testdata_file("rtplan.dcm")
+SC_JPEG = get_testdata_file("SC_rgb_jpeg.dcm")
+
+
+def _pixel_data_elem(path):
+    """Return the dataset and pixel data element from the file at `path`."""
+    ds = dcmread(path, defer_size=0)
+    return ds, ds["PixelData"]
+
+
+class TestProbe:
+    """Tests for probe()"""
+
+    def test_native(self):
+        """Test probing a file with native pixel data."""
+        ds, elem = _pixel_data_elem(CT_SMALL)
+        result = probe(CT_SMALL)
+        assert isinstance(result, ProbeResult)
+        assert result.has_preamble
+        assert ds.file_meta.TransferSyntaxUID == result.transfer_syntax_uid
+        assert ds.SOPClassUID == result.sop_class_uid
+        assert ds.SOPInstanceUID == result.sop_instance_uid
+        assert elem.file_tell == result.pixel_data_offset
+        assert 32768 == result.pixel_data_length
+        assert 1 == result.number_of_frames
+        assert not result.is_encapsulated
+
+        with open(CT_SMALL, "rb") as f:
+            f.seek(result.pixel_data_offset)
+            assert dcmread(CT_SMALL).PixelData == f.read(result.pixel_data_length)
+
+    def test_encapsulated(self):
+        """Test probing a file with encapsulated pixel data."""
+        ds, elem = _pixel_data_elem(RTDOSE_RLE)
+        result = probe(RTDOSE_RLE)
+        assert RLELossless == result.transfer_syntax_uid
+        assert elem.file_tell == result.pixel_data_offset
+        assert len(dcmread(RTDOSE_RLE).PixelData) == result.pixel_data_length
+        assert 15 == result.number_of_frames
+        assert result.is_encapsulated
+
+    def test_big_endian(self):
+        """Test probing an explicit VR big endian file."""
+        _, elem = _pixel_data_elem(MR_BIG)
+        result = probe(MR_BIG)
+        assert ExplicitVRBigEndian == result.transfer_syntax_uid
+        assert elem.file_tell == result.pixel_data_offset
+        assert 8192 == result.pixel_data_length
+
+    def test_no_pixel_data(self):
+        """Test probing a file with sequences and no pixel data."""
+        ds = dcmread(RTPLAN)
+        result = probe(RTPLAN)
+        assert ImplicitVRLittleEndian == result.transfer_syntax_uid
+        assert ds.SOPInstanceUID == result.sop_instance_uid
+        assert result.pixel_data_offset is None
+        assert result.pixel_data_length is None
+        assert result.number_of_frames is None
+
+    def test_deflated(self):
+        """Test the pixel data offset isn't available for deflated datasets."""
+        result = probe(DEFLATED)
+        assert DeflatedExplicitVRLittleEndian == result.transfer_syntax_uid
+        assert result.pixel_data_offset is None
+        assert len(dcmread(DEFLATED).PixelData) == result.pixel_data_length
+
+    def test_mismatched_vr(self):
+        """Test a dataset encoded with the wrong VR encoding."""
+        _, elem = _pixel_data_elem(SC_JPEG)
+        result = probe(SC_JPEG)
+        assert elem.file_tell == result.pixel_data_offset
+        assert result.is_encapsulated
+
+    def test_no_preamble(self):
+        """Test probing a file without a preamble."""
+        msg = "File is missing DICOM File Meta Information header"
+        with pytest.raises(InvalidDicomError, match=msg):
+            probe(NO_META)
+
+        result = probe(NO_META, force=True)
+        assert not result.has_preamble
+        assert result.transfer_syntax_uid is None
+        assert result.sop_instance_uid is None
+        assert 0x7FE00010 not in dcmread(NO_META, force=True)
+        assert result.pixel_data_offset is None
+
+    def test_buffer(self):
+        """Test probing a buffer."""
+        with open(CT_SMALL, "rb") as f:
+            data = f.read()
+
+        buffer = BytesIO(b"\x00" * 10 + data)
+        buffer.seek(10)
+        result = probe(buffer)
+        assert probe(CT_SMALL)._replace(pixel_data_offset=6310) == result
+
+    def test_empty(self):
+        """Test probing an empty file."""
+        result = probe(BytesIO(), force=True)
+        assert ProbeResult(False, None, None, None, None, None, None, False) == result
+
+    def test_package_level(self):
+        """Test probe() is available from the package."""
+        assert pydicom3.probe is probe
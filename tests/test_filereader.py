@@ -1,6 +1,10 @@
 # Copyright 2008-2018 pydicom3 authors. See LICENSE file for details.
 """Unit tests for the pydicom3.filereader module."""
 
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import copy
+import gc
 import gzip
 import io
 from io import BytesIO
@@ -8,26 +12,37 @@ import logging
 import os
 import shutil
 from pathlib import Path
+import struct
 from struct import unpack
 import sys
 import tempfile
+import threading
+import zlib
 
 import pytest
 
 import pydicom3.config
-from pydicom3 import config, dicomio
+from pydicom3 import config, dicomio, filereader
 from pydicom3.dataset import Dataset, FileDataset, FileMetaDataset
 from pydicom3.data import get_testdata_file
 from pydicom3.datadict import add_dict_entries
 from pydicom3.filereader import (
+    async_dcmread,
     dcmread,
     read_dataset,
     data_element_generator,
     read_file_meta_info,
+    read_headers,
 )
-from pydicom3.dataelem import DataElement, convert_raw_data_element
+from pydicom3.dataelem import DataElement, RawDataElement, convert_raw_data_element
 from pydicom3.errors import InvalidDicomError
-from pydicom3.filebase import DicomBytesIO
+from pydicom3.filebase import (
+    DicomBytesIO,
+    DicomFileLike,
+    DicomInflateIO,
+    DicomMemoryViewIO,
+)
+from pydicom3.fileindex import ElementIndex
 from pydicom3.multival import MultiValue
 from pydicom3.sequence import Sequence
 from pydicom3.tag import Tag, TupleTag
@@ -42,6 +57,7 @@ from pydicom3.uid import (
 import pydicom3.valuerep
 from pydicom3 import values
 
+from .test_helpers import AsyncBytesIO
 
 from pydicom3.pixel_data_handlers import gdcm_handler
 
@@ -285,9 +301,102 @@ class TestReader:
         # If we can read anything else, the decompression must have been ok.
         ds = dcmread(deflate_name)
         assert "WSD" == ds.ConversionType
-        assert isinstance(ds.buffer, DicomBytesIO)
+        assert isinstance(ds.buffer, DicomInflateIO)
         assert ds.filename == deflate_name
 
+    def test_deflate_partial(self):
+        """Test stop_before_pixels and specific_tags with a deflated dataset"""
+        ds = dcmread(deflate_name, stop_before_pixels=True)
+        assert "WSD" == ds.ConversionType
+        assert "PixelData" not in ds
+        # Only the start of the deflated stream has been inflated
+        assert ds.buffer.tell() < 262144
+
+        ds = dcmread(deflate_name, specific_tags=["ConversionType"])
+        assert "WSD" == ds.ConversionType
+        assert 1 == len(ds)
+
+    def test_deflate_matches_full_inflate(self):
+        """Test the streamed inflate gives the same dataset as inflating
+        in a single pass"""
+        ds = dcmread(deflate_name)
+        with open(deflate_name, "rb") as f:
+            # Skip the preamble, prefix and file meta information
+            f.seek(ds.file_meta.FileMetaInformationGroupLength + 144)
+            inflated = zlib.decompress(f.read(), -zlib.MAX_WBITS)
+
+        ref = read_dataset(BytesIO(inflated), False, True)
+        assert ref == Dataset(ds)
+
+    def test_mmap(self):
+        """Test reading with mmap uses views for large binary values"""
+        ref = dcmread(ct_name)
+        with dcmread(ct_name, mmap=True) as ds:
+            assert isinstance(ds.buffer, DicomMemoryViewIO)
+            assert isinstance(ds._dict[0x7FE00010].value, memoryview)
+            assert isinstance(ds.PixelData, memoryview)
+            assert isinstance(ds.SOPInstanceUID, str)
+            assert ds == ref
+            pixel_data = ds.PixelData
+
+        # Views are released and the mapping closed on exit
+        assert ds._mapping is None
+        assert ds.buffer.closed
+        with pytest.raises(ValueError, match="released memoryview"):
+            bytes(pixel_data)
+
+    def test_mmap_implicit_and_encapsulated(self):
+        """Test reading with mmap for implicit VR and encapsulated data"""
+        implicit_name = get_testdata_file("MR_small_implicit.dcm")
+        for fpath in (implicit_name, get_testdata_file("MR_small_RLE.dcm")):
+            with dcmread(fpath, mmap=True, force=True) as ds:
+                assert isinstance(ds.PixelData, memoryview)
+                assert ds == dcmread(fpath, force=True)
+
+    def test_mmap_deferred(self):
+        """Test deferred reads with mmap"""
+        with dcmread(ct_name, mmap=True, defer_size=100) as ds:
+            assert ds._dict[0x7FE00010].value is None
+            assert isinstance(ds.PixelData, memoryview)
+
+        # After closing the mapping the file is used instead
+        ds = dcmread(ct_name, mmap=True, defer_size=100)
+        ds.__exit__(None, None, None)
+        assert isinstance(ds.PixelData, bytes)
+        assert ds == dcmread(ct_name)
+
+    def test_mmap_file_object(self):
+        """Test mmap with a file object"""
+        with open(ct_name, "rb") as f:
+            ds = dcmread(f, mmap=True)
+
+        assert isinstance(ds.PixelData, memoryview)
+        assert ds == dcmread(ct_name)
+
+    def test_mmap_buffer_raises(self):
+        """Test mmap with a buffer without fileno() raises"""
+        with open(ct_name, "rb") as f:
+            buffer = BytesIO(f.read())
+
+        msg = "'mmap' requires a file path or a file-like with a 'fileno\\(\\)'"
+        with pytest.raises(TypeError, match=msg):
+            dcmread(buffer, mmap=True)
+
+    def test_mmap_copy_and_write(self):
+        """Test copying and writing a dataset read with mmap"""
+        ref = dcmread(ct_name)
+        with dcmread(ct_name, mmap=True) as ds:
+            ds_copy = copy.deepcopy(ds)
+            fp = BytesIO()
+            ds.save_as(fp)
+
+        assert ds_copy._mapping is None
+        assert ds_copy.buffer is None
+        assert isinstance(ds_copy.PixelData, bytes)
+        assert ds_copy == ref
+        fp.seek(0)
+        assert dcmread(fp) == ref
+
     def test_sequence_with_implicit_vr(self):
         """Test that reading a UN sequence with unknown length and implicit VR
         in a dataset with explicit VR is read regardless of the value of
@@ -424,6 +533,69 @@ class TestReader:
                 specific_tags=[unknown_len_tag],
             )
 
+    def test_specific_tags_stops_after_last_tag(self):
+        """Test reading stops once past the last of the specific tags."""
+        with open(ct_name, "rb") as f:
+            data = f.read()
+
+        fp = BytesIO(data)
+        ds = dcmread(fp, specific_tags=["PatientName", "StudyDate"])
+        assert ["SpecificCharacterSet", "StudyDate", "PatientName"] == [
+            elem.keyword for elem in ds
+        ]
+        # Rewound to the start of the element following the last tag
+        index = ElementIndex.from_file(ct_name)
+        next_tag = next(tag for tag in index if tag > 0x00100010)
+        assert index[next_tag].offset == fp.tell()
+
+    @pytest.mark.parametrize("buffering", [-1, 0])
+    def test_specific_tags_skips_sequences(self, buffering, tmp_path, monkeypatch):
+        """Test undefined length sequences not in the specific tags are
+        skipped without being parsed.
+        """
+        nested = Dataset()
+        nested.PatientID = "Nested"
+        nested.is_undefined_length_sequence_item = True
+        item = Dataset()
+        item.ReferencedSOPInstanceUID = "1.2.3"
+        item.ReferencedImageSequence = [nested, Dataset()]
+        item["ReferencedImageSequence"].is_undefined_length = True
+        item.add_new(0x00091001, "OB", b"\x00\x01" * 10)
+        item.is_undefined_length_sequence_item = True
+        defined = Dataset()
+        defined.PatientName = "Defined"
+
+        ds = Dataset()
+        ds.SpecificCharacterSet = "ISO_IR 100"
+        ds.ReferencedSeriesSequence = [item, defined]
+        ds["ReferencedSeriesSequence"].is_undefined_length = True
+        ds.PatientID = "Top"
+        ds.PatientSex = "O"
+        for implicit in (True, False):
+            path = tmp_path / f"{implicit}.dcm"
+            ds.save_as(path, implicit_vr=implicit, little_endian=True)
+
+            def read_sequence(*args, **kwargs):
+                raise RuntimeError("the sequence was parsed")
+
+            with monkeypatch.context() as m:
+                m.setattr(filereader, "read_sequence", read_sequence)
+                with open(path, "rb", buffering=buffering) as f:
+                    ds_read = dcmread(f, force=True, specific_tags=["PatientID"])
+                    assert ["SpecificCharacterSet", "PatientID"] == [
+                        elem.keyword for elem in ds_read
+                    ]
+                    assert "Top" == ds_read.PatientID
+                    # Stopped at (0010,0040) *Patient's Sex*
+                    assert f.tell() == os.path.getsize(path) - 10
+
+            ds_read = dcmread(
+                path, force=True, specific_tags=["ReferencedSeriesSequence"]
+            )
+            seq = ds_read.ReferencedSeriesSequence
+            assert "Nested" == seq[0].ReferencedImageSequence[0].PatientID
+            assert "Defined" == seq[1].PatientName
+
     def test_private_SQ(self):
         """Can read private undefined length SQ without error."""
         # From issues 91, 97, 98. Bug introduced by fast reading, due to
@@ -1691,9 +1863,156 @@ class TestDeferredRead:
         """Deferred values work with file-like objects."""
         path = get_testdata_file("image_dfl.dcm")
         ds = pydicom3.dcmread(path, defer_size=1024)
-        assert isinstance(ds.buffer, DicomBytesIO)
+        assert isinstance(ds.buffer, DicomInflateIO)
         assert 262144 == len(ds.PixelData)
 
+    @pytest.mark.filterwarnings("error::ResourceWarning")
+    def test_deflate_deferred_closes_file(self):
+        """Test the file re-opened for a deflated deferred read is closed"""
+        with dcmread(deflate_name, defer_size=100) as ds:
+            assert 262144 == len(ds.PixelData)
+            source = ds.buffer.parent._source
+            assert source.closed
+
+        ds = dcmread(deflate_name, defer_size=100)
+        ds.load_deferred()
+        assert ds.buffer.parent._source.closed
+        assert 262144 == len(ds.PixelData)
+        assert ds.buffer.parent._source.closed
+        # Reading the dataset's buffer directly re-opens the file until closed
+        ds.buffer.seek(0)
+        assert ds.buffer.read(4)
+        assert not ds.buffer.parent._source.closed
+        ds.close()
+        assert ds.buffer.parent._source.closed
+        gc.collect()
+
+    @pytest.fixture
+    def opener(self):
+        """Return a callable that counts the files opened with it"""
+
+        class Opener:
+            count = 0
+
+            def __call__(self, *args):
+                self.count += 1
+                return open(*args)
+
+        return Opener()
+
+    @pytest.fixture
+    def pool_size(self):
+        """Enable the pool of deferred read handles"""
+        config.settings.deferred_read_pool_size = 2
+        yield
+        config.settings.deferred_read_pool_size = 0
+
+    def test_load_deferred(self, opener):
+        """Test loading all the deferred values in a single pass"""
+        ds = dcmread(self.testfile_name, defer_size=1024)
+        ds.fileobj_type = opener
+        ds.load_deferred()
+        assert 1 == opener.count
+        assert [] == [elem for elem in ds._dict.values() if elem.value is None]
+
+        os.remove(self.testfile_name)
+        assert dcmread(ct_name) == ds
+
+    def test_load_deferred_tags(self, opener):
+        """Test loading the deferred values of specific elements"""
+        ds = dcmread(self.testfile_name, defer_size=1024)
+        ds.fileobj_type = opener
+        ds.load_deferred(["PixelData", "PatientName", 0x00100020])
+        assert 1 == opener.count
+        assert ds._dict[0x7FE00010].value is not None
+        assert ds._dict[0x00431029].value is None
+
+        # Nothing left to load
+        ds.load_deferred(["PixelData"])
+        assert 1 == opener.count
+
+    def test_load_deferred_raises(self):
+        """Test loading deferred values from a missing file raises"""
+        ds = dcmread(self.testfile_name, defer_size=1024)
+        os.remove(self.testfile_name)
+        with pytest.raises(OSError, match="original file .* is missing"):
+            ds.load_deferred()
+
+    def test_keep_open(self, opener):
+        """Test keeping the file open for deferred reads"""
+        ds = dcmread(self.testfile_name, defer_size=1024)
+        ds.fileobj_type = opener
+        with ds.keep_open():
+            assert ds.keep_open() is ds
+            fp = ds._deferred_fp
+            assert 32768 == len(ds.PixelData)
+            private_block = ds.private_block(0x43, "GEMS_PARM_01")
+            assert 2068 == len(private_block[0x29].value)
+            assert 1 == opener.count
+
+        assert ds._deferred_fp is None
+        assert fp.closed
+
+    def test_keep_open_missing(self, opener):
+        """Test keep_open() doesn't open the file if it's missing"""
+        ds = dcmread(self.testfile_name, defer_size=1024)
+        ds.fileobj_type = opener
+        os.remove(self.testfile_name)
+        with pytest.raises(OSError):
+            ds.keep_open()
+
+        assert ds._deferred_fp is None
+        assert 0 == opener.count
+
+    def test_keep_open_buffer(self):
+        """Test keep_open() with a dataset read from a buffer"""
+        with open(ct_name, "rb") as f:
+            ds = dcmread(io.BytesIO(f.read()), defer_size=1024)
+
+        ds.keep_open()
+        assert ds._deferred_fp is None
+        assert 32768 == len(ds.PixelData)
+
+        ds.buffer = None
+        msg = "Unable to keep the file open as the dataset wasn't read from a file"
+        with pytest.raises(OSError, match=msg):
+            ds.keep_open()
+
+    def test_pool(self, opener, pool_size):
+        """Test sharing a pool of handles for deferred reads"""
+        ds = dcmread(self.testfile_name, defer_size=1024)
+        other = dcmread(self.testfile_name, defer_size=1024)
+        ds.fileobj_type = other.fileobj_type = opener
+        assert 32768 == len(ds.PixelData)
+        assert 32768 == len(other.PixelData)
+        private_block = ds.private_block(0x43, "GEMS_PARM_01")
+        assert 2068 == len(private_block[0x29].value)
+        assert 1 == opener.count
+
+        # Least recently used handles are closed
+        ct = dcmread(ct_name, defer_size=1024)
+        mr = dcmread(mr_name, defer_size=1024)
+        ct.fileobj_type = mr.fileobj_type = opener
+        ct.PixelData
+        mr.PixelData
+        assert 3 == opener.count
+        other.private_block(0x43, "GEMS_PARM_01")[0x29].value
+        assert 4 == opener.count
+
+    def test_pool_file_changed(self, opener, pool_size):
+        """Test idle handles aren't used after the file changes"""
+        ds = dcmread(self.testfile_name, defer_size=1024)
+        ds.fileobj_type = opener
+        ds.PixelData
+
+        st = os.stat(self.testfile_name)
+        os.utime(self.testfile_name, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        msg = "Deferred read warning -- file modification time has changed"
+        with pytest.warns(UserWarning, match=msg):
+            ds.private_block(0x43, "GEMS_PARM_01")[0x29].value
+
+        assert 2 == opener.count
+
 
 class TestReadTruncatedFile:
     def testReadFileWithMissingPixelData(self):
@@ -1816,9 +2135,260 @@ class TestDataElementGenerator:
         assert elem == convert_raw_data_element(next(gen), encoding="ISO_IR 100")
 
 
+@pytest.fixture
+def small_blocks(monkeypatch):
+    """Use a block size smaller than most elements when buffering"""
+    monkeypatch.setattr(filereader, "_BLOCK_SIZE", 20)
+
+
+class TestBlockBufferedGenerator:
+    """Test data_element_generator() reading unbuffered file-likes in blocks"""
+
+    def test_use_block_buffer(self, tmp_path):
+        """Test which file-likes are read in blocks"""
+        path = tmp_path / "file"
+        path.write_bytes(b"\x00" * 8)
+        with open(path, "rb", buffering=0) as f:
+            assert filereader._use_block_buffer(f)
+            assert filereader._use_block_buffer(DicomFileLike(f))
+
+        with open(path, "rb") as f:
+            assert not filereader._use_block_buffer(f)
+
+        assert not filereader._use_block_buffer(BytesIO())
+        assert not filereader._use_block_buffer(DicomBytesIO())
+        assert not filereader._use_block_buffer(DicomInflateIO(BytesIO()))
+
+    @pytest.mark.parametrize("small", [False, True])
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"defer_size": 100},
+            {"stop_before_pixels": True},
+            {"specific_tags": ["PatientName", "BeamSequence", "PixelData"]},
+        ],
+    )
+    @pytest.mark.parametrize(
+        "path",
+        [
+            ct_name,
+            mr_name,
+            rtplan_name,
+            priv_SQ_name,
+            jpeg2000_name,
+            no_meta_group_length,
+        ],
+    )
+    def test_matches_unbuffered(self, path, kwargs, small, monkeypatch):
+        """Test the elements match those read without buffering"""
+        if small:
+            monkeypatch.setattr(filereader, "_BLOCK_SIZE", 20)
+
+        with open(path, "rb") as f:
+            ref = dcmread(f, force=True, **kwargs)
+            ref_tell = f.tell()
+
+        with open(path, "rb", buffering=0) as f:
+            ds = dcmread(f, force=True, **kwargs)
+            assert ref_tell == f.tell()
+
+        assert ref == ds
+        for elem, ref_elem in zip(ds._dict.values(), ref._dict.values()):
+            assert type(ref_elem) is type(elem)
+            if isinstance(elem, RawDataElement):
+                assert ref_elem == elem
+
+    def test_position(self, tmp_path, small_blocks):
+        """Test the file position is correct after each element"""
+        path = tmp_path / "file"
+        # (0010,0010) PN 6 ABCDEF, (0010,0020) LO 30, (0010,0030) DA 0
+        path.write_bytes(
+            b"\x10\x00\x10\x00PN\x06\x00ABCDEF"
+            + b"\x10\x00\x20\x00LO\x1e\x00"
+            + b"A" * 30
+            + b"\x10\x00\x30\x00DA\x00\x00"
+        )
+        with open(path, "rb", buffering=0) as f:
+            gen = data_element_generator(f, False, True)
+            elem = next(gen)
+            assert (0x00100010, b"ABCDEF", 8) == (elem.tag, elem.value, elem.value_tell)
+            assert 14 == f.tell()
+            elem = next(gen)
+            assert (0x00100020, b"A" * 30, 22) == (
+                elem.tag,
+                elem.value,
+                elem.value_tell,
+            )
+            assert 52 == f.tell()
+            elem = next(gen)
+            assert (0x00100030, b"", 60) == (elem.tag, elem.value, elem.value_tell)
+            assert 60 == f.tell()
+            assert next(gen, None) is None
+
+    def test_caller_moves_position(self, tmp_path):
+        """Test the file position being moved between elements"""
+        path = tmp_path / "file"
+        path.write_bytes(
+            b"\x10\x00\x10\x00PN\x06\x00ABCDEF"
+            + b"\x10\x00\x20\x00LO\x04\x00ABCD"
+            + b"\x10\x00\x30\x00DA\x00\x00"
+        )
+        with open(path, "rb", buffering=0) as f:
+            gen = data_element_generator(f, False, True)
+            assert 0x00100010 == next(gen).tag
+            f.seek(26)
+            assert 0x00100030 == next(gen).tag
+            f.seek(0)
+            assert 0x00100010 == next(gen).tag
+
+    def test_truncated_header(self, tmp_path):
+        """Test a truncated 4-byte length"""
+        path = tmp_path / "file"
+        path.write_bytes(b"\x10\x00\x10\x00PN\x06\x00ABCDEF\x10\x00\x20\x00OB\x00\x00")
+        with open(path, "rb", buffering=0) as f:
+            gen = data_element_generator(f, False, True)
+            assert 0x00100010 == next(gen).tag
+            with pytest.raises(struct.error):
+                next(gen)
+
+
 def test_read_file_meta_info():
     """Test read_file_meta_info()"""
     ds = read_file_meta_info(rtplan_name)
     assert len(ds) == 6
     assert isinstance(ds, FileMetaDataset)
     assert ds.TransferSyntaxUID == ImplicitVRLittleEndian
+
+
+class TestReadHeaders:
+    """Tests for read_headers()"""
+
+    paths = [ct_name, mr_name, rtplan_name, deflate_name, truncated_mr_name]
+
+    def test_ordered(self):
+        """Test the datasets are yielded in the same order as the paths"""
+        datasets = list(read_headers(self.paths, workers=3))
+        assert self.paths == [ds.filename for ds in datasets]
+        for ds, path in zip(datasets, self.paths):
+            assert "PixelData" not in ds
+            assert dcmread(path, stop_before_pixels=True) == ds
+
+    def test_unordered(self):
+        """Test yielding the datasets as they complete"""
+        datasets = list(read_headers(self.paths * 3, workers=2, ordered=False))
+        assert sorted(self.paths * 3) == sorted(ds.filename for ds in datasets)
+
+    def test_lazy_paths(self):
+        """Test the paths are consumed lazily"""
+        consumed = []
+
+        def paths():
+            for path in self.paths * 4:
+                consumed.append(path)
+                yield path
+
+        reader = read_headers(paths(), workers=1)
+        assert ct_name == next(reader).filename
+        assert len(consumed) < 20
+        reader.close()
+
+    def test_kwargs(self):
+        """Test passing arguments through to dcmread()"""
+        datasets = list(
+            read_headers(
+                [ct_name, Path(mr_name)],
+                stop_before_pixels=False,
+                specific_tags=["PatientName", "PixelData"],
+            )
+        )
+        for ds in datasets:
+            assert ["PatientName", "PixelData"] == [e.keyword for e in ds][-2:]
+
+        ds = next(read_headers([ct_name], defer_size=1024, stop_before_pixels=False))
+        assert ds["PixelData"].value is not None
+        ds = next(read_headers([explicit_vr_le_no_meta], force=True))
+        assert "SOPInstanceUID" in ds
+
+    def test_errors(self, tmp_path):
+        """Test files that can't be read don't stop the batch"""
+        missing = os.fspath(tmp_path / "missing.dcm")
+        paths = [ct_name, missing, explicit_vr_le_no_meta, mr_name]
+        errors = {}
+        datasets = list(read_headers(paths, workers=2, errors=errors))
+        assert [ct_name, mr_name] == [ds.filename for ds in datasets]
+        assert [missing, explicit_vr_le_no_meta] == list(errors)
+        assert isinstance(errors[missing], FileNotFoundError)
+        assert isinstance(errors[explicit_vr_le_no_meta], InvalidDicomError)
+
+        msg = f"Unable to read the file at '{missing}'"
+        with pytest.warns(UserWarning, match=msg):
+            datasets = list(read_headers(paths, workers=2))
+
+        assert 2 == len(datasets)
+
+    def test_processes(self):
+        """Test using a process pool"""
+        errors = {}
+        paths = self.paths + ["missing.dcm"]
+        datasets = list(
+            read_headers(paths, workers=2, use_processes=True, errors=errors)
+        )
+        assert self.paths == [ds.filename for ds in datasets]
+        assert ["missing.dcm"] == list(errors)
+        for ds, path in zip(datasets, self.paths):
+            assert dcmread(path, stop_before_pixels=True) == ds
+
+
+class TestAsyncDcmread:
+    """Tests for async_dcmread()"""
+
+    @pytest.mark.parametrize("path", [ct_name, rtplan_name, deflate_name])
+    def test_read(self, path):
+        """Test reading matches dcmread() and the I/O happens in the loop"""
+        with open(path, "rb") as f:
+            src = AsyncBytesIO(f.read())
+
+        async def read():
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                ds = await async_dcmread(src, executor=executor)
+
+            assert src.threads == {threading.get_ident()}
+            return ds
+
+        ds = asyncio.run(read())
+        assert dcmread(path) == ds
+        assert dcmread(path).file_meta == ds.file_meta
+
+    def test_kwargs(self):
+        """Test the dcmread() keyword arguments are used"""
+        with open(ct_name, "rb") as f:
+            src = AsyncBytesIO(f.read())
+
+        ds = asyncio.run(
+            async_dcmread(
+                src,
+                stop_before_pixels=True,
+                specific_tags=["PatientName", "PixelData"],
+            )
+        )
+        assert ["SpecificCharacterSet", "PatientName"] == [e.keyword for e in ds]
+
+    def test_deferred(self):
+        """Test deferred values are read from the async file-like"""
+        with open(ct_name, "rb") as f:
+            src = AsyncBytesIO(f.read())
+
+        async def read():
+            ds = await async_dcmread(src, defer_size=1024)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, lambda: ds.PixelData)
+
+        assert dcmread(ct_name).PixelData == asyncio.run(read())
+
+    def test_invalid_executor_raises(self):
+        """Test using a process pool raises"""
+        msg = "async_dcmread: 'executor' must use threads, not processes"
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            with pytest.raises(TypeError, match=msg):
+                asyncio.run(async_dcmread(AsyncBytesIO(b""), executor=executor))
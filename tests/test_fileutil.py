@@ -4,12 +4,17 @@ from io import BytesIO, RawIOBase
 from pathlib import Path
 import platform
 import tempfile
+import zlib
 
 import pytest
 
 from pydicom3.config import settings
+from pydicom3.filebase import DicomInflateIO, DicomMemoryViewIO
 from pydicom3.fileutil import (
+    find_bytes,
+    length_of_undefined_length,
     path_from_pathlike,
+    read_undefined_length_value,
     check_buffer,
     reset_buffer_position,
     read_buffer,
@@ -17,6 +22,7 @@ from pydicom3.fileutil import (
     buffer_length,
     buffer_equality,
 )
+from pydicom3.tag import SequenceDelimiterTag
 
 
 IS_WINDOWS = platform.system() == "Windows"
@@ -193,3 +199,100 @@ class TestBufferFunctions:
     def test_equality_not_buffer(self):
         """Test equality if 'other' is not a buffer or bytes"""
         assert buffer_equality(b"", None) is False
+
+
+# (FFFE,E0DD) Sequence Delimitation Item, little endian
+DELIMITER = b"\xfe\xff\xdd\xe0\x00\x00\x00\x00"
+
+
+class TestFindBytes:
+    """Tests for find_bytes() and length_of_undefined_length()"""
+
+    @pytest.mark.parametrize("offset", [0, 1, 6, 7, 8, 9, 1000, 5000])
+    def test_block_boundaries(self, offset):
+        """Test finding bytes at and across the block boundaries"""
+        fp = BytesIO(b"\x00" * offset + b"\x01\x02\x03\x04" + b"\x00" * 10)
+        assert find_bytes(fp, b"\x01\x02\x03\x04", read_size=8) == offset
+        assert fp.tell() == 0
+        assert find_bytes(fp, b"\x01\x02\x03\x04", read_size=8, rewind=False) == (
+            offset
+        )
+        assert fp.tell() == offset + 4
+
+    def test_not_found(self):
+        """Test the position is restored if not found"""
+        fp = BytesIO(b"\x00" * 100)
+        fp.seek(10)
+        assert find_bytes(fp, b"\x01\x02", read_size=8, rewind=False) is None
+        assert fp.tell() == 10
+
+    def test_memory_view(self):
+        """Test searching a memory view buffer"""
+        fp = DicomMemoryViewIO(b"\x01\x02" + b"\x00" * 100 + b"\x01\x02")
+        fp.seek(1)
+        assert find_bytes(fp, b"\x01\x02", rewind=False) == 102
+        assert fp.tell() == 104
+
+    def test_length_of_undefined_length(self):
+        """Test the length to the delimiter"""
+        fp = BytesIO(b"\x00" * 20 + b"\x01" * 30 + DELIMITER)
+        fp.seek(20)
+        assert length_of_undefined_length(fp, SequenceDelimiterTag, True) == 30
+        assert fp.tell() == 20
+
+        fp = BytesIO(b"\x01" * 30 + b"\xff\xfe\xe0\xdd")
+        assert length_of_undefined_length(fp, SequenceDelimiterTag, False) == 30
+        assert length_of_undefined_length(fp, SequenceDelimiterTag, True) is None
+
+
+class TestReadUndefinedLengthValue:
+    """Tests for read_undefined_length_value()"""
+
+    def test_read(self):
+        """Test reading values of various lengths"""
+        for length in (0, 3, 8 * 1024 - 2, 100_000):
+            value = bytes(range(256)) * (length // 256) + b"\x01" * (length % 256)
+            fp = BytesIO(value + DELIMITER + b"\x01")
+            result = read_undefined_length_value(
+                fp, True, SequenceDelimiterTag, read_size=8
+            )
+            assert value == result
+            assert fp.tell() == length + 8
+
+    def test_defer_size(self):
+        """Test deferring the value"""
+        fp = BytesIO(b"\x01" * 100 + DELIMITER)
+        assert read_undefined_length_value(fp, True, SequenceDelimiterTag, 100) is None
+        assert fp.tell() == 108
+
+        fp.seek(0)
+        value = read_undefined_length_value(fp, True, SequenceDelimiterTag, 101)
+        assert b"\x01" * 100 == value
+        assert fp.tell() == 108
+
+    def test_memory_view(self):
+        """Test the value is a view of a memory view buffer"""
+        fp = DicomMemoryViewIO(b"\x01" * 100 + DELIMITER + b"\x02")
+        value = read_undefined_length_value(fp, True, SequenceDelimiterTag)
+        assert isinstance(value, memoryview)
+        assert b"\x01" * 100 == value
+        assert fp.tell() == 108
+
+    def test_inflated(self):
+        """Test reading from an inflated stream"""
+        value = b"\x01\x02\x03" * 100_000
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        data = compressor.compress(value + DELIMITER) + compressor.flush()
+        fp = DicomInflateIO(BytesIO(data))
+        assert value == read_undefined_length_value(fp, True, SequenceDelimiterTag)
+        assert fp.tell() == len(value) + 8
+
+    def test_missing_delimiter(self):
+        """Test the position is restored if there's no delimiter"""
+        fp = BytesIO(b"\x01" * 10_000)
+        fp.seek(10)
+        msg = "End of file reached before delimiter"
+        with pytest.raises(EOFError, match=msg):
+            read_undefined_length_value(fp, True, SequenceDelimiterTag)
+
+        assert fp.tell() == 10
@@ -10,7 +10,7 @@ from pathlib import Path
 import pickle
 import platform
 
-from struct import unpack
+from struct import pack, unpack
 from tempfile import TemporaryFile
 from typing import cast
 import zlib
@@ -38,6 +38,7 @@ from pydicom3.filewriter import (
     write_file_meta_info,
     correct_ambiguous_vr_element,
     write_numbers,
+    write_number_string,
     write_PN,
     _format_DT,
     write_text,
@@ -2726,6 +2727,69 @@ class TestWriteNumbers:
         write_numbers(fp, elem, "h")
         assert fp.getvalue() == b"\x80\x00\x00\x00\x00\x10"
 
+    @pytest.mark.skipif(not config.have_numpy, reason="NumPy is not available")
+    def test_write_array(self):
+        """Test writing an ndarray value"""
+        import numpy
+
+        arr = numpy.asarray([1, 2, 65535], dtype="<u2")
+        elem = DataElement(0x00280010, "US", arr)
+        assert elem.value is arr
+        fp = DicomBytesIO()
+        fp.is_little_endian = True
+        write_numbers(fp, elem, "H")
+        assert fp.getvalue() == b"\x01\x00\x02\x00\xff\xff"
+
+        # Byte swapped if the endianness doesn't match
+        fp = DicomBytesIO()
+        fp.is_little_endian = False
+        write_numbers(fp, elem, "H")
+        assert fp.getvalue() == b"\x00\x01\x00\x02\xff\xff"
+
+        # Converted to the dtype for the VR
+        elem = DataElement(0x00186028, "FD", numpy.asarray([0.5, 1, 2], dtype="f4"))
+        fp = DicomBytesIO()
+        fp.is_little_endian = True
+        write_numbers(fp, elem, "d")
+        assert fp.getvalue() == pack("<3d", 0.5, 1, 2)
+
+        # Values that can't be encoded
+        elem = DataElement(0x00280010, "US", numpy.asarray([1, -1, 65536]))
+        msg = r"The values are out of range for an array of dtype '<u2'"
+        with pytest.raises(OSError, match=msg):
+            write_numbers(fp, elem, "H")
+
+    @pytest.mark.skipif(not config.have_numpy, reason="NumPy is not available")
+    def test_write_array_lut_descriptor(self):
+        """Test writing an ndarray LUT Descriptor"""
+        import numpy
+
+        elem = DataElement(0x00283002, "SS", numpy.asarray([32768, 0, 16]))
+        fp = DicomBytesIO()
+        fp.is_little_endian = True
+        write_numbers(fp, elem, "h")
+        assert fp.getvalue() == b"\x00\x80\x00\x00\x10\x00"
+
+    @pytest.mark.skipif(not config.have_numpy, reason="NumPy is not available")
+    def test_write_array_roundtrip(self):
+        """Test writing the read-only array values of a dataset"""
+        config.settings.numeric_array_threshold = 3
+        try:
+            for path in ("liver_1frame.dcm", "liver_expb_1frame.dcm"):
+                ds = dcmread(get_testdata_file(path))
+                item = ds.SegmentSequence[0]
+                value = item.RecommendedDisplayCIELabValue
+                assert not value.flags.writeable
+
+                fp = DicomBytesIO()
+                ds.save_as(fp)
+                out = dcmread(DicomBytesIO(fp.getvalue()))
+                value = out.SegmentSequence[0].RecommendedDisplayCIELabValue
+                assert [41661, 41167, 40792] == value.tolist()
+                assert out == ds
+        finally:
+            config.settings.numeric_array_threshold = 0
+
 
 class TestWriteOtherVRs:
     """Tests for writing the 'O' VRs like OB, OW, OF, etc."""
@@ -3050,6 +3114,67 @@ class TestWriteDT:
         assert _format_DT(elem.value) == "20010203123456"
 
 
+@pytest.mark.skipif(not config.have_numpy, reason="NumPy is not available")
+class TestWriteNumberStringArray:
+    """Test filewriter.write_number_string with ndarray values"""
+
+    def test_write_DS(self):
+        """Test writing a DS array"""
+        import numpy
+
+        arr = numpy.asarray([1.5, -2.25, 0.1 + 0.2, 123.45678901234567])
+        elem = DataElement(0x30060050, "DS", arr)
+        assert elem.value is arr
+        fp = DicomBytesIO()
+        write_number_string(fp, elem)
+        assert fp.getvalue() == b"1.5\\-2.25\\0.3\\123.456789012346"
+
+        # Padded to even length
+        elem = DataElement(0x30060050, "DS", numpy.asarray([1.5, 2]))
+        fp = DicomBytesIO()
+        write_number_string(fp, elem)
+        assert fp.getvalue() == b"1.5\\2 "
+
+    def test_write_IS(self):
+        """Test writing an IS array"""
+        import numpy
+
+        elem = DataElement(0x3006002A, "IS", numpy.asarray([255, 0, 10]))
+        fp = DicomBytesIO()
+        write_number_string(fp, elem)
+        assert fp.getvalue() == b"255\\0\\10"
+
+        elem = DataElement(0x3006002A, "IS", numpy.asarray([255, 0, 10.5]))
+        msg = "Non-integer values aren't allowed for VR IS"
+        with pytest.raises(ValueError, match=msg):
+            write_number_string(DicomBytesIO(), elem)
+
+    def test_roundtrip(self):
+        """Test writing and reading DS and IS arrays"""
+        import numpy
+
+        ds = Dataset()
+        ds.ContourData = numpy.linspace(-250.1, 250.3, 3000)
+        ds.ROIDisplayColor = numpy.asarray([255, 0, 10])
+        fp = DicomBytesIO()
+        dcmwrite(fp, ds, implicit_vr=False, little_endian=True)
+        out = read_dataset(BytesIO(fp.getvalue()), False, True)
+        assert numpy.allclose(ds.ContourData, out.ContourData, rtol=1e-14)
+        assert [255, 0, 10] == out.ROIDisplayColor
+
+        # Arrays read using config.use_DS_numpy are written unchanged
+        config.use_DS_numpy = True
+        try:
+            out = read_dataset(BytesIO(fp.getvalue()), False, True)
+            assert isinstance(out.ContourData, numpy.ndarray)
+            fp = DicomBytesIO()
+            dcmwrite(fp, out, implicit_vr=False, little_endian=True)
+            arr = read_dataset(BytesIO(fp.getvalue()), False, True).ContourData
+            assert (out.ContourData == arr).all()
+        finally:
+            config.use_DS_numpy = False
+
+
 class TestWriteUndefinedLengthPixelData:
     """Test write_data_element() for pixel data with undefined length."""
 
@@ -0,0 +1,170 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Tests for the pydicom3.functional_groups module."""
+
+from io import BytesIO
+
+import pytest
+
+try:
+    import numpy as np
+
+    HAVE_NP = True
+except ImportError:
+    HAVE_NP = False
+
+from pydicom3 import dcmread
+from pydicom3.data import get_testdata_file
+from pydicom3.dataset import Dataset, FileMetaDataset
+from pydicom3.functional_groups import extract_per_frame
+from pydicom3.uid import ExplicitVRLittleEndian, ImplicitVRLittleEndian, generate_uid
+
+
+LIVER = get_testdata_file("liver_1frame.dcm")
+LIVER_BIG = get_testdata_file("liver_expb_1frame.dcm")
+
+
+def _create_dataset(nr_frames, tsyntax=ExplicitVRLittleEndian):
+    """Return a dataset with `nr_frames` per-frame functional groups items."""
+    ds = Dataset()
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = tsyntax
+    ds.file_meta.MediaStorageSOPClassUID = "1.2.840.10008.5.1.4.1.1.4.1"
+    ds.file_meta.MediaStorageSOPInstanceUID = generate_uid()
+    ds.SpecificCharacterSet = "ISO_IR 100"
+    ds.NumberOfFrames = nr_frames
+
+    orientation = Dataset()
+    orientation.ImageOrientationPatient = [1, 0, 0, 0, 1, 0]
+    content = Dataset()
+    content.FrameAcquisitionNumber = 1
+    shared = Dataset()
+    shared.PlaneOrientationSequence = [orientation]
+    shared.FrameContentSequence = [content]
+    ds.SharedFunctionalGroupsSequence = [shared]
+
+    groups = []
+    for idx in range(nr_frames):
+        position = Dataset()
+        position.ImagePositionPatient = [0, 0.5, idx]
+        content = Dataset()
+        content.InStackPositionNumber = idx + 1
+        content.DimensionIndexValues = [1, idx + 1]
+        content.FrameComments = f"Frame {idx + 1} Gr\xfc\xdfe"
+        group = Dataset()
+        group.PlanePositionSequence = [position]
+        group.FrameContentSequence = [content]
+        groups.append(group)
+
+    ds.PerFrameFunctionalGroupsSequence = groups
+    ds.BitsAllocated = 8
+    ds.PixelData = b"\x00" * 8
+
+    return ds
+
+
+def _encode(ds):
+    """Return `ds` encoded in a buffer."""
+    buffer = BytesIO()
+    ds.save_as(buffer, enforce_file_format=True)
+    buffer.seek(0)
+    return buffer
+
+
+@pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+class TestExtractPerFrame:
+    """Tests for extract_per_frame()"""
+
+    @pytest.mark.parametrize("path", [LIVER, LIVER_BIG])
+    def test_file(self, path):
+        """Test extracting from files matches extracting from the dataset"""
+        keywords = [
+            "ImagePositionPatient",
+            "ImageOrientationPatient",
+            "DimensionIndexValues",
+            "SliceThickness",
+            "CodeMeaning",
+        ]
+        arrays = extract_per_frame(path, keywords)
+        ref = extract_per_frame(dcmread(path), keywords)
+        assert list(arrays) == keywords
+        for keyword in keywords:
+            assert ref[keyword].dtype == arrays[keyword].dtype
+            assert np.array_equal(ref[keyword], arrays[keyword])
+
+        arr = arrays["ImagePositionPatient"]
+        assert (3, 3) == arr.shape
+        assert np.float64 == arr.dtype
+        assert [-235.2, -226.8, -127.69] == arr[1].tolist()
+        assert (3, 6) == arrays["ImageOrientationPatient"].shape
+        assert [[1, 1], [1, 2], [1, 3]] == arrays["DimensionIndexValues"].tolist()
+        assert np.int64 == arrays["DimensionIndexValues"].dtype
+        assert (3,) == arrays["SliceThickness"].shape
+
+    @pytest.mark.parametrize(
+        "tsyntax", [ExplicitVRLittleEndian, ImplicitVRLittleEndian]
+    )
+    def test_shared(self, tsyntax):
+        """Test shared values are used if not present per-frame"""
+        ds = _create_dataset(4, tsyntax)
+        ds.PerFrameFunctionalGroupsSequence[2].FrameContentSequence[
+            0
+        ].FrameAcquisitionNumber = 5
+        keywords = [
+            "ImageOrientationPatient",
+            "FrameAcquisitionNumber",
+            "InStackPositionNumber",
+            "FrameComments",
+        ]
+        for src in (ds, _encode(ds)):
+            arrays = extract_per_frame(src, keywords)
+            assert (4, 6) == arrays["ImageOrientationPatient"].shape
+            assert [1, 0, 0, 0, 1, 0] == arrays["ImageOrientationPatient"][3].tolist()
+            assert [1, 1, 5, 1] == arrays["FrameAcquisitionNumber"].tolist()
+            assert [1, 2, 3, 4] == arrays["InStackPositionNumber"].tolist()
+            assert "Frame 2 Gr\xfc\xdfe" == arrays["FrameComments"][1]
+
+    def test_no_per_frame(self):
+        """Test a dataset with only shared functional groups"""
+        ds = _create_dataset(3)
+        del ds.PerFrameFunctionalGroupsSequence
+        for src in (ds, _encode(ds)):
+            arr = extract_per_frame(src, ["ImageOrientationPatient"])[
+                "ImageOrientationPatient"
+            ]
+            assert (3, 6) == arr.shape
+
+    def test_missing_raises(self):
+        """Test an exception is raised if a frame has no value"""
+        ds = _create_dataset(3)
+        del ds.PerFrameFunctionalGroupsSequence[1].PlanePositionSequence
+        msg = (
+            "No value for 'ImagePositionPatient' found for frame 2 in the "
+            "per-frame or shared functional groups"
+        )
+        for src in (ds, _encode(ds)):
+            with pytest.raises(ValueError, match=msg):
+                extract_per_frame(src, ["ImagePositionPatient"])
+
+    def test_inconsistent_raises(self):
+        """Test an exception is raised if the number of values differs"""
+        ds = _create_dataset(3)
+        ds.PerFrameFunctionalGroupsSequence[1].FrameContentSequence[
+            0
+        ].DimensionIndexValues = [1, 2, 3]
+        msg = "The number of values for 'DimensionIndexValues' differs between frames"
+        for src in (ds, _encode(ds)):
+            with pytest.raises(ValueError, match=msg):
+                extract_per_frame(src, ["DimensionIndexValues"])
+
+    def test_unknown_keyword_raises(self):
+        """Test an exception is raised for an unknown keyword"""
+        with pytest.raises(ValueError, match="Unknown DICOM element keyword 'Foo'"):
+            extract_per_frame(LIVER, ["Foo"])
+
+    def test_stops_early(self):
+        """Test the file isn't read past the functional groups"""
+        buffer = _encode(_create_dataset(3))
+        arrays = extract_per_frame(buffer, ["InStackPositionNumber"])
+        assert [1, 2, 3] == arrays["InStackPositionNumber"].tolist()
+        # Stopped at the start of the Pixel Data element
+        assert buffer.getvalue().rindex(b"\xe0\x7f\x10\x00") == buffer.tell()
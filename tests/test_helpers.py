@@ -1,6 +1,8 @@
 # Copyright 2008-2018 pydicom3 authors. See LICENSE file for details.
 """Helper functions for tests."""
 
+from io import BytesIO
+import threading
 import warnings
 from contextlib import contextmanager
 from collections.abc import Generator
@@ -14,3 +16,23 @@ def assert_no_warning() -> Generator:
     with warnings.catch_warnings():
         warnings.simplefilter("error")
         yield
+
+
+class AsyncBytesIO:
+    """An async file-like over a bytes object that records the threads its
+    methods are called from.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        self._buffer = BytesIO(data)
+        self.threads: set[int] = set()
+
+    async def read(self, size: int = -1, /) -> bytes:
+        self.threads.add(threading.get_ident())
+        return self._buffer.read(size)
+
+    async def seek(self, offset: int, whence: int = 0, /) -> int:
+        return self._buffer.seek(offset, whence)
+
+    async def tell(self) -> int:
+        return self._buffer.tell()
@@ -0,0 +1,252 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Tests for the pydicom3.leanread module."""
+
+from io import BytesIO
+
+import pytest
+
+from pydicom3 import dcmread
+from pydicom3.data import get_testdata_file
+from pydicom3.dataelem import RawDataElement
+from pydicom3.dataset import Dataset, FileMetaDataset
+from pydicom3.errors import InvalidDicomError
+from pydicom3.leanread import LeanElement, iter_elements
+from pydicom3.uid import ExplicitVRLittleEndian, generate_uid
+
+
+CT_SMALL = get_testdata_file("CT_small.dcm")
+DEFLATED = get_testdata_file("image_dfl.dcm")
+MR_BIG = get_testdata_file("MR_small_bigendian.dcm")
+NO_META = get_testdata_file("no_meta.dcm")
+PRIV_SQ = get_testdata_file("priv_SQ.dcm")
+RTDOSE_RLE = get_testdata_file("rtdose_rle.dcm")
+RTPLAN = get_testdata_file("rtplan.dcm")
+
+ITEM = 0xFFFEE000
+
+
+def _undefined_length_sequences():
+    """Return an encoded dataset with undefined length sequences and items."""
+    ds = Dataset()
+    ds.PatientName = "Citizen^Jan"
+    item = Dataset()
+    item.CodeValue = "121"
+    item.ConceptCodeSequence = [Dataset(), Dataset()]
+    item.ConceptCodeSequence[1].CodeMeaning = "Nested"
+    ds.ConceptNameCodeSequence = [Dataset(), item]
+    ds.PatientID = "12345"
+    ds["ConceptNameCodeSequence"].is_undefined_length = True
+    for item in ds.ConceptNameCodeSequence:
+        item.is_undefined_length_sequence_item = True
+
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds.file_meta.MediaStorageSOPClassUID = "1.2.840.10008.5.1.4.1.1.88.11"
+    ds.file_meta.MediaStorageSOPInstanceUID = generate_uid()
+    buffer = BytesIO()
+    ds.save_as(buffer, enforce_file_format=True)
+    buffer.seek(0)
+    return buffer
+
+
+class TestIterElements:
+    """Tests for iter_elements()"""
+
+    @pytest.mark.parametrize("path", [CT_SMALL, MR_BIG, RTPLAN])
+    def test_top_level(self, path):
+        """Test the top-level elements match dcmread()"""
+        ds = dcmread(path, defer_size=0)
+        ref = dcmread(path)
+        elems = list(iter_elements(path))
+        assert all(isinstance(elem, LeanElement) for elem in elems)
+        assert all(len(elem.path) == 1 for elem in elems)
+        assert [t for t in ds.file_meta.keys()] + list(ds.keys()) == [
+            elem.path[0] for elem in elems
+        ]
+        for elem in elems:
+            if elem.path[0] >> 16 == 0x0002:
+                assert ds.file_meta[elem.path[0]].VR == elem.VR
+                continue
+
+            raw = ds.get_item(elem.path[0])
+            if isinstance(raw, RawDataElement):
+                assert raw.length == elem.length
+                assert raw.value_tell == elem.offset
+                assert ref.get_item(elem.path[0]).value == elem.value
+            else:
+                assert raw.file_tell == elem.offset
+
+    def test_descend(self):
+        """Test descending into sequences."""
+        ds = dcmread(RTPLAN)
+        elems = {elem.path: elem for elem in iter_elements(RTPLAN, descend=True)}
+        beam_seq = elems[(0x300A00B0,)]
+        assert "SQ" == beam_seq.VR
+        assert beam_seq.value is None
+
+        item = elems[(0x300A00B0, 0, ITEM)]
+        assert item.VR is None
+        assert beam_seq.offset + 8 == item.offset
+        assert beam_seq.length == item.length + 8
+        assert b"Field 1 " == elems[(0x300A00B0, 0, 0x300A00C2)].value
+
+        cp_path = (0x300A00B0, 0, 0x300A0111, 0, 0x300A011E)
+        assert ds.BeamSequence[0].ControlPointSequence[0].GantryAngle == float(
+            elems[cp_path].value
+        )
+
+        for elem in ds:
+            if elem.VR == "SQ":
+                items = [p for p in elems if p[0] == elem.tag and p[2:] == (ITEM,)]
+                assert len(elem.value) == len(items)
+
+    def test_undefined_length(self):
+        """Test descending into undefined length sequences and items."""
+        buffer = _undefined_length_sequences()
+        elems = list(iter_elements(buffer, descend=True))
+        paths = [elem.path for elem in elems if elem.path[0] >> 16 != 0x0002]
+        assert [
+            (0x00100010,),
+            (0x00100020,),
+            (0x0040A043,),
+            (0x0040A043, 0, ITEM),
+            (0x0040A043, 1, ITEM),
+            (0x0040A043, 1, 0x00080100),
+            (0x0040A043, 1, 0x0040A168),
+            (0x0040A043, 1, 0x0040A168, 0, ITEM),
+            (0x0040A043, 1, 0x0040A168, 1, ITEM),
+            (0x0040A043, 1, 0x0040A168, 1, 0x00080104),
+        ] == paths
+        by_path = {elem.path: elem for elem in elems}
+        assert 0xFFFFFFFF == by_path[(0x0040A043,)].length
+        assert 0xFFFFFFFF == by_path[(0x0040A043, 1, ITEM)].length
+        assert b"Nested" == by_path[(0x0040A043, 1, 0x0040A168, 1, 0x00080104)].value
+        assert b"12345 " == by_path[(0x00100020,)].value
+
+        # Not descending skips the sequence
+        buffer.seek(0)
+        paths = [
+            elem.path for elem in iter_elements(buffer) if elem.path[0] >> 16 != 0x0002
+        ]
+        assert [(0x00100010,), (0x00100020,), (0x0040A043,)] == paths
+
+    def test_include(self):
+        """Test only yielding the included elements."""
+        elems = list(
+            iter_elements(
+                RTPLAN, include=lambda path: path[-1] == 0x300A00C2, descend=True
+            )
+        )
+        assert [(0x300A00B0, 0, 0x300A00C2)] == [elem.path for elem in elems]
+
+        elems = list(iter_elements(CT_SMALL, include=lambda path: path[0] < 0x00080000))
+        assert all(elem.path[0] >> 16 == 0x0002 for elem in elems)
+
+    def test_exclude(self):
+        """Test excluded sequences aren't descended into."""
+        seen = []
+
+        def exclude(path):
+            seen.append(path)
+            return path[0] == 0x300A00B0
+
+        paths = [
+            elem.path for elem in iter_elements(RTPLAN, exclude=exclude, descend=True)
+        ]
+        assert (0x300A00B0,) in seen
+        assert not any(p[0] == 0x300A00B0 for p in paths)
+        assert not any(p[0] == 0x300A00B0 and len(p) > 1 for p in seen)
+        assert (0x300A0010, 0, ITEM) in paths
+
+        # Excluding items
+        paths = [
+            elem.path
+            for elem in iter_elements(
+                RTPLAN, exclude=lambda path: path[-1] == ITEM, descend=True
+            )
+        ]
+        assert (0x300A00B0,) in paths
+        assert all(len(p) == 1 for p in paths)
+
+    def test_stop_when(self):
+        """Test stopping the iteration."""
+        cp_path = (0x300A00B0, 0, 0x300A0111)
+        offsets = {
+            elem.path: elem.offset for elem in iter_elements(RTPLAN, descend=True)
+        }
+        with open(RTPLAN, "rb") as f:
+            paths = [
+                elem.path
+                for elem in iter_elements(
+                    f, descend=True, stop_when=lambda path: path == cp_path
+                )
+            ]
+            # Positioned at the start of the implicit VR element
+            assert offsets[cp_path] - 8 == f.tell()
+
+        assert cp_path not in paths
+        assert (0x300A00B0, 0, 0x300A00C2) in paths
+        assert not any(p[0] > 0x300A00B0 for p in paths)
+
+        paths = [
+            elem.path
+            for elem in iter_elements(RTPLAN, stop_when=lambda path: path[0] >> 16 > 8)
+        ]
+        assert paths
+        assert all(p[0] >> 16 <= 8 for p in paths)
+
+    def test_defer_size(self):
+        """Test large values aren't read."""
+        elems = {elem.path: elem for elem in iter_elements(CT_SMALL, defer_size=20)}
+        assert elems[(0x7FE00010,)].value is None
+        assert 32768 == elems[(0x7FE00010,)].length
+        assert elems[(0x00100010,)].value is None
+        assert b"1.2.840.10008.1.2.1\x00" == elems[(0x00020010,)].value
+        assert b"CT" == elems[(0x00080060,)].value
+
+    def test_big_endian(self):
+        """Test reading big endian datasets."""
+        ref = dcmread(MR_BIG)
+        elems = {elem.path: elem for elem in iter_elements(MR_BIG)}
+        assert ref.get_item("PixelData").value == elems[(0x7FE00010,)].value
+        assert b"\x00\x40" == elems[(0x00280010,)].value
+
+    def test_implicit_items(self):
+        """Test implicit VR items in explicit VR datasets."""
+        elems = {elem.path: elem for elem in iter_elements(RTDOSE_RLE, descend=True)}
+        assert "SQ" == elems[(0x300C0002,)].VR
+        assert (
+            b"1.2.840.10008.5.1.4.1.1.481.5\x00"
+            == elems[(0x300C0002, 0, 0x00081150)].value
+        )
+
+    def test_private_sequence(self):
+        """Test detecting private implicit VR sequences."""
+        elems = {
+            elem.path: elem for elem in iter_elements(PRIV_SQ, descend=True, force=True)
+        }
+        assert "SQ" == elems[(0x3F031001,)].VR
+        assert (0x3F031001, 0, ITEM) in elems
+
+    def test_deflated(self):
+        """Test reading deflated datasets."""
+        ref = dcmread(DEFLATED)
+        elems = {elem.path: elem for elem in iter_elements(DEFLATED)}
+        assert ref.PixelData == elems[(0x7FE00010,)].value
+
+    def test_no_preamble(self):
+        """Test reading without a preamble or file meta."""
+        with pytest.raises(InvalidDicomError, match="File is missing DICOM File"):
+            next(iter_elements(NO_META))
+
+        ref = dcmread(NO_META, force=True)
+        elems = list(iter_elements(NO_META, force=True))
+        assert list(ref.keys()) == [elem.path[0] for elem in elems]
+        assert ref.get_item(0x08200500).value == elems[0].value
+
+    def test_file_like(self):
+        """Test reading from a file-like."""
+        with open(CT_SMALL, "rb") as f:
+            ref = list(iter_elements(f))
+
+        assert ref == list(iter_elements(CT_SMALL))
@@ -1,6 +1,8 @@
 # Copyright 2008-2018 pydicom3 authors. See LICENSE file for details.
 """Unit tests for the pydicom3.multival module."""
 
+import pickle
+
 import pytest
 
 from pydicom3 import config
@@ -87,6 +89,17 @@ class TestMultiValue:
         multival = MultiValue(DSfloat, range(7))
         deepcopy(multival)
 
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, protocol):
+        """Test pickling a MultiValue, which uses slots."""
+        multival = MultiValue(DSfloat, ["1.5", "2"])
+        assert not hasattr(multival, "__dict__")
+        unpickled = pickle.loads(pickle.dumps(multival, protocol=protocol))
+        assert multival == unpickled
+        assert DSfloat is unpickled._constructor
+        unpickled.append("3")
+        assert isinstance(unpickled[2], DSfloat)
+
     def testSorting(self):
         """MultiValue: allow inline sort."""
         multival = MultiValue(DS, [12, 33, 5, 7, 1])
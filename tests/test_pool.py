@@ -0,0 +1,157 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Tests for the pydicom3.pool module."""
+
+import copy
+import pickle
+import sys
+
+import pytest
+
+from pydicom3 import config, dcmread
+from pydicom3.data import get_testdata_file
+from pydicom3.dataelem import RawDataElement
+from pydicom3.pool import ElementPool
+
+
+CT_SMALL = get_testdata_file("CT_small.dcm")
+MR_SMALL = get_testdata_file("MR_small.dcm")
+RTPLAN = get_testdata_file("rtplan.dcm")
+
+
+@pytest.fixture
+def lazy_sequences():
+    original = config.settings.lazy_sequences
+    config.settings.lazy_sequences = True
+    yield
+    config.settings.lazy_sequences = original
+
+
+class TestElementPool:
+    """Tests for ElementPool"""
+
+    def test_encoded_values(self):
+        """Test the encoded values of raw elements are shared."""
+        pool = ElementPool()
+        ds = dcmread(CT_SMALL, pool=pool)
+        other = dcmread(CT_SMALL, pool=pool)
+        assert ds._pool is pool
+        assert len(pool) > 0
+        assert pool.hits > 0
+        assert pool.bytes_saved > 0
+
+        raw = ds.get_item("StudyInstanceUID")
+        other_raw = other.get_item("StudyInstanceUID")
+        assert isinstance(raw, RawDataElement)
+        assert raw.value is other_raw.value
+        assert raw.value_tell == other_raw.value_tell
+
+        # Large values aren't shared
+        assert ds.get_item("PixelData").value is not other.get_item("PixelData").value
+        assert ds == other
+
+    def test_converted_values(self):
+        """Test the converted values are shared."""
+        pool = ElementPool()
+        ds = dcmread(CT_SMALL, pool=pool)
+        other = dcmread(CT_SMALL, pool=pool)
+        hits = pool.hits
+        assert ds.StudyInstanceUID is other.StudyInstanceUID
+        assert ds.PatientName is other.PatientName
+        assert ds["PatientName"] is not other["PatientName"]
+        assert pool.hits == hits + 2
+
+        # Strings are interned
+        assert ds.Modality is other.Modality
+        assert ds.Modality is sys.intern("CT")
+
+        # Different values aren't
+        mr = dcmread(MR_SMALL, pool=pool)
+        assert mr.PatientName != ds.PatientName
+
+    def test_multi_value(self):
+        """Test modifying a multi-valued element doesn't affect others."""
+        pool = ElementPool()
+        ds = dcmread(CT_SMALL, pool=pool)
+        other = dcmread(CT_SMALL, pool=pool)
+        assert ds.ImageType == other.ImageType
+        assert ds.ImageType is not other.ImageType
+        assert ds.ImageType[0] is other.ImageType[0]
+
+        ds.ImageType[0] = "DERIVED"
+        ds.ImagePositionPatient.append(1)
+        assert "ORIGINAL" == other.ImageType[0]
+        assert 3 == len(other.ImagePositionPatient)
+        assert "ORIGINAL" == dcmread(CT_SMALL, pool=pool).ImageType[0]
+
+    def test_sequences(self):
+        """Test sharing the values in sequence items."""
+        pool = ElementPool()
+        ds = dcmread(RTPLAN, pool=pool)
+        other = dcmread(RTPLAN, pool=pool)
+        beam = ds.BeamSequence[0]
+        other_beam = other.BeamSequence[0]
+        assert beam._pool is pool
+        assert beam.BeamName is other_beam.BeamName
+
+        beam.BeamName = "Modified"
+        assert "Field 1" == other_beam.BeamName
+        assert "Field 1" == dcmread(RTPLAN, pool=pool).BeamSequence[0].BeamName
+
+    def test_lazy_sequences(self, lazy_sequences):
+        """Test sharing the values in lazily parsed sequence items."""
+        pool = ElementPool()
+        ds = dcmread(RTPLAN, pool=pool)
+        other = dcmread(RTPLAN, pool=pool)
+        cp = ds.BeamSequence[0].ControlPointSequence[0]
+        other_cp = other.BeamSequence[0].ControlPointSequence[0]
+        assert cp._pool is pool
+        assert cp.GantryAngle is other_cp.GantryAngle
+
+    def test_ambiguous(self):
+        """Test elements with ambiguous VRs are corrected per dataset."""
+        pool = ElementPool()
+        ds = dcmread(get_testdata_file("MR_small_implicit.dcm"), pool=pool)
+        other = dcmread(get_testdata_file("MR_small_implicit.dcm"), pool=pool)
+        assert "SS" == ds["SmallestImagePixelValue"].VR
+        assert "SS" == other["SmallestImagePixelValue"].VR
+        assert ds.SmallestImagePixelValue == other.SmallestImagePixelValue
+
+    def test_callback(self):
+        """Test values aren't shared when a callback is used."""
+
+        def callback(raw_elem, **kwargs):
+            return raw_elem
+
+        pool = ElementPool()
+        ds = dcmread(CT_SMALL, pool=pool)
+        other = dcmread(CT_SMALL, pool=pool)
+        config.data_element_callback = callback
+        try:
+            assert ds.PatientName is not other.PatientName
+        finally:
+            config.data_element_callback = None
+
+    def test_copy_pickle(self):
+        """Test the pool is shared by copies and its values not pickled."""
+        pool = ElementPool(max_length=64)
+        ds = dcmread(CT_SMALL, pool=pool)
+        other = dcmread(CT_SMALL, pool=pool)
+        assert copy.deepcopy(ds)._pool is pool
+        assert copy.copy(ds)._pool is pool
+
+        ds, other = pickle.loads(pickle.dumps([ds, other]))
+        assert ds._pool is other._pool
+        assert 0 == len(ds._pool)
+        assert 64 == ds._pool.max_length
+        assert ds == other
+
+    def test_clear(self):
+        """Test clearing the pool."""
+        pool = ElementPool()
+        ds = dcmread(CT_SMALL, pool=pool)
+        name = ds.PatientName
+        pool.clear()
+        assert 0 == len(pool)
+        other = dcmread(CT_SMALL, pool=pool)
+        assert other.PatientName is not name
+        assert other.PatientName == name
@@ -2,11 +2,16 @@
 """Unit tests for the pydicom3.sequence module."""
 
 import copy
+from io import BytesIO
+import pickle
 
 import pytest
 
-from pydicom3.dataset import Dataset
-from pydicom3.sequence import Sequence
+from pydicom3 import dcmread
+from pydicom3.data import get_testdata_file
+from pydicom3.dataset import Dataset, FileMetaDataset
+from pydicom3.sequence import Sequence, LazySequence
+from pydicom3.uid import ExplicitVRLittleEndian, ImplicitVRLittleEndian
 
 
 class TestSequence:
@@ -180,3 +185,207 @@ class TestSequence:
 
         seq2 = copy.deepcopy(my_sequence_subclass)
         assert seq2.__class__ is MySequenceSubclass
+
+
+def _encoded_dataset(undefined_length):
+    """Return an encoded dataset with a sequence of 5 items"""
+    ds = Dataset()
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds.file_meta.MediaStorageSOPClassUID = "1.2.3"
+    ds.file_meta.MediaStorageSOPInstanceUID = "1.2.3.4"
+    ds.PatientName = "Citizen^Jan"
+    ds.BeamSequence = [Dataset() for _ in range(5)]
+    for idx, item in enumerate(ds.BeamSequence):
+        item.BeamNumber = idx
+        item.BeamName = f"Beam {idx}"
+        item.ControlPointSequence = [Dataset()]
+        item.ControlPointSequence[0].ControlPointIndex = idx
+        item.is_undefined_length_sequence_item = undefined_length
+
+    ds["BeamSequence"].is_undefined_length = undefined_length
+    fp = BytesIO()
+    ds.save_as(fp, enforce_file_format=True)
+
+    return fp.getvalue()
+
+
+@pytest.mark.usefixtures("lazy_sequences")
+class TestLazySequence:
+    """Tests for LazySequence"""
+
+    @pytest.mark.parametrize("undefined_length", [False, True])
+    def test_read(self, undefined_length):
+        """Test items are only parsed when accessed"""
+        data = _encoded_dataset(undefined_length)
+        ds = dcmread(BytesIO(data))
+        seq = ds.BeamSequence
+        assert isinstance(seq, LazySequence)
+        assert seq.is_undefined_length == undefined_length
+        assert len(seq) == 5
+        assert not seq.is_parsed
+
+        assert seq[2].BeamName == "Beam 2"
+        assert seq[2].is_undefined_length_sequence_item == undefined_length
+        assert isinstance(seq[2].ControlPointSequence, LazySequence)
+        assert seq[2].ControlPointSequence[0].ControlPointIndex == 2
+        assert seq[-1].BeamNumber == 4
+        assert seq.encoded_item(2) is None
+        assert seq.encoded_item(0) is not None
+        assert not seq.is_parsed
+
+        assert [item.BeamNumber for item in seq] == [0, 1, 2, 3, 4]
+        assert seq.is_parsed
+        assert [item.BeamNumber for item in seq[1:3]] == [1, 2]
+
+    @pytest.mark.parametrize("undefined_length", [False, True])
+    def test_matches_eager(self, undefined_length):
+        """Test the items are the same as when read eagerly"""
+        data = _encoded_dataset(undefined_length)
+        ds = dcmread(BytesIO(data))
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("pydicom3.config.settings._lazy_sequences", False)
+            ref = dcmread(BytesIO(data))
+            assert not isinstance(ref.BeamSequence, LazySequence)
+            assert ref.BeamSequence == ds.BeamSequence
+
+        for item, ref_item in zip(ds.BeamSequence, ref.BeamSequence):
+            assert item.file_tell == ref_item.file_tell
+            assert item.seq_item_tell == ref_item.seq_item_tell
+
+    @pytest.mark.parametrize("undefined_length", [False, True])
+    def test_write_unparsed(self, undefined_length):
+        """Test writing unparsed and modified items"""
+        data = _encoded_dataset(undefined_length)
+        ds = dcmread(BytesIO(data))
+        fp = BytesIO()
+        ds.save_as(fp)
+        assert fp.getvalue() == data
+        assert not ds.BeamSequence.is_parsed
+
+        ds.BeamSequence[1].BeamName = "Modified"
+        fp = BytesIO()
+        ds.save_as(fp)
+        assert ds.BeamSequence.encoded_item(0) is not None
+        ds = dcmread(BytesIO(fp.getvalue()))
+        assert [item.BeamName for item in ds.BeamSequence] == [
+            "Beam 0",
+            "Modified",
+            "Beam 2",
+            "Beam 3",
+            "Beam 4",
+        ]
+
+    def test_write_different_encoding(self):
+        """Test changing the encoding parses the items"""
+        ds = dcmread(BytesIO(_encoded_dataset(False)))
+        ds.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+        fp = BytesIO()
+        ds.save_as(fp)
+        ds = dcmread(BytesIO(fp.getvalue()))
+        assert ds.BeamSequence[3].BeamName == "Beam 3"
+        assert ds.BeamSequence.original_encoding == (True, True)
+
+    def test_undefined_length_items_not_parsed(self, monkeypatch):
+        """Test undefined length items are found without parsing them"""
+        data = _encoded_dataset(True)
+
+        def read_dataset(*args, **kwargs):
+            raise AssertionError("read_dataset() called")
+
+        with monkeypatch.context() as mp:
+            ds = dcmread(BytesIO(data), stop_before_pixels=True)
+            mp.setattr("pydicom3.filereader.read_dataset", read_dataset)
+            assert len(ds.BeamSequence) == 5
+            assert not ds.BeamSequence.is_parsed
+
+        assert ds.BeamSequence[4].BeamName == "Beam 4"
+
+    def test_nested_views(self):
+        """Test nested sequences use views of the enclosing sequence"""
+        ds = dcmread(BytesIO(_encoded_dataset(False)))
+        seq = ds.BeamSequence
+        nested = seq[1].ControlPointSequence
+        assert isinstance(nested, LazySequence)
+        assert isinstance(nested._buffer, memoryview)
+        assert nested[0].ControlPointIndex == 1
+
+        # Undefined length sequences in an item are read directly from the
+        #   enclosing sequence's buffer
+        ds = dcmread(BytesIO(_encoded_dataset(False)))
+        ds.BeamSequence[1]["ControlPointSequence"].is_undefined_length = True
+        fp = BytesIO()
+        ds.save_as(fp)
+        ds = dcmread(BytesIO(fp.getvalue()))
+        seq = ds.BeamSequence
+        nested = seq[1].ControlPointSequence
+        assert nested.is_undefined_length
+        assert nested._buffer.obj is seq._buffer.obj
+        assert nested[0].ControlPointIndex == 1
+
+        # Views are converted to bytes when pickling or copying
+        ds = pickle.loads(pickle.dumps(ds))
+        assert isinstance(ds.BeamSequence[1].ControlPointSequence._buffer, bytes)
+        assert ds.BeamSequence[1].ControlPointSequence[0].ControlPointIndex == 1
+        ds_copy = copy.deepcopy(seq[2])
+        assert ds_copy.ControlPointSequence[0].ControlPointIndex == 2
+
+    def test_mmap(self, tmp_path):
+        """Test lazy sequences read using mmap use views of the file and
+        aren't parsed when the file is closed
+        """
+        ds = dcmread(BytesIO(_encoded_dataset(False)))
+        ds.BeamSequence = [Dataset() for _ in range(100)]
+        for idx, item in enumerate(ds.BeamSequence):
+            item.BeamName = f"Beam {idx}"
+            item.ControlPointSequence = [Dataset() for _ in range(50)]
+
+        path = tmp_path / "seq.dcm"
+        ds.save_as(path)
+
+        with dcmread(path, mmap=True) as ds:
+            seq = ds.BeamSequence
+            assert isinstance(seq._buffer, memoryview)
+            assert not isinstance(seq._buffer.obj, bytes)
+            nested = seq[1].ControlPointSequence
+            assert isinstance(nested, LazySequence)
+            assert not nested.is_parsed
+
+        assert not seq.is_parsed
+        assert not nested.is_parsed
+        # The views have been released
+        with pytest.raises(ValueError, match="released memoryview"):
+            seq._buffer.tobytes()
+
+        with pytest.raises(ValueError, match="released memoryview"):
+            nested._buffer.tobytes()
+
+    def test_list_methods(self):
+        """Test modifying a lazy sequence"""
+        ds = dcmread(BytesIO(_encoded_dataset(False)))
+        seq = ds.BeamSequence
+        del seq[0]
+        new = Dataset()
+        new.BeamNumber = 10
+        seq.insert(1, new)
+        seq.append(copy.deepcopy(new))
+        assert [item.BeamNumber for item in seq] == [1, 10, 2, 3, 4, 10]
+        assert seq.pop().BeamNumber == 10
+        assert len(seq) == 5
+
+    def test_copy(self):
+        """Test copying a lazy sequence"""
+        ds = dcmread(BytesIO(_encoded_dataset(False)))
+        ds_copy = copy.deepcopy(ds)
+        assert isinstance(ds_copy.BeamSequence, LazySequence)
+        assert not ds_copy.BeamSequence.is_parsed
+        assert ds_copy == ds
+
+    def test_file(self):
+        """Test reading a file with nested sequences"""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        assert isinstance(ds.BeamSequence, LazySequence)
+        fp = BytesIO()
+        ds.save_as(fp)
+        with open(get_testdata_file("rtplan.dcm"), "rb") as f:
+            assert fp.getvalue() == f.read()
@@ -0,0 +1,230 @@
+# Copyright 2008-2024 pydicom3 authors. See LICENSE file for details.
+"""Tests for the pydicom3.table module."""
+
+from io import BytesIO
+import math
+
+import pytest
+
+try:
+    import numpy as np
+
+    HAVE_NP = True
+except ImportError:
+    HAVE_NP = False
+
+from pydicom3 import dcmread
+from pydicom3.data import get_testdata_file
+from pydicom3.dataset import Dataset, FileMetaDataset
+from pydicom3.table import DatasetTable, tabulate
+from pydicom3.uid import ExplicitVRLittleEndian, generate_uid
+
+
+CT_SMALL = get_testdata_file("CT_small.dcm")
+MR_SMALL = get_testdata_file("MR_small.dcm")
+RTPLAN = get_testdata_file("rtplan.dcm")
+LIVER = get_testdata_file("liver_1frame.dcm")
+
+
+def _encode(ds):
+    """Return `ds` encoded in a buffer."""
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds.file_meta.MediaStorageSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+    ds.file_meta.MediaStorageSOPInstanceUID = generate_uid()
+    buffer = BytesIO()
+    ds.save_as(buffer, enforce_file_format=True)
+    buffer.seek(0)
+    return buffer
+
+
+@pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+class TestTabulate:
+    """Tests for tabulate()"""
+
+    def test_columns(self):
+        """Test the column dtypes, shapes and masks"""
+        table = tabulate(
+            [CT_SMALL, MR_SMALL, RTPLAN],
+            [
+                "Modality",
+                "SliceThickness",
+                "ImagePositionPatient",
+                "ImageType",
+                "Rows",
+                "PatientName",
+                "TransferSyntaxUID",
+            ],
+        )
+        assert isinstance(table, DatasetTable)
+        assert 3 == len(table)
+        assert [
+            "Modality",
+            "SliceThickness",
+            "ImagePositionPatient",
+            "ImageType",
+            "Rows",
+            "PatientName",
+            "TransferSyntaxUID",
+        ] == table.columns
+        assert "Rows" in table
+        assert "Columns" not in table
+
+        assert object == table["Modality"].dtype
+        assert ["CT", "MR", "RTPLAN"] == table["Modality"].tolist()
+
+        arr = table["SliceThickness"]
+        assert np.float64 == arr.dtype
+        assert [5.0, 0.8] == arr[:2].tolist()
+        assert math.isnan(arr[2])
+        assert [False, False, True] == table.mask("SliceThickness").tolist()
+
+        arr = table["ImagePositionPatient"]
+        assert (3, 3) == arr.shape
+        assert [-83.9063, -91.2, 6.6406] == arr[1].tolist()
+        assert np.isnan(arr[2]).all()
+
+        assert ("ORIGINAL", "PRIMARY", "AXIAL") == table["ImageType"][0]
+        assert table["ImageType"][2] is None
+        assert [False, False, True] == table.mask("ImageType").tolist()
+
+        assert np.int64 == table["Rows"].dtype
+        assert [128, 64, 0] == table["Rows"].tolist()
+        assert "CompressedSamples^CT1" == table["PatientName"][0]
+        assert isinstance(table["PatientName"][0], str)
+        assert "1.2.840.10008.1.2" == table["TransferSyntaxUID"][2]
+
+    def test_paths(self):
+        """Test columns for elements in sequences"""
+        columns = [
+            "BeamSequence[0].ControlPointSequence[0].GantryAngle",
+            "BeamSequence.ControlPointSequence[1].CumulativeMetersetWeight",
+            "BeamSequence[1].BeamName",
+            "SharedFunctionalGroupsSequence.PixelMeasuresSequence.SliceThickness",
+            "300A00B0.300A00C2",
+        ]
+        table = tabulate([RTPLAN, LIVER], columns)
+        assert columns == table.columns
+        ref = dcmread(RTPLAN)
+        beam = ref.BeamSequence[0]
+        assert 0.0 == table[columns[0]][0]
+        assert 1.0 == table[columns[1]][0]
+        assert [True, True] == table.mask(columns[2]).tolist()
+        assert [True, False] == table.mask(columns[3]).tolist()
+        assert 1.0 == table[columns[3]][1]
+        assert [beam.BeamName, None] == table[columns[4]].tolist()
+
+    def test_tags(self):
+        """Test columns using tags"""
+        ds = Dataset()
+        ds.PatientID = "12345"
+        ds.add_new(0x00091001, "LO", "Private")
+        table = tabulate([ds, Dataset()], [0x00100020, 0x00091001])
+        assert ["PatientID", "00091001"] == table.columns
+        assert ["12345", None] == table["PatientID"].tolist()
+        assert [("Private",), None] == table["00091001"].tolist()
+
+    def test_datasets(self):
+        """Test tabulating datasets and file-likes"""
+        ds = Dataset()
+        ds.ImagePositionPatient = [1, 2]
+        ds.InstanceNumber = "4"
+        ds.WindowCenter = [40, 400]
+        ds.SeriesInstanceUID = "1.2.3"
+        ds_empty = Dataset()
+        ds_empty.InstanceNumber = None
+        ds_empty.SeriesInstanceUID = "1.2.4"
+
+        for sources in ([ds, ds_empty], [_encode(ds), _encode(ds_empty)]):
+            table = tabulate(
+                sources,
+                ["ImagePositionPatient", "InstanceNumber", "WindowCenter"],
+            )
+            # The wrong number of values
+            assert np.isnan(table["ImagePositionPatient"]).all()
+            assert [True, True] == table.mask("ImagePositionPatient").tolist()
+            assert np.int64 == table["InstanceNumber"].dtype
+            assert [4, 0] == table["InstanceNumber"].tolist()
+            assert [False, True] == table.mask("InstanceNumber").tolist()
+            # Variable VM
+            assert object == table["WindowCenter"].dtype
+            assert (40, 400) == table["WindowCenter"][0]
+
+    def test_specific_tags(self, monkeypatch):
+        """Test only the needed elements are read"""
+        import pydicom3.table
+
+        kwargs = []
+
+        def read(*args, **kw):
+            kwargs.append(kw)
+            return dcmread(*args, **kw)
+
+        monkeypatch.setattr(pydicom3.table, "dcmread", read)
+        tabulate(
+            [CT_SMALL],
+            ["PatientID", "SourceImageSequence[0].ReferencedSOPInstanceUID"],
+            force=True,
+        )
+        assert [0x00080005, 0x00082112, 0x00100020] == kwargs[0]["specific_tags"]
+        assert kwargs[0]["force"]
+
+    def test_filter(self):
+        """Test filtering the rows"""
+        table = tabulate(
+            [CT_SMALL, MR_SMALL, RTPLAN], ["Modality", "SliceThickness", "Rows"]
+        )
+        subset = table[(table["Modality"] == "MR") & (table["SliceThickness"] < 1)]
+        assert 1 == len(subset)
+        assert [64] == subset["Rows"].tolist()
+        assert [False] == subset.mask("Rows").tolist()
+
+        subset = table[1:]
+        assert ["MR", "RTPLAN"] == subset["Modality"].tolist()
+        assert "<DatasetTable: 2 rows, columns" in repr(subset)
+
+    def test_masked(self):
+        """Test returning masked arrays"""
+        table = tabulate([CT_SMALL, RTPLAN], ["SliceThickness", "ImagePositionPatient"])
+        arr = table.masked("SliceThickness")
+        assert isinstance(arr, np.ma.MaskedArray)
+        assert [5.0] == arr.compressed().tolist()
+        arr = table.masked("ImagePositionPatient")
+        assert (2, 3) == arr.shape
+        assert [[False] * 3, [True] * 3] == arr.mask.tolist()
+
+    def test_to_structured(self):
+        """Test returning a structured array"""
+        table = tabulate(
+            [CT_SMALL, MR_SMALL], ["Modality", "Rows", "ImagePositionPatient"]
+        )
+        arr = table.to_structured()
+        assert ("Modality", "Rows", "ImagePositionPatient") == arr.dtype.names
+        assert np.int64 == arr.dtype["Rows"]
+        assert (3,) == arr.dtype["ImagePositionPatient"].shape
+        assert [128, 64] == arr["Rows"].tolist()
+        assert "MR" == arr[1]["Modality"]
+
+    def test_invalid_column_raises(self):
+        """Test invalid columns raise exceptions"""
+        msg = (
+            "Invalid column 'Foo', 'Foo' is not a known element keyword or an "
+            "8 character hex tag"
+        )
+        with pytest.raises(ValueError, match=msg):
+            tabulate([], ["Foo"])
+
+        msg = "Invalid column 'BeamSequence..BeamName'"
+        with pytest.raises(ValueError, match=msg):
+            tabulate([], ["BeamSequence..BeamName"])
+
+        msg = (
+            r"Invalid column 'BeamSequence\[0\]', the last element in a path must "
+            "not have an item index"
+        )
+        with pytest.raises(ValueError, match=msg):
+            tabulate([], ["BeamSequence[0]"])
+
+        msg = "The column 'PatientID' is included more than once"
+        with pytest.raises(ValueError, match=msg):
+            tabulate([], ["PatientID", 0x00100020])
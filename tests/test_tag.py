@@ -1,6 +1,8 @@
 # Copyright 2008-2018 pydicom3 authors. See LICENSE file for details.
 """Unit tests for the pydicom3.tag module."""
 
+import pickle
+
 import pytest
 
 from pydicom3.tag import BaseTag, Tag, TupleTag, tag_in_exception
@@ -9,6 +11,17 @@ from pydicom3.tag import BaseTag, Tag, TupleTag, tag_in_exception
 class TestBaseTag:
     """Test the BaseTag class."""
 
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, protocol):
+        """Test pickling a tag."""
+        tag = pickle.loads(pickle.dumps(BaseTag(0x00100010), protocol=protocol))
+        assert isinstance(tag, BaseTag)
+        assert 0x00100010 == tag
+
+    def test_slots(self):
+        """Test tags have no instance dict."""
+        assert not hasattr(BaseTag(0x00100010), "__dict__")
+
     def test_le_same_class(self):
         """Test __le__ of two classes with same type."""
         assert BaseTag(0x00000000) <= BaseTag(0x00000001)
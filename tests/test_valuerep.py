@@ -34,6 +34,9 @@ from pydicom3.valuerep import (
     FLOAT_VR,
     INT_VR,
     LIST_VR,
+    format_number_as_ds,
+    format_numbers_as_ds,
+    is_valid_ds,
 )
 from pydicom3.values import convert_value
 
@@ -480,6 +483,104 @@ class TestTruncateFloatForDS:
             pydicom3.valuerep.format_number_as_ds("1.0")
 
 
+@pytest.mark.skipif(not config.have_numpy, reason="NumPy is not available")
+class TestFormatNumbersForDS:
+    """Unit tests for valuerep.format_numbers_as_ds"""
+
+    def test_format(self):
+        """Test formatting some basic values."""
+        import numpy
+
+        values = [1.0, 0.0, -0.0, 0.123, -0.321, 10, 100.5, -1050.25, 0.1 + 0.2]
+        assert (
+            b"1\\0\\0\\0.123\\-0.321\\10\\100.5\\-1050.25\\0.3"
+            == format_numbers_as_ds(numpy.asarray(values))
+        )
+        assert b"1\\2\\-3" == format_numbers_as_ds(numpy.asarray([1, 2, -3]))
+        assert b"" == format_numbers_as_ds(numpy.asarray([]))
+
+    @pytest.mark.parametrize(
+        "val,expected_str",
+        [
+            [0.00001, "1e-05"],
+            [3.14159265358979323846, "3.14159265358979"],
+            [-3.14159265358979323846, "-3.1415926535898"],
+            [5.3859401928763739403e-7, "5.3859401929e-07"],
+            [-5.3859401928763739403e-7, "-5.385940193e-07"],
+            [1.2342534378125532912998323e10, "12342534378.1255"],
+            [6.40708699858767842501238e13, "64070869985876.8"],
+            [1.7976931348623157e308, "1.797693135e+308"],
+            [9.999999999999998, "10"],
+            [-0.9999999999999999, "-1"],
+            [0.0001, "0.0001"],
+            [8730.421526217066, "8730.42152621707"],
+        ],
+    )
+    def test_truncation(self, val: float, expected_str: str):
+        """Test truncation of values that need more than 16 characters."""
+        import numpy
+
+        assert expected_str.encode() == format_numbers_as_ds(numpy.asarray([val]))
+
+    def test_format_number_as_ds(self):
+        """Test the values match those of format_number_as_ds()."""
+        import numpy
+
+        rng = numpy.random.default_rng(1234)
+        values = numpy.concatenate(
+            [
+                rng.standard_normal(5000) * 10.0 ** rng.integers(-20, 20, 5000),
+                rng.standard_normal(1000) * 10.0 ** rng.integers(-300, 300, 1000),
+                numpy.round(rng.random(1000) * 1000 - 500, 2),
+                math.pi * 10.0 ** numpy.arange(-16, 17),
+                -math.pi * 10.0 ** numpy.arange(-16, 17),
+            ]
+        )
+        encoded = format_numbers_as_ds(values).decode().split("\\")
+        assert len(values) == len(encoded)
+        assert all(is_valid_ds(s) and not s.endswith(".") for s in encoded)
+
+        # Never less precise than format_number_as_ds()
+        for val, s in zip(values.tolist(), encoded):
+            expected = format_number_as_ds(val)
+            assert abs(Decimal(s) - Decimal(val)) <= abs(
+                Decimal(expected) - Decimal(val)
+            )
+
+        # Values with short representations are unchanged
+        short = numpy.asarray([len(str(val)) <= 16 for val in values.tolist()])
+        assert (numpy.asarray(encoded, dtype="f8")[short] == values[short]).all()
+
+    def test_precision(self):
+        """Test fixed-point values are correctly rounded"""
+        import numpy
+
+        rng = numpy.random.default_rng(5678)
+        values = rng.random(20000) * 10.0 ** rng.integers(-4, 14, 20000)
+        values[::2] *= -0.1
+        encoded = format_numbers_as_ds(values).decode().split("\\")
+        for val, s in zip(values.tolist(), encoded):
+            expected = format_number_as_ds(val)
+            if len(expected) == 16 and "e" not in expected:
+                # Both use as many significant digits as fit in 16 characters
+                assert Decimal(expected) == Decimal(s)
+            else:
+                assert abs(Decimal(s) - Decimal(val)) <= abs(
+                    Decimal(expected) - Decimal(val)
+                )
+
+    @pytest.mark.parametrize(
+        "val", [float("-nan"), float("nan"), float("-inf"), float("inf")]
+    )
+    def test_invalid(self, val: float):
+        """Test non-finite floating point numbers raise an error"""
+        import numpy
+
+        msg = "Cannot encode non-finite floats as DICOM decimal strings"
+        with pytest.raises(ValueError, match=msg):
+            format_numbers_as_ds(numpy.asarray([1.0, val]))
+
+
 class TestDS:
     """Unit tests for DS values"""
 
@@ -1,9 +1,18 @@
 # Copyright 2008-2018 pydicom3 authors. See LICENSE file for details.
 """Tests for dataset.py"""
 import logging
+from struct import pack
 
 import pytest
 
+try:
+    import numpy
+
+    HAVE_NP = True
+except ImportError:
+    HAVE_NP = False
+
+from pydicom3 import config
 from pydicom3.tag import Tag
 from pydicom3.uid import UID
 from pydicom3.values import (
@@ -12,6 +21,11 @@ from pydicom3.values import (
     convert_tag,
     convert_ATvalue,
     convert_DA_string,
+    convert_DS_array,
+    convert_DS_string,
+    convert_IS_array,
+    convert_IS_string,
+    convert_numbers,
     convert_text,
     convert_single_string,
     convert_AE_string,
@@ -238,6 +252,152 @@ class TestConvertValue:
         assert "PN" in converters
 
 
+class TestConvertNumbers:
+    """Test values.convert_numbers"""
+
+    def test_convert(self):
+        """Test converting to numbers."""
+        assert "" == convert_numbers(b"", True, "H")
+        assert 1 == convert_numbers(b"\x01\x00", True, "H")
+        assert [1, 256] == convert_numbers(b"\x01\x00\x00\x01", True, "H")
+        assert [256, 1] == convert_numbers(b"\x01\x00\x00\x01", False, "H")
+
+    @pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+    def test_array(self):
+        """Test converting to an array."""
+        value = pack("<4H", 1, 2, 3, 65535)
+        arr = convert_numbers(value, True, "H", array_threshold=4)
+        assert isinstance(arr, numpy.ndarray)
+        assert "<u2" == arr.dtype.str
+        assert [1, 2, 3, 65535] == arr.tolist()
+
+        # A read-only view of the encoded value
+        assert not arr.flags.writeable
+        assert not arr.flags.owndata
+        with pytest.raises(ValueError, match="read-only"):
+            arr[0] = 2
+
+        # Below the threshold or a single value
+        assert [1, 2, 3, 65535] == convert_numbers(value, True, "H", 5)
+        assert 1 == convert_numbers(value[:2], True, "H", 1)
+
+    @pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+    def test_array_dtypes(self):
+        """Test the array dtypes match the format and endianness."""
+        for fmt, dtype in [
+            ("d", "f8"),
+            ("f", "f4"),
+            ("h", "i2"),
+            ("H", "u2"),
+            ("l", "i4"),
+            ("L", "u4"),
+            ("q", "i8"),
+            ("Q", "u8"),
+        ]:
+            values = [1, 2, 127]
+            arr = convert_numbers(pack(f"<3{fmt}", *values), True, fmt, 2)
+            assert f"<{dtype}" == arr.dtype.str
+            assert values == arr.tolist()
+
+            arr = convert_numbers(pack(f">3{fmt}", *values), False, fmt, 2)
+            assert f">{dtype}" == arr.dtype.str
+            assert values == arr.tolist()
+
+    @pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+    def test_array_threshold_setting(self):
+        """Test using config.settings.numeric_array_threshold."""
+        value = pack("<3d", 1.5, -2.5, 3.0)
+        assert [1.5, -2.5, 3.0] == convert_numbers(value, True, "d")
+
+        config.settings.numeric_array_threshold = 3
+        try:
+            arr = convert_numbers(value, True, "d")
+            assert isinstance(arr, numpy.ndarray)
+            assert [1.5, -2.5, 3.0] == arr.tolist()
+            # The per-call threshold takes precedence
+            assert [1.5, -2.5, 3.0] == convert_numbers(value, True, "d", 0)
+        finally:
+            config.settings.numeric_array_threshold = 0
+
+
+@pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+class TestConvertNumericStringArray:
+    """Test values.convert_DS_array and values.convert_IS_array"""
+
+    def test_convert_DS(self):
+        """Test converting DS values."""
+        arr = convert_DS_array(b" 1.5\\-2e3\\.5\\+4 \\0 ")
+        assert "float64" == arr.dtype
+        assert [1.5, -2000, 0.5, 4, 0] == arr.tolist()
+        assert 0 == convert_DS_array(b"").size
+        assert 0 == convert_DS_array(b"  ").size
+
+    def test_convert_IS(self):
+        """Test converting IS values."""
+        arr = convert_IS_array(b" 1\\-2\\+3 \\2147483647")
+        assert "int64" == arr.dtype
+        assert [1, -2, 3, 2147483647] == arr.tolist()
+
+    def test_invalid_characters(self):
+        """Test values with characters not in the repertoire raise."""
+        msg = r"DS: char\(s\) not in repertoire: 'x'"
+        with pytest.raises(ValueError, match=msg):
+            convert_DS_array(b"1.5\\x")
+
+        msg = r"IS: char\(s\) not in repertoire: 'e'"
+        with pytest.raises(ValueError, match=msg):
+            convert_IS_array(b"1\\1e3")
+
+    def test_invalid_values(self):
+        """Test empty and unparseable values raise."""
+        msg = (
+            "Unable to convert the DS value to an array as it contains empty "
+            "or invalid values"
+        )
+        for value in (b"1\\\\2", b"1\\", b"1.2.3\\4", b"1 2\\3"):
+            with pytest.raises(ValueError, match=msg):
+                convert_DS_array(value)
+
+    def test_validation(self):
+        """Test validating the values."""
+        value = b"1.23456789012345678\\2"
+        msg = (
+            r"The value length \(19\) exceeds the maximum length of 16 allowed "
+            "for VR DS"
+        )
+        with pytest.warns(UserWarning, match=msg):
+            arr = convert_DS_array(value)
+
+        assert [1.23456789012345678, 2] == arr.tolist()
+        with pytest.raises(ValueError, match=msg):
+            convert_DS_array(value, config.RAISE)
+
+        convert_DS_array(value, config.IGNORE)
+
+        msg = "Elements with a VR of IS must have a value between -2"
+        with pytest.raises(ValueError, match=msg):
+            convert_IS_array(b"1\\2147483648", config.RAISE)
+
+        msg = r"The value length \(13\) exceeds the maximum length of 12"
+        with pytest.raises(ValueError, match=msg):
+            convert_IS_array(b"1\\-100000000000", config.RAISE)
+
+    def test_use_numpy(self):
+        """Test the arrays are used by convert_DS_string and convert_IS_string."""
+        original = config.use_DS_numpy, config.use_IS_numpy
+        config.use_DS_numpy = True
+        config.use_IS_numpy = True
+        try:
+            arr = convert_DS_string(b"1.5\\2.5 ", True)
+            assert [1.5, 2.5] == arr.tolist()
+            assert 1.5 == convert_DS_string(b"1.5 ", True)
+            arr = convert_IS_string(b"1\\2 ", True)
+            assert [1, 2] == arr.tolist()
+            assert 1 == convert_IS_string(b"1 ", True)
+        finally:
+            config.use_DS_numpy, config.use_IS_numpy = original
+
+
 class TestConvertOValues:
     """Test converting values with the 'O' VRs like OB, OW, OF, etc."""
 